@@ -8,6 +8,7 @@ from nfv_common.debug._debug_log import debug_get_logger  # noqa: F401
 from nfv_common.debug._debug_log import debug_trace  # noqa: F401
 from nfv_common.debug._debug_module import debug_deregister_config_change_callback  # noqa: F401
 from nfv_common.debug._debug_module import debug_finalize  # noqa: F401
+from nfv_common.debug._debug_module import debug_flush  # noqa: F401
 from nfv_common.debug._debug_module import debug_get_config  # noqa: F401
 from nfv_common.debug._debug_module import debug_initialize  # noqa: F401
 from nfv_common.debug._debug_module import debug_register_config_change_callback  # noqa: F401
@@ -5,7 +5,6 @@
 #
 import datetime
 import functools
-import inspect
 import logging
 import os
 import six
@@ -15,7 +14,16 @@ from nfv_common.debug._debug_defs import DEBUG_LEVEL
 from nfv_common.debug._debug_module import Debug
 from nfv_common.debug._debug_thread import DebugLoggingThread
 
+_VERBOSE = DEBUG_LEVEL.VERBOSE
+_DEBUG = DEBUG_LEVEL.DEBUG
+_INFO = DEBUG_LEVEL.INFO
+_NOTICE = DEBUG_LEVEL.NOTICE
+_WARN = DEBUG_LEVEL.WARN
+_ERROR = DEBUG_LEVEL.ERROR
+_CRITICAL = DEBUG_LEVEL.CRITICAL
+
 _debug_loggers = {}
+_debug_callers = {}
 
 
 class DebugLogFormatter(logging.Formatter):
@@ -96,11 +104,13 @@ class DebugLogHandler(logging.Handler):
 
     def emit(self, record):
         """
-        Send record to debug logging thread
+        Send record to debug logging thread, warnings and above are sent
+        straight away rather than with the next batch
         """
         try:
             log_record = self._format_record(record)
-            DebugLoggingThread().send_log_record(log_record)
+            DebugLoggingThread().send_log_record(
+                log_record, flush=logging.WARNING <= log_record.levelno)
 
         except (KeyboardInterrupt, SystemExit):
             raise
@@ -112,6 +122,10 @@ class DebugLogHandler(logging.Handler):
 class DebugLogger(object):
     """
     Debug Logger
+
+    Pass the message arguments rather than formatting the message at the
+    call site, the message is then only formatted if it is logged. Use
+    is_enabled_for to avoid working out arguments that will not be logged.
     """
     log_level_mapping = {DEBUG_LEVEL.NONE: logging.NOTSET,
                          DEBUG_LEVEL.VERBOSE: logging.DEBUG,
@@ -131,6 +145,7 @@ class DebugLogger(object):
         self.process_name = process_name
         self.thread_name = thread_name
         self.debug_level = debug_level
+        self.enabled_level = debug_level
         self.logger = logging.getLogger(name)
         self.logger.propagate = False
         self.logger.setLevel(logging.NOTSET)
@@ -144,8 +159,17 @@ class DebugLogger(object):
         """
         log_level = self.log_level_mapping.get(debug_level, logging.NOTSET)
         self.debug_level = debug_level
+        # The overall debug level only changes along with the level of
+        # every logger, see debug_set_loggers_level
+        self.enabled_level = max(debug_level, Debug().debug_level)
         self.logger.setLevel(log_level)
 
+    def is_enabled_for(self, debug_level):
+        """
+        Returns true if logs of the given debug level would be logged
+        """
+        return debug_level >= self.enabled_level
+
     def set_process_name(self, process_name):
         """
         Set the process name
@@ -165,72 +189,70 @@ class DebugLogger(object):
         """
         Get the calling function and line number
         """
-        caller = inspect.currentframe().f_back.f_back
-        _, filename = os.path.split(caller.f_code.co_filename)
-        return "%42s.%-4s  " % (filename, caller.f_lineno)
+        caller = sys._getframe(2)
+        key = (caller.f_code.co_filename, caller.f_lineno)
+        caller_str = _debug_callers.get(key, None)
+        if caller_str is None:
+            _, filename = os.path.split(caller.f_code.co_filename)
+            caller_str = "%42s.%-4s  " % (filename, caller.f_lineno)
+            _debug_callers[key] = caller_str
+        return caller_str
 
     def verbose(self, msg, *args, **kwargs):
         """
         Debug log with severity of VERBOSE
         """
-        if DEBUG_LEVEL.VERBOSE >= Debug().debug_level:
-            if DEBUG_LEVEL.VERBOSE >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.debug(caller + msg, *args, **kwargs)
+        if _VERBOSE >= self.enabled_level:
+            caller = self.get_caller()
+            self.logger.debug(caller + msg, *args, **kwargs)
 
     def debug(self, msg, *args, **kwargs):
         """
         Debug log with severity of DEBUG
         """
-        if DEBUG_LEVEL.DEBUG >= Debug().debug_level:
-            if DEBUG_LEVEL.DEBUG >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.debug(caller + msg, *args, **kwargs)
+        if _DEBUG >= self.enabled_level:
+            caller = self.get_caller()
+            self.logger.debug(caller + msg, *args, **kwargs)
 
     def info(self, msg, *args, **kwargs):
         """
         Debug log with severity of INFO
         """
-        if DEBUG_LEVEL.INFO >= Debug().debug_level:
-            if DEBUG_LEVEL.INFO >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.info(caller + msg, *args, **kwargs)
+        if _INFO >= self.enabled_level:
+            caller = self.get_caller()
+            self.logger.info(caller + msg, *args, **kwargs)
 
     def notice(self, msg, *args, **kwargs):
         """
         Debug log with severity of NOTICE
         """
-        if DEBUG_LEVEL.NOTICE >= Debug().debug_level:
-            if DEBUG_LEVEL.NOTICE >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.info(caller + msg, *args, **kwargs)
+        if _NOTICE >= self.enabled_level:
+            caller = self.get_caller()
+            self.logger.info(caller + msg, *args, **kwargs)
 
     def warn(self, msg, *args, **kwargs):
         """
         Debug log with severity of WARNING
         """
-        if DEBUG_LEVEL.WARN >= Debug().debug_level:
-            if DEBUG_LEVEL.WARN >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.warning(caller + msg, *args, **kwargs)
+        if _WARN >= self.enabled_level:
+            caller = self.get_caller()
+            self.logger.warning(caller + msg, *args, **kwargs)
 
     def error(self, msg, *args, **kwargs):
         """
         Debug log with severity of ERROR
         """
-        if DEBUG_LEVEL.ERROR >= Debug().debug_level:
-            if DEBUG_LEVEL.ERROR >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.error(caller + msg, *args, **kwargs)
+        if _ERROR >= self.enabled_level:
+            caller = self.get_caller()
+            self.logger.error(caller + msg, *args, **kwargs)
 
     def critical(self, msg, *args, **kwargs):
         """
         Debug log with severity of CRITICAL
         """
-        if DEBUG_LEVEL.CRITICAL >= Debug().debug_level:
-            if DEBUG_LEVEL.CRITICAL >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.critical(caller + msg, *args, **kwargs)
+        if _CRITICAL >= self.enabled_level:
+            caller = self.get_caller()
+            self.logger.critical(caller + msg, *args, **kwargs)
 
     def exception(self, msg, *args):
         """
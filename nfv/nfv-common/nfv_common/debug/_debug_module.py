@@ -41,7 +41,8 @@ class Debug(object):
         """
         Deregister a configuration change callback
         """
-        self._config_change_callbacks.remove(callback)
+        if callback in self._config_change_callbacks:
+            self._config_change_callbacks.remove(callback)
 
     def load(self, process_name=None, thread_name=None):
         """
@@ -169,8 +170,15 @@ def debug_initialize(config, process_name=None, thread_name=None):
     Debug().load(process_name, thread_name)
 
 
+def debug_flush():
+    """
+    Send the log records waiting to be sent to the debug logging thread
+    """
+    DebugLoggingThread().flush()
+
+
 def debug_finalize():
     """
     Finalizes the debug subsystem
     """
-    return
+    debug_flush()
@@ -5,6 +5,7 @@
 #
 import logging
 import multiprocessing
+import os
 import six
 import sys
 import threading
@@ -32,26 +33,85 @@ class DebugLoggingThreadFormatter(logging.Formatter):
 class DebugLoggingThread(object):
     """
     Debug Logging Thread
+
+    Log records are sent in batches, a batch is sent once it holds
+    BATCH_MAX_RECORDS records, once its first record is BATCH_MAX_DELAY_SECS
+    old or when flushed.
     """
+    BATCH_MAX_RECORDS = 64
+    BATCH_MAX_DELAY_SECS = 0.1
+
     def __init__(self):
         self._handlers = list()
         self._log_queue = multiprocessing.Queue()
+        self._batch_lock = threading.Lock()
+        self._batch = list()
+        self._batch_pid = os.getpid()
         self._thread = threading.Thread(target=self._receive_logs)
         self._thread.daemon = True
         self._thread.start()
 
-    def send_log_record(self, log_record):
+    def _check_owner(self):
+        """
+        Forget a batch inherited from a parent process, the parent sends it
+        """
+        if os.getpid() != self._batch_pid:
+            self._batch_lock = threading.Lock()
+            self._batch = list()
+            self._batch_pid = os.getpid()
+
+    def _send_batch(self):
+        """
+        Send the batch of log records, called with the batch lock held
+        """
+        if self._batch:
+            self._log_queue.put_nowait(['log-records', self._batch])
+            self._batch = list()
+
+    def send_log_record(self, log_record, flush=False):
         """
         Send a log record to debug logging thread
         """
-        self._log_queue.put_nowait(['log-record', log_record])
+        self._check_owner()
+        with self._batch_lock:
+            self._batch.append(log_record)
+            if flush or self.BATCH_MAX_RECORDS <= len(self._batch) or \
+                    self.BATCH_MAX_DELAY_SECS <= \
+                    log_record.created - self._batch[0].created:
+                self._send_batch()
+
+    def flush(self):
+        """
+        Send the log records waiting to be sent to debug logging thread
+        """
+        self._check_owner()
+        with self._batch_lock:
+            self._send_batch()
 
     def send_log_config(self, config):
         """
         Send log configuration to debug logging thread
         """
+        self.flush()
         self._log_queue.put_nowait(['log-config', config])
 
+    def _emit(self, log_record):
+        """
+        Emit a log record on each of the handlers
+        """
+        for handler in self._handlers:
+            if hasattr(handler, 'is_stdout'):
+                try:
+                    date_time = log_record.asctime
+                    text = str(log_record.formatted_log)
+                    text = text.split('[', 1)[-1]
+                    text = text.split(':', 1)[-1]
+                    log_record.formatted_log = date_time + ' ' + text
+                except Exception:
+                    pass
+
+            handler.emit(log_record)
+
     def _receive_logs(self):
         """
         Receive log records sent to the debug logging thread
@@ -65,20 +125,14 @@ class DebugLoggingThread(object):
                 if log_work is not None:
                     action, work = log_work
 
-                    if 'log-record' == action:
+                    if 'log-records' == action:
                         if self._handlers:
-                            for handler in self._handlers:
-                                if hasattr(handler, 'is_stdout'):
-                                    try:
-                                        date_time = work.asctime
-                                        text = str(work.formatted_log)
-                                        text = text.split('[', 1)[-1]
-                                        text = text.split(':', 1)[-1]
-                                        work.formatted_log = date_time + ' ' + text
-                                    except Exception:
-                                        pass
-
-                                handler.emit(work)
+                            for log_record in work:
+                                self._emit(log_record)
+
+                    elif 'log-record' == action:
+                        if self._handlers:
+                            self._emit(work)
 
                     elif 'log-config' == action:
                         if self._handlers:
@@ -22,3 +22,4 @@ from nfv_common.forensic._analysis import analysis_stdout  # noqa: F401
 from nfv_common.forensic._evidence import evidence_from_files  # noqa: F401
 from nfv_common.forensic._forensic_module import forensic_finalize  # noqa: F401
 from nfv_common.forensic._forensic_module import forensic_initialize  # noqa: F401
+from nfv_common.forensic._index import evidence_from_index  # noqa: F401
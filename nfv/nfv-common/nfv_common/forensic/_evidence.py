@@ -3,60 +3,234 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import heapq
+import mmap
+import multiprocessing
+import os
+
 from nfv_common import debug
 from nfv_common.forensic import _parsers
 
 DLOG = debug.debug_get_logger('forensic-evidence')
 
+# Files smaller than this are not worth handing to worker processes
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+
+# Size of the pieces a file is split into for the worker processes
+CHUNK_MIN_BYTES = 4 * 1024 * 1024
 
-def evidence_from_files(files, start_date, end_date, progress=None):
+
+def _line_start(data, offset):
     """
-    Gather evidence
+    Returns the offset of the line that starts at or after offset
     """
-    records = list()
-    file_ctrl = dict()
+    if 0 == offset:
+        return 0
+    newline = data.find(b'\n', offset - 1)
+    if -1 == newline:
+        return len(data)
+    return newline + 1
 
-    total_lines = 0
-    for parser_name, file_name in files.items():
-        total_lines += sum(1 for _ in open(file_name))
-        file_ctrl[file_name] = (parser_name, open(file_name), None)
-
-    lines_read = 0
-    while 0 < len(file_ctrl):
-        # Read a record from each file.
-        for file_name, (parser_name, f, record) in file_ctrl.items():
-            if record is None:
-                line = f.readline()
-                while line:
-                    parser = _parsers.parser_get(parser_name)
-                    record = parser.parse(start_date, end_date, line)
-                    if record is not None:
-                        file_ctrl[file_name] = (parser_name, f, record)
+
+def _next_timestamp(parser, data, offset, end):
+    """
+    Returns the timestamp of the first line at or after offset that starts
+    with one, None if there is none before end
+    """
+    while offset < end:
+        newline = data.find(b'\n', offset, end)
+        if -1 == newline:
+            newline = end
+        timestamp = parser.parse_timestamp(data[offset:newline])
+        if timestamp is not None:
+            return timestamp
+        offset = newline + 1
+    return None
+
+
+def _seek(parser, data, after):
+    """
+    Returns the offset of the first line with a timestamp that is after
+    the one given, binary searching the file on the timestamps of its lines
+    """
+    low = 0
+    high = len(data)
+    while low < high:
+        middle = (low + high) // 2
+        timestamp = _next_timestamp(parser, data, _line_start(data, middle),
+                                    len(data))
+        if timestamp is None or after(timestamp):
+            high = middle
+        else:
+            low = middle + 1
+    return _line_start(data, low)
+
+
+def _file_range(parser, file_name, start_date, end_date):
+    """
+    Returns the range of a file that holds the lines between the start and
+    end dates
+    """
+    if 0 == os.path.getsize(file_name):
+        return 0, 0
+
+    with open(file_name, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            start = _seek(parser, data, lambda ts: ts >= start_date)
+            end = _seek(parser, data, lambda ts: ts > end_date)
+        finally:
+            data.close()
+    return start, max(start, end)
+
+
+def _evidence_from_chunk(parser_name, file_name, start, end, start_date,
+                         end_date):
+    """
+    Returns the records found in a piece of a file
+    """
+    parser = _parsers.parser_get(parser_name)
+    if parser is None:
+        # Worker process that has not initialized the parsers
+        _parsers.parser_initialize()
+        parser = _parsers.parser_get(parser_name)
+
+    records = list()
+    with open(file_name, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            offset = start
+            while offset < end:
+                if parser.prefilter is None:
+                    line_start = offset
+                else:
+                    # Only the lines the prefilter finds are parsed
+                    match = parser.prefilter.search(data, offset, end)
+                    if match is None:
                         break
-                    line = f.readline()
-                    lines_read += 1
-
-        # Remove files that do not have any more records.
-        for file_name, (parser_name, f, record) in file_ctrl.items():
-            if record is None:
-                del file_ctrl[file_name]
-
-        # Sort records and take the earliest record.
-        earliest = None
-        for file_name, (parser_name, f, record) in file_ctrl.items():
-            if earliest is None:
-                earliest = (file_name, parser_name, f, record)
-            else:
-                _, _, _, earliest_record = earliest
-                if earliest_record['timestamp'] > record['timestamp']:
-                    earliest = (file_name, parser_name, f, record)
-
-        if earliest is not None:
-            file_name, parser_name, f, record = earliest
-            file_ctrl[file_name] = (parser_name, f, None)
-            records.append(record)
-
-        if progress is not None:
-            progress((float(lines_read) / total_lines) * 100)
+                    line_start = max(offset, data.rfind(
+                        b'\n', offset, match.start()) + 1)
+
+                line_end = data.find(b'\n', line_start, end)
+                if -1 == line_end:
+                    line_end = end
+                offset = line_end + 1
 
+                record = parser.parse(start_date, end_date,
+                                      data[line_start:offset].decode(
+                                          'utf-8', 'replace'))
+                if record is not None:
+                    records.append(record)
+        finally:
+            data.close()
     return records
+
+
+def _evidence_from_chunk_args(args):
+    """
+    Returns the records found in a piece of a file, for a worker process
+    """
+    return _evidence_from_chunk(*args)
+
+
+def _chunks(file_name, start, end, num_chunks):
+    """
+    Returns the ranges a piece of a file splits into, on line boundaries
+    """
+    if 1 >= num_chunks:
+        return [(start, end)]
+
+    with open(file_name, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            offsets = [start]
+            for idx in range(1, num_chunks):
+                offset = _line_start(data, start +
+                                     (end - start) * idx // num_chunks)
+                offsets.append(max(offsets[-1], min(offset, end)))
+            offsets.append(end)
+        finally:
+            data.close()
+    return [(offsets[idx], offsets[idx + 1]) for idx in range(num_chunks)
+            if offsets[idx] < offsets[idx + 1]]
+
+
+def evidence_from_ranges(work, start_date, end_date, progress=None,
+                          processes=None):
+    """
+    Returns the records found in the ranges of each file, a list of records
+    per file in timestamp order
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+
+    total_bytes = sum(end - start for _, _, start, end in work)
+    if 1 >= processes or total_bytes < PARALLEL_MIN_BYTES:
+        processes = 1
+
+    chunks = list()
+    for file_idx, (parser_name, file_name, start, end) in enumerate(work):
+        num_chunks = 1
+        if 1 < processes:
+            num_chunks = min(processes, max(1, (end - start) //
+                                            CHUNK_MIN_BYTES))
+        for chunk_start, chunk_end in _chunks(file_name, start, end,
+                                              num_chunks):
+            chunks.append((file_idx, (parser_name, file_name, chunk_start,
+                                      chunk_end, start_date, end_date)))
+
+    pool = None
+    if 1 == processes:
+        results = (_evidence_from_chunk(*args) for _, args in chunks)
+    else:
+        # Results come back in the order of the chunks, the chunks of a
+        # file are in file order
+        pool = multiprocessing.Pool(processes)
+        results = pool.imap(_evidence_from_chunk_args,
+                            [args for _, args in chunks])
+
+    file_records = [list() for _ in work]
+    bytes_read = 0
+    try:
+        for (file_idx, args), records in zip(chunks, results):
+            file_records[file_idx].extend(records)
+            bytes_read += args[3] - args[2]
+            if progress is not None:
+                if 0 == total_bytes:
+                    progress(100)
+                else:
+                    progress((float(bytes_read) / total_bytes) * 100)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return file_records
+
+
+def evidence_from_files(files, start_date, end_date, progress=None,
+                        processes=None):
+    """
+    Gather evidence
+
+    Each file is binary searched for the lines between the start and end
+    dates, lines that cannot be a log of interest are skipped before being
+    parsed and large files are parsed by worker processes. The records of
+    each file are in timestamp order, they are merged into one list.
+    """
+    work = list()
+    for parser_name, file_name in files.items():
+        parser = _parsers.parser_get(parser_name)
+        start, end = _file_range(parser, file_name, start_date, end_date)
+        DLOG.verbose("File %s, searching bytes %s to %s."
+                     % (file_name, start, end))
+        work.append((parser_name, file_name, start, end))
+
+    file_records = evidence_from_ranges(work, start_date, end_date,
+                                         progress, processes)
+
+    # Merge the records of the files, earliest first
+    merged = heapq.merge(*[[(record['timestamp'], file_idx, idx, record)
+                            for idx, record in enumerate(records)]
+                           for file_idx, records in enumerate(file_records)])
+    return [record for _, _, _, record in merged]
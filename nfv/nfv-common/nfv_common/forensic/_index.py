@@ -0,0 +1,262 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+
+from nfv_common import debug
+from nfv_common.forensic import _evidence
+from nfv_common.forensic import _parsers
+
+DLOG = debug.debug_get_logger('forensic-index')
+
+_INDEX_VERSION = 1
+
+# Bytes at the start of a file remembered to tell a file that was rewritten
+# from one that was appended to
+_HEAD_BYTES = 256
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS parsers (parser_name TEXT PRIMARY KEY, "
+    "digest TEXT)",
+    "CREATE TABLE IF NOT EXISTS files (file_name TEXT PRIMARY KEY, "
+    "parser_name TEXT, inode INTEGER, mtime REAL, size INTEGER, "
+    "offset INTEGER, head BLOB)",
+    "CREATE TABLE IF NOT EXISTS records (id INTEGER PRIMARY KEY, "
+    "file_name TEXT, timestamp INTEGER, type TEXT, instance_uuid TEXT, "
+    "instance_name TEXT, host_name TEXT, record TEXT)",
+    "CREATE INDEX IF NOT EXISTS records_timestamp ON records "
+    "(timestamp)",
+    "CREATE INDEX IF NOT EXISTS records_file_name ON records "
+    "(file_name)",
+    "CREATE INDEX IF NOT EXISTS records_type ON records "
+    "(type, timestamp)",
+    "CREATE INDEX IF NOT EXISTS records_instance_uuid ON records "
+    "(instance_uuid, timestamp)",
+    "CREATE INDEX IF NOT EXISTS records_instance_name ON records "
+    "(instance_name, timestamp)",
+    "CREATE INDEX IF NOT EXISTS records_host_name ON records "
+    "(host_name, timestamp)",
+]
+
+
+def _timestamp_to_index(timestamp):
+    """
+    Returns a timestamp as microseconds since the epoch
+    """
+    delta = timestamp - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _timestamp_from_index(value):
+    """
+    Returns a timestamp from microseconds since the epoch
+    """
+    return _EPOCH + datetime.timedelta(microseconds=value)
+
+
+def _parser_digest(parser):
+    """
+    Returns a digest of the configuration of a parser, records indexed
+    with another configuration are not reused
+    """
+    config_data = json.dumps(parser.config_data, sort_keys=True)
+    return hashlib.sha1(config_data.encode('utf-8')).hexdigest()
+
+
+def _open(index_file):
+    """
+    Open the index, creating it if needed
+    """
+    connection = sqlite3.connect(index_file, timeout=60,
+                                 isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if 0 != version and version != _INDEX_VERSION:
+        DLOG.info("Index %s is version %s, rebuilding as version %s."
+                  % (index_file, version, _INDEX_VERSION))
+        for table in ['parsers', 'files', 'records']:
+            connection.execute("DROP TABLE IF EXISTS %s" % table)
+    for statement in _SCHEMA:
+        connection.execute(statement)
+    connection.execute("PRAGMA user_version=%d" % _INDEX_VERSION)
+    return connection
+
+
+def _file_state(file_name):
+    """
+    Returns the inode, modification time, size, the offset just past the
+    last complete line and the first bytes of a file
+    """
+    stat = os.stat(file_name)
+    if 0 == stat.st_size:
+        return stat.st_ino, stat.st_mtime, 0, 0, b''
+
+    with open(file_name, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # A line being written is left for the next update
+            size = len(data)
+            end = data.rfind(b'\n') + 1
+            head = data[:_HEAD_BYTES]
+        finally:
+            data.close()
+    return stat.st_ino, stat.st_mtime, size, end, head
+
+
+def _index_update(connection, files, progress=None, processes=None):
+    """
+    Parse what was appended to the files since they were last indexed
+    """
+    digests = dict()
+    for parser_name in set(files.keys()):
+        digests[parser_name] = _parser_digest(_parsers.parser_get(parser_name))
+
+    indexed = dict()
+    for row in connection.execute("SELECT file_name, parser_name, inode, "
+                                  "mtime, size, offset, head FROM files"):
+        indexed[row[0]] = row[1:]
+
+    indexed_digests = dict(connection.execute("SELECT parser_name, digest "
+                                              "FROM parsers"))
+
+    work = list()
+    updates = list()
+    for parser_name, file_name in files.items():
+        inode, mtime, size, end, head = _file_state(file_name)
+        start = 0
+        previous = indexed.get(file_name, None)
+        if previous is not None:
+            p_parser_name, p_inode, p_mtime, p_size, p_offset, p_head \
+                = previous
+            if (p_parser_name == parser_name and p_inode == inode and
+                    p_offset <= end and
+                    bytes(p_head) == head[:len(p_head)] and
+                    digests[parser_name] == indexed_digests.get(parser_name)):
+                if p_mtime == mtime and p_size == size:
+                    continue
+                start = p_offset
+            else:
+                DLOG.info("File %s was replaced, indexing it again."
+                          % file_name)
+
+        DLOG.verbose("File %s, indexing bytes %s to %s."
+                     % (file_name, start, end))
+        work.append((parser_name, file_name, start, end))
+        updates.append((previous, start, (file_name, parser_name, inode,
+                                          mtime, size, end, head)))
+
+    file_records = list()
+    if work:
+        file_records = _evidence.evidence_from_ranges(
+            work, datetime.datetime.min, datetime.datetime.max, progress,
+            processes)
+    elif progress is not None:
+        progress(100)
+
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        for file_name in set(indexed.keys()) - set(files.values()):
+            connection.execute("DELETE FROM records WHERE file_name = ?",
+                               (file_name,))
+            connection.execute("DELETE FROM files WHERE file_name = ?",
+                               (file_name,))
+
+        for (previous, start, row), records in zip(updates, file_records):
+            file_name = row[0]
+            current = connection.execute(
+                "SELECT parser_name, inode, mtime, size, offset, head "
+                "FROM files WHERE file_name = ?", (file_name,)).fetchone()
+            if current != previous:
+                # Indexed by someone else in the meantime
+                continue
+
+            if previous is not None and 0 == start:
+                connection.execute("DELETE FROM records WHERE file_name = ?",
+                                   (file_name,))
+
+            connection.executemany(
+                "INSERT INTO records (file_name, timestamp, type, "
+                "instance_uuid, instance_name, host_name, record) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(file_name, _timestamp_to_index(record['timestamp']),
+                  record['data']['type'],
+                  record['data'].get('instance_uuid', None),
+                  record['data'].get('instance_name', None),
+                  record['data'].get('host_name', None),
+                  json.dumps(dict((key, value) for key, value
+                                  in record.items() if 'timestamp' != key)))
+                 for record in records])
+            connection.execute(
+                "INSERT OR REPLACE INTO files (file_name, parser_name, "
+                "inode, mtime, size, offset, head) VALUES "
+                "(?, ?, ?, ?, ?, ?, ?)", row[:6] + (sqlite3.Binary(row[6]),))
+
+        for parser_name, digest in digests.items():
+            connection.execute("INSERT OR REPLACE INTO parsers (parser_name, "
+                               "digest) VALUES (?, ?)", (parser_name, digest))
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def evidence_from_index(index_file, files, start_date, end_date,
+                        instance_uuid=None, instance_name=None,
+                        host_name=None, record_types=None, progress=None,
+                        processes=None):
+    """
+    Gather evidence from an index of the files
+
+    The index is brought up to date first, only the lines appended to the
+    files since the last time are parsed. The records between the start and
+    end dates are returned in timestamp order, limited to those of an
+    instance (by uuid or name), of a host or of the given types.
+    """
+    connection = _open(index_file)
+    try:
+        _index_update(connection, files, progress, processes)
+
+        query = ("SELECT timestamp, record FROM records "
+                 "WHERE timestamp >= ? AND timestamp <= ?")
+        params = [_timestamp_to_index(start_date),
+                  _timestamp_to_index(end_date)]
+
+        if instance_uuid is not None and instance_name is not None:
+            query += " AND (instance_uuid = ? OR instance_name = ?)"
+            params += [instance_uuid, instance_name]
+        elif instance_uuid is not None:
+            query += " AND instance_uuid = ?"
+            params.append(instance_uuid)
+        elif instance_name is not None:
+            query += " AND instance_name = ?"
+            params.append(instance_name)
+
+        if host_name is not None:
+            query += " AND host_name = ?"
+            params.append(host_name)
+
+        if record_types is not None:
+            query += (" AND type IN (%s)"
+                      % ', '.join('?' * len(record_types)))
+            params += list(record_types)
+
+        query += " ORDER BY timestamp, id"
+
+        records = list()
+        for timestamp, data in connection.execute(query, params):
+            record = json.loads(data)
+            record['timestamp'] = _timestamp_from_index(timestamp)
+            records.append(record)
+        return records
+
+    finally:
+        connection.close()
@@ -6,6 +6,7 @@
 import datetime
 import os
 import re
+import six
 import yaml
 
 from pyparsing import alphas
@@ -17,6 +18,64 @@ from pyparsing import Suppress
 from pyparsing import Word
 
 
+_TIMESTAMP = re.compile(br'(\d{4})-(\d+)-(\d+)T(\d+):(\d+):(\d+)\.(\d+) ')
+
+# Characters that end the literal text a regex starts with
+_REGEX_SPECIAL = '.^$*+?{}[]|()'
+_REGEX_QUANTIFIERS = '*+?{'
+
+
+def _regex_literal_prefix(regex):
+    """
+    Returns the literal text every match of a regex starts with
+    """
+    literal = list()
+    idx = 0
+    while idx < len(regex):
+        char = regex[idx]
+        if '\\' == char:
+            if idx + 1 >= len(regex) or regex[idx + 1].isalnum():
+                # A character class or back-reference, not a literal
+                break
+            char = regex[idx + 1]
+            idx += 2
+        elif char in _REGEX_SPECIAL:
+            break
+        else:
+            idx += 1
+
+        if idx < len(regex) and regex[idx] in _REGEX_QUANTIFIERS:
+            # The character may not be there, or be there more than once
+            break
+        literal.append(char)
+    return ''.join(literal)
+
+
+def _literals_regex(literals):
+    """
+    Returns a regex matching any of the literals, built as a trie so that
+    literals sharing a start are only compared once
+    """
+    trie = dict()
+    for literal in literals:
+        node = trie
+        for char in six.iterbytes(literal):
+            node = node.setdefault(char, dict())
+        node[None] = dict()
+
+    def build(node):
+        if None in node:
+            # Matching this far is enough, longer literals add nothing
+            return b''
+        alternatives = [re.escape(six.int2byte(char)) + build(child)
+                        for char, child in sorted(node.items())]
+        if 1 == len(alternatives):
+            return alternatives[0]
+        return b'(?:' + b'|'.join(alternatives) + b')'
+
+    return re.compile(build(trie))
+
+
 class NfvVimParser(object):
     """
     NFV-VIM Parser
@@ -24,6 +83,21 @@ class NfvVimParser(object):
     def __init__(self, config_data):
         self._config_data = config_data
 
+        # Lines that contain none of the text the log regexes start with
+        # cannot be a log of interest, they are skipped before being parsed
+        literals = set()
+        for log in config_data['logs']:
+            literal = _regex_literal_prefix(log['regex'])
+            if not literal:
+                literals = None
+                break
+            literals.add(literal.encode('utf-8'))
+
+        if literals:
+            self.prefilter = _literals_regex(literals)
+        else:
+            self.prefilter = None
+
         year = Word(nums)
         month = Suppress('-') + Word(nums)
         day = Suppress('-') + Word(nums)
@@ -50,6 +124,10 @@ class NfvVimParser(object):
                           millisecond + hostname + pid + ignore + filename +
                           lineno + message)
 
+    @property
+    def config_data(self):
+        return self._config_data
+
     def parse_message(self, filename, lineno, message):
         for log in self._config_data['logs']:
             if log.get('file', None) is not None:
@@ -70,6 +148,23 @@ class NfvVimParser(object):
                 return message_data
         return None
 
+    @staticmethod
+    def parse_timestamp(line):
+        """
+        Returns the timestamp a line starts with, None if the line does not
+        start with a timestamp
+        """
+        match = _TIMESTAMP.match(line)
+        if match is None:
+            return None
+
+        try:
+            return datetime.datetime(*[int(field) for field in
+                                       match.groups()[:6]],
+                                     microsecond=int(match.group(7)) * 1000)
+        except ValueError:
+            return None
+
     def parse(self, start_date, end_date, line):
         record = None
 
@@ -108,7 +203,7 @@ def parser_initialize():
     path = os.path.abspath(__file__)
     config_file = os.path.dirname(path) + "/config/nfv-vim.yaml"
     if os.path.isfile(config_file):
-        config_data = yaml.load(open(config_file))
+        config_data = yaml.safe_load(open(config_file))
         return NfvVimParser(config_data)
     return None
 
@@ -3,31 +3,262 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
-import array
+import collections
 import datetime
+import glob
+import json
 import math
+import os
+import threading
+import time
 
 from nfv_common import debug
 
 DLOG = debug.debug_get_logger('nfv_common.histogram')
 
+# Number of significant decimal digits the value of a sample is kept to
+DEFAULT_SIGNIFICANT_DIGITS = 2
+
+# Percentiles reported for each histogram
+PERCENTILES = [50.0, 90.0, 99.0, 99.9]
+
+# Rolling windows are built from slices of samples, the oldest slice is
+# dropped as a new one is started
+WINDOW_SLICE_IN_SECS = 10
+WINDOWS = [('1m', 60), ('5m', 300)]
+
+# Name of the window with all samples since the histogram was last reset
+WINDOW_ALL = 'all'
+
+
+if hasattr(time, 'monotonic'):
+    def _now_ms():
+        """
+        Returns the monotonic timestamp in milliseconds
+        """
+        return time.monotonic() * 1000
+else:
+    def _now_ms():
+        """
+        Returns the monotonic timestamp in milliseconds
+        """
+        # Imported here as the timers use histograms
+        from nfv_common import timers
+        return timers.get_monotonic_timestamp_in_ms()
+
+
+def _percentile_name(percentile):
+    """
+    Returns the name of a percentile, e.g. p99 or p999
+    """
+    return 'p' + ('%g' % percentile).replace('.', '')
+
+
+class HistogramData(object):
+    """
+    Histogram Data
+
+    Samples are counted in log-linear buckets, values up to the sub-bucket
+    count are exact and larger values are kept to the number of significant
+    digits given. Buckets are only allocated once a sample falls into them.
+    """
+    def __init__(self, significant_digits=DEFAULT_SIGNIFICANT_DIGITS):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant digits must be between 1 and 5, "
+                             "got %s" % significant_digits)
+
+        self._significant_digits = significant_digits
+        self._sub_bucket_bits = int(math.ceil(
+            math.log(2 * 10 ** significant_digits, 2)))
+        self._sub_bucket_count = 1 << self._sub_bucket_bits
+        self._sub_bucket_half_count = self._sub_bucket_count >> 1
+        self._counts = dict()
+        self._num_samples = 0
+        self._sample_total = 0
+        self._min_sample = None
+        self._max_sample = None
+
+    @property
+    def significant_digits(self):
+        """
+        Returns the number of significant digits samples are kept to
+        """
+        return self._significant_digits
+
+    @property
+    def num_samples(self):
+        """
+        Returns the number of samples
+        """
+        return self._num_samples
+
+    @property
+    def sample_total(self):
+        """
+        Returns the total of all samples
+        """
+        return self._sample_total
+
+    @property
+    def min_sample(self):
+        """
+        Returns the smallest sample
+        """
+        return self._min_sample
+
+    @property
+    def max_sample(self):
+        """
+        Returns the largest sample
+        """
+        return self._max_sample
+
+    @property
+    def average_sample(self):
+        """
+        Returns the average of all samples
+        """
+        if 0 == self._num_samples:
+            return None
+        return self._sample_total / float(self._num_samples)
+
+    def _bucket_index(self, value):
+        """
+        Returns the index of the bucket a value falls into
+        """
+        if value < self._sub_bucket_count:
+            return value
+
+        shift = value.bit_length() - self._sub_bucket_bits
+        return (self._sub_bucket_count +
+                (shift - 1) * self._sub_bucket_half_count +
+                (value >> shift) - self._sub_bucket_half_count)
+
+    def _bucket_range(self, bucket_idx):
+        """
+        Returns the lowest and highest value of a bucket
+        """
+        if bucket_idx < self._sub_bucket_count:
+            return bucket_idx, bucket_idx
+
+        shift, sub_bucket_idx = divmod(bucket_idx - self._sub_bucket_count,
+                                       self._sub_bucket_half_count)
+        shift += 1
+        low = (sub_bucket_idx + self._sub_bucket_half_count) << shift
+        return low, low + (1 << shift) - 1
+
+    def add_data(self, sample):
+        """
+        Add a sample
+        """
+        bucket_idx = self._bucket_index(max(0, int(sample)))
+        self._counts[bucket_idx] = self._counts.get(bucket_idx, 0) + 1
+
+        self._num_samples += 1
+        self._sample_total += sample
+        if self._min_sample is None or sample < self._min_sample:
+            self._min_sample = sample
+        if self._max_sample is None or sample > self._max_sample:
+            self._max_sample = sample
+
+    def merge(self, other):
+        """
+        Add the samples of another histogram data kept to the same number
+        of significant digits
+        """
+        if self._significant_digits != other.significant_digits:
+            raise ValueError("cannot merge histogram data kept to %s "
+                             "significant digits with data kept to %s"
+                             % (self._significant_digits,
+                                other.significant_digits))
+
+        for bucket_idx, count in other._counts.items():
+            self._counts[bucket_idx] = self._counts.get(bucket_idx, 0) + count
+
+        self._num_samples += other.num_samples
+        self._sample_total += other.sample_total
+        if other.min_sample is not None:
+            if self._min_sample is None or other.min_sample < self._min_sample:
+                self._min_sample = other.min_sample
+        if other.max_sample is not None:
+            if self._max_sample is None or other.max_sample > self._max_sample:
+                self._max_sample = other.max_sample
+
+    def copy(self):
+        """
+        Returns a copy of the histogram data
+        """
+        data = HistogramData(self._significant_digits)
+        data.merge(self)
+        return data
+
+    def value_at_percentile(self, percentile):
+        """
+        Returns the value that the given percentage of samples are at or
+        below, None if there are no samples
+        """
+        if 0 == self._num_samples:
+            return None
+
+        target = max(1, int(math.ceil(percentile * self._num_samples / 100.0)))
+        total = 0
+        for bucket_idx in sorted(self._counts):
+            total += self._counts[bucket_idx]
+            if total >= target:
+                _, high = self._bucket_range(bucket_idx)
+                return max(self._min_sample, min(high, self._max_sample))
+        return self._max_sample
+
+    def percentiles(self):
+        """
+        Returns the value of the reported percentiles
+        """
+        return collections.OrderedDict(
+            (_percentile_name(percentile), self.value_at_percentile(percentile))
+            for percentile in PERCENTILES)
+
+    def buckets(self):
+        """
+        Returns the lowest value, highest value and count of each bucket
+        with samples
+        """
+        buckets = list()
+        for bucket_idx in sorted(self._counts):
+            low, high = self._bucket_range(bucket_idx)
+            buckets.append((low, high, self._counts[bucket_idx]))
+        return buckets
+
+    def as_dict(self):
+        """
+        Represent the histogram data as a dictionary
+        """
+        data = dict()
+        data['count'] = self._num_samples
+        data['sum'] = self._sample_total
+        data['min'] = self._min_sample
+        data['max'] = self._max_sample
+        data['avg'] = self.average_sample
+        data['percentiles'] = self.percentiles()
+        data['buckets'] = [list(bucket) for bucket in self.buckets()]
+        return data
+
 
 class Histogram(object):
     """
     Histogram Object
     """
-    def __init__(self, name, num_buckets, units):
+    def __init__(self, name, units,
+                 significant_digits=DEFAULT_SIGNIFICANT_DIGITS):
         self._name = name
         self._units = units
-        self._num_buckets = num_buckets
+        self._significant_digits = significant_digits
         self._created_date = datetime.datetime.now()
         self._reset_date = self._created_date
-        self._sample_total = 0
-        self._num_samples = 0
-        self._average_sample = None
-        self._max_sample = -1
         self._max_sample_date = None
-        self._buckets = array.array("L", [0] * num_buckets)
+        self._data = HistogramData(significant_digits)
+        self._slices = collections.deque(
+            maxlen=max(seconds for _, seconds in WINDOWS) //
+            WINDOW_SLICE_IN_SECS)
 
     @property
     def name(self):
@@ -36,60 +267,80 @@ class Histogram(object):
         """
         return self._name
 
-    def add_data(self, sample):
+    @property
+    def units(self):
         """
-        Convert data given to the nearest power of two.
+        Returns the units of the samples
         """
-        sample_as_int = int(sample)
-        if 0 == sample_as_int:
-            bucket_idx = sample_as_int.bit_length()
-        else:
-            bucket_idx = (sample_as_int - 1).bit_length()
+        return self._units
 
-        if bucket_idx > self._num_buckets:
-            bucket_idx = self._num_buckets - 1
+    def add_data(self, sample):
+        """
+        Add a sample to the histogram and to the current window slice
+        """
+        slice_id = int(_now_ms() // (WINDOW_SLICE_IN_SECS * 1000))
+        if not self._slices or self._slices[-1][0] != slice_id:
+            self._slices.append(
+                (slice_id, HistogramData(self._significant_digits)))
+        self._slices[-1][1].add_data(sample)
 
-        if sample_as_int > self._max_sample:
-            self._max_sample = sample_as_int
+        if self._data.max_sample is None or sample > self._data.max_sample:
             self._max_sample_date = datetime.datetime.now()
-
-        self._sample_total += sample_as_int
-        self._num_samples += 1
-        self._average_sample = (self._sample_total / self._num_samples)
-
-        self._buckets[bucket_idx] += 1
+        self._data.add_data(sample)
 
     def reset_data(self):
         """
         Clear out the collected samples.
         """
         self._reset_date = datetime.datetime.now()
-        self._sample_total = 0
-        self._num_samples = 0
-        self._average_sample = None
-        self._max_sample = -1
         self._max_sample_date = None
-        for idx, _ in enumerate(self._buckets):
-            self._buckets[idx] = 0
+        self._data = HistogramData(self._significant_digits)
+        self._slices.clear()
 
-    @staticmethod
-    def _scale_sample(scale_min, scale_max, sample_min, sample_max, sample):
+    def snapshot(self, window_in_secs=None):
         """
-        Normalize sample to be compared with other samples
+        Returns a copy of the samples collected over the last window of
+        seconds, all samples since the last reset if no window is given
         """
-        if scale_min == scale_max:
-            return sample
-
-        if sample_min == sample_max:
-            return sample
-
-        return ((((scale_max - scale_min) * (sample - sample_min)) /
-                 (sample_max - sample_min)) + sample_max)
-
-    def display_data(self, pretty_format=True):
+        if window_in_secs is None:
+            return self._data.copy()
+
+        oldest_slice_id = (int(_now_ms() // (WINDOW_SLICE_IN_SECS * 1000)) -
+                           window_in_secs // WINDOW_SLICE_IN_SECS)
+        data = HistogramData(self._significant_digits)
+        for slice_id, slice_data in self._slices:
+            if slice_id > oldest_slice_id:
+                data.merge(slice_data)
+        return data
+
+    def as_dict(self):
+        """
+        Represent the histogram as a dictionary, with the samples of each
+        window
         """
-        Output the histogram to a log.
+        windows = collections.OrderedDict()
+        windows[WINDOW_ALL] = self.snapshot().as_dict()
+        for window_name, window_in_secs in WINDOWS:
+            windows[window_name] = self.snapshot(window_in_secs).as_dict()
+
+        data = dict()
+        data['name'] = self._name
+        data['units'] = self._units
+        data['significant_digits'] = self._significant_digits
+        data['created_date'] = str(self._created_date)
+        data['reset_date'] = str(self._reset_date)
+        data['windows'] = windows
+        return data
+
+    def display_data(self, pretty_format=True, data=None):
         """
+        Output the histogram to a log, bucket counts are grouped up to each
+        power of two. The samples output are those of the snapshot given,
+        or of one taken now.
+        """
+        if data is None:
+            data = self.snapshot()
+
         date_str = ""
         values_str = ""
 
@@ -98,15 +349,20 @@ class Histogram(object):
             if self._reset_date is not None:
                 date_str += "  reset-date: %s" % self._reset_date
 
-            values_str += "  total: %s" % self._num_samples
+            values_str += "  total: %s" % data.num_samples
 
-            if self._average_sample is not None:
-                values_str += "  avg: %s" % self._average_sample
+            if data.average_sample is not None:
+                values_str += "  avg: %s" % data.average_sample
 
             if self._max_sample_date is not None:
-                values_str += ("  max: %s (%s)" % (self._max_sample,
+                values_str += ("  max: %s (%s)" % (data.max_sample,
                                                    self._max_sample_date))
 
+            if 0 < data.num_samples:
+                values_str += "  %s" % "  ".join(
+                    "%s: %s" % (name, value)
+                    for name, value in data.percentiles().items())
+
             DLOG.info("%s" % '-' * 120)
 
         DLOG.info("Histogram: %s" % self._name)
@@ -117,25 +373,32 @@ class Histogram(object):
         if "" != values_str:
             DLOG.info("  %s" % values_str)
 
-        for idx, bucket_value in enumerate(self._buckets):
-            if 0 != bucket_value:
-                if pretty_format:
-                    scaled_bucket_value \
-                        = self._scale_sample(0, 60, 0, self._max_sample,
-                                             bucket_value)
-
-                    DLOG.info("    %03i [up to %03i %s]: %07i %s"
-                              % (idx, math.pow(2, idx), self._units, bucket_value,
-                                 '*' * min(60, scaled_bucket_value)))
-                else:
-                    DLOG.info("    %03i [up to %03i %s]: %07i"
-                              % (idx, math.pow(2, idx), self._units, bucket_value))
+        groups = collections.OrderedDict()
+        for _, high, count in data.buckets():
+            group_idx = max(0, high - 1).bit_length()
+            groups[group_idx] = groups.get(group_idx, 0) + count
+
+        max_count = max(groups.values()) if groups else 0
+        for idx, bucket_value in groups.items():
+            if pretty_format:
+                scaled_bucket_value = bucket_value * 60 // max_count
+                DLOG.info("    %03i [up to %03i %s]: %07i %s"
+                          % (idx, 2 ** idx, self._units, bucket_value,
+                             '*' * max(1, scaled_bucket_value)))
+            else:
+                DLOG.info("    %03i [up to %03i %s]: %07i"
+                          % (idx, 2 ** idx, self._units, bucket_value))
 
         if pretty_format:
             DLOG.info("%s" % '-' * 120)
 
 
+_lock = threading.Lock()
 _histograms = dict()
+_export_dir = None
+_export_process_name = None
+_export_interval_in_ms = 0
+_last_export_ms = None
 
 
 def _find_histogram(name):
@@ -147,41 +410,177 @@ def _find_histogram(name):
     return None
 
 
-def add_histogram_data(name, sample, units):
+def add_histogram_data(name, sample, units,
+                       significant_digits=DEFAULT_SIGNIFICANT_DIGITS):
     """
-    Add a sample to a histogram
+    Add a sample to a histogram, created with the given units and precision
+    the first time
     """
     global _histograms
 
-    histogram = _find_histogram(name)
-    if histogram is None:
-        histogram = Histogram(name, 16, units)
-        _histograms[name] = histogram
+    with _lock:
+        histogram = _find_histogram(name)
+        if histogram is None:
+            histogram = Histogram(name, units, significant_digits)
+            _histograms[name] = histogram
 
-    histogram.add_data(sample)
+        histogram.add_data(sample)
 
 
 def reset_histogram_data(name=None):
     """
     Reset histogram data
     """
-    if name is None:
-        for histogram in _histograms.values():
-            histogram.reset_data()
-    else:
-        histogram = _find_histogram(name)
-        if histogram is not None:
-            histogram.reset_data()
+    with _lock:
+        if name is None:
+            for histogram in _histograms.values():
+                histogram.reset_data()
+        else:
+            histogram = _find_histogram(name)
+            if histogram is not None:
+                histogram.reset_data()
 
 
 def display_histogram_data(name=None, pretty_format=True):
     """
     Display histogram data captured
     """
-    if name is None:
-        for histogram in _histograms.values():
-            histogram.display_data(pretty_format)
+    with _lock:
+        if name is None:
+            histograms = list(_histograms.values())
+        else:
+            histograms = [_histograms[name]] if name in _histograms else []
+        snapshots = [(histogram, histogram.snapshot())
+                     for histogram in histograms]
+
+    for histogram, data in snapshots:
+        histogram.display_data(pretty_format, data)
+
+
+def get_histogram_data(process_name=None):
+    """
+    Returns the histogram data captured by this process as a dictionary
+    """
+    with _lock:
+        histograms = [_histograms[name].as_dict()
+                      for name in sorted(_histograms)]
+
+    data = dict()
+    data['process'] = process_name or _export_process_name
+    data['date'] = str(datetime.datetime.now())
+    data['histograms'] = histograms
+    return data
+
+
+def _escape_label_value(value):
+    """
+    Escape a prometheus label value
+    """
+    return (value.replace('\\', '\\\\').replace('\n', '\\n')
+            .replace('"', '\\"'))
+
+
+def format_histogram_data_prometheus(histogram_data_list):
+    """
+    Format the histogram data of one or more processes in the prometheus
+    text format, each histogram window is a summary
+    """
+    lines = ["# HELP nfv_histogram Samples captured by the NFV histograms.",
+             "# TYPE nfv_histogram summary"]
+
+    for histogram_data in histogram_data_list:
+        process_name = histogram_data.get('process') or ''
+        for histogram in histogram_data['histograms']:
+            for window_name, window in histogram['windows'].items():
+                labels = ('process="%s",name="%s",units="%s",window="%s"'
+                          % (_escape_label_value(process_name),
+                             _escape_label_value(histogram['name']),
+                             _escape_label_value(histogram['units']),
+                             window_name))
+                for percentile in PERCENTILES:
+                    value = window['percentiles'][_percentile_name(percentile)]
+                    if value is not None:
+                        lines.append('nfv_histogram{%s,quantile="%g"} %s'
+                                     % (labels, percentile / 100.0, value))
+                lines.append('nfv_histogram_sum{%s} %s'
+                             % (labels, window['sum']))
+                lines.append('nfv_histogram_count{%s} %s'
+                             % (labels, window['count']))
+
+    return "\n".join(lines) + "\n"
+
+
+def _write_file(file_name, contents):
+    """
+    Write a file, replacing the previous file only once written
+    """
+    tmp_file_name = file_name + '.tmp'
+    with open(tmp_file_name, 'w') as f:
+        f.write(contents)
+    os.rename(tmp_file_name, file_name)
+
+
+def export_histogram_data(force=False):
+    """
+    Export the histogram data captured by this process to the export
+    directory as json and in the prometheus text format, unless already
+    exported within the export interval
+    """
+    global _last_export_ms
+
+    if _export_dir is None:
+        return
+
+    now_ms = _now_ms()
+    if not force:
+        if 0 >= _export_interval_in_ms:
+            return
+        if _last_export_ms is not None:
+            if _export_interval_in_ms > now_ms - _last_export_ms:
+                return
+    _last_export_ms = now_ms
+
+    histogram_data = get_histogram_data()
+    file_name = os.path.join(_export_dir, _export_process_name)
+    try:
+        if not os.path.isdir(_export_dir):
+            os.makedirs(_export_dir)
+        _write_file(file_name + '.json', json.dumps(histogram_data))
+        _write_file(file_name + '.prom',
+                    format_histogram_data_prometheus([histogram_data]))
+    except (IOError, OSError) as e:
+        DLOG.error("Failed to export histograms to %s, error=%s."
+                   % (_export_dir, e))
+
+
+def load_histogram_data(export_dir):
+    """
+    Returns the histogram data exported by each process to a directory
+    """
+    histogram_data_list = list()
+    for file_name in sorted(glob.glob(os.path.join(export_dir, '*.json'))):
+        try:
+            with open(file_name, 'r') as f:
+                histogram_data_list.append(json.load(f))
+        except (IOError, ValueError) as e:
+            DLOG.info("Skipping histograms in %s, error=%s." % (file_name, e))
+    return histogram_data_list
+
+
+def histogram_initialize(config, process_name):
+    """
+    Initialize the histogram module, histograms are exported to the
+    directory configured, if any
+    """
+    global _export_dir, _export_process_name, _export_interval_in_ms
+    global _last_export_ms
+
+    _export_process_name = process_name
+    _last_export_ms = None
+    if config is None or not config.get('export_dir'):
+        _export_dir = None
+        _export_interval_in_ms = 0
     else:
-        histogram = _find_histogram(name)
-        if histogram is not None:
-            histogram.display_data(pretty_format)
+        _export_dir = config['export_dir']
+        _export_interval_in_ms = \
+            int(config.get('export_interval', 60)) * 1000
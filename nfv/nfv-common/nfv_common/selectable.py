@@ -32,6 +32,10 @@ class ThreadQueue(object):
         except threading_queue.Empty:
             return None
 
+    def close(self):
+        self._send_socket.close()
+        self._receive_socket.close()
+
 
 class MultiprocessQueue(object):
     def __init__(self):
@@ -54,7 +58,10 @@ class MultiprocessQueue(object):
 
     def close(self):
         self._queue.close()
-        if self._queue._writer is not None:
+        # The feeder thread closes the writer once it has flushed the queue,
+        # wait for it rather than closing the writer underneath it
+        self._queue.join_thread()
+        if self._queue._writer is not None and \
+                not self._queue._writer.closed:
             # Fix memory leak with pipes in the multiprocessing.queue module
             self._queue._writer.close()
-        self._queue.join_thread()
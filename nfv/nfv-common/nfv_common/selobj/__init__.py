@@ -12,3 +12,4 @@ from nfv_common.selobj._selobj_module import selobj_del_write_obj  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_dispatch  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_finalize  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_initialize  # noqa: F401
+from nfv_common.selobj._selobj_poller import SELOBJ_BACKEND  # noqa: F401
@@ -9,11 +9,23 @@ import socket
 
 from nfv_common import debug
 
+from nfv_common.selobj._selobj_poller import create_poller
+from nfv_common.selobj._selobj_poller import SELOBJ_BACKEND
+
 DLOG = debug.debug_get_logger('nfv_common.selobj')
 
 _read_callbacks = dict()
 _write_callbacks = dict()
 _error_callbacks = dict()
+_poller = create_poller(SELOBJ_BACKEND.SELECT)
+
+
+def _selobj_update(selobj):
+    """
+    Update the events the poller watches for on a selection object
+    """
+    _poller.update(selobj, selobj in _read_callbacks,
+                   selobj in _write_callbacks)
 
 
 def selobj_add_read_obj(selobj, callback, *callback_args, **callback_kwargs):
@@ -25,6 +37,7 @@ def selobj_add_read_obj(selobj, callback, *callback_args, **callback_kwargs):
 
     coroutine = callback(*callback_args, **callback_kwargs)
     _read_callbacks[selobj] = coroutine
+    _selobj_update(selobj)
 
 
 def selobj_del_read_obj(selobj):
@@ -35,6 +48,7 @@ def selobj_del_read_obj(selobj):
 
     if selobj in list(_read_callbacks):
         _read_callbacks.pop(selobj)
+        _selobj_update(selobj)
 
 
 def selobj_add_write_obj(selobj, callback, *callback_args, **callback_kwargs):
@@ -46,6 +60,7 @@ def selobj_add_write_obj(selobj, callback, *callback_args, **callback_kwargs):
 
     coroutine = callback(*callback_args, **callback_kwargs)
     _write_callbacks[selobj] = coroutine
+    _selobj_update(selobj)
 
 
 def selobj_del_write_obj(selobj):
@@ -56,6 +71,7 @@ def selobj_del_write_obj(selobj):
 
     if selobj in list(_write_callbacks):
         _write_callbacks.pop(selobj)
+        _selobj_update(selobj)
 
 
 def selobj_add_error_callback(selobj, callback, *callback_args,
@@ -90,12 +106,8 @@ def selobj_dispatch(timeout_in_ms):
 
     global _read_callbacks, _write_callbacks, _error_callbacks
 
-    read_objs = list(_read_callbacks)
-    write_objs = list(_write_callbacks)
-
     try:
-        readable, writeable, in_error = select.select(read_objs, write_objs, [],
-                                                      timeout_in_ms / 1000.0)
+        readable, writeable, in_error = _poller.poll(timeout_in_ms)
 
         for selobj in readable:
             callback = _read_callbacks.get(selobj, None)
@@ -105,9 +117,10 @@ def selobj_dispatch(timeout_in_ms):
                     callback.send(selobj)
                 except StopIteration:
                     _read_callbacks.pop(selobj)
+                    _selobj_update(selobj)
                 elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
                 histogram.add_histogram_data("selobj read: " + callback.__name__,
-                                             elapsed_ms / 100, "decisecond")
+                                             elapsed_ms, "ms")
 
         for selobj in writeable:
             callback = _write_callbacks.get(selobj, None)
@@ -117,9 +130,10 @@ def selobj_dispatch(timeout_in_ms):
                     callback.send(selobj)
                 except StopIteration:
                     _write_callbacks.pop(selobj)
+                    _selobj_update(selobj)
                 elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
                 histogram.add_histogram_data("selobj write: " + callback.__name__,
-                                             elapsed_ms / 100, "decisecond")
+                                             elapsed_ms, "ms")
 
         for selobj in in_error:
             callback = _error_callbacks.get(selobj, None)
@@ -131,7 +145,7 @@ def selobj_dispatch(timeout_in_ms):
                     _error_callbacks.pop(selobj)
                 elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
                 histogram.add_histogram_data("selobj error: " + callback.__name__,
-                                             elapsed_ms / 100, "decisecond")
+                                             elapsed_ms, "ms")
 
             if selobj in list(_read_callbacks):
                 _read_callbacks.pop(selobj)
@@ -139,16 +153,24 @@ def selobj_dispatch(timeout_in_ms):
             if selobj in list(_write_callbacks):
                 _write_callbacks.pop(selobj)
 
+            _selobj_update(selobj)
+
     except (OSError, socket.error, select.error) as e:
         if errno.EINTR == e.args[0]:
             pass
 
 
-def selobj_initialize():
+def selobj_initialize(backend=SELOBJ_BACKEND.SELECT):
     """
-    Initialize the selection object module
+    Initialize the selection object module, backend selects how selection
+    objects are polled
     """
-    global _read_callbacks, _write_callbacks
+    global _read_callbacks, _write_callbacks, _poller
+
+    _poller.close()
+    _poller = create_poller(backend)
+    DLOG.info("Selection objects polled using %s."
+              % _poller.__class__.__name__)
 
     del _read_callbacks
     _read_callbacks = dict()  # noqa: F841
@@ -161,7 +183,10 @@ def selobj_finalize():
     """
     Finalize the selection object module
     """
-    global _read_callbacks, _write_callbacks
+    global _read_callbacks, _write_callbacks, _poller
+
+    _poller.close()
+    _poller = create_poller(SELOBJ_BACKEND.SELECT)
 
     del _read_callbacks
     _read_callbacks = dict()  # noqa: F841
@@ -0,0 +1,251 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import errno
+import select
+import six
+
+from nfv_common import debug
+from nfv_common.helpers import Constant
+from nfv_common.helpers import Constants
+from nfv_common.helpers import Singleton
+
+try:
+    import selectors
+except ImportError:
+    selectors = None
+
+DLOG = debug.debug_get_logger('nfv_common.selobj.poller')
+
+
+@six.add_metaclass(Singleton)
+class SelobjBackend(Constants):
+    """
+    Selection Object Backend Constants
+    """
+    SELECT = Constant('select')
+    EPOLL = Constant('epoll')
+
+
+# Constant Instantiation
+SELOBJ_BACKEND = SelobjBackend()
+
+
+def _fileno(selobj):
+    """
+    Returns the file descriptor of a selection object
+    """
+    if isinstance(selobj, six.integer_types):
+        return selobj
+    return selobj.fileno()
+
+
+class SelectPoller(object):
+    """
+    Selection Object Poller using select, the read and write lists are
+    rebuilt on every poll
+    """
+    def __init__(self):
+        self._read_objs = set()
+        self._write_objs = set()
+
+    def update(self, selobj, readable, writeable):
+        """
+        Update the events a selection object is polled for
+        """
+        if readable:
+            self._read_objs.add(selobj)
+        else:
+            self._read_objs.discard(selobj)
+
+        if writeable:
+            self._write_objs.add(selobj)
+        else:
+            self._write_objs.discard(selobj)
+
+    def poll(self, timeout_in_ms):
+        """
+        Returns the selection objects that are readable, writeable and
+        in error
+        """
+        return select.select(list(self._read_objs), list(self._write_objs),
+                             [], timeout_in_ms / 1000.0)
+
+    def close(self):
+        """
+        Release the poller
+        """
+        self._read_objs.clear()
+        self._write_objs.clear()
+
+
+class EpollPoller(object):
+    """
+    Selection Object Poller using epoll, file descriptors are registered
+    once and only the ready ones are returned by a poll
+    """
+    def __init__(self):
+        self._epoll = select.epoll()
+        self._registered = dict()
+        self._selobjs = dict()
+
+    def _unregister(self, selobj):
+        """
+        Remove a selection object from the epoll set
+        """
+        fd, _ = self._registered.pop(selobj)
+        del self._selobjs[fd]
+        try:
+            self._epoll.unregister(fd)
+        except (IOError, OSError, ValueError) as e:
+            # Already gone if the file descriptor was closed first
+            DLOG.verbose("Unregister of fd %s failed, error=%s.", fd, e)
+
+    def update(self, selobj, readable, writeable):
+        """
+        Update the events a selection object is polled for
+        """
+        events = 0
+        if readable:
+            events |= select.EPOLLIN
+        if writeable:
+            events |= select.EPOLLOUT
+
+        registered = self._registered.get(selobj, None)
+        if registered is not None:
+            fd, registered_events = registered
+            if not events:
+                self._unregister(selobj)
+            elif events != registered_events:
+                self._epoll.modify(fd, events)
+                self._registered[selobj] = (fd, events)
+            return
+
+        if not events:
+            return
+
+        fd = _fileno(selobj)
+        stale_selobj = self._selobjs.get(fd, None)
+        if stale_selobj is not None:
+            # File descriptor was closed and reused before being deleted
+            self._unregister(stale_selobj)
+
+        try:
+            self._epoll.register(fd, events)
+        except (IOError, OSError) as e:
+            if errno.EEXIST != e.errno:
+                raise
+            self._epoll.modify(fd, events)
+
+        self._registered[selobj] = (fd, events)
+        self._selobjs[fd] = selobj
+
+    def poll(self, timeout_in_ms):
+        """
+        Returns the selection objects that are readable, writeable and
+        in error
+        """
+        readable = list()
+        writeable = list()
+
+        for fd, events in self._epoll.poll(timeout_in_ms / 1000.0):
+            selobj = self._selobjs.get(fd, None)
+            if selobj is None:
+                continue
+
+            # Report errors and hangups the same way select does, the
+            # callback sees them on its next read or write.
+            if events & (select.EPOLLIN | select.EPOLLERR | select.EPOLLHUP):
+                if self._registered[selobj][1] & select.EPOLLIN:
+                    readable.append(selobj)
+
+            if events & (select.EPOLLOUT | select.EPOLLERR | select.EPOLLHUP):
+                if self._registered[selobj][1] & select.EPOLLOUT:
+                    writeable.append(selobj)
+
+        return readable, writeable, list()
+
+    def close(self):
+        """
+        Release the poller
+        """
+        self._registered.clear()
+        self._selobjs.clear()
+        self._epoll.close()
+
+
+class SelectorsPoller(object):
+    """
+    Selection Object Poller using the best selector available on the
+    platform, used when epoll is not available
+    """
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+
+    def update(self, selobj, readable, writeable):
+        """
+        Update the events a selection object is polled for
+        """
+        events = 0
+        if readable:
+            events |= selectors.EVENT_READ
+        if writeable:
+            events |= selectors.EVENT_WRITE
+
+        try:
+            key = self._selector.get_key(selobj)
+        except (KeyError, ValueError):
+            key = None
+
+        if key is None:
+            if events:
+                self._selector.register(selobj, events)
+        elif not events:
+            self._selector.unregister(selobj)
+        elif events != key.events:
+            self._selector.modify(selobj, events)
+
+    def poll(self, timeout_in_ms):
+        """
+        Returns the selection objects that are readable, writeable and
+        in error
+        """
+        readable = list()
+        writeable = list()
+
+        for key, events in self._selector.select(timeout_in_ms / 1000.0):
+            if events & selectors.EVENT_READ:
+                readable.append(key.fileobj)
+            if events & selectors.EVENT_WRITE:
+                writeable.append(key.fileobj)
+
+        return readable, writeable, list()
+
+    def close(self):
+        """
+        Release the poller
+        """
+        self._selector.close()
+
+
+def create_poller(backend):
+    """
+    Create a selection object poller for the given backend
+    """
+    if SELOBJ_BACKEND.EPOLL == backend:
+        if hasattr(select, 'epoll'):
+            return EpollPoller()
+
+        if selectors is not None:
+            DLOG.info("Epoll not available, using selectors.")
+            return SelectorsPoller()
+
+        DLOG.info("Epoll not available, using select.")
+
+    elif SELOBJ_BACKEND.SELECT != backend:
+        DLOG.error("Unknown selection object backend %s, using select."
+                   % backend)
+
+    return SelectPoller()
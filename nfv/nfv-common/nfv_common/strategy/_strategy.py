@@ -48,6 +48,9 @@ class Strategy(object):
         apply_phase.strategy = self
         abort_phase.strategy = self
 
+        self._changed_stages = None
+        self._saved_stage_counts = None
+
         self._phase = dict()
         self._phase[STRATEGY_PHASE.BUILD] = build_phase
         self._phase[STRATEGY_PHASE.APPLY] = apply_phase
@@ -107,6 +110,14 @@ class Strategy(object):
         """
         return self._phase[STRATEGY_PHASE.ABORT]
 
+    @property
+    def changed_stages(self):
+        """
+        Returns the phase name and id of the stages changed since the last
+        save, None if any part of the strategy may have changed
+        """
+        return self._changed_stages
+
     def is_building(self):
         """
         Returns true if the strategy is building
@@ -335,11 +346,30 @@ class Strategy(object):
 
         return handled
 
-    def phase_save(self):
+    def phase_save(self, phase=None, stage=None):
         """
         Strategy Phase Save
         """
-        self.save()
+        stage_counts = [self.build_phase.total_stages,
+                        self.apply_phase.total_stages,
+                        self.abort_phase.total_stages]
+
+        # Stages added or removed since the last phase save, or a strategy
+        # not saved this way yet, need the whole strategy saved
+        if phase is not None and stage_counts == self._saved_stage_counts:
+            if stage is None:
+                # The phase may have just moved on from the previous stage
+                stage_ids = [phase.current_stage - 1, phase.current_stage]
+            else:
+                stage_ids = [stage.id]
+            self._changed_stages = [(phase.name, stage_id)
+                                    for stage_id in stage_ids
+                                    if 0 <= stage_id < phase.total_stages]
+        self._saved_stage_counts = stage_counts
+        try:
+            self.save()
+        finally:
+            self._changed_stages = None
 
     def phase_extend_timeout(self, phase):
         """
@@ -496,9 +526,10 @@ class Strategy(object):
                           abort_phase)
         return self
 
-    def as_dict(self):
+    def as_dict(self, include_stages=True):
         """
-        Represent the strategy as a dictionary
+        Represent the strategy as a dictionary, the phases without their
+        stages if include_stages is false
         """
         data = dict()
         data['uuid'] = self.uuid
@@ -516,9 +547,9 @@ class Strategy(object):
                 = self.abort_phase.completion_percentage
         else:
             data['current_phase_completion_percentage'] = 0
-        data['build_phase'] = self.build_phase.as_dict()
-        data['apply_phase'] = self.apply_phase.as_dict()
-        data['abort_phase'] = self.abort_phase.as_dict()
+        data['build_phase'] = self.build_phase.as_dict(include_stages)
+        data['apply_phase'] = self.apply_phase.as_dict(include_stages)
+        data['abort_phase'] = self.abort_phase.as_dict(include_stages)
         return data
 
     def as_json(self):
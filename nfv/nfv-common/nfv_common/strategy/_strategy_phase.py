@@ -228,12 +228,12 @@ class StrategyPhase(object):
         stage.phase = self
         self._stages.append(stage)
 
-    def _save(self):
+    def _save(self, stage=None):
         """
         Phase Save
         """
         if self.strategy is not None:
-            self.strategy.phase_save()
+            self.strategy.phase_save(self, stage)
         else:
             DLOG.info("Strategy reference is invalid for phase (%s)." % self._name)
 
@@ -460,11 +460,11 @@ class StrategyPhase(object):
         else:
             self.refresh_timeouts()
 
-    def stage_save(self):
+    def stage_save(self, stage=None):
         """
         Strategy Stage Save
         """
-        self._save()
+        self._save(stage)
 
     def refresh_timeouts(self):
         """
@@ -594,9 +594,10 @@ class StrategyPhase(object):
 
         return self
 
-    def as_dict(self):
+    def as_dict(self, include_stages=True):
         """
-        Represent the strategy phase as a dictionary
+        Represent the strategy phase as a dictionary, without the stages if
+        include_stages is false
         """
         data = dict()
         data['name'] = self.name
@@ -606,9 +607,10 @@ class StrategyPhase(object):
         data['current_stage'] = self._current_stage
         data['stop_at_stage'] = self._stop_at_stage
         data['total_stages'] = len(self._stages)
-        data['stages'] = list()
-        for stage in self._stages:
-            data['stages'].append(stage.as_dict())
+        if include_stages:
+            data['stages'] = list()
+            for stage in self._stages:
+                data['stages'].append(stage.as_dict())
         data['result'] = self._result
         data['result_reason'] = self._result_reason
         data['start_date_time'] = self._start_date_time
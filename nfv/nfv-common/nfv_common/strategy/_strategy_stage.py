@@ -203,7 +203,7 @@ class StrategyStage(object):
         import os
 
         if self.phase is not None:
-            self.phase.stage_save()
+            self.phase.stage_save(self)
         else:
             caller = inspect.currentframe().f_back
             _, filename = os.path.split(caller.f_code.co_filename)
@@ -574,9 +574,10 @@ class StrategyStage(object):
 
         return self
 
-    def as_dict(self):
+    def as_dict(self, include_steps=True):
         """
-        Represent the strategy stage as a dictionary
+        Represent the strategy stage as a dictionary, without the steps if
+        include_steps is false
         """
         data = dict()
         data['id'] = self._id
@@ -585,9 +586,10 @@ class StrategyStage(object):
         data['inprogress'] = self._inprogress
         data['current_step'] = self._current_step
         data['total_steps'] = len(self._steps)
-        data['steps'] = list()
-        for step in self._steps:
-            data['steps'].append(step.as_dict())
+        if include_steps:
+            data['steps'] = list()
+            for step in self._steps:
+                data['steps'].append(step.as_dict())
         data['result'] = self._result
         data['result_reason'] = self._result_reason
         data['start_date_time'] = self._start_date_time
@@ -7,4 +7,5 @@ from nfv_common.tasks._task import Task  # noqa: F401
 from nfv_common.tasks._task import TASK_PRIORITY  # noqa: F401
 from nfv_common.tasks._task_future import TaskFuture  # noqa: F401
 from nfv_common.tasks._task_scheduler import TaskScheduler  # noqa: F401
+from nfv_common.tasks._task_worker import TASK_WORKER_BACKEND  # noqa: F401
 from nfv_common.tasks._task_worker_pool import TaskWorkerPool  # noqa: F401
@@ -55,7 +55,8 @@ class Task(object):
         self._started = False
         self._target = target
         self._work_list = collections.OrderedDict()
-        DLOG.debug("Task created, id=%s, name=%s." % (self._id, self._name))
+        self._queue_waits = dict()
+        DLOG.debug("Task created, id=%s, name=%s.", self._id, self._name)
         Task._id += 1
 
     @property
@@ -127,15 +128,40 @@ class Task(object):
         """
         self._scheduler.cancel_task_io_write_wait(select_obj, self)
 
+    def add_queue_wait(self, queue):
+        """
+        Add a thread queue to wait on
+        """
+        self._queue_waits[queue.selobj] = queue
+        self._scheduler.add_task_io_read_wait(queue.selobj, self)
+
+    def cancel_queue_waits(self):
+        """
+        Cancel the thread queues being waited on, the queues are closed
+        """
+        for select_obj, queue in list(self._queue_waits.items()):
+            self._scheduler.cancel_task_io_read_wait(select_obj, self)
+            queue.close()
+        self._queue_waits.clear()
+
     def io_wait_complete(self, select_obj):
         """
         Called when a selection object being waited on has become
         readable or writeable; the selection object is sent to
-        the tasks co-routine target
-        """
-        task_result = TaskResult(complete=True, selobj_result=True,
-                                 result_data=select_obj,
-                                 ancillary_result_data=None)
+        the tasks co-routine target, or the message if the selection
+        object is that of a thread queue being waited on
+        """
+        queue = self._queue_waits.pop(select_obj, None)
+        if queue is not None:
+            self._scheduler.cancel_task_io_read_wait(select_obj, self)
+            message = queue.get_nowait()
+            queue.close()
+            task_result = TaskResult(complete=True, result_data=message,
+                                     ancillary_result_data=None)
+        else:
+            task_result = TaskResult(complete=True, selobj_result=True,
+                                     result_data=select_obj,
+                                     ancillary_result_data=None)
         self._target.send(task_result)
         self._scheduler.schedule_task(self)
 
@@ -152,12 +178,12 @@ class Task(object):
         Task work has been completed, send result to the task target
         (results are sent in order the task work was scheduled)
         """
-        DLOG.verbose("TaskWork complete, name=%s." % task_work.name)
+        DLOG.verbose("TaskWork complete, name=%s.", task_work.name)
 
         state, _ = self._work_list[task_work.id]
         if Task._TIMEOUT == state:
             DLOG.verbose("TaskWork already marked as timed out, ignoring "
-                         "completed result, name=%s." % task_work.name)
+                         "completed result, name=%s.", task_work.name)
             self._scheduler.schedule_task(self)
             return
 
@@ -208,7 +234,7 @@ class Task(object):
         """
         Run the task
         """
-        DLOG.debug("Task(%s) run, id=%s." % (self._name, self._id))
+        DLOG.debug("Task(%s) run, id=%s.", self._name, self._id)
         if not self._started:
             self._target.send(None)
             self._scheduler.reschedule_task(self)
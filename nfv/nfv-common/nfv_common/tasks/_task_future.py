@@ -141,6 +141,17 @@ class TaskFuture(object):
         else:
             raise LookupError("Running task no longer running")
 
+    def queue_wait(self, queue):
+        """
+        Wait on a thread queue, the message put on the queue by another
+        thread is the result; the queue is closed once the message is taken
+        """
+        if self._scheduler.running_task is not None:
+            self._scheduler.running_task.add_queue_wait(queue)
+            self._result = None
+        else:
+            raise LookupError("Running task no longer running")
+
     @property
     def result(self):
         """
@@ -24,6 +24,8 @@ class TaskScheduler(object):
     """
     Task Scheduler
     """
+    POOL_CHECK_INTERVAL_SECS = 1
+
     def __init__(self, name, task_worker_pool):
         """
         Create a task scheduler
@@ -47,6 +49,9 @@ class TaskScheduler(object):
             self._ready_dequeues.append(0)
         self._run_queue = selectable.MultiprocessQueue()
         selobj.selobj_add_read_obj(self._run_queue.selobj, self.run_tasks)
+        self._pool_check_timer_id = timers.timers_create_timer(
+            name + ' [pool-check]', self.POOL_CHECK_INTERVAL_SECS,
+            self.POOL_CHECK_INTERVAL_SECS, self.pool_check)
 
     @property
     def name(self):
@@ -69,8 +74,8 @@ class TaskScheduler(object):
         if inspect.isgeneratorfunction(target):
             future = TaskFuture(self)
             task = Task(self, priority, target(future, *args, **kwargs))
-            DLOG.debug("Pool %s: Add Task, name=%s."
-                       % (self._task_worker_pool.name, task.name))
+            DLOG.debug("Pool %s: Add Task, name=%s.",
+                       self._task_worker_pool.name, task.name)
             self.schedule_task(task)
             result = task.id
         else:
@@ -81,8 +86,8 @@ class TaskScheduler(object):
         """
         Delete a task from the task scheduler
         """
-        DLOG.debug("Pool %s: Delete Task, name=%s."
-                   % (self._task_worker_pool.name, task.name))
+        DLOG.debug("Pool %s: Delete Task, name=%s.",
+                   self._task_worker_pool.name, task.name)
         for timer_id, timer_owner in self._task_timers.items():
             if timer_owner.id == task.id:
                 timers.timers_delete_timer(timer_id)
@@ -103,6 +108,8 @@ class TaskScheduler(object):
                 selobj.selobj_del_write_obj(select_obj)
                 del self._task_write_selobjs[select_obj]
 
+        task.cancel_queue_waits()
+
         del self._tasks[task.id]
 
     def add_task_timer(self, name, interval_secs, task):
@@ -236,8 +243,8 @@ class TaskScheduler(object):
         """
         Schedule or Reschedule a task
         """
-        DLOG.verbose("Pool %s: Scheduling Task, name=%s."
-                     % (self._task_worker_pool.name, task.name))
+        DLOG.verbose("Pool %s: Scheduling Task, name=%s.",
+                     self._task_worker_pool.name, task.name)
         self._tasks[task.id] = task
 
         for pri in TASK_PRIORITY:
@@ -274,18 +281,26 @@ class TaskScheduler(object):
         Schedule task work to one of the task workers if available
         """
         if task_work is not None:
-            self._wait_queue.appendleft(task_work)
+            self._wait_queue.appendleft(
+                (timers.get_monotonic_timestamp_in_ms(), task_work))
+            histogram.add_histogram_data(
+                self._task_worker_pool.name + ' [work-queue-depth]',
+                len(self._wait_queue), "work")
 
         if 0 == len(self._wait_queue):
             return False
 
         worker = self._task_worker_pool.claim_worker()
         if worker is not None:
-            task_work = self._wait_queue.pop()
+            queued_ms, task_work = self._wait_queue.pop()
+            wait_ms = timers.get_monotonic_timestamp_in_ms() - queued_ms
+            histogram.add_histogram_data(
+                self._task_worker_pool.name + ' [work-wait-time]',
+                wait_ms, "ms")
 
             DLOG.verbose("Pool %s: Task worker available to run TaskWork, "
-                         "name=%s." % (self._task_worker_pool.name,
-                                       task_work.name))
+                         "name=%s.", self._task_worker_pool.name,
+                         task_work.name)
 
             selobj.selobj_add_read_obj(worker.selobj, self.task_work_complete)
             self._workers_selobj[worker.selobj] = worker
@@ -300,8 +315,8 @@ class TaskScheduler(object):
                 self._workers_timer[timer_id] = worker
             return True
         else:
-            DLOG.verbose("Pool %s: No task worker available to run TaskWork."
-                         % self._task_worker_pool.name)
+            DLOG.verbose("Pool %s: No task worker available to run TaskWork.",
+                         self._task_worker_pool.name)
             return False
 
     @coroutine
@@ -344,10 +359,11 @@ class TaskScheduler(object):
         timer_id = (yield)
         worker = self._workers_timer.get(timer_id, None)
         if worker is not None:
-            self._task_worker_pool.timeout_worker(worker)
+            # Stopping the worker closes its selection object
             selobj.selobj_del_read_obj(worker.selobj)
             del self._workers_selobj[worker.selobj]
             del self._workers_timer[timer_id]
+            self._task_worker_pool.timeout_worker(worker)
 
             task_work = self._task_work_timers.get(timer_id, None)
             if task_work is not None:
@@ -362,6 +378,21 @@ class TaskScheduler(object):
             if self._task_worker_pool.available_workers():
                 self.schedule_task_work()
 
+    @coroutine
+    def pool_check(self):
+        """
+        Called periodically to let the task worker pool scale to the work
+        waiting for it
+        """
+        while True:
+            (yield)
+            wait_ms = None
+            if self._wait_queue:
+                queued_ms, _ = self._wait_queue[-1]
+                wait_ms = timers.get_monotonic_timestamp_in_ms() - queued_ms
+            if self._task_worker_pool.check(wait_ms):
+                self.schedule_task_work()
+
     @coroutine
     def run_tasks(self):
         """
@@ -373,15 +404,14 @@ class TaskScheduler(object):
                 self._tasks_scheduled = False
                 task_id = self._run_queue.get()
                 if self._tasks:
-                    DLOG.verbose("Pool %s: Total tasks=%s."
-                                 % (self._task_worker_pool.name,
-                                    len(self._tasks)))
+                    DLOG.verbose("Pool %s: Total tasks=%s.",
+                                 self._task_worker_pool.name, len(self._tasks))
                     self._running_task = self._tasks.get(task_id, None)
                     if self._running_task is not None:
                         try:
-                            DLOG.verbose("Pool %s: Running task, name=%s."
-                                         % (self._task_worker_pool.name,
-                                            self._running_task.name))
+                            DLOG.verbose("Pool %s: Running task, name=%s.",
+                                         self._task_worker_pool.name,
+                                         self._running_task.name)
                             self._running_task.run()
 
                         except StopIteration:
@@ -393,5 +423,5 @@ class TaskScheduler(object):
                     self._schedule_next_task()
 
                 else:
-                    DLOG.verbose("Pool %s: No tasks to schedule."
-                                 % self._task_worker_pool.name)
+                    DLOG.verbose("Pool %s: No tasks to schedule.",
+                                 self._task_worker_pool.name)
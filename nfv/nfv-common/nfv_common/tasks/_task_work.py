@@ -33,8 +33,8 @@ class TaskWork(object):
         self._ancillary_result_data = None
         self._create_timestamp_ms = timers.get_monotonic_timestamp_in_ms()
 
-        DLOG.debug("TaskWork created, id=%s, name=%s, timeout_in_secs=%i."
-                   % (self._id, self._name, self._timeout_in_secs))
+        DLOG.debug("TaskWork created, id=%s, name=%s, timeout_in_secs=%i.",
+                   self._id, self._name, self._timeout_in_secs)
         TaskWork._id += 1
 
     @property
@@ -98,7 +98,7 @@ class TaskWork(object):
         """
         Runs the task work
         """
-        DLOG.debug("TaskWork run, id=%s, name=%s." % (self._id, self._name))
+        DLOG.debug("TaskWork run, id=%s, name=%s.", self._id, self._name)
         try:
             result = self._target(*self._args, **self._kwargs)
             if isinstance(result, Result):
@@ -3,14 +3,60 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import six
+import threading
+
 from nfv_common import debug
 from nfv_common import histogram
+from nfv_common import selectable
 from nfv_common import thread
 from nfv_common import timers
 
+from nfv_common.helpers import Constant
+from nfv_common.helpers import Constants
+from nfv_common.helpers import Singleton
+
 DLOG = debug.debug_get_logger('nfv_common.tasks.task_worker')
 
 
+@six.add_metaclass(Singleton)
+class TaskWorkerBackend(Constants):
+    """
+    Task Worker Backend Constants
+    """
+    PROCESS = Constant('process')
+    THREAD = Constant('thread')
+
+
+# Constant Instantiation
+TASK_WORKER_BACKEND = TaskWorkerBackend()
+
+
+def _task_work_result_histograms(result):
+    """
+    Record how long task work took to run and how it connected
+    """
+    if hasattr(result.ancillary_result_data, 'execution_time'):
+        histogram.add_histogram_data(
+            result.name + ' [worker-execution-time]',
+            result.ancillary_result_data.execution_time * 1000, 'ms')
+
+    if hasattr(result.ancillary_result_data, 'connection_reused'):
+        if result.ancillary_result_data.connection_reused:
+            histogram.add_histogram_data(
+                result.name + ' [connection-pool-hit]', 1, 'requests')
+        else:
+            histogram.add_histogram_data(
+                result.name + ' [connection-pool-miss]', 1, 'requests')
+            histogram.add_histogram_data(
+                result.name + ' [connect-time]',
+                result.ancillary_result_data.connect_time * 1000, 'ms')
+
+    now_ms = timers.get_monotonic_timestamp_in_ms()
+    histogram.add_histogram_data(result.name + ' [execution-time]',
+                                 now_ms - result.create_timestamp_ms, 'ms')
+
+
 class TaskWorker(thread.ThreadWorker):
     """
     Task Worker
@@ -82,15 +128,102 @@ class TaskWorkerThread(thread.Thread):
         Returns the result of task work completed
         """
         result = self._worker.get_result()
+        if result is not None:
+            _task_work_result_histograms(result)
+        return result
 
-        if hasattr(result.ancillary_result_data, 'execution_time'):
-            histogram.add_histogram_data(
-                result.name + ' [worker-execution-time]',
-                result.ancillary_result_data.execution_time, 'secs')
 
-        now_ms = timers.get_monotonic_timestamp_in_ms()
-        elapsed_secs = (now_ms - result.create_timestamp_ms) / 1000
-        histogram.add_histogram_data(result.name + ' [execution-time]',
-                                     elapsed_secs, 'secs')
+class TaskWorkerLocalThread(object):
+    """
+    Task Worker Local Thread
 
+    Runs task work on a thread of this process, the task work and its
+    result are handed over by reference rather than pickled through a
+    process. Suited to task work that waits on I/O. A thread cannot be
+    killed, so the task work must bound its own run time (e.g. socket
+    timeouts); a worker that times out is abandoned and its result dropped.
+    """
+    def __init__(self, name):
+        """
+        Create a task worker
+        """
+        self._id = TaskWorkerThread._id
+        self._name = name
+        self._work_queue = six.moves.queue.Queue()
+        self._result_queue = selectable.ThreadQueue(b'r')
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._thread_main, name=name)
+        self._thread.daemon = True
+        TaskWorkerThread._id += 1
+
+    @property
+    def id(self):
+        """
+        Returns a unique identifier for this task worker
+        """
+        return self._id
+
+    @property
+    def name(self):
+        """
+        Returns the name for this task worker
+        """
+        return self._name
+
+    @property
+    def selobj(self):
+        """
+        Returns the selection object that signals when task work is complete
+        """
+        return self._result_queue.selobj
+
+    def _thread_main(self):
+        """
+        Run task work until stopped
+        """
+        while True:
+            task_work = self._work_queue.get()
+            if task_work is None:
+                break
+
+            task_work.run()
+
+            with self._lock:
+                if self._stopped:
+                    DLOG.info("Task worker %s stopped, dropping result of "
+                              "TaskWork %s." % (self._name, task_work.name))
+                    break
+                self._result_queue.put(task_work)
+
+    def start(self):
+        """
+        Start the task worker
+        """
+        self._thread.start()
+
+    def stop(self, max_wait_in_seconds):
+        """
+        Stop the task worker, a thread busy with task work is left to finish
+        it on its own
+        """
+        with self._lock:
+            self._stopped = True
+            self._result_queue.close()
+        self._work_queue.put(None)
+        self._thread.join(max_wait_in_seconds)
+
+    def submit_task_work(self, task_work):
+        """
+        Submit task work for this task worker to execute
+        """
+        self._work_queue.put(task_work)
+
+    def get_task_work_result(self):
+        """
+        Returns the result of task work completed
+        """
+        result = self._result_queue.get_nowait()
+        if result is not None:
+            _task_work_result_histograms(result)
         return result
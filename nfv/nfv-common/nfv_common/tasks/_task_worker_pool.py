@@ -6,7 +6,11 @@
 import collections
 
 from nfv_common import debug
+from nfv_common import histogram
+from nfv_common import timers
 
+from nfv_common.tasks._task_worker import TASK_WORKER_BACKEND
+from nfv_common.tasks._task_worker import TaskWorkerLocalThread
 from nfv_common.tasks._task_worker import TaskWorkerThread
 
 DLOG = debug.debug_get_logger('nfv_common.tasks.task_worker_pool')
@@ -15,22 +19,41 @@ DLOG = debug.debug_get_logger('nfv_common.tasks.task_worker_pool')
 class TaskWorkerPool(object):
     """
     Task Worker Pool
+
+    The pool starts num_workers workers. When max_workers is above that the
+    pool autoscales, a worker is added when work has waited
+    scale_up_wait_secs for one and workers idle for scale_down_idle_secs
+    are stopped, down to num_workers.
+
+    The backend decides what runs the task work, a process per worker or a
+    thread of this process per worker.
     """
-    def __init__(self, pool_name, num_workers=1):
+    def __init__(self, pool_name, num_workers=1, max_workers=None,
+                 scale_up_wait_secs=2, scale_down_idle_secs=60,
+                 backend=TASK_WORKER_BACKEND.PROCESS):
         """
         Create Task Worker Pool
         """
+        if backend not in TASK_WORKER_BACKEND:
+            raise ValueError("Unknown task worker backend %s" % backend)
+
         self._pool_name = pool_name
+        self._backend = backend
+        self._min_workers = max(1, num_workers)
+        self._max_workers = max(self._min_workers, max_workers or 0)
+        self._scale_up_wait_ms = scale_up_wait_secs * 1000
+        self._scale_down_idle_ms = scale_down_idle_secs * 1000
         self._workers_avail = collections.OrderedDict()
+        self._workers_idle_ms = dict()
         self._workers = list()
+        self._next_worker_x = 0
+        self._busy_ms = 0
+        self._busy_since_ms = timers.get_monotonic_timestamp_in_ms()
+        self._check_ms = self._busy_since_ms
+        self._check_busy_ms = 0
 
-        for worker_x in range(num_workers):
-            worker = TaskWorkerThread("%s-Worker-%s" % (pool_name, worker_x))
-            self._workers.append(worker)
-
-        for worker in self._workers:
-            worker.start()
-            self._workers_avail[worker.id] = worker
+        for _ in range(self._min_workers):
+            self._add_worker()
 
     @property
     def name(self):
@@ -39,6 +62,68 @@ class TaskWorkerPool(object):
         """
         return self._pool_name
 
+    @property
+    def backend(self):
+        """
+        Returns the backend running the task work
+        """
+        return self._backend
+
+    @property
+    def autoscale(self):
+        """
+        Returns true if the pool adds and removes workers as needed
+        """
+        return self._max_workers > self._min_workers
+
+    @property
+    def num_workers(self):
+        """
+        Returns the number of workers in the pool
+        """
+        return len(self._workers)
+
+    @property
+    def num_busy_workers(self):
+        """
+        Returns the number of workers doing work
+        """
+        return len(self._workers) - len(self._workers_avail)
+
+    def _add_worker(self, name=None):
+        """
+        Start a worker and make it available
+        """
+        if name is None:
+            name = "%s-Worker-%s" % (self._pool_name, self._next_worker_x)
+            self._next_worker_x += 1
+        if TASK_WORKER_BACKEND.THREAD == self._backend:
+            worker = TaskWorkerLocalThread(name)
+        else:
+            worker = TaskWorkerThread(name)
+        worker.start()
+        self._workers.append(worker)
+        self._workers_avail[worker.id] = worker
+        self._workers_idle_ms[worker.id] = \
+            timers.get_monotonic_timestamp_in_ms()
+        return worker
+
+    def _remove_worker(self, worker):
+        """
+        Forget a worker, it is no longer available
+        """
+        self._workers = [x for x in self._workers if x.id != worker.id]
+        self._workers_avail.pop(worker.id, None)
+        self._workers_idle_ms.pop(worker.id, None)
+
+    def _account_busy(self):
+        """
+        Add up the time workers have been busy for since last called
+        """
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        self._busy_ms += self.num_busy_workers * (now_ms - self._busy_since_ms)
+        self._busy_since_ms = now_ms
+
     def available_workers(self):
         """
         Returns true if there are workers available to do work
@@ -52,8 +137,10 @@ class TaskWorkerPool(object):
         Claims a worker, returns a worker if available or None otherwise
         """
         if self._workers_avail:
+            self._account_busy()
             _, worker = self._workers_avail.popitem()
-            DLOG.verbose("Claim worker %s" % worker.name)
+            self._workers_idle_ms.pop(worker.id, None)
+            DLOG.verbose("Claim worker %s", worker.name)
             return worker
         return None
 
@@ -62,8 +149,11 @@ class TaskWorkerPool(object):
         Release a worker back into the pool
         """
         if worker is not None:
-            DLOG.verbose("Release worker %s" % worker.name)
+            DLOG.verbose("Release worker %s", worker.name)
+            self._account_busy()
             self._workers_avail[worker.id] = worker
+            self._workers_idle_ms[worker.id] = \
+                timers.get_monotonic_timestamp_in_ms()
 
     def timeout_worker(self, worker):
         """
@@ -71,14 +161,56 @@ class TaskWorkerPool(object):
         """
         if worker is not None:
             DLOG.info("Timeout worker %s" % worker.name)
+            self._account_busy()
+            self._remove_worker(worker)
             worker.stop(max_wait_in_seconds=1)
-            new_worker = TaskWorkerThread(worker.name)
-            new_worker.start()
-            self._workers = [x for x in self._workers if x.id == worker.id]
-            self._workers.append(new_worker)
-            self._workers_avail[new_worker.id] = new_worker
+            self._add_worker(worker.name)
             del worker
 
+    def check(self, wait_ms=None):
+        """
+        Record how busy the pool has been since last checked and scale it,
+        wait_ms is how long the oldest work has waited for a worker, None if
+        no work is waiting. Returns true if a worker was added
+        """
+        self._account_busy()
+        now_ms = self._busy_since_ms
+        elapsed_ms = now_ms - self._check_ms
+        if 0 < elapsed_ms:
+            utilisation = (100 * (self._busy_ms - self._check_busy_ms) //
+                           (elapsed_ms * len(self._workers)))
+            histogram.add_histogram_data(
+                self._pool_name + ' [worker-utilisation]', utilisation,
+                "percent")
+        self._check_ms = now_ms
+        self._check_busy_ms = self._busy_ms
+
+        if not self.autoscale:
+            return False
+
+        if wait_ms is not None and self._scale_up_wait_ms <= wait_ms and \
+                len(self._workers) < self._max_workers:
+            worker = self._add_worker()
+            DLOG.info("Pool %s: added worker %s, work waited %s ms, "
+                      "workers=%s." % (self._pool_name, worker.name, wait_ms,
+                                       len(self._workers)))
+            return True
+
+        # The least recently used workers are at the front
+        for worker in list(self._workers_avail.values()):
+            if len(self._workers) <= self._min_workers:
+                break
+            idle_ms = now_ms - self._workers_idle_ms[worker.id]
+            if idle_ms < self._scale_down_idle_ms:
+                break
+            # An idle worker stops by itself, nothing is left behind
+            self._remove_worker(worker)
+            worker.stop(max_wait_in_seconds=1)
+            DLOG.info("Pool %s: removed worker %s, idle for %s ms, "
+                      "workers=%s." % (self._pool_name, worker.name, idle_ms,
+                                       len(self._workers)))
+        return False
+
     def shutdown(self):
         """
         Shutdown the pool of workers
@@ -3,5 +3,13 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+from nfv_common.tcp._tcp_codec import TCP_CODEC  # noqa: F401
+from nfv_common.tcp._tcp_codec import tcp_codec_decode  # noqa: F401
+from nfv_common.tcp._tcp_codec import tcp_codec_detect  # noqa: F401
+from nfv_common.tcp._tcp_codec import tcp_codec_encode  # noqa: F401
 from nfv_common.tcp._tcp_connection import TCPConnection  # noqa: F401
 from nfv_common.tcp._tcp_server import TCPServer  # noqa: F401
+from nfv_common.tcp._tcp_channel import TCPChannel  # noqa: F401
+from nfv_common.tcp._tcp_channel import TCPChannelPool  # noqa: F401
+from nfv_common.tcp._tcp_channel import TCPChannelRequest  # noqa: F401
+from nfv_common.tcp._tcp_connection import TCPRequestConnection  # noqa: F401
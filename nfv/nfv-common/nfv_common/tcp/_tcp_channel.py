@@ -0,0 +1,308 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import socket
+import threading
+
+from six.moves import queue
+
+from nfv_common import debug
+from nfv_common import histogram
+from nfv_common import timers
+
+from nfv_common.tcp._tcp_connection import TCPConnection
+
+DLOG = debug.debug_get_logger('nfv_common.tcp')
+
+
+class TCPChannelRequest(object):
+    """
+    TCP Channel Request, a request multiplexed over a TCP channel
+    """
+    def __init__(self, channel, request_id):
+        """
+        Create a TCP channel request
+        """
+        self._channel = channel
+        self._request_id = request_id
+        self._responses = queue.Queue()
+        self._ended = False
+        self._name = None
+        self._send_timestamp_ms = None
+
+    @property
+    def request_id(self):
+        """
+        Returns the identifier of the request
+        """
+        return self._request_id
+
+    def set_name(self, name):
+        """
+        Set the name used to record the latency of the request
+        """
+        self._name = name
+
+    def put_response(self, msg):
+        """
+        Queue a message received for the request, None when the channel
+        has gone down
+        """
+        self._responses.put(msg)
+
+    def send(self, payload):
+        """
+        Send a message for the request
+        """
+        self._send_timestamp_ms = timers.get_monotonic_timestamp_in_ms()
+        return self._channel.send(self._request_id, payload)
+
+    def receive(self, blocking=True, timeout_in_secs=5):
+        """
+        Receive a message for the request, returns None once the other end
+        has ended the request, the channel has gone down or on a timeout
+        """
+        if self._ended:
+            return None
+
+        try:
+            msg = self._responses.get(blocking, timeout_in_secs)
+        except queue.Empty:
+            DLOG.info("Timed out waiting for a message, request_id=%s."
+                      % self._request_id)
+            return None
+
+        if self._send_timestamp_ms is not None:
+            if self._name is not None:
+                now_ms = timers.get_monotonic_timestamp_in_ms()
+                histogram.add_histogram_data(
+                    self._name, now_ms - self._send_timestamp_ms, 'ms')
+            self._send_timestamp_ms = None
+
+        if not msg:
+            self._ended = True
+            return None
+        return msg
+
+    def close(self):
+        """
+        Close the request, the channel stays open
+        """
+        self._ended = True
+        self._channel.release(self._request_id)
+
+
+class TCPChannel(object):
+    """
+    TCP Channel, a long-lived connection that carries many outstanding
+    requests at once
+    """
+    RECONNECT_BACKOFF_MIN_MS = 100
+    RECONNECT_BACKOFF_MAX_MS = 5000
+
+    def __init__(self, ip, port, remote_ip, remote_port, auth_key=None,
+                 connect_timeout_in_secs=5):
+        """
+        Create a TCP channel, connects on the first request
+        """
+        self._ip = ip
+        self._port = port
+        self._remote_ip = remote_ip
+        self._remote_port = remote_port
+        self._auth_key = auth_key
+        self._connect_timeout_in_secs = connect_timeout_in_secs
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._connection = None
+        self._requests = dict()
+        self._last_request_id = 0
+        self._reconnect_backoff_ms = 0
+        self._reconnect_timestamp_ms = 0
+        self._connects = 0
+
+    @property
+    def outstanding(self):
+        """
+        Returns the number of requests outstanding on the channel
+        """
+        return len(self._requests)
+
+    @property
+    def connects(self):
+        """
+        Returns the number of connections made by the channel
+        """
+        return self._connects
+
+    def _connect(self):
+        """
+        Connect to the end-point, backing off after a failure, must be
+        called with the lock held
+        """
+        if self._connection is not None:
+            return self._connection
+
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        if now_ms < self._reconnect_timestamp_ms:
+            raise socket.error("Reconnect to %s, port=%s, in back-off for "
+                               "%s ms." % (self._remote_ip, self._remote_port,
+                                           self._reconnect_timestamp_ms
+                                           - now_ms))
+        try:
+            connection = TCPConnection(self._ip, self._port,
+                                       auth_key=self._auth_key)
+            connection.connect(self._remote_ip, self._remote_port,
+                               self._connect_timeout_in_secs)
+        except (socket.error, ValueError):
+            self._reconnect_backoff_ms = min(
+                max(self._reconnect_backoff_ms * 2,
+                    self.RECONNECT_BACKOFF_MIN_MS),
+                self.RECONNECT_BACKOFF_MAX_MS)
+            self._reconnect_timestamp_ms = now_ms + self._reconnect_backoff_ms
+            raise
+
+        self._reconnect_backoff_ms = 0
+        self._reconnect_timestamp_ms = 0
+        self._connection = connection
+        self._connects += 1
+
+        thread = threading.Thread(target=self._receive_loop,
+                                  args=(connection,),
+                                  name='tcp-channel-%s' % self._remote_port)
+        thread.daemon = True
+        thread.start()
+        return connection
+
+    def _receive_loop(self, connection):
+        """
+        Receive messages from the connection and hand them to the requests
+        """
+        while not connection.is_shutdown():
+            request_id, msg = connection.receive_frame(blocking=True,
+                                                       timeout_in_secs=1)
+            if msg is None:
+                continue
+
+            if request_id is None:
+                DLOG.info("Message received that is not for a request, "
+                          "remote_ip=%s, remote_port=%s."
+                          % (self._remote_ip, self._remote_port))
+                continue
+
+            with self._lock:
+                request = self._requests.get(request_id, None)
+
+            if request is not None:
+                request.put_response(msg)
+
+        with self._lock:
+            if self._connection is connection:
+                self._connection = None
+                DLOG.info("Channel connection closed, remote_ip=%s, "
+                          "remote_port=%s, outstanding=%s."
+                          % (self._remote_ip, self._remote_port,
+                             len(self._requests)))
+            requests = list(self._requests.values())
+            self._requests.clear()
+
+        for request in requests:
+            request.put_response(None)
+
+    def request(self):
+        """
+        Returns a new request on the channel, connecting if needed
+        """
+        with self._lock:
+            self._connect()
+            self._last_request_id = (self._last_request_id % 0x7FFFFFFF) + 1
+            request = TCPChannelRequest(self, self._last_request_id)
+            self._requests[request.request_id] = request
+        return request
+
+    def send(self, request_id, payload):
+        """
+        Send a message for a request
+        """
+        connection = self._connection
+        if connection is None or request_id not in self._requests:
+            raise socket.error("Channel to %s, port=%s, is down."
+                               % (self._remote_ip, self._remote_port))
+        try:
+            with self._send_lock:
+                return connection.send(payload, request_id)
+        except socket.error:
+            self._shutdown(connection)
+            raise
+
+    @staticmethod
+    def _shutdown(connection):
+        """
+        Shutdown a connection, the receive loop sees the connection close
+        and closes it from its own thread
+        """
+        sock = connection.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+
+    def release(self, request_id):
+        """
+        Forget a request, messages that arrive for it are dropped
+        """
+        with self._lock:
+            self._requests.pop(request_id, None)
+
+    def close(self):
+        """
+        Close the channel, outstanding requests get no further messages
+        """
+        with self._lock:
+            connection = self._connection
+        if connection is not None:
+            self._shutdown(connection)
+
+
+class TCPChannelPool(object):
+    """
+    TCP Channel Pool, spreads requests over a small number of channels
+    """
+    def __init__(self, ip, port, remote_ip, remote_port, num_channels=2,
+                 auth_key=None, connect_timeout_in_secs=5):
+        """
+        Create a TCP channel pool
+        """
+        self._channels = [TCPChannel(ip, port, remote_ip, remote_port,
+                                     auth_key, connect_timeout_in_secs)
+                          for _ in range(max(1, num_channels))]
+
+    @property
+    def channels(self):
+        """
+        Returns the channels of the pool
+        """
+        return self._channels
+
+    def request(self):
+        """
+        Returns a new request on the channel with the fewest outstanding
+        requests, trying the others if it cannot connect
+        """
+        channels = sorted(self._channels,
+                          key=lambda channel: channel.outstanding)
+        for channel in channels[:-1]:
+            try:
+                return channel.request()
+            except socket.error as e:
+                DLOG.info("Channel request failed, error=%s." % e)
+        return channels[-1].request()
+
+    def close(self):
+        """
+        Close the channels of the pool
+        """
+        for channel in self._channels:
+            channel.close()
@@ -0,0 +1,198 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import json
+import six
+import struct
+
+from nfv_common.helpers import Constant
+from nfv_common.helpers import Constants
+from nfv_common.helpers import Singleton
+
+
+@six.add_metaclass(Singleton)
+class _TCPCodec(Constants):
+    """
+    TCP Codec Constants
+    """
+    JSON = Constant('json')
+    COMPACT = Constant('compact')
+
+
+# Constant Instantiation
+TCP_CODEC = _TCPCodec()
+
+# Compact payloads start with a byte that never starts a JSON document, so
+# the codec of a message can be told from the message itself
+_COMPACT_MARKER = b'\xc1'
+
+# Type codes, a subset of the msgpack encoding
+_NIL = 0xc0
+_FALSE = 0xc2
+_TRUE = 0xc3
+_FLOAT64 = 0xcb
+_INT64 = 0xd3
+_BIN32 = 0xc6
+_STR32 = 0xdb
+_ARRAY32 = 0xdd
+_MAP32 = 0xdf
+_FIXSTR = 0xa0
+_FIXSTR_MAX_LEN = 31
+
+_INT64_STRUCT = struct.Struct('!Bq')
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+_FLOAT64_STRUCT = struct.Struct('!Bd')
+_LEN32_STRUCT = struct.Struct('!BL')
+
+
+def _encode(value, parts):
+    """
+    Append the compact encoding of a value to parts
+    """
+    if value is None:
+        parts.append(six.int2byte(_NIL))
+
+    elif value is True:
+        parts.append(six.int2byte(_TRUE))
+
+    elif value is False:
+        parts.append(six.int2byte(_FALSE))
+
+    elif isinstance(value, six.string_types):
+        if isinstance(value, six.text_type):
+            value = value.encode('utf-8')
+        if _FIXSTR_MAX_LEN >= len(value):
+            parts.append(six.int2byte(_FIXSTR | len(value)))
+        else:
+            parts.append(_LEN32_STRUCT.pack(_STR32, len(value)))
+        parts.append(value)
+
+    elif isinstance(value, six.integer_types):
+        if 0 <= value <= 0x7f:
+            parts.append(six.int2byte(value))
+        elif _INT64_MIN <= value <= _INT64_MAX:
+            parts.append(_INT64_STRUCT.pack(_INT64, value))
+        else:
+            raise TypeError("Unable to encode %s, out of range." % value)
+
+    elif isinstance(value, float):
+        parts.append(_FLOAT64_STRUCT.pack(_FLOAT64, value))
+
+    elif isinstance(value, dict):
+        parts.append(_LEN32_STRUCT.pack(_MAP32, len(value)))
+        for key, item in value.items():
+            _encode(key, parts)
+            _encode(item, parts)
+
+    elif isinstance(value, (list, tuple)):
+        parts.append(_LEN32_STRUCT.pack(_ARRAY32, len(value)))
+        for item in value:
+            _encode(item, parts)
+
+    elif isinstance(value, (six.binary_type, bytearray, memoryview)):
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        else:
+            value = bytes(value)
+        parts.append(_LEN32_STRUCT.pack(_BIN32, len(value)))
+        parts.append(value)
+
+    else:
+        raise TypeError("Unable to encode %s." % type(value))
+
+
+def _decode(data, offset):
+    """
+    Returns the value decoded at offset and the offset that follows it
+    """
+    code = six.indexbytes(data, offset)
+    offset += 1
+
+    if 0x7f >= code:
+        return code, offset
+
+    elif _FIXSTR == code & 0xe0:
+        end = offset + (code & 0x1f)
+        return data[offset:end].decode('utf-8'), end
+
+    elif _NIL == code:
+        return None, offset
+
+    elif _TRUE == code:
+        return True, offset
+
+    elif _FALSE == code:
+        return False, offset
+
+    elif _INT64 == code:
+        return _INT64_STRUCT.unpack_from(data, offset - 1)[1], offset + 8
+
+    elif _FLOAT64 == code:
+        return _FLOAT64_STRUCT.unpack_from(data, offset - 1)[1], offset + 8
+
+    elif code not in (_STR32, _MAP32, _ARRAY32, _BIN32):
+        raise ValueError("Unknown type code 0x%02x at offset %s."
+                         % (code, offset - 1))
+
+    length = _LEN32_STRUCT.unpack_from(data, offset - 1)[1]
+    offset += 4
+
+    if _STR32 == code:
+        end = offset + length
+        return data[offset:end].decode('utf-8'), end
+
+    elif _MAP32 == code:
+        value = dict()
+        for _ in range(length):
+            key, offset = _decode(data, offset)
+            value[key], offset = _decode(data, offset)
+        return value, offset
+
+    elif _ARRAY32 == code:
+        value = list()
+        for _ in range(length):
+            item, offset = _decode(data, offset)
+            value.append(item)
+        return value, offset
+
+    else:
+        end = offset + length
+        return data[offset:end], end
+
+
+def tcp_codec_detect(data):
+    """
+    Returns the codec a message was encoded with
+    """
+    if _COMPACT_MARKER == data[:1]:
+        return TCP_CODEC.COMPACT
+    return TCP_CODEC.JSON
+
+
+def tcp_codec_encode(value, codec=TCP_CODEC.JSON):
+    """
+    Encode a value (dicts, lists, strings, numbers, booleans and None)
+    """
+    if TCP_CODEC.COMPACT == codec:
+        parts = [_COMPACT_MARKER]
+        _encode(value, parts)
+        return b"".join(parts)
+    return json.dumps(value)
+
+
+def tcp_codec_decode(data):
+    """
+    Decode a message, whichever codec it was encoded with
+    """
+    if _COMPACT_MARKER == data[:1]:
+        value, offset = _decode(data, 1)
+        if offset != len(data):
+            raise ValueError("Trailing data after offset %s." % offset)
+        return value
+
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
@@ -8,20 +8,35 @@ import errno
 import hashlib
 import hmac
 import select
+import six
 import socket
 import struct
 
 from nfv_common import debug
+from nfv_common import selobj
 from nfv_common import timers
 
+from nfv_common.helpers import coroutine
+from nfv_common.tcp._tcp_codec import TCP_CODEC
+
 DLOG = debug.debug_get_logger('nfv_common.tcp')
 
+_MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', 0)
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+_LENGTH_STRUCT = struct.Struct('!L')
+_REQUEST_ID_STRUCT = struct.Struct('!L')
+
 
 class TCPConnection(object):
     """
     TCP Connection
     """
     AUTH_VECTOR_MAX_SIZE = 64
+    MSG_MULTIPLEXED = 0x80000000
+    RECEIVE_BUFFER_SIZE = 65536
+    RECEIVE_BUFFER_MAX_SIZE = 1048576
+    SEND_BUFFER_MAX_SIZE = 16777216
+    SEND_TIMEOUT_IN_SECS = 5
 
     def __init__(self, ip, port, sock=None, blocking=True, owner=None,
                  auth_key=None):
@@ -56,9 +71,15 @@ class TCPConnection(object):
         self._blocking = blocking
         self._socket.setblocking(blocking)
         self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-        self._msg_parts = list()
-        self._msg_len = 0
-        self._msg_len_remaining = -1
+        # Messages are small and written whole, do not hold them back
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._rx_buffer = bytearray(self.RECEIVE_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buffer)
+        self._rx_start = 0
+        self._rx_end = 0
+        self._tx_buffer = bytearray()
+        self._close_pending = False
+        self._codec = TCP_CODEC.JSON
 
     @property
     def ip(self):
@@ -74,6 +95,20 @@ class TCPConnection(object):
         """
         return self._port
 
+    @property
+    def codec(self):
+        """
+        Returns the codec messages are answered with
+        """
+        return self._codec
+
+    @codec.setter
+    def codec(self, codec):
+        """
+        Set the codec messages are answered with
+        """
+        self._codec = codec
+
     @property
     def sock(self):
         """
@@ -90,9 +125,10 @@ class TCPConnection(object):
 
     def is_shutdown(self):
         """
-        Returns true if the connection has shutdown
+        Returns true if the connection has shutdown, or is closing once the
+        messages queued have been sent
         """
-        return self._socket is None
+        return self._socket is None or self._close_pending
 
     def connect(self, ip, port, timeout_in_secs=None):
         """
@@ -115,153 +151,434 @@ class TCPConnection(object):
             self.close()
             raise
 
-    def send(self, payload):
+    def _auth_vector(self, payload, request_id):
+        """
+        Returns the authorization vector of a message, the request
+        identifier of a multiplexed message is covered as well
+        """
+        auth = hmac.new(self._auth_key, digestmod=hashlib.sha512)
+        if request_id is not None:
+            auth.update(_REQUEST_ID_STRUCT.pack(request_id))
+        auth.update(payload)
+        return auth.digest()
+
+    def _queue_send(self, data):
+        """
+        Queue bytes to be sent once the socket is writeable, after those
+        already queued
+        """
+        if not self._tx_buffer:
+            selobj.selobj_add_write_obj(self.selobj, self._send_queued)
+
+        self._tx_buffer += data
+        if self.SEND_BUFFER_MAX_SIZE < len(self._tx_buffer):
+            DLOG.error("TCP send queue full, ip=%s, port=%s, queued=%s, "
+                       "closing connection." % (self._ip, self._port,
+                                                len(self._tx_buffer)))
+            self._close_socket()
+
+    @coroutine
+    def _send_queued(self):
+        """
+        Called when the socket is writeable, sends the bytes queued
+        """
+        while True:
+            select_obj = (yield)
+            if self._socket is None:
+                continue
+
+            try:
+                bytes_sent = self._socket.send(self._tx_buffer)
+            except socket.error as e:
+                if e.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    continue
+                DLOG.error("TCP socket error, ip=%s, port=%s, error=%s."
+                           % (self._ip, self._port, e))
+                self._close_socket()
+                continue
+
+            del self._tx_buffer[:bytes_sent]
+            if not self._tx_buffer:
+                selobj.selobj_del_write_obj(select_obj)
+                if self._close_pending:
+                    self._close_socket()
+
+    def _send_parts(self, parts, length):
+        """
+        Send the parts of a frame. What a non-blocking socket does not take
+        at once is queued and sent once the socket is writeable, a blocking
+        socket waits to be writeable.
+        """
+        if self._tx_buffer:
+            # Keep the frame behind those still queued
+            self._queue_send(b"".join(parts))
+            return
+
+        try:
+            if _HAS_SENDMSG:
+                bytes_sent = self._socket.sendmsg(parts)
+            else:
+                bytes_sent = self._socket.send(b"".join(parts))
+        except socket.error as e:
+            if e.args[0] not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+            bytes_sent = 0
+
+        if length == bytes_sent:
+            return
+
+        view = memoryview(b"".join(parts))[bytes_sent:]
+        if not self._blocking:
+            self._queue_send(view)
+            return
+
+        while len(view):
+            _, writeable, _ = select.select([], [self._socket.fileno()], [],
+                                            self.SEND_TIMEOUT_IN_SECS)
+            if not writeable:
+                raise socket.timeout("Timed out sending, %s bytes of %s sent."
+                                     % (length - len(view), length))
+            try:
+                view = view[self._socket.send(view):]
+            except socket.error as e:
+                if e.args[0] not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    raise
+
+    def send(self, payload, request_id=None):
         """
         Send a message into the TCP connection, assumes the following
         messaging format:  | length (4-bytes) | string of bytes |
+        A message that belongs to a request multiplexed over the connection
+        has the top bit of the length set and is followed by the request
+        identifier:  | length (4-bytes) | request-id (4-bytes) | bytes |
         """
         bytes_sent = 0
 
-        if self._socket is not None:
-            if self._auth_key is None:
-                msg = struct.pack('!L', socket.htonl(len(payload)))
-                msg += payload
+        if self._socket is not None and not self._close_pending:
+            if isinstance(payload, six.text_type):
+                payload = payload.encode('utf-8')
+
+            msg_len = len(payload)
+            if self._auth_key is not None:
+                auth_vector = self._auth_vector(payload, request_id)
+                auth_vector = auth_vector[:self.AUTH_VECTOR_MAX_SIZE]
+                msg_len += len(auth_vector)
+
+            if request_id is None:
+                header = struct.pack('!L', socket.htonl(msg_len))
+            else:
+                header = struct.pack('!LL', socket.htonl(msg_len |
+                                                         self.MSG_MULTIPLEXED),
+                                     request_id)
+
+            if self._auth_key is not None:
+                parts = [header, auth_vector, payload]
             else:
-                auth_vector = hmac.new(self._auth_key, msg=payload,
-                                       digestmod=hashlib.sha512).digest()
-                msg_len = len(auth_vector) + len(payload)
-                msg = struct.pack('!L', socket.htonl(msg_len))
-                msg += auth_vector[:self.AUTH_VECTOR_MAX_SIZE]
-                msg += payload
-
-            bytes_sent = self._socket.send(bytes(msg))
+                parts = [header, payload]
+
+            bytes_sent = len(header) + msg_len
+            self._send_parts(parts, bytes_sent)
         return bytes_sent
 
-    def _receive_non_blocking(self):
+    def _receive_message(self, msg, request_id):
+        """
+        Returns the payload of a message received, None if the
+        authorization vector does not match
+        """
+        if self._auth_key is None:
+            return msg.tobytes()
+
+        auth_vector = msg[:self.AUTH_VECTOR_MAX_SIZE].tobytes()
+        message = msg[self.AUTH_VECTOR_MAX_SIZE:].tobytes()
+        expected = self._auth_vector(message, request_id)
+
+        if auth_vector != expected:
+            auth_vector_str = base64.b64encode(auth_vector)
+            expected_str = base64.b64encode(expected)
+
+            DLOG.info("Authorization vector mismatch, msg=%s, "
+                      "auth_vector=%s, expected=%s."
+                      % (message, auth_vector_str, expected_str))
+            return None
+
+        return message
+
+    def _receive_buffered(self):
+        """
+        Returns the request identifier and message of the next message in
+        the receive buffer, returns the size of the frame still needed when
+        the frame has not been fully received
+        """
+        while True:
+            start = self._rx_start
+            available = self._rx_end - start
+            if _LENGTH_STRUCT.size > available:
+                return None, None, _LENGTH_STRUCT.size
+
+            msg_len = socket.ntohl(_LENGTH_STRUCT.unpack_from(
+                self._rx_buffer, start)[0])
+            if msg_len & self.MSG_MULTIPLEXED:
+                msg_len &= ~self.MSG_MULTIPLEXED
+                header_size = _LENGTH_STRUCT.size + _REQUEST_ID_STRUCT.size
+                if header_size > available:
+                    return None, None, header_size
+                request_id = _REQUEST_ID_STRUCT.unpack_from(
+                    self._rx_buffer, start + _LENGTH_STRUCT.size)[0]
+            else:
+                header_size = _LENGTH_STRUCT.size
+                request_id = None
+
+            frame_size = header_size + msg_len
+            if frame_size > available:
+                return None, None, frame_size
+
+            msg_start = start + header_size
+            message = self._receive_message(
+                self._rx_view[msg_start:msg_start + msg_len], request_id)
+
+            self._rx_start += frame_size
+            if self._rx_start == self._rx_end:
+                self._rx_start = self._rx_end = 0
+                if len(self._rx_buffer) > self.RECEIVE_BUFFER_MAX_SIZE:
+                    # Give back the memory taken by a large message
+                    self._rx_buffer = bytearray(self.RECEIVE_BUFFER_SIZE)
+                    self._rx_view = memoryview(self._rx_buffer)
+
+            if message is not None:
+                return request_id, message, 0
+
+    def _reserve_receive_buffer(self, frame_size):
+        """
+        Make room in the receive buffer for a frame of the given size
+        """
+        start = self._rx_start
+        pending = self._rx_end - start
+        if start + frame_size <= len(self._rx_buffer):
+            return
+
+        if frame_size <= len(self._rx_buffer):
+            self._rx_buffer[:pending] = self._rx_view[start:self._rx_end]
+        else:
+            rx_buffer = bytearray(max(frame_size, 2 * len(self._rx_buffer)))
+            rx_buffer[:pending] = self._rx_view[start:self._rx_end]
+            self._rx_buffer = rx_buffer
+            self._rx_view = memoryview(self._rx_buffer)
+        self._rx_start = 0
+        self._rx_end = pending
+
+    def _receive_non_blocking(self, set_non_blocking=True):
         """
         Receive a message from the TCP connection (non-blocking), assumes the
         following messaging format:  | length (4-bytes) | string of bytes |
+        or the multiplexed format, returns the request identifier (None if
+        not multiplexed) and the message
         """
-        if self._socket is None:
-            return None
+        request_id, message, frame_size = self._receive_buffered()
+        if message is not None or self._socket is None:
+            return request_id, message
 
-        message = None
-        self._socket.setblocking(False)
+        recv_flags = 0
+        if set_non_blocking:
+            self._socket.setblocking(False)
+        else:
+            # Leave the socket alone, it may be sending from another thread
+            recv_flags = _MSG_DONTWAIT
         try:
-            if -1 == self._msg_len_remaining:
-                if 0 == self._msg_len:
-                    read_len = struct.calcsize('!L')
+            # Read as much as is available, into the receive buffer
+            while self._socket is not None:
+                self._reserve_receive_buffer(frame_size)
+                if self.RECEIVE_BUFFER_SIZE < frame_size:
+                    # Read no further than the end of a large message, the
+                    # start of the next one would need moving up otherwise
+                    rx_view = self._rx_view[self._rx_end:
+                                            self._rx_start + frame_size]
                 else:
-                    read_len = struct.calcsize('!L') - self._msg_len
-
-                msg_block = self._socket.recv(read_len)
-                if 0 == len(msg_block):
+                    rx_view = self._rx_view[self._rx_end:]
+                bytes_received = self._socket.recv_into(rx_view, 0,
+                                                        recv_flags)
+                if 0 == bytes_received:
                     DLOG.verbose("Connection closed.")
                     self.close()
-                else:
-                    self._msg_parts.append(msg_block)
-                    msg = b"".join(self._msg_parts)
-                    self._msg_len = len(msg_block)
+                    break
 
-                    if struct.calcsize('!L') == len(msg):
-                        self._msg_parts[:] = list()
-                        self._msg_len = socket.ntohl(struct.unpack('!L', msg)[0])
-                        self._msg_len_remaining = self._msg_len
+                self._rx_end += bytes_received
+                request_id, message, frame_size = self._receive_buffered()
+                if message is not None:
+                    break
 
-            else:
-                msg_block = self._socket.recv(self._msg_len_remaining)
-                if 0 == len(msg_block):
-                    DLOG.verbose("Connection closed.")
-                    self.close()
-                else:
-                    self._msg_parts.append(msg_block)
-                    self._msg_len_remaining -= len(msg_block)
-                    if 0 == self._msg_len_remaining:
-                        msg = b"".join(self._msg_parts)
-                        self._msg_parts[:] = list()
-                        self._msg_len = 0
-                        self._msg_len_remaining = -1
-
-                        if self._auth_key is None:
-                            message = msg
-                        else:
-                            auth_vector = msg[:self.AUTH_VECTOR_MAX_SIZE]
-                            message = msg[self.AUTH_VECTOR_MAX_SIZE:]
-                            expected = hmac.new(self._auth_key, msg=message,
-                                                digestmod=hashlib.sha512).digest()
-
-                            if auth_vector != expected:
-                                auth_vector_str = base64.b64encode(auth_vector)
-                                expected_str = base64.b64encode(expected)
-
-                                DLOG.info("Authorization vector mismatch, msg=%s, "
-                                          "auth_vector=%s, expected=%s."
-                                          % (message, auth_vector_str,
-                                             expected_str))
-                                message = None
+                if not set_non_blocking and 0 == recv_flags:
+                    # Unable to read without blocking, wait to be readable
+                    break
 
         except socket.timeout as e:
             DLOG.info("TCP socket timeout, ip=%s, por=%s, error=%s."
                       % (self._ip, self._port, e))
 
         except socket.error as e:
-            DLOG.error("TCP socket error, ip=%s, port=%s, error=%s."
-                       % (self._ip, self._port, e))
-            self.close()
+            if e.args[0] not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                DLOG.error("TCP socket error, ip=%s, port=%s, error=%s."
+                           % (self._ip, self._port, e))
+                self.close()
 
         finally:
-            if self._socket is not None:
+            if self._socket is not None and set_non_blocking:
                 self._socket.setblocking(self._blocking)
 
-        return message
+        return request_id, message
 
     def _receive_blocking(self, timeout_in_secs=5):
         """
         Receive a message from the TCP connection (blocking)
         """
-        start_ms = timers.get_monotonic_timestamp_in_ms()
+        if _MSG_DONTWAIT:
+            # Take what has already arrived without waiting on the socket
+            request_id, msg = self._receive_non_blocking(False)
+            if msg is not None:
+                return request_id, msg
+
+        start_ms = None
 
         while self._socket is not None:
+            request_id, msg, _ = self._receive_buffered()
+            if msg is not None:
+                return request_id, msg
+
+            now_ms = timers.get_monotonic_timestamp_in_ms()
+            if start_ms is None:
+                start_ms = now_ms
+            secs_expired = (now_ms - start_ms) / 1000.0
+            if timeout_in_secs <= secs_expired:
+                DLOG.info("Timed out waiting for a message.")
+                break
+
             read_objs = [self._socket.fileno()]
             try:
                 readable, writeable, in_error \
-                    = select.select(read_objs, [], [], timeout_in_secs)
+                    = select.select(read_objs, [], [],
+                                    timeout_in_secs - secs_expired)
 
                 for selobj in readable:
                     if selobj == self._socket.fileno():
-                        msg = self._receive_non_blocking()
+                        request_id, msg = self._receive_non_blocking(False)
                         if msg is not None:
-                            return msg
+                            return request_id, msg
 
-            except (OSError, socket.error, select.error) as e:
+            except (OSError, socket.error, select.error, ValueError) as e:
                 if errno.EINTR != e.args[0]:
                     pass
 
-            now_ms = timers.get_monotonic_timestamp_in_ms()
-            secs_expired = (now_ms - start_ms) / 1000
-            if timeout_in_secs <= secs_expired:
-                DLOG.info("Timed out waiting for a message.")
-                break
-            else:
-                timeout_in_secs -= secs_expired
+        return None, None
 
-        return None
-
-    def receive(self, blocking=True, timeout_in_secs=5):
+    def receive_frame(self, blocking=True, timeout_in_secs=5):
         """
-        Receive a message from the TCP connection
+        Receive a message from the TCP connection, returns the request
+        identifier of a multiplexed message (None otherwise) and the message
         """
         if blocking:
             return self._receive_blocking(timeout_in_secs)
         else:
             return self._receive_non_blocking()
 
-    def close(self):
+    def receive(self, blocking=True, timeout_in_secs=5):
+        """
+        Receive a message from the TCP connection
+        """
+        return self.receive_frame(blocking, timeout_in_secs)[1]
+
+    def _close_socket(self):
         """
-        Close the TCP connection
+        Close the socket, dropping anything still queued to be sent
         """
         if self._socket is not None:
-            if self._owner is not None:
+            if self._owner is not None and not self._close_pending:
                 self._owner.closing_connection(self.selobj)
+            if self._tx_buffer:
+                selobj.selobj_del_write_obj(self.selobj)
+                self._tx_buffer = bytearray()
             self._socket.close()
             self._socket = None
+
+    def close(self):
+        """
+        Close the TCP connection, the socket is closed once the messages
+        queued have been sent
+        """
+        if self._socket is not None and not self._close_pending:
+            if self._tx_buffer:
+                if self._owner is not None:
+                    self._owner.closing_connection(self.selobj)
+                self._close_pending = True
+            else:
+                self._close_socket()
+
+
+class TCPRequestConnection(object):
+    """
+    TCP Request Connection, a request multiplexed over a TCP connection
+    """
+    def __init__(self, connection, request_id, codec=None):
+        """
+        Create a TCP request connection
+        """
+        self._connection = connection
+        self._request_id = request_id
+        if codec is None:
+            codec = connection.codec
+        self._codec = codec
+        self._closed = False
+
+    @property
+    def ip(self):
+        """
+        Returns the ip of the connection
+        """
+        return self._connection.ip
+
+    @property
+    def port(self):
+        """
+        Returns the port of the connection
+        """
+        return self._connection.port
+
+    @property
+    def request_id(self):
+        """
+        Returns the identifier of the request
+        """
+        return self._request_id
+
+    @property
+    def codec(self):
+        """
+        Returns the codec the request is answered with
+        """
+        return self._codec
+
+    def is_shutdown(self):
+        """
+        Returns true if the request has ended or the connection has shutdown
+        """
+        return self._closed or self._connection.is_shutdown()
+
+    def send(self, payload):
+        """
+        Send a message for the request
+        """
+        if self._closed:
+            return 0
+        return self._connection.send(payload, self._request_id)
+
+    def close(self):
+        """
+        End the request, an empty message tells the other end that no more
+        messages will be sent for the request, the connection stays open
+        """
+        if not self._closed:
+            self._closed = True
+            try:
+                self._connection.send(b"", self._request_id)
+            except socket.error as e:
+                DLOG.info("TCP socket error ending request, ip=%s, port=%s, "
+                          "request_id=%s, error=%s."
+                          % (self.ip, self.port, self._request_id, e))
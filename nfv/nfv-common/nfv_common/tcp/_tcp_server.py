@@ -8,7 +8,9 @@ from nfv_common import selobj
 
 from nfv_common.helpers import coroutine
 
+from nfv_common.tcp._tcp_codec import tcp_codec_detect
 from nfv_common.tcp._tcp_connection import TCPConnection
+from nfv_common.tcp._tcp_connection import TCPRequestConnection
 
 DLOG = debug.debug_get_logger('nfv_common.tcp')
 
@@ -68,13 +70,29 @@ class TCPServer(object):
                 client_connection = self._client_connections.get(select_obj,
                                                                  None)
                 if client_connection is not None:
-                    msg = client_connection.receive(blocking=False)
-                    if msg is not None:
+                    request_id, msg \
+                        = client_connection.receive_frame(blocking=False)
+                    while msg is not None:
                         DLOG.verbose("Message received from %s, port=%s, "
                                      "select_obj=%s." % (client_connection.ip,
                                                          client_connection.port,
                                                          select_obj))
-                        self._message_handler(client_connection, msg)
+                        # Answer in the codec the message was sent with
+                        codec = tcp_codec_detect(msg)
+                        if request_id is None:
+                            client_connection.codec = codec
+                            self._message_handler(client_connection, msg)
+                        else:
+                            # Multiplexed request, the handler closing the
+                            # connection only ends the request
+                            self._message_handler(
+                                TCPRequestConnection(client_connection,
+                                                     request_id, codec), msg)
+
+                        # Requests multiplexed over the connection may
+                        # already be waiting
+                        request_id, msg \
+                            = client_connection.receive_frame(blocking=False)
 
                 client_connection = self._client_connections.get(select_obj,
                                                                  None)
@@ -121,9 +121,13 @@ class Thread(object):
         self._process.join(max_wait_in_seconds)
         if self._process.is_alive():
             self._process.terminate()
+            self._process.join(max_wait_in_seconds)
         if self._check_timer_id is not None:
             timers.timers_delete_timer(self._check_timer_id)
+            self._check_timer_id = None
+        debug.debug_deregister_config_change_callback(self.debug_config_change)
         self._work_queue.close()
+        self._thread_worker.close()
 
     def debug_config_change(self):
         self._work_queue.put([Thread.ACTION_DEBUG_CONFIG_RELOAD, None])
@@ -213,6 +217,7 @@ def _thread_main(thread_name, progress_marker, debug_config, thread_worker,
             progress_marker.increment()
             selobj.selobj_dispatch(thread_worker.tick_interval_in_ms)
             timers.timers_schedule()
+            debug.debug_flush()
 
             if not timers.timers_scheduling_on_time():
                 DLOG.info("Thread %s: not scheduling on time" % thread_name)
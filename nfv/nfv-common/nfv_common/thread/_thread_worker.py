@@ -60,6 +60,12 @@ class ThreadWorker(object):
         """
         return self._result_queue.get()
 
+    def close(self):
+        """
+        Close the result queue, called once the thread has stopped
+        """
+        self._result_queue.close()
+
     def do_work(self, action, work):
         """
         Called to do work from thread-main
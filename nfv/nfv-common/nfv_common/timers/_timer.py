@@ -47,6 +47,13 @@ class Timer(object):
         """
         return self._timer_name
 
+    @property
+    def expiry_ms(self):
+        """
+        Returns the monotonic timestamp after which this timer fires
+        """
+        return self._arm_timestamp + (self._next_expiry_in_secs * 1000)
+
     def reschedule(self, interval_secs):
         """
         Reschedule a timer
@@ -62,8 +69,8 @@ class Timer(object):
         rearm = True
         secs_expired = (now_ms - self._arm_timestamp) / 1000
         if secs_expired > self._next_expiry_in_secs:
-            DLOG.verbose("Timer %s with timer id %s fired." % (self._timer_name,
-                                                               self._timer_id))
+            DLOG.verbose("Timer %s with timer id %s fired.", self._timer_name,
+                         self._timer_id)
             try:
                 self._callback.send(self._timer_id)
                 self._arm_timestamp = get_monotonic_timestamp_in_ms()
@@ -45,7 +45,7 @@ def timers_create_timer(name, initial_delay_secs, interval_secs,
     timer = Timer(name, initial_delay_secs, interval_secs,
                   callback, *callback_args, **callback_kwargs)
     _scheduler.add_timer(timer)
-    DLOG.debug("Timer %s created, name=%s." % (timer.timer_id, name))
+    DLOG.debug("Timer %s created, name=%s.", timer.timer_id, name)
     return timer.timer_id
 
 
@@ -56,7 +56,7 @@ def timers_delete_timer(timer_id):
     global _scheduler
 
     _scheduler.delete_timer(timer_id)
-    DLOG.debug("Timer %s deleted." % timer_id)
+    DLOG.debug("Timer %s deleted.", timer_id)
 
 
 def timers_reschedule_timer(timer_id, interval_secs):
@@ -66,8 +66,8 @@ def timers_reschedule_timer(timer_id, interval_secs):
     global _scheduler
 
     _scheduler.reschedule_timer(timer_id, interval_secs)
-    DLOG.debug("Timer %s rescheduled every %s seconds." % (timer_id,
-                                                           interval_secs))
+    DLOG.debug("Timer %s rescheduled every %s seconds.", timer_id,
+               interval_secs)
 
 
 def timers_scheduling_on_time():
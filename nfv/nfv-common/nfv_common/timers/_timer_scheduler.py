@@ -3,6 +3,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import collections
+import heapq
+
 from nfv_common import debug
 from nfv_common import histogram
 
@@ -14,7 +17,17 @@ DLOG = debug.debug_get_logger('nfv_common.timers.timer_scheduler')
 class TimerScheduler(object):
     """
     Timer Scheduler
+
+    Timers are kept in a heap ordered by expiry time so that only expired
+    timers are visited when scheduling. Deleting or rescheduling a timer
+    invalidates its heap entry in place, stale entries are discarded as they
+    surface or when they make up more than half of the heap.
     """
+    _ENTRY_EXPIRY = 0
+    _ENTRY_TIMER_ID = 1
+    _ENTRY_TIMER = 2
+    _ENTRY_IN_HEAP = 3
+
     def __init__(self, scheduler_interval_ms, scheduler_max_delay_ms,
                  scheduler_delay_debounce_ms):
         """
@@ -25,10 +38,10 @@ class TimerScheduler(object):
         self._scheduler_delay_debounce_ms = scheduler_delay_debounce_ms
         self._scheduler_timestamp_ms = 0
         self._scheduler_delay_timestamp_ms = 0
-        self._timers = []
+        self._timers = dict()
+        self._timer_heap = list()
+        self._stale_entries = 0
         self._scheduling_on_time = True
-        self._timers_to_delete = []
-        self._scheduling_timers = False
 
     @property
     def scheduling_on_time(self):
@@ -37,6 +50,44 @@ class TimerScheduler(object):
         """
         return self._scheduling_on_time
 
+    def _push_timer(self, timer):
+        """
+        Insert a heap entry for a timer at its current expiry
+        """
+        entry = [timer.expiry_ms, timer.timer_id, timer, True]
+        self._timers[timer.timer_id] = entry
+        heapq.heappush(self._timer_heap, entry)
+
+    def _pop_expired(self, now_ms):
+        """
+        Remove and return the heap entries of all timers expired at now_ms
+        """
+        expired = collections.deque()
+        while self._timer_heap \
+                and self._timer_heap[0][self._ENTRY_EXPIRY] < now_ms:
+            entry = heapq.heappop(self._timer_heap)
+            entry[self._ENTRY_IN_HEAP] = False
+            if entry[self._ENTRY_TIMER] is None:
+                self._stale_entries -= 1
+            else:
+                expired.append(entry)
+        return expired
+
+    def _invalidate_entry(self, entry):
+        """
+        Mark a heap entry as stale, compacting the heap if needed
+        """
+        entry[self._ENTRY_TIMER] = None
+        if not entry[self._ENTRY_IN_HEAP]:
+            return
+
+        self._stale_entries += 1
+        if self._stale_entries > len(self._timer_heap) // 2:
+            self._timer_heap[:] = [x for x in self._timer_heap
+                                   if x[self._ENTRY_TIMER] is not None]
+            heapq.heapify(self._timer_heap)
+            self._stale_entries = 0
+
     def schedule(self):
         """
         Schedule timers
@@ -46,7 +97,7 @@ class TimerScheduler(object):
 
         if ms_expired < self._scheduler_interval_ms:
             DLOG.verbose("Not enough time has elapsed to schedule timers, "
-                         "ms_expired=%d ms." % ms_expired)
+                         "ms_expired=%d ms.", ms_expired)
             return
 
         if 0 != self._scheduler_timestamp_ms:
@@ -66,52 +117,69 @@ class TimerScheduler(object):
                         DLOG.info("Now scheduling on time.")
 
         self._scheduler_timestamp_ms = now_ms
-        self._scheduling_timers = True
         overall_start_ms = get_monotonic_timestamp_in_ms()
+        expired = collections.deque()
         try:
             DLOG.verbose('Scheduling timers.')
-            for timer in self._timers:
+            # Pop every expired timer before running any callbacks, timers
+            # added or rearmed by a callback are not due until a later tick.
+            expired = self._pop_expired(now_ms)
+            while expired:
+                entry = expired.popleft()
+                timer = entry[self._ENTRY_TIMER]
+                if timer is None:
+                    # Deleted or rescheduled by an earlier callback
+                    continue
+
                 start_ms = get_monotonic_timestamp_in_ms()
-                rearm = timer.callback(now_ms)
+                try:
+                    rearm = timer.callback(now_ms)
+                except Exception:
+                    self._push_timer(timer)
+                    raise
                 elapsed_ms = get_monotonic_timestamp_in_ms() - start_ms
                 histogram.add_histogram_data("timer callback: " + timer.timer_name,
-                                             elapsed_ms / 100, "decisecond")
-                if not rearm and timer.timer_id not in self._timers_to_delete:
-                    self._timers_to_delete.append(timer.timer_id)
-        finally:
-            self._scheduling_timers = False
+                                             elapsed_ms, "ms")
 
-            # Cleanup pending timers to be deleted.
-            self._timers[:] = [timer for timer in self._timers
-                               if timer.timer_id not in self._timers_to_delete]
-            # Cleanup list of timers to delete
-            del self._timers_to_delete[:]
+                if entry[self._ENTRY_TIMER] is None:
+                    # Deleted or rescheduled by its own callback
+                    continue
+                elif rearm:
+                    self._push_timer(timer)
+                else:
+                    del self._timers[timer.timer_id]
+        finally:
+            # Timers not dispatched because a callback raised are retried
+            # on the next tick.
+            for entry in expired:
+                if entry[self._ENTRY_TIMER] is not None:
+                    self._push_timer(entry[self._ENTRY_TIMER])
 
             elapsed_ms = get_monotonic_timestamp_in_ms() - overall_start_ms
             histogram.add_histogram_data("timer overall time per dispatch: ",
-                                         elapsed_ms / 100, "decisecond")
+                                         elapsed_ms, "ms")
 
     def add_timer(self, timer):
         """
         Add a timer
         """
-        self._timers.append(timer)
+        self._push_timer(timer)
 
     def delete_timer(self, timer_id):
         """
         Delete a timer
         """
-        if self._scheduling_timers:
-            self._timers_to_delete.append(timer_id)
-        else:
-            self._timers[:] = [timer for timer in self._timers
-                               if timer_id != timer.timer_id]
+        entry = self._timers.pop(timer_id, None)
+        if entry is not None:
+            self._invalidate_entry(entry)
 
     def reschedule_timer(self, timer_id, interval_secs):
         """
         Reschedule a timer
         """
-        existing_timer = next((timer for timer in self._timers
-                               if timer_id == timer.timer_id), None)
-        if existing_timer is not None:
-            existing_timer.reschedule(interval_secs)
+        entry = self._timers.get(timer_id, None)
+        if entry is not None:
+            timer = entry[self._ENTRY_TIMER]
+            timer.reschedule(interval_secs)
+            self._invalidate_entry(entry)
+            self._push_timer(timer)
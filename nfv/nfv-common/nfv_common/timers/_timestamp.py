@@ -37,5 +37,5 @@ def get_monotonic_timestamp_in_ms():
         errno_ = ctypes.get_errno()
         raise OSError(errno_, os.strerror(errno_))
     timestamp_ms = (t.tv_sec * 1e+3) + (t.tv_nsec * 1e-6)
-    DLOG.verbose("Monotonic timestamp fetched is %s." % timestamp_ms)
+    DLOG.verbose("Monotonic timestamp fetched is %s.", timestamp_ms)
     return timestamp_ms
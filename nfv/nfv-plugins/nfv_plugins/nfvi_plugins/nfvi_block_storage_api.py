@@ -81,10 +81,10 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
     _version = '1.0.0'
     _provider = 'Wind River'
     _signature = '22b3dbf6-e4ba-441b-8797-fb8a51210a43'
+    _token = openstack.SharedToken('_directory')
 
     def __init__(self):
         super(NFVIBlockStorageAPI, self).__init__()
-        self._token = None
         self._directory = None
 
     @property
@@ -124,7 +124,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
                 return
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -136,7 +136,8 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
             DLOG.verbose("Volume paging (before): %s" % paging)
 
             future.work(cinder.get_volumes, self._token, paging.page_limit,
-                        paging.next_page)
+                        paging.next_page, changes_since=paging.changes_since,
+                        fields=('id', 'name'))
             future.result = (yield)
 
             if not future.result.is_complete():
@@ -146,12 +147,11 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
 
             volumes = list()
 
-            for volume_data in volume_data_list['volumes']:
-                name = volume_data.get('name', None)
+            for volume_id, name in volume_data_list['volumes']:
                 if name is None:
-                    name = volume_data['id']
+                    name = volume_id
 
-                volumes.append((volume_data['id'], name))
+                volumes.append((volume_id, name))
 
             paging.next_page = None
 
@@ -198,7 +198,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -288,7 +288,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -335,7 +335,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -423,7 +423,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -511,7 +511,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
                 return
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -290,17 +290,10 @@ def instance_get_action_type(vm_action, vm_data=None):
 
 def instance_supports_live_migration(instance_data, ports_data):
     """
-    Determine if the instance supports live-migration
+    Determine if the instance supports live-migration, returns None if
+    that depends on ports that are not given
     """
 
-    # Live migration is not supported if there is a pci-passthrough or
-    # pci-sriov NIC.
-    for port in ports_data:
-        vnic_type = port.get('binding:vnic_type', '')
-        if (vnic_type in [neutron.VNIC_TYPE.DIRECT_PHYSICAL,
-                          neutron.VNIC_TYPE.DIRECT]):
-            return False
-
     # Live migration is not supported if there is an attached pci passthrough
     # device.
     flavor = instance_data['flavor']
@@ -309,9 +302,90 @@ def instance_supports_live_migration(instance_data, ports_data):
         if 'pci_passthrough:alias' in flavor_data_extra:
             return False
 
+    if ports_data is None:
+        return None
+
+    # Live migration is not supported if there is a pci-passthrough or
+    # pci-sriov NIC.
+    for port in ports_data:
+        vnic_type = port.get('binding:vnic_type', '')
+        if (vnic_type in [neutron.VNIC_TYPE.DIRECT_PHYSICAL,
+                          neutron.VNIC_TYPE.DIRECT]):
+            return False
+
     return True
 
 
+def instance_from_server_data(instance_data, ports_data=None):
+    """
+    Convert the nova server details to an nfvi instance, the live migration
+    support is left unknown if the ports of the server are not given
+    """
+    power_state_str = \
+        nova.vm_power_state_str(instance_data['OS-EXT-STS:power_state'])
+
+    nfvi_data = dict()
+    nfvi_data['vm_state'] = instance_data['OS-EXT-STS:vm_state']
+    nfvi_data['task_state'] = instance_data['OS-EXT-STS:task_state']
+    nfvi_data['power_state'] = power_state_str
+    nfvi_data['last_update_timestamp'] = instance_data['updated']
+
+    if nfvi_data['task_state'] is None:
+        nfvi_data['task_state'] = nova.VM_TASK_STATE.NONE
+
+    admin_state = instance_get_admin_state(nfvi_data['vm_state'],
+                                           nfvi_data['task_state'],
+                                           nfvi_data['power_state'])
+
+    oper_state = instance_get_oper_state(nfvi_data['vm_state'],
+                                         nfvi_data['task_state'],
+                                         nfvi_data['power_state'])
+
+    avail_status = instance_get_avail_status(nfvi_data['vm_state'],
+                                             nfvi_data['task_state'],
+                                             nfvi_data['power_state'])
+
+    action = instance_get_action(nfvi_data['task_state'],
+                                 nfvi_data['vm_state'],
+                                 nfvi_data['power_state'])
+
+    tenant_uuid = uuid.UUID(instance_data['tenant_id'])
+
+    instance_type = instance_data['flavor']
+
+    image_data = instance_data.get('image', None)
+    if image_data:
+        image_uuid = image_data.get('id', None)
+    else:
+        image_uuid = None
+
+    live_migration_support = instance_supports_live_migration(
+        instance_data, ports_data)
+
+    volumes = instance_data.get('os-extended-volumes:volumes_attached',
+                                list())
+    attached_volumes = list()
+    for volume in volumes:
+        attached_volumes.append(volume['id'])
+
+    instance_name = instance_data['name']
+    metadata = instance_data.get('metadata', dict())
+
+    # Check instance metadata for the recovery priority
+    recovery_priority = nova.get_recovery_priority(metadata, instance_name)
+
+    # Check instance metadata for the live migration timeout
+    live_migration_timeout = nova.get_live_migration_timeout(metadata,
+                                                             instance_name)
+
+    return nfvi_objs.Instance(
+        instance_data['id'], instance_data['name'],
+        str(tenant_uuid), admin_state, oper_state, avail_status, action,
+        instance_data['OS-EXT-SRV-ATTR:host'], instance_type,
+        image_uuid, live_migration_support, attached_volumes,
+        nfvi_data, recovery_priority, live_migration_timeout)
+
+
 def flavor_data_extra_get(flavor_data_extra):
     """
     Return flavor extra data fields
@@ -347,6 +421,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
     _version = '1.0.0'
     _provider = 'Wind River'
     _signature = '22b3dbf6-e4ba-441b-8797-fb8a51210a43'
+    _token = openstack.SharedToken('_directory')
 
     @property
     def name(self):
@@ -366,7 +441,6 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
     def __init__(self):
         super(NFVIComputeAPI, self).__init__()
-        self._token = None
         self._directory = None
         self._rpc_listener = None
         self._rest_api_server = None
@@ -408,7 +482,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -465,7 +539,8 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
                 response['reason'] = 'failed to get token from keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -531,7 +606,8 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
                                      'keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -595,7 +671,8 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
                                      'keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -669,7 +746,8 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
                                      'keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -749,7 +827,8 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             if self._host_supports_nova_compute(host_personality):
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -872,7 +951,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         """
         while True:
             timer_id = (yield)
-            DLOG.verbose("Auditing action requests, timer_id=%s." % timer_id)
+            DLOG.verbose("Auditing action requests, timer_id=%s.", timer_id)
             self._ageout_action_requests()
 
     def get_host_aggregates(self, future, callback):
@@ -887,7 +966,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -947,7 +1026,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1009,7 +1088,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1092,7 +1171,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1101,7 +1180,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
                 self._token = future.result.data
 
-            DLOG.verbose("Instance-Type paging (before): %s" % paging)
+            DLOG.verbose("Instance-Type paging (before): %s", paging)
 
             future.work(nova.get_flavors, self._token, paging.page_limit,
                         paging.next_page)
@@ -1128,7 +1207,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
                         paging.next_page = flavor_link['href']
                         break
 
-            DLOG.verbose("Instance-Type paging (after): %s" % paging)
+            DLOG.verbose("Instance-Type paging (after): %s", paging)
 
             response['result-data'] = instance_type_objs
             response['completed'] = True
@@ -1166,7 +1245,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1279,7 +1358,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1327,7 +1406,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1431,7 +1510,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1520,7 +1599,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1529,10 +1608,12 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
                 self._token = future.result.data
 
-            DLOG.verbose("Instance paging (before): %s" % paging)
+            DLOG.verbose("Instance paging (before): %s", paging)
 
             future.work(nova.get_servers, self._token, paging.page_limit,
-                        paging.next_page, context=context)
+                        paging.next_page, context=context,
+                        changes_since=paging.changes_since,
+                        fields=('id', 'name'))
             future.result = (yield)
 
             if not future.result.is_complete():
@@ -1540,10 +1621,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             instance_data_list = future.result.data
 
-            instances = list()
-
-            for instance_data in instance_data_list['servers']:
-                instances.append((instance_data['id'], instance_data['name']))
+            instances = instance_data_list['servers']
 
             paging.next_page = None
 
@@ -1554,7 +1632,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
                         paging.next_page = server_link['href']
                         break
 
-            DLOG.verbose("Instance paging (after): %s" % paging)
+            DLOG.verbose("Instance paging (after): %s", paging)
 
             response['result-data'] = instances
             response['completed'] = True
@@ -1578,6 +1656,87 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             callback.send(response)
             callback.close()
 
+    def get_instances_detail(self, future, paging, context, callback):
+        """
+        Get a list of instances with their details, the ports of the
+        instances are not looked up so their live migration support may be
+        left unknown
+        """
+        response = dict()
+        response['completed'] = False
+        response['reason'] = ''
+        response['page-request-id'] = paging.page_request_id
+        response['incomplete-instances'] = list()
+
+        try:
+            future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
+
+            if self._token is None or self._token.is_expired():
+                future.queue_wait(openstack.get_token_queue(self._directory))
+                future.result = (yield)
+
+                if not future.result.is_complete() or \
+                        future.result.data is None:
+                    return
+
+                self._token = future.result.data
+
+            DLOG.verbose("Instance detail paging (before): %s", paging)
+
+            future.work(nova.get_servers, self._token, paging.page_limit,
+                        paging.next_page, context=context,
+                        changes_since=paging.changes_since, detail=True)
+            future.result = (yield)
+
+            if not future.result.is_complete():
+                return
+
+            instance_data_list = future.result.data
+
+            instances = list()
+            for instance_data in instance_data_list['servers']:
+                try:
+                    instances.append(instance_from_server_data(instance_data))
+                except (KeyError, TypeError, ValueError) as e:
+                    DLOG.error("Incomplete details for instance %s, error=%s."
+                               % (instance_data.get('id', None), e))
+                    response['incomplete-instances'].append(
+                        (instance_data.get('id', None),
+                         instance_data.get('name', None)))
+
+            paging.next_page = None
+
+            server_links = instance_data_list.get('servers_links', None)
+            if server_links is not None:
+                for server_link in server_links:
+                    if 'next' == server_link['rel']:
+                        paging.next_page = server_link['href']
+                        break
+
+            DLOG.verbose("Instance detail paging (after): %s", paging)
+
+            response['result-data'] = instances
+            response['completed'] = True
+
+        except exceptions.OpenStackRestAPIException as e:
+            if httplib.UNAUTHORIZED == e.http_status_code:
+                response['error-code'] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
+                if self._token is not None:
+                    self._token.set_expired()
+
+            else:
+                DLOG.exception("Caught exception while trying to get a list"
+                               " of instance details, error=%s." % e)
+                response['reason'] = e.http_response_reason
+
+        except Exception as e:
+            DLOG.exception("Caught exception while trying to get a list of "
+                           "instance details, error=%s." % e)
+
+        finally:
+            callback.send(response)
+            callback.close()
+
     def create_instance(self, future, instance_name, instance_type_uuid,
                         image_uuid, block_devices, networks, context,
                         callback):
@@ -1592,7 +1751,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1711,7 +1870,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1787,7 +1946,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1862,7 +2021,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1939,7 +2098,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2016,7 +2175,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2091,7 +2250,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2166,7 +2325,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2241,7 +2400,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2316,7 +2475,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2396,7 +2555,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2467,7 +2626,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2520,7 +2679,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2594,7 +2753,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2668,7 +2827,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2742,7 +2901,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2816,7 +2975,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2889,7 +3048,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2957,7 +3116,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -3012,7 +3171,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -3040,71 +3199,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             ports_data = future.result.data.get('ports', [])
 
-            power_state_str = \
-                nova.vm_power_state_str(instance_data['OS-EXT-STS:power_state'])
-
-            nfvi_data = dict()
-            nfvi_data['vm_state'] = instance_data['OS-EXT-STS:vm_state']
-            nfvi_data['task_state'] = instance_data['OS-EXT-STS:task_state']
-            nfvi_data['power_state'] = power_state_str
-            nfvi_data['last_update_timestamp'] = instance_data['updated']
-
-            if nfvi_data['task_state'] is None:
-                nfvi_data['task_state'] = nova.VM_TASK_STATE.NONE
-
-            admin_state = instance_get_admin_state(nfvi_data['vm_state'],
-                                                   nfvi_data['task_state'],
-                                                   nfvi_data['power_state'])
-
-            oper_state = instance_get_oper_state(nfvi_data['vm_state'],
-                                                 nfvi_data['task_state'],
-                                                 nfvi_data['power_state'])
-
-            avail_status = instance_get_avail_status(nfvi_data['vm_state'],
-                                                     nfvi_data['task_state'],
-                                                     nfvi_data['power_state'])
-
-            action = instance_get_action(nfvi_data['task_state'],
-                                         nfvi_data['vm_state'],
-                                         nfvi_data['power_state'])
-
-            tenant_uuid = uuid.UUID(instance_data['tenant_id'])
-
-            instance_type = instance_data['flavor']
-
-            image_data = instance_data.get('image', None)
-            if image_data:
-                image_uuid = image_data.get('id', None)
-            else:
-                image_uuid = None
-
-            live_migration_support = instance_supports_live_migration(
-                instance_data, ports_data)
-
-            volumes = instance_data.get('os-extended-volumes:volumes_attached',
-                                        list())
-            attached_volumes = list()
-            for volume in volumes:
-                attached_volumes.append(volume['id'])
-
-            instance_name = instance_data['name']
-            metadata = instance_data.get('metadata', dict())
-
-            # Check instance metadata for the recovery priority
-            recovery_priority = \
-                nova.get_recovery_priority(metadata,
-                                           instance_name)
-            # Check instance metadata for the live migration timeout
-            live_migration_timeout = \
-                nova.get_live_migration_timeout(metadata,
-                                                instance_name)
-
-            instance_obj = nfvi_objs.Instance(
-                instance_data['id'], instance_data['name'],
-                str(tenant_uuid), admin_state, oper_state, avail_status, action,
-                instance_data['OS-EXT-SRV-ATTR:host'], instance_type,
-                image_uuid, live_migration_support, attached_volumes,
-                nfvi_data, recovery_priority, live_migration_timeout)
+            instance_obj = instance_from_server_data(instance_data, ports_data)
 
             response['result-data'] = instance_obj
             response['completed'] = True
@@ -3223,8 +3318,8 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         reason = message.get('reason', None)
 
         DLOG.debug("Instance action-change: instance_uuid=%s, task_state=%s,"
-                   " task_status=%s, error_msg=%s."
-                   % (instance_uuid, task_state, task_status, reason))
+                   " task_status=%s, error_msg=%s.", instance_uuid, task_state,
+                   task_status, reason)
 
         action = instance_get_action(task_state)
 
@@ -3302,8 +3397,8 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
                 break
 
             if instance_action_data is not None:
-                DLOG.verbose("Instance %s action=%s" % (instance_uuid,
-                                                        instance_action_data))
+                DLOG.verbose("Instance %s action=%s", instance_uuid,
+                             instance_action_data)
 
                 for callback in self._instance_action_callbacks:
                     success = callback(instance_uuid, instance_action_data)
@@ -3317,8 +3412,8 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         else:
             http_response = httplib.NO_CONTENT
 
-        DLOG.debug("Instance action rest-api post path: %s."
-                   % request_dispatch.path)
+        DLOG.debug("Instance action rest-api post path: %s.",
+                   request_dispatch.path)
 
         if httplib.ACCEPTED == http_response:
             if self._auto_accept_action_requests:
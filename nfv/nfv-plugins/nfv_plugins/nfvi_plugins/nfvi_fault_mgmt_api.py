@@ -24,6 +24,7 @@ class NFVIFaultMgmtAPI(nfvi.api.v1.NFVIFaultMgmtAPI):
     _version = '1.0.0'
     _provider = 'StarlingX'
     _signature = '2808f351-92bb-482c-b873-66ab232254af'
+    _openstack_token = openstack.SharedToken('_openstack_directory')
 
     @property
     def name(self):
@@ -43,7 +44,6 @@ class NFVIFaultMgmtAPI(nfvi.api.v1.NFVIFaultMgmtAPI):
 
     def __init__(self):
         super(NFVIFaultMgmtAPI, self).__init__()
-        self._openstack_token = None
         self._openstack_directory = None
 
     def get_openstack_alarms(self, future, callback):
@@ -59,7 +59,8 @@ class NFVIFaultMgmtAPI(nfvi.api.v1.NFVIFaultMgmtAPI):
 
             if self._openstack_token is None or \
                     self._openstack_token.is_expired():
-                future.work(openstack.get_token, self._openstack_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._openstack_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -119,7 +120,8 @@ class NFVIFaultMgmtAPI(nfvi.api.v1.NFVIFaultMgmtAPI):
 
             if self._openstack_token is None or \
                     self._openstack_token.is_expired():
-                future.work(openstack.get_token, self._openstack_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._openstack_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -169,7 +171,8 @@ class NFVIFaultMgmtAPI(nfvi.api.v1.NFVIFaultMgmtAPI):
 
             if self._openstack_token is None or \
                     self._openstack_token.is_expired():
-                future.work(openstack.get_token, self._openstack_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._openstack_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
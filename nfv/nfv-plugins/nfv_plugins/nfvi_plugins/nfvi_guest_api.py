@@ -186,6 +186,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
     _version = '1.0.0'
     _provider = 'Wind River'
     _signature = '22b3dbf6-e4ba-441b-8797-fb8a51210a43'
+    _token = openstack.SharedToken('_directory')
 
     @property
     def name(self):
@@ -205,7 +206,6 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
 
     def __init__(self):
         super(NFVIGuestAPI, self).__init__()
-        self._token = None
         self._directory = None
         self._openstack_directory = None
         self._rest_api_server = None
@@ -233,7 +233,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -285,7 +285,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -360,7 +360,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -416,7 +416,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -493,7 +493,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -554,7 +554,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -620,7 +620,8 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
                                      'keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -709,7 +710,8 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
                                      'keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -779,7 +781,8 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
                                      'keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -845,7 +848,8 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
                                      'keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -916,7 +920,8 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
             if self._host_supports_nova_compute(host_personality):
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -27,10 +27,10 @@ class NFVIIdentityAPI(nfvi.api.v1.NFVIIdentityAPI):
     _version = '1.0.0'
     _provider = 'Wind River'
     _signature = '22b3dbf6-e4ba-441b-8797-fb8a51210a43'
+    _token = openstack.SharedToken('_directory')
 
     def __init__(self):
         super(NFVIIdentityAPI, self).__init__()
-        self._token = None
         self._directory = None
 
     @property
@@ -61,7 +61,7 @@ class NFVIIdentityAPI(nfvi.api.v1.NFVIIdentityAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
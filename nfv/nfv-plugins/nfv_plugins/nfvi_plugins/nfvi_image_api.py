@@ -57,10 +57,10 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
     _version = '1.0.0'
     _provider = 'Wind River'
     _signature = '22b3dbf6-e4ba-441b-8797-fb8a51210a43'
+    _token = openstack.SharedToken('_directory')
 
     def __init__(self):
         super(NFVIImageAPI, self).__init__()
-        self._token = None
         self._directory = None
 
     @property
@@ -100,7 +100,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
                 return
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -112,7 +112,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
             DLOG.verbose("Image paging (before): %s" % paging)
 
             future.work(glance.get_images, self._token, paging.page_limit,
-                        paging.next_page)
+                        paging.next_page, changes_since=paging.changes_since)
             future.result = (yield)
 
             if not future.result.is_complete():
@@ -209,7 +209,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -339,7 +339,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -390,7 +390,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -504,7 +504,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -103,6 +103,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
     _version = '1.0.0'
     _provider = 'Wind River'
     _signature = '22b3dbf6-e4ba-441b-8797-fb8a51210a43'
+    _platform_token = openstack.SharedToken('_platform_directory')
+    _openstack_token = openstack.SharedToken('_openstack_directory')
 
     @property
     def name(self):
@@ -153,8 +155,6 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
     def __init__(self):
         super(NFVIInfrastructureAPI, self).__init__()
-        self._platform_token = None
-        self._openstack_token = None
         self._platform_directory = None
         self._openstack_directory = None
         self._rest_api_server = None
@@ -188,7 +188,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -240,7 +241,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -306,7 +308,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -364,7 +367,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
                 DLOG.error("AR_TEST: future.result.data is %s, future.result.is_complete is %s" % (future.result.data, future.result.is_complete()) )
                 if not future.result.is_complete() or \
@@ -514,7 +518,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -631,7 +636,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -686,7 +692,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -742,7 +749,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -798,7 +806,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -854,7 +863,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -919,7 +929,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -976,7 +987,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1033,7 +1045,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1230,7 +1243,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1350,7 +1364,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1470,7 +1485,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1589,7 +1605,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1707,7 +1724,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1760,7 +1778,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1883,7 +1902,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1941,7 +1961,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1994,7 +2015,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2047,7 +2069,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2100,7 +2123,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2153,7 +2177,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2204,7 +2229,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2264,7 +2290,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -2314,7 +2341,8 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
             if self._platform_token is None or \
                     self._platform_token.is_expired():
-                future.work(openstack.get_token, self._platform_directory)
+                future.queue_wait(
+                    openstack.get_token_queue(self._platform_directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
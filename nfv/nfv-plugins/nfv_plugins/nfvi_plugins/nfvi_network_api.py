@@ -63,10 +63,10 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
     _version = '1.0.0'
     _provider = 'Wind River'
     _signature = '22b3dbf6-e4ba-441b-8797-fb8a51210a43'
+    _token = openstack.SharedToken('_directory')
 
     def __init__(self):
         super(NFVINetworkAPI, self).__init__()
-        self._token = None
         self._directory = None
         self._neutron_extensions = None
 
@@ -112,7 +112,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
                 return
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -121,10 +121,14 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
                 self._token = future.result.data
 
-            DLOG.verbose("Network paging (before): %s" % paging)
+            DLOG.verbose("Network paging (before): %s", paging)
 
             future.work(neutron.get_networks, self._token, paging.page_limit,
-                        paging.next_page)
+                        paging.next_page, changes_since=paging.changes_since,
+                        fields=('id', 'name', 'admin_state_up', 'status',
+                                'shared', 'mtu', 'provider:physical_network',
+                                'provider:network_type',
+                                'provider:segmentation_id'))
             future.result = (yield)
 
             if not future.result.is_complete():
@@ -134,20 +138,18 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             network_objs = list()
 
-            for network_data in network_data_list['networks']:
+            for (network_id, name, admin_state_up, status, shared, mtu,
+                 physical_network, network_type, segmentation_id) \
+                    in network_data_list['networks']:
                 provider_data = nfvi.objects.v1.NetworkProviderData(
-                    network_data['provider:physical_network'],
-                    network_data['provider:network_type'],
-                    network_data['provider:segmentation_id'])
+                    physical_network, network_type, segmentation_id)
 
                 network_obj = nfvi.objects.v1.Network(
-                    network_data['id'], network_data['name'],
-                    network_get_admin_state(network_data['admin_state_up']),
-                    network_get_oper_state(network_data['status']),
-                    network_get_avail_status(network_data['status']),
-                    network_data['shared'],
-                    network_data['mtu'],
-                    provider_data)
+                    network_id, name,
+                    network_get_admin_state(admin_state_up),
+                    network_get_oper_state(status),
+                    network_get_avail_status(status),
+                    shared, mtu, provider_data)
 
                 network_objs.append(network_obj)
 
@@ -160,7 +162,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
                         paging.next_page = network_link['href']
                         break
 
-            DLOG.verbose("Network paging (after): %s" % paging)
+            DLOG.verbose("Network paging (after): %s", paging)
 
             response['result-data'] = network_objs
             response['completed'] = True
@@ -196,7 +198,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -262,7 +264,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -327,7 +329,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -377,7 +379,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -453,7 +455,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
                 return
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -462,10 +464,12 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
                 self._token = future.result.data
 
-            DLOG.verbose("Subnet paging (before): %s" % paging)
+            DLOG.verbose("Subnet paging (before): %s", paging)
 
             future.work(neutron.get_subnets, self._token, paging.page_limit,
-                        paging.next_page)
+                        paging.next_page, changes_since=paging.changes_since,
+                        fields=('id', 'name', 'ip_version', 'cidr',
+                                'gateway_ip', 'network_id', 'enable_dhcp'))
             future.result = (yield)
 
             if not future.result.is_complete():
@@ -475,18 +479,17 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             subnet_objs = list()
 
-            for subnet_data in subnet_data_list['subnets']:
-                subnet = subnet_data['cidr'].split('/')
+            for (subnet_id, name, ip_version, cidr, gateway_ip, network_id,
+                 enable_dhcp) in subnet_data_list['subnets']:
+                subnet = cidr.split('/')
                 subnet_ip = subnet[0]
                 subnet_prefix = subnet[1]
 
-                subnet_obj = nfvi.objects.v1.Subnet(subnet_data['id'],
-                                                    subnet_data['name'],
-                                                    subnet_data['ip_version'],
+                subnet_obj = nfvi.objects.v1.Subnet(subnet_id, name,
+                                                    ip_version,
                                                     subnet_ip, subnet_prefix,
-                                                    subnet_data['gateway_ip'],
-                                                    subnet_data['network_id'],
-                                                    subnet_data['enable_dhcp'])
+                                                    gateway_ip, network_id,
+                                                    enable_dhcp)
                 subnet_objs.append(subnet_obj)
 
             paging.next_page = None
@@ -498,7 +501,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
                         paging.next_page = subnet_link['href']
                         break
 
-            DLOG.verbose("Subnet paging (after): %s" % paging)
+            DLOG.verbose("Subnet paging (after): %s", paging)
 
             response['result-data'] = subnet_objs
             response['completed'] = True
@@ -538,7 +541,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -605,7 +608,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -668,7 +671,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -718,7 +721,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -788,7 +791,8 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
                                      'keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -872,7 +876,8 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
                                      'keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -955,7 +960,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1025,7 +1030,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1099,7 +1104,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1173,7 +1178,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1247,7 +1252,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1321,7 +1326,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1395,7 +1400,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1469,7 +1474,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1543,7 +1548,7 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
 
             if self._token is None or \
                     self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -1620,7 +1625,8 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
             if self._host_supports_neutron(host_personality):
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -1700,7 +1706,8 @@ class NFVINetworkAPI(nfvi.api.v1.NFVINetworkAPI):
                 response['reason'] = 'failed to get token from keystone'
                 if self._token is None or \
                         self._token.is_expired():
-                    future.work(openstack.get_token, self._directory)
+                    future.queue_wait(
+                        openstack.get_token_queue(self._directory))
                     future.result = (yield)
 
                     if not future.result.is_complete() or \
@@ -25,10 +25,10 @@ class NFVISwMgmtAPI(nfvi.api.v1.NFVISwMgmtAPI):
     _version = '1.0.0'
     _provider = 'Wind River'
     _signature = '22b3dbf6-e4ba-441b-8797-fb8a51210a43'
+    _token = openstack.SharedToken('_directory')
 
     def __init__(self):
         super(NFVISwMgmtAPI, self).__init__()
-        self._token = None
         self._directory = None
 
     @property
@@ -59,7 +59,7 @@ class NFVISwMgmtAPI(nfvi.api.v1.NFVISwMgmtAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -118,7 +118,7 @@ class NFVISwMgmtAPI(nfvi.api.v1.NFVISwMgmtAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -178,7 +178,7 @@ class NFVISwMgmtAPI(nfvi.api.v1.NFVISwMgmtAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
@@ -228,7 +228,7 @@ class NFVISwMgmtAPI(nfvi.api.v1.NFVISwMgmtAPI):
             future.set_timeouts(config.CONF.get('nfvi-timeouts', None))
 
             if self._token is None or self._token.is_expired():
-                future.work(openstack.get_token, self._directory)
+                future.queue_wait(openstack.get_token_queue(self._directory))
                 future.result = (yield)
 
                 if not future.result.is_complete() or \
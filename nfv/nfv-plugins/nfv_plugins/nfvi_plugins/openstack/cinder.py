@@ -12,6 +12,7 @@ from nfv_common.helpers import Constants
 from nfv_common.helpers import Singleton
 
 from nfv_plugins.nfvi_plugins.openstack.objects import OPENSTACK_SERVICE
+from nfv_plugins.nfvi_plugins.openstack.rest_api import rest_api_list_request
 from nfv_plugins.nfvi_plugins.openstack.rest_api import rest_api_request
 
 DLOG = debug.debug_get_logger('nfv_plugins.nfvi_plugins.openstack.cinder')
@@ -40,9 +41,12 @@ class VolumeStatus(Constants):
 VOLUME_STATUS = VolumeStatus()
 
 
-def get_volumes(token, page_limit=None, next_page=None, all_tenants=True):
+def get_volumes(token, page_limit=None, next_page=None, all_tenants=True,
+                changes_since=None, fields=None):
     """
-    Asks OpenStack Cinder for a list of volumes
+    Asks OpenStack Cinder for a list of volumes, only volumes changed since
+    the given timestamp are listed if changes_since is set. If fields are
+    given each volume is returned as a tuple of those fields.
     """
     if next_page is None:
         url = token.get_service_url(OPENSTACK_SERVICE.CINDER)
@@ -57,12 +61,17 @@ def get_volumes(token, page_limit=None, next_page=None, all_tenants=True):
                 api_cmd += "&all_tenants=1"
         elif all_tenants:
             api_cmd += "?all_tenants=1"
+
+        if changes_since is not None:
+            api_cmd += "%schanges-since=%s" % ('&' if '?' in api_cmd else '?',
+                                              changes_since)
     else:
         api_cmd = next_page
 
     api_cmd_headers = dict()
 
-    response = rest_api_request(token, "GET", api_cmd, api_cmd_headers)
+    response = rest_api_list_request(token, api_cmd, 'volumes', fields,
+                                     api_cmd_headers)
     return response
 
 
@@ -34,9 +34,10 @@ class ImageStatus(Constants):
 IMAGE_STATUS = ImageStatus()
 
 
-def get_images(token, page_limit=1, next_page=None):
+def get_images(token, page_limit=1, next_page=None, changes_since=None):
     """
-    Ask OpenStack Glance for a list of images
+    Ask OpenStack Glance for a list of images, only images updated since
+    the given timestamp are listed if changes_since is set
     """
     url = token.get_service_url(OPENSTACK_SERVICE.GLANCE, strip_version=True)
     if url is None:
@@ -49,6 +50,10 @@ def get_images(token, page_limit=1, next_page=None):
 
         if page_limit is not None:
             api_cmd += "?limit=%s" % page_limit
+
+        if changes_since is not None:
+            api_cmd += "%supdated_at=gte:%s" % ('&' if '?' in api_cmd else '?',
+                                                changes_since)
     else:
         api_cmd += next_page
 
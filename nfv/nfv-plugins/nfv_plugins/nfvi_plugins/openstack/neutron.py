@@ -13,6 +13,7 @@ from nfv_common.helpers import Constants
 from nfv_common.helpers import Singleton
 
 from nfv_plugins.nfvi_plugins.openstack.objects import OPENSTACK_SERVICE
+from nfv_plugins.nfvi_plugins.openstack.rest_api import rest_api_list_request
 from nfv_plugins.nfvi_plugins.openstack.rest_api import rest_api_request
 
 DLOG = debug.debug_get_logger('nfv_plugins.nfvi_plugins.openstack.neutron')
@@ -300,9 +301,12 @@ def get_extensions(token):
     return response
 
 
-def get_networks(token, page_limit=None, next_page=None):
+def get_networks(token, page_limit=None, next_page=None,
+                 changes_since=None, fields=None):
     """
-    Asks OpenStack Neutron for a list of networks
+    Asks OpenStack Neutron for a list of networks, only networks changed since
+    the given timestamp are listed if changes_since is set. If fields are
+    given each network is returned as a tuple of those fields.
     """
     if next_page is None:
         url = token.get_service_url(OPENSTACK_SERVICE.NEUTRON)
@@ -313,12 +317,17 @@ def get_networks(token, page_limit=None, next_page=None):
 
         if page_limit is not None:
             api_cmd += "?limit=%s" % page_limit
+
+        if changes_since is not None:
+            api_cmd += "%schanged_since=%s" % ('&' if '?' in api_cmd else '?',
+                                                changes_since)
     else:
         api_cmd = next_page
 
     api_cmd_headers = dict()
 
-    response = rest_api_request(token, "GET", api_cmd, api_cmd_headers)
+    response = rest_api_list_request(token, api_cmd, 'networks', fields,
+                                     api_cmd_headers)
     return response
 
 
@@ -420,9 +429,12 @@ def get_network(token, network_id):
     return response
 
 
-def get_subnets(token, page_limit=None, next_page=None):
+def get_subnets(token, page_limit=None, next_page=None,
+                changes_since=None, fields=None):
     """
-    Ask OpenStack Neutron for a list of subnets
+    Ask OpenStack Neutron for a list of subnets, only subnets changed since
+    the given timestamp are listed if changes_since is set. If fields are
+    given each subnet is returned as a tuple of those fields.
     """
     if next_page is None:
         url = token.get_service_url(OPENSTACK_SERVICE.NEUTRON)
@@ -433,12 +445,17 @@ def get_subnets(token, page_limit=None, next_page=None):
 
         if page_limit is not None:
             api_cmd += "?limit=%s" % page_limit
+
+        if changes_since is not None:
+            api_cmd += "%schanged_since=%s" % ('&' if '?' in api_cmd else '?',
+                                                changes_since)
     else:
         api_cmd = next_page
 
     api_cmd_headers = dict()
 
-    response = rest_api_request(token, "GET", api_cmd, api_cmd_headers)
+    response = rest_api_list_request(token, api_cmd, 'subnets', fields,
+                                     api_cmd_headers)
     return response
 
 
@@ -13,6 +13,8 @@ from nfv_common.helpers import Singleton
 
 from nfv_plugins.nfvi_plugins.openstack.exceptions import NotFound
 from nfv_plugins.nfvi_plugins.openstack.objects import OPENSTACK_SERVICE
+from nfv_plugins.nfvi_plugins.openstack.rest_api import rest_api_list_request
+from nfv_plugins.nfvi_plugins.openstack.rest_api import rest_api_list_request_with_context
 from nfv_plugins.nfvi_plugins.openstack.rest_api import rest_api_request
 from nfv_plugins.nfvi_plugins.openstack.rest_api import rest_api_request_with_context
 
@@ -407,9 +409,12 @@ def get_server_groups(token, all_projects=True):
 
 
 def get_servers(token, page_limit=None, next_page=None, all_tenants=True,
-                context=None):
+                context=None, changes_since=None, fields=None, detail=False):
     """
-    Asks OpenStack Nova for a list of servers
+    Asks OpenStack Nova for a list of servers, only servers changed since
+    the given timestamp are listed if changes_since is set. If fields are
+    given each server is returned as a tuple of those fields. The details
+    of each server are listed if detail is set.
     """
     if context is None:
         tenant_id = token.get_tenant_id()
@@ -422,6 +427,8 @@ def get_servers(token, page_limit=None, next_page=None, all_tenants=True,
             raise ValueError("OpenStack Nova URL is invalid")
 
         api_cmd = url + "/v2.1/%s/servers" % tenant_id
+        if detail:
+            api_cmd += "/detail"
 
         if page_limit is not None:
             api_cmd += "?limit=%s" % page_limit
@@ -429,19 +436,28 @@ def get_servers(token, page_limit=None, next_page=None, all_tenants=True,
                 api_cmd += "&all_tenants=1"
         elif all_tenants:
             api_cmd += "?all_tenants=1"
+
+        if changes_since is not None:
+            api_cmd += "%schanges-since=%s" % ('&' if '?' in api_cmd else '?',
+                                              changes_since)
     else:
         api_cmd = next_page
 
     api_cmd_headers = dict()
 
     if context is None:
-        response = rest_api_request(token, "GET", api_cmd, api_cmd_headers)
+        if detail:
+            # Same server details as get_server
+            api_cmd_headers['X-OpenStack-Nova-API-Version'] = NOVA_API_VERSION
+        response = rest_api_list_request(token, api_cmd, 'servers', fields,
+                                         api_cmd_headers)
     else:
         if context.version is not None:
             api_cmd_headers['X-OpenStack-Nova-API-Version'] = context.version
 
-        response = rest_api_request_with_context(context, "GET", api_cmd,
-                                                 api_cmd_headers)
+        response = rest_api_list_request_with_context(context, api_cmd,
+                                                      'servers', fields,
+                                                      api_cmd_headers)
     return response
 
 
@@ -234,14 +234,26 @@ class Token(object):
     """
     Token
     """
+    _expired_callbacks = list()
+
     def __init__(self, token_data, directory, token_id):
         self._expired = False
         self._data = token_data
         self._directory = directory
         self._token_id = token_id
 
+    @staticmethod
+    def register_expired_callback(callback):
+        """
+        Register a callback to be called with a token when it is set as
+        expired
+        """
+        Token._expired_callbacks.append(callback)
+
     def set_expired(self):
         self._expired = True
+        for callback in Token._expired_callbacks:
+            callback(self)
 
     def is_expired(self, within_seconds=300):
         if not self._expired:
@@ -5,8 +5,13 @@
 #
 import json
 from six.moves import urllib
+import socket
+import threading
 
 from nfv_common import debug
+from nfv_common import histogram
+from nfv_common import selectable
+from nfv_common import timers
 from nfv_plugins.nfvi_plugins.openstack.objects import Directory
 from nfv_plugins.nfvi_plugins.openstack.objects import OPENSTACK_SERVICE
 from nfv_plugins.nfvi_plugins.openstack.objects import PLATFORM_SERVICE
@@ -79,6 +84,256 @@ def get_token(directory):
         return None
 
 
+class TokenManager(object):
+    """
+    Token Manager, a token is shared by everyone using the same directory
+    and is refreshed in the background before it expires so that callers
+    rarely need to authenticate themselves. Callers that find the token
+    missing or expired wait for the refresh in progress instead of asking
+    keystone themselves.
+    """
+    def __init__(self, refresh_before_secs=900, check_interval_secs=30):
+        self._refresh_before_secs = refresh_before_secs
+        self._check_interval_secs = check_interval_secs
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._directories = dict()
+        self._tokens = dict()
+        self._token_timestamps_ms = dict()
+        self._refreshing = set()
+        self._waiters = dict()
+        self._thread = None
+
+    @staticmethod
+    def _key(directory):
+        """
+        Returns the key of the token for a directory
+        """
+        return (directory.service_category, directory.auth_uri,
+                directory.auth_host, directory.auth_port,
+                directory.auth_username, directory.auth_project)
+
+    def _start(self):
+        """
+        Start the refresh thread, called with the lock held
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._refresh_loop,
+                                            name='token-manager')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def get_token(self, directory):
+        """
+        Returns the token for a directory, None if no token is available
+        """
+        key = self._key(directory)
+        with self._lock:
+            if key not in self._directories:
+                self._directories[key] = directory
+                self._start()
+            token = self._tokens.get(key, None)
+
+        if token is None:
+            self._wakeup.set()
+        return token
+
+    def wait_token(self, directory):
+        """
+        Returns a queue that is given the token for a directory once the
+        refresh in progress, or one started now, completes; the queue is
+        given None if the refresh fails
+        """
+        key = self._key(directory)
+        token_queue = selectable.ThreadQueue(b't')
+        with self._lock:
+            self._directories.setdefault(key, directory)
+            token = self._tokens.get(key, None)
+            refresh = token is None or token.is_expired()
+            if refresh:
+                self._waiters.setdefault(key, list()).append(token_queue)
+                self._start()
+
+        if refresh:
+            self._wakeup.set()
+        else:
+            token_queue.put(token)
+        return token_queue
+
+    def token_expired(self, token):
+        """
+        A token has been set as expired, it is refreshed now if shared
+        """
+        with self._lock:
+            shared = any(token is shared_token
+                         for shared_token in self._tokens.values())
+        if shared:
+            self._wakeup.set()
+
+    def set_token(self, directory, token):
+        """
+        Share a token obtained for a directory, setting no token discards
+        the token shared
+        """
+        key = self._key(directory)
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        with self._lock:
+            self._directories.setdefault(key, directory)
+            old_token = self._tokens.get(key, None)
+            if old_token is token:
+                return
+            self._start()
+            if token is None:
+                del self._tokens[key]
+            else:
+                self._tokens[key] = token
+                token_timestamp_ms = self._token_timestamps_ms.get(key, None)
+                self._token_timestamps_ms[key] = now_ms
+
+        if token is None:
+            self._wakeup.set()
+
+        elif old_token is not None and token_timestamp_ms is not None:
+            histogram.add_histogram_data(
+                "token-manager %s (token-age)" % directory.service_category,
+                (now_ms - token_timestamp_ms) / 1000, 'secs')
+
+    def refresh_due(self):
+        """
+        Returns the directories whose tokens are missing, expired or close
+        to expiring, or are waited on
+        """
+        due = list()
+        with self._lock:
+            for key, directory in self._directories.items():
+                if key in self._refreshing:
+                    continue
+                token = self._tokens.get(key, None)
+                if token is None or key in self._waiters or \
+                        token.is_expired(within_seconds=self._refresh_before_secs):
+                    due.append((key, directory))
+        return due
+
+    def refresh_token(self, key, directory):
+        """
+        Get a new token from keystone, blocks the caller. The callers
+        waiting on the token are given the token once done.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        try:
+            start_ms = timers.get_monotonic_timestamp_in_ms()
+            token = get_token(directory)
+            elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
+            histogram.add_histogram_data(
+                "token-manager %s (refresh-latency)"
+                % directory.service_category, elapsed_ms, 'ms')
+
+            if token is not None:
+                self.set_token(directory, token)
+            else:
+                DLOG.error("Token refresh failed for %s."
+                           % directory.service_category)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+                waiters = self._waiters.pop(key, list())
+                token = self._tokens.get(key, None)
+
+            if token is not None and token.is_expired():
+                token = None
+
+            for token_queue in waiters:
+                try:
+                    token_queue.put(token)
+                except socket.error:
+                    # Waiting task was deleted, which closed the queue
+                    pass
+
+    def _refresh_loop(self):
+        """
+        Refresh thread, never runs in the main loop as getting a token
+        blocks on keystone
+        """
+        while True:
+            self._wakeup.wait(self._check_interval_secs)
+            self._wakeup.clear()
+            for key, directory in self.refresh_due():
+                try:
+                    self.refresh_token(key, directory)
+                except Exception as e:
+                    DLOG.exception("Caught exception while refreshing token "
+                                   "for %s, error=%s."
+                                   % (directory.service_category, e))
+
+
+_token_manager = TokenManager()
+
+
+def get_token_manager():
+    """
+    Get a reference to the token manager
+    """
+    return _token_manager
+
+
+def get_token_queue(directory):
+    """
+    Returns a queue given the token for a directory once the token manager
+    has one, for tasks to wait on instead of asking keystone themselves
+    """
+    return _token_manager.wait_token(directory)
+
+
+def _token_expired(token):
+    """
+    Called when a token is set as expired
+    """
+    _token_manager.token_expired(token)
+
+
+Token.register_expired_callback(_token_expired)
+
+
+class SharedToken(object):
+    """
+    Shared Token, an attribute holding the token of the directory kept in
+    another attribute of the same object, the token is shared through the
+    token manager
+    """
+    def __init__(self, directory_attr):
+        self._directory_attr = directory_attr
+        self._seen_attr = '_shared_token_seen%s' % directory_attr
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        directory = getattr(obj, self._directory_attr, None)
+        if directory is None:
+            return None
+
+        token = _token_manager.get_token(directory)
+        if token is not None and token is not obj.__dict__.get(self._seen_attr):
+            # Obtained by someone else, this is a re-authentication avoided
+            obj.__dict__[self._seen_attr] = token
+            histogram.add_histogram_data(
+                "token-manager %s (re-auth-avoided)"
+                % directory.service_category, 1, 'requests')
+        return token
+
+    def __set__(self, obj, token):
+        directory = getattr(obj, self._directory_attr, None)
+        if directory is None:
+            return
+
+        obj.__dict__[self._seen_attr] = token
+        _token_manager.set_token(directory, token)
+
+
 def get_directory(config, service_category):
     """
     Get directory information from the given configuration for the given
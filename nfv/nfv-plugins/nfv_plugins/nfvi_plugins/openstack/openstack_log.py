@@ -17,14 +17,16 @@ def _log_write_log(error, msg, *args, **kwargs):
         return timestamp_data.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
 
     if False:
+        if args:
+            msg %= args
         with open(NFVI_OPENSTACK_LOG, "a") as f:
             fcntl.flock(f, fcntl.LOCK_EX)
             if error:
                 f.write(str('** ' + timestamp_str(datetime.datetime.now()) + ' ' +
-                            msg + '\n', *args, **kwargs))
+                            msg + '\n'))
             else:
                 f.write(str('   ' + timestamp_str(datetime.datetime.now()) + ' ' +
-                            msg + '\n', *args, **kwargs))
+                            msg + '\n'))
             fcntl.flock(f, fcntl.LOCK_UN)
 
 
@@ -3,8 +3,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import codecs
 import json
+import os
 import re
+import six
 from six.moves import BaseHTTPServer
 from six.moves import http_client as httplib
 from six.moves import socketserver as SocketServer
@@ -12,6 +15,7 @@ from six.moves import urllib
 
 import socket
 import struct
+import threading
 
 from nfv_common import debug
 from nfv_common import selobj
@@ -29,6 +33,169 @@ from nfv_plugins.nfvi_plugins.openstack.openstack_log import log_info
 DLOG = debug.debug_get_logger('nfv_plugins.nfvi_plugins.openstack.rest_api')
 
 
+class RestAPIRouteTable(object):
+    """
+    Rest-API Route Table, the path of a handler is a regular expression and
+    the longest path that matches the request wins. A path starting with
+    '/' is matched from the start of the request path, unless it has
+    alternatives outside of a group. The routes are kept in a radix trie
+    of the literal start of their paths, built when the table changes, so
+    that a request is matched in one pass whatever the number of routes.
+    Named groups are returned as path parameters.
+    """
+    _special_chars = '.^$*+?{}[]\\|()'
+    _quantifier_chars = '*+?{'
+
+    def __init__(self):
+        self._handlers = dict()
+        self._trie = (None, dict())
+        self._unanchored = list()
+
+    def __len__(self):
+        return len(self._handlers)
+
+    def __contains__(self, path):
+        return path in self._handlers
+
+    def add(self, path, handler):
+        """
+        Add a route
+        """
+        self._handlers[path] = handler
+        self._compile()
+
+    def delete(self, path):
+        """
+        Delete a route
+        """
+        if path in self._handlers:
+            del self._handlers[path]
+            self._compile()
+
+    @staticmethod
+    def _has_alternation(path):
+        """
+        Returns true if a path has a '|' outside of any group, which makes
+        each side of it a path of its own
+        """
+        depth = 0
+        in_class = False
+        escaped = False
+        for char in path:
+            if escaped:
+                escaped = False
+            elif '\\' == char:
+                escaped = True
+            elif in_class:
+                in_class = ']' != char
+            elif '[' == char:
+                in_class = True
+            elif '(' == char:
+                depth += 1
+            elif ')' == char:
+                depth -= 1
+            elif '|' == char and 0 == depth:
+                return True
+        return False
+
+    @classmethod
+    def _literal_prefix(cls, path):
+        """
+        Returns the start of a path that can only match itself
+        """
+        for idx, char in enumerate(path):
+            if char in cls._special_chars:
+                if char in cls._quantifier_chars and 0 < idx:
+                    # The previous character is optional or repeated
+                    idx -= 1
+                return path[:idx]
+        return path
+
+    @classmethod
+    def _compress(cls, node):
+        """
+        Returns a radix trie node, the routes ending at the node and the
+        edges to the next nodes keyed by their first character
+        """
+        edges = dict()
+        for char, child in node.items():
+            if char is None:
+                continue
+            edge = char
+            while None not in child and 1 == len(child):
+                next_char, child = list(child.items())[0]
+                edge += next_char
+            edges[char] = (edge, cls._compress(child))
+        return node.get(None, None), edges
+
+    def _compile(self):
+        """
+        Build the radix trie from a trie of the characters of the paths,
+        with the routes ending at a node kept under None
+        """
+        trie = dict()
+        self._unanchored = list()
+
+        paths = sorted(self._handlers, key=len, reverse=True)
+        for priority, path in enumerate(paths):
+            regex = re.compile(path)
+            if self._has_alternation(path):
+                # Only the first alternative has the start of the path
+                self._unanchored.append((priority, regex.search,
+                                         self._handlers[path]))
+                continue
+
+            if path.startswith('^'):
+                prefix = self._literal_prefix(path[1:])
+            elif path.startswith('/'):
+                prefix = self._literal_prefix(path)
+            else:
+                self._unanchored.append((priority, regex.search,
+                                         self._handlers[path]))
+                continue
+
+            node = trie
+            for char in prefix:
+                node = node.setdefault(char, dict())
+            node.setdefault(None, list()).append((priority, regex.match,
+                                                  self._handlers[path]))
+
+        self._trie = self._compress(trie)
+
+    def match(self, request_path):
+        """
+        Returns the handler for a request path and the path parameters,
+        the handler is None if no route matches
+        """
+        candidates = list(self._unanchored)
+        routes, edges = self._trie
+        pos = 0
+        while True:
+            if routes is not None:
+                candidates.extend(routes)
+
+            if pos >= len(request_path):
+                break
+
+            next_node = edges.get(request_path[pos], None)
+            if next_node is None:
+                break
+
+            edge, (routes, edges) = next_node
+            if not request_path.startswith(edge, pos):
+                break
+            pos += len(edge)
+
+        if 1 < len(candidates):
+            candidates.sort(key=lambda candidate: candidate[0])
+
+        for _, regex_match, handler in candidates:
+            match = regex_match(request_path)
+            if match is not None:
+                return handler, match.groupdict()
+        return None, dict()
+
+
 class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
     """
     Reset-API Request Handler
@@ -38,6 +205,7 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
     def __init__(self, request, client_address, server):
         self._is_shutdown = False
         self._response_delayed = False
+        self.path_params = dict()
 
         # Call old-style class __init__
         BaseHTTPServer.BaseHTTPRequestHandler.__init__(self, request,
@@ -113,20 +281,15 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
         if not self._response_delayed:
             self.done()
 
-    def _dispatch(self, handlers):
+    def _dispatch(self, route_table):
         """
         Dispatch Rest-API command to the appropriate handler
         """
-        DLOG.verbose("Rest-API dispatch, path=%s" % self.path)
+        DLOG.verbose("Rest-API dispatch, path=%s", self.path)
 
-        path_list = list(handlers.keys())
-        path_list.sort(key=len, reverse=True)
-        for path in path_list:
-            # Longest match search
-            if re.search(path, self.path) is not None:
-                handler = handlers[path]
-                handler(self)
-                break
+        handler, self.path_params = route_table.match(self.path)
+        if handler is not None:
+            handler(self)
 
     def do_GET(self):
         """
@@ -167,9 +330,9 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
             cls._handlers[port] = dict()
 
         if operation.upper() not in cls._handlers[port]:
-            cls._handlers[port][operation.upper()] = dict()
+            cls._handlers[port][operation.upper()] = RestAPIRouteTable()
 
-        cls._handlers[port][operation.upper()][path] = handler
+        cls._handlers[port][operation.upper()].add(path, handler)
 
     @classmethod
     def del_handler(cls, host, port, operation, path):
@@ -178,8 +341,7 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
         """
         if port in cls._handlers:
             if operation.upper() in cls._handlers[port]:
-                if path in cls._handlers[port][operation.upper()]:
-                    del cls._handlers[port][operation.upper()][path]
+                cls._handlers[port][operation.upper()].delete(path)
 
 
 class RestAPIServer(SocketServer.TCPServer):
@@ -283,12 +445,344 @@ def rest_api_get_server(host, port):
     """
     Get a reference to the res-api server
     """
-    DLOG.verbose("Creating Rest-API Servier, host=%s, port=%s." % (host, port))
+    DLOG.verbose("Creating Rest-API Servier, host=%s, port=%s.", host, port)
     return RestAPIServer(host, port)
 
 
+class RestAPIConnectionPool(object):
+    """
+    Rest-API Connection Pool, keeps a bounded number of idle keep-alive
+    connections per endpoint so that requests do not need to set up a new
+    TCP (and TLS) connection each time
+    """
+    def __init__(self, max_idle_per_endpoint=4, idle_timeout_in_secs=30):
+        self._max_idle_per_endpoint = max_idle_per_endpoint
+        self._idle_timeout_ms = idle_timeout_in_secs * 1000
+        self._lock = threading.Lock()
+        self._idle = dict()
+        self._pid = os.getpid()
+
+    def _check_owner(self):
+        """
+        Forget connections inherited from a parent process, the sockets
+        are still in use by the parent
+        """
+        if os.getpid() != self._pid:
+            self._idle = dict()
+            self._pid = os.getpid()
+
+    def acquire(self, scheme, netloc, timeout_in_secs):
+        """
+        Returns an idle connection to the endpoint, or a new one. Also
+        returns true if the connection was reused and the time taken to
+        connect in milliseconds.
+        """
+        key = (scheme, netloc)
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        connection = None
+        expired = list()
+
+        with self._lock:
+            self._check_owner()
+            idle_connections = self._idle.get(key, list())
+            while idle_connections:
+                connection, last_used_ms = idle_connections.pop()
+                if self._idle_timeout_ms > now_ms - last_used_ms:
+                    break
+                expired.append(connection)
+                connection = None
+
+        for expired_connection in expired:
+            expired_connection.close()
+
+        if connection is not None:
+            connection.timeout = timeout_in_secs
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout_in_secs)
+            return connection, True, 0
+
+        if 'https' == scheme:
+            connection = httplib.HTTPSConnection(netloc,
+                                                 timeout=timeout_in_secs)
+        else:
+            connection = httplib.HTTPConnection(netloc,
+                                                timeout=timeout_in_secs)
+        connection.connect()
+        connect_ms = timers.get_monotonic_timestamp_in_ms() - now_ms
+        return connection, False, connect_ms
+
+    def release(self, scheme, netloc, connection):
+        """
+        Return a connection to the pool once the response has been read,
+        connections beyond the bound are closed
+        """
+        key = (scheme, netloc)
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+
+        with self._lock:
+            self._check_owner()
+            idle_connections = self._idle.setdefault(key, list())
+            if len(idle_connections) < self._max_idle_per_endpoint:
+                idle_connections.append((connection, now_ms))
+                return
+
+        connection.close()
+
+    def clear(self):
+        """
+        Close all idle connections
+        """
+        with self._lock:
+            self._check_owner()
+            idle = self._idle
+            self._idle = dict()
+
+        for idle_connections in idle.values():
+            for connection, _ in idle_connections:
+                connection.close()
+
+    def idle_count(self, scheme, netloc):
+        """
+        Returns the number of idle connections to an endpoint
+        """
+        with self._lock:
+            self._check_owner()
+            return len(self._idle.get((scheme, netloc), list()))
+
+
+_connection_pool = RestAPIConnectionPool()
+
+
+def rest_api_get_connection_pool():
+    """
+    Get a reference to the rest-api connection pool
+    """
+    return _connection_pool
+
+
+class RestAPIListDecoder(object):
+    """
+    Rest-API List Decoder, decodes a json object read in chunks and yields
+    the items of one of its lists as they are decoded, projected to the
+    given fields, the other members of the object are kept in members
+    """
+    _whitespace = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, read, list_key, fields=None, chunk_size=65536):
+        self._read = read
+        self._list_key = list_key
+        self._fields = fields
+        self._chunk_size = chunk_size
+        self._json_decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = u''
+        self._pos = 0
+        self._eof = False
+        self.members = dict()
+
+    def _fill(self):
+        """
+        Read the next chunk, the part of the buffer already decoded is
+        dropped, returns false at the end of the data
+        """
+        if self._eof:
+            return False
+
+        data = self._read(self._chunk_size)
+        if not data:
+            self._eof = True
+            text = self._text_decoder.decode(b'', True)
+        elif isinstance(data, six.binary_type):
+            text = self._text_decoder.decode(data)
+        else:
+            text = data
+
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self):
+        while True:
+            self._pos = self._whitespace.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or not self._fill():
+                return
+
+    def _expect(self, chars):
+        """
+        Returns the next character, which must be one of the given
+        characters
+        """
+        self._skip_whitespace()
+        if self._pos >= len(self._buffer):
+            raise ValueError("Expecting '%s', end of data reached" % chars)
+
+        char = self._buffer[self._pos]
+        if char not in chars:
+            raise ValueError("Expecting '%s', found '%s' at %s"
+                             % (chars, char, self._pos))
+        self._pos += 1
+        return char
+
+    def _peek(self, char):
+        """
+        Consume the next character if it is the given character
+        """
+        self._skip_whitespace()
+        if self._buffer.startswith(char, self._pos):
+            self._pos += 1
+            return True
+        return False
+
+    def _decode_value(self):
+        """
+        Decode the next json value, more data is read until the value is
+        complete
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer,
+                                                           self._pos)
+                # A number may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+
+            except ValueError:
+                if self._eof:
+                    raise
+
+            self._fill()
+
+    def _project(self, item):
+        if self._fields is None:
+            return item
+        return tuple(item.get(field, None) for field in self._fields)
+
+    def __iter__(self):
+        self._expect('{')
+        if not self._peek('}'):
+            while True:
+                key = self._decode_value()
+                self._expect(':')
+                if key == self._list_key:
+                    self._expect('[')
+                    if not self._peek(']'):
+                        while True:
+                            yield self._project(self._decode_value())
+                            if ']' == self._expect(',]'):
+                                break
+                else:
+                    self.members[key] = self._decode_value()
+
+                if '}' == self._expect(',}'):
+                    break
+
+        # Consume the rest of the body so the connection can be reused
+        while self._fill():
+            pass
+
+    def decode(self):
+        """
+        Returns the members of the json object, with the list replaced by
+        the projected items
+        """
+        items = list(self)
+        self.members[self._list_key] = items
+        return self.members
+
+
+# Methods that can be sent again without changing the outcome
+_IDEMPOTENT_METHODS = ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE']
+
+# Statuses followed to the location given, as urllib did for these methods
+_REDIRECT_STATUSES = [httplib.MOVED_PERMANENTLY, httplib.FOUND,
+                      httplib.SEE_OTHER, httplib.TEMPORARY_REDIRECT]
+_REDIRECT_METHODS = ['GET', 'HEAD']
+_MAX_REDIRECTS = 10
+
+
+def _rest_api_closed_without_response(e):
+    """
+    Internal: returns true if the server closed the connection before any
+    of the response was received
+    """
+    remote_disconnected = getattr(httplib, 'RemoteDisconnected', None)
+    if remote_disconnected is not None:
+        return isinstance(e, remote_disconnected)
+    return isinstance(e, httplib.BadStatusLine) and e.line in ['', "''"]
+
+
+def _rest_api_send(method, api_cmd, headers, payload, timeout_in_secs,
+                   list_key=None, list_fields=None):
+    """
+    Internal: send a rest-api request over a pooled connection, a request
+    that fails on a reused connection is retried once on a new connection
+    as the server may have closed the idle connection. Requests that are
+    not idempotent are only retried if the server closed the connection
+    without answering. A successful response is decoded as it is read if
+    a list key is given.
+    """
+    url = urllib.parse.urlsplit(api_cmd)
+    path = url.path or '/'
+    if url.query:
+        path += '?' + url.query
+
+    idempotent = method.upper() in _IDEMPOTENT_METHODS
+
+    while True:
+        connection, reused, connect_ms = _connection_pool.acquire(
+            url.scheme, url.netloc, timeout_in_secs)
+        sent = False
+        try:
+            connection.request(method, path, payload, headers)
+            sent = True
+            response = connection.getresponse()
+            if list_key is not None and \
+                    httplib.OK <= response.status < httplib.MULTIPLE_CHOICES:
+                response_raw = RestAPIListDecoder(response.read, list_key,
+                                                  list_fields).decode()
+            else:
+                response_raw = response.read()
+
+        except (httplib.HTTPException, socket.error) as e:
+            connection.close()
+            if reused and not isinstance(e, socket.timeout) and \
+                    (idempotent or not sent or
+                     _rest_api_closed_without_response(e)):
+                DLOG.verbose("Rest-API stale connection to %s, error=%s, "
+                             "reconnecting.", url.netloc, e)
+                continue
+            raise
+
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            _connection_pool.release(url.scheme, url.netloc, connection)
+
+        return response, response_raw, reused, connect_ms
+
+
+def _rest_api_get_headers(response_headers, headers_per_hop):
+    """
+    Internal: returns the end-to-end headers of a rest-api response
+    """
+    headers = list()  # list of tuples
+    for key, value in response_headers:
+        if key.lower() not in headers_per_hop:
+            cap_key = '-'.join((ck.capitalize()
+                                for ck in key.lower().split('-')))
+            headers.append((cap_key, value))
+    return headers
+
+
 def _rest_api_request(token_id, method, api_cmd, api_cmd_headers,
-                      api_cmd_payload, timeout_in_secs):
+                      api_cmd_payload, timeout_in_secs, list_key=None,
+                      list_fields=None):
     """
     Internal: make a rest-api request
     """
@@ -299,127 +793,135 @@ def _rest_api_request(token_id, method, api_cmd, api_cmd_headers,
     start_ms = timers.get_monotonic_timestamp_in_ms()
 
     try:
-        request_info = urllib.request.Request(api_cmd)
-        request_info.get_method = lambda: method
-        request_info.add_header("X-Auth-Token", token_id)
-        request_info.add_header("Accept", "application/json")
+        request_headers = dict()
+        request_headers["X-Auth-Token"] = token_id
+        request_headers["Accept"] = "application/json"
 
         if api_cmd_headers is not None:
             for header_type, header_value in api_cmd_headers.items():
-                request_info.add_header(header_type, header_value)
+                request_headers[header_type] = header_value
 
         if api_cmd_payload is not None:
-            request_info.add_data(api_cmd_payload)
+            if isinstance(api_cmd_payload, six.text_type):
+                api_cmd_payload = api_cmd_payload.encode('utf-8')
+
+            if not any('content-type' == header_type.lower()
+                       for header_type in request_headers):
+                request_headers["Content-Type"] \
+                    = "application/x-www-form-urlencoded"
 
         DLOG.verbose("Rest-API method=%s, api_cmd=%s, api_cmd_headers=%s, "
-                     "api_cmd_payload=%s" % (method, api_cmd, api_cmd_headers,
-                                             api_cmd_payload))
+                     "api_cmd_payload=%s", method, api_cmd, api_cmd_headers,
+                     api_cmd_payload)
+
+        url = api_cmd
+        for _ in range(_MAX_REDIRECTS + 1):
+            request, response_raw, reused, connect_ms = _rest_api_send(
+                method, url, request_headers, api_cmd_payload,
+                timeout_in_secs, list_key, list_fields)
+
+            location = request.getheader('location', None)
+            if request.status not in _REDIRECT_STATUSES or \
+                    method.upper() not in _REDIRECT_METHODS or \
+                    location is None:
+                break
 
-        # Enable Debug
-        # handler = urllib.request.HTTPHandler(debuglevel=1)
-        # opener = urllib.request.build_opener(handler)
-        # urllib.request.install_opener(opener)
+            url = urllib.parse.urljoin(url, location)
+            DLOG.verbose("Rest-API status=%s, %s, %s, redirected to %s",
+                         request.status, method, api_cmd, url)
 
-        request = urllib.request.urlopen(request_info, timeout=timeout_in_secs)
+        headers = _rest_api_get_headers(request.getheaders(), headers_per_hop)
 
-        headers = list()  # list of tuples
-        for key, value in request.info().items():
-            if key not in headers_per_hop:
-                cap_key = '-'.join((ck.capitalize() for ck in key.split('-')))
-                headers.append((cap_key, value))
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        elapsed_ms = now_ms - start_ms
 
-        response_raw = request.read()
-        if response_raw == "":
+        if httplib.MULTIPLE_CHOICES <= request.status:
+            log_error("Rest-API status=%s, %s, %s, hdrs=%s, payload=%s, "
+                      "elapsed_ms=%s", request.status, method, api_cmd,
+                      api_cmd_headers, api_cmd_payload, int(elapsed_ms))
+
+            if httplib.FOUND == request.status:
+                return Result(response_raw, Object(status_code=request.status,
+                                                   headers=headers,
+                                                   response=response_raw))
+
+            # Attempt to get the reason for the http error from the response
+            reason = ''
+            for header, value in headers:
+                if 'Content-Type' == header:
+                    if 'application/json' == value.split(';')[0]:
+                        try:
+                            response = json.loads(response_raw)
+
+                            compute_fault = response.get('computeFault', None)
+                            if compute_fault is not None:
+                                message = compute_fault.get('message', None)
+                                if message is not None:
+                                    reason = str(message.lower().rstrip('.'))
+
+                            if not reason:
+                                bad_request = response.get('badRequest', None)
+                                if bad_request is not None:
+                                    message = bad_request.get('message', None)
+                                    if message is not None:
+                                        reason = str(
+                                            message.lower().rstrip('.'))
+
+                            if not reason:
+                                error_message = response.get('error_message',
+                                                             None)
+                                if error_message is not None:
+                                    error_message = json.loads(error_message)
+                                    message = error_message.get('faultstring',
+                                                                None)
+                                    if message is not None:
+                                        reason = str(
+                                            message.lower().rstrip('.'))
+
+                        except ValueError:
+                            pass
+
+            error = "HTTP Error %s: %s" % (request.status, request.reason)
+            raise OpenStackRestAPIException(method, api_cmd, api_cmd_headers,
+                                            api_cmd_payload, request.status,
+                                            error, error, headers,
+                                            response_raw, reason)
+
+        if isinstance(response_raw, dict):
+            # Already decoded, the raw body was never held in memory
+            response = response_raw
+            response_raw = None
+        elif not response_raw:
             response = dict()
         else:
             response = json.loads(response_raw)
 
-        request.close()
-
-        now_ms = timers.get_monotonic_timestamp_in_ms()
-        elapsed_ms = now_ms - start_ms
         elapsed_secs = elapsed_ms / 1000
 
-        DLOG.verbose("Rest-API code=%s, headers=%s, response=%s"
-                     % (request.code, headers, response))
+        DLOG.verbose("Rest-API code=%s, headers=%s, response=%s",
+                     request.status, headers, response)
 
-        log_info("Rest-API status=%s, %s, %s, hdrs=%s, payload=%s, elapsed_ms=%s"
-                 % (request.code, method, api_cmd, api_cmd_headers,
-                    api_cmd_payload, int(elapsed_ms)))
+        log_info("Rest-API status=%s, %s, %s, hdrs=%s, payload=%s, elapsed_ms=%s",
+                 request.status, method, api_cmd, api_cmd_headers,
+                 api_cmd_payload, int(elapsed_ms))
 
-        return Result(response, Object(status_code=request.code,
+        return Result(response, Object(status_code=request.status,
                                        headers=headers,
                                        response=response_raw,
-                                       execution_time=elapsed_secs))
-
-    except urllib.error.HTTPError as e:
-        headers = list()
-        response_raw = dict()
-
-        if e.fp is not None:
-            headers = list()  # list of tuples
-            for key, value in e.fp.info().items():
-                if key not in headers_per_hop:
-                    cap_key = '-'.join((ck.capitalize()
-                                        for ck in key.split('-')))
-                    headers.append((cap_key, value))
-
-            response_raw = e.fp.read()
-
-        now_ms = timers.get_monotonic_timestamp_in_ms()
-        elapsed_ms = now_ms - start_ms
-
-        log_error("Rest-API status=%s, %s, %s, hdrs=%s, payload=%s, elapsed_ms=%s"
-                  % (e.code, method, api_cmd, api_cmd_headers,
-                     api_cmd_payload, int(elapsed_ms)))
-
-        if httplib.FOUND == e.code:
-            return Result(response_raw, Object(status_code=e.code, headers=headers,
-                                               response=response_raw))
+                                       execution_time=elapsed_secs,
+                                       connection_reused=reused,
+                                       connect_time=connect_ms / 1000.0))
 
-        # Attempt to get the reason for the http error from the response
-        reason = ''
-        for header, value in headers:
-            if 'Content-Type' == header:
-                if 'application/json' == value.split(';')[0]:
-                    try:
-                        response = json.loads(response_raw)
-
-                        compute_fault = response.get('computeFault', None)
-                        if compute_fault is not None:
-                            message = compute_fault.get('message', None)
-                            if message is not None:
-                                reason = str(message.lower().rstrip('.'))
-
-                        if not reason:
-                            bad_request = response.get('badRequest', None)
-                            if bad_request is not None:
-                                message = bad_request.get('message', None)
-                                if message is not None:
-                                    reason = str(message.lower().rstrip('.'))
-
-                        if not reason:
-                            error_message = response.get('error_message', None)
-                            if error_message is not None:
-                                error_message = json.loads(error_message)
-                                message = error_message.get('faultstring', None)
-                                if message is not None:
-                                    reason = str(message.lower().rstrip('.'))
-
-                    except ValueError:
-                        pass
-
-        raise OpenStackRestAPIException(method, api_cmd, api_cmd_headers,
-                                        api_cmd_payload, e.code, str(e),
-                                        str(e), headers, response_raw, reason)
+    except OpenStackRestAPIException:
+        raise
 
-    except urllib.error.URLError as e:
+    except (httplib.HTTPException, socket.error) as e:
         now_ms = timers.get_monotonic_timestamp_in_ms()
         elapsed_ms = now_ms - start_ms
 
-        log_error("Rest-API status=ERR, %s, %s, hdrs=%s, payload=%s, elapsed_ms=%s"
-                  % (method, api_cmd, api_cmd_headers, api_cmd_payload,
-                     int(elapsed_ms)))
+        log_error("Rest-API status=ERR, %s, %s, hdrs=%s, payload=%s, elapsed_ms=%s",
+                  method, api_cmd, api_cmd_headers, api_cmd_payload,
+                  int(elapsed_ms))
 
         raise OpenStackException(method, api_cmd, api_cmd_headers,
                                  api_cmd_payload, str(e), str(e))
@@ -428,9 +930,9 @@ def _rest_api_request(token_id, method, api_cmd, api_cmd_headers,
         now_ms = timers.get_monotonic_timestamp_in_ms()
         elapsed_ms = now_ms - start_ms
 
-        log_error("Rest-API failure, %s, %s, hdrs=%s, payload=%s, elapsed_ms=%s"
-                  % (method, api_cmd, api_cmd_headers, api_cmd_payload,
-                     int(elapsed_ms)))
+        log_error("Rest-API failure, %s, %s, hdrs=%s, payload=%s, elapsed_ms=%s",
+                  method, api_cmd, api_cmd_headers, api_cmd_payload,
+                  int(elapsed_ms))
 
         raise OpenStackException(method, api_cmd, api_cmd_headers,
                                  api_cmd_payload, str(e), str(e))
@@ -464,3 +966,37 @@ def rest_api_request_with_context(context, method, api_cmd,
     """
     return _rest_api_request(context.token_id, method, api_cmd, api_cmd_headers,
                              api_cmd_payload, timeout_in_secs)
+
+
+def rest_api_list_request(token, api_cmd, list_key, list_fields=None,
+                          api_cmd_headers=None, timeout_in_secs=20):
+    """
+    Make a rest-api list request using the given token, the items of the
+    list are decoded as the response is read and only the given fields
+    are kept, as tuples
+    WARNING: Any change to the default timeout must be reflected in the timeout
+    calculations done in the TaskFuture class.
+    """
+    try:
+        return _rest_api_request(token.get_id(), "GET", api_cmd,
+                                 api_cmd_headers, None, timeout_in_secs,
+                                 list_key, list_fields)
+
+    except OpenStackRestAPIException as e:
+        if httplib.UNAUTHORIZED == e.http_status_code:
+            token.set_expired()
+        raise
+
+
+def rest_api_list_request_with_context(context, api_cmd, list_key,
+                                       list_fields=None, api_cmd_headers=None,
+                                       timeout_in_secs=20):
+    """
+    Make a rest-api list request using the given context, the items of the
+    list are decoded as the response is read and only the given fields
+    are kept, as tuples
+    WARNING: Any change to the default timeout must be reflected in the timeout
+    calculations done in the TaskFuture class.
+    """
+    return _rest_api_request(context.token_id, "GET", api_cmd, api_cmd_headers,
+                             None, timeout_in_secs, list_key, list_fields)
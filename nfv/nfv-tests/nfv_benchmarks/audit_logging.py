@@ -0,0 +1,104 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import os
+import time
+import timeit
+
+from nfv_common import debug
+from nfv_common.debug._debug_log import debug_set_loggers_level
+from nfv_common.debug._debug_module import Debug
+
+from nfv_benchmarks import instance_detail_audit
+
+from nfv_plugins.nfvi_plugins.nfvi_compute_api import instance_from_server_data
+
+DLOG = debug.debug_get_logger('nfv_benchmarks.audit_logging')
+
+
+def set_debug_level(debug_level):
+    """
+    Set the overall debug level and the level of every logger
+    """
+    Debug()._debug_level = debug_level
+    debug_set_loggers_level(debug_level)
+
+
+def audit_cycle(num_instances, page_limit, seed):
+    """
+    Run a full instance audit cycle, returns the processing time
+    """
+    nova = instance_detail_audit.StubNova(num_instances, page_limit, seed)
+    instance_detail_audit.install_stub(nova)
+    instance_detail_audit.build_cache(nova, num_instances // 20,
+                                      num_instances // 200, seed)
+    _, elapsed, _ = instance_detail_audit.full_refresh(nova, True, 0)
+    debug.debug_flush()
+    return elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-i', '--instances', type=int, default=2000)
+    arg_parser.add_argument('-p', '--page-limit', type=int, default=32)
+    arg_parser.add_argument('-r', '--repeat', type=int, default=10)
+    arg_parser.add_argument('--seed', type=int, default=1)
+    args = arg_parser.parse_args()
+
+    # No log handlers are configured, records are sent to the debug logging
+    # thread and dropped there
+    debug.debug_initialize(None)
+
+    print("%-10s %-14s" % ("verbose", "audit cycle (s)"))
+    for debug_level in [debug.DEBUG_LEVEL.INFO, debug.DEBUG_LEVEL.VERBOSE]:
+        set_debug_level(debug_level)
+        elapsed = min(audit_cycle(args.instances, args.page_limit, args.seed)
+                      for _ in range(args.repeat))
+        print("%-10s %-14.3f"
+              % ('enabled' if DLOG.is_enabled_for(debug.DEBUG_LEVEL.VERBOSE)
+                 else 'disabled', elapsed))
+
+    # A disabled log of a page of the instances audit response, formatted
+    # before the call and formatted only if logged
+    set_debug_level(debug.DEBUG_LEVEL.INFO)
+    nova = instance_detail_audit.StubNova(args.page_limit, args.page_limit,
+                                          args.seed)
+    response = dict(completed=True, reason='', result_data=[
+        instance_from_server_data(server)
+        for server in nova.servers.values()])
+    number = 1000
+    eager = timeit.timeit(
+        lambda: DLOG.verbose("Audit-Instances callback, response=%s."
+                             % response), number=number)
+    lazy = timeit.timeit(
+        lambda: DLOG.verbose("Audit-Instances callback, response=%s.",
+                             response), number=number)
+    print("")
+    print("disabled verbose of a %d instance response, per call:"
+          % args.page_limit)
+    print("  %-22s %.2f us" % ("formatted at the call", eager * 1e6 / number))
+    print("  %-22s %.2f us" % ("arguments passed", lazy * 1e6 / number))
+
+    # Warnings are sent one at a time, the processor time includes the
+    # pickling and unpickling done by the queue and debug logging threads
+    print("")
+    print("enabled records sent to the debug logging thread, per record:")
+    set_debug_level(debug.DEBUG_LEVEL.VERBOSE)
+    for name, log in [('one at a time', lambda: DLOG.warn("record %s", 1)),
+                      ('batched', lambda: DLOG.verbose("record %s", 1))]:
+        time.sleep(1)
+        start = sum(os.times()[:2])
+        for _ in range(number * 10):
+            log()
+        debug.debug_flush()
+        time.sleep(1)
+        print("  %-22s %.2f us"
+              % (name, (sum(os.times()[:2]) - start) * 1e6 / (number * 10)))
+    debug.debug_finalize()
+
+
+if __name__ == '__main__':
+    main()
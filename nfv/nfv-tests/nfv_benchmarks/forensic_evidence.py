@@ -0,0 +1,165 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import datetime
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+from nfv_common import forensic
+from nfv_common.forensic import _parsers
+
+START = datetime.datetime(2016, 2, 15)
+
+MESSAGES = [
+    ('_host.py', "Host State-Change detected: nfvi_admin_state=unlocked "
+                 "host_admin_state=unlocked, nfvi_oper_state=enabled "
+                 "host_oper_state=enabled, nfvi_avail_state=available "
+                 "host_avail_status=available, locking=False "
+                 "unlocking=False fsm current_state=enabled for compute-%d."),
+    ('_instance_state_start.py', "Entering state (start) for instance-%d."),
+    ('_timer_scheduler.py', "Timer tick took %d ms, timers=42."),
+    ('_vim_nfvi_audits.py', "Audit instances called, timer_id=%d, audit "
+                            "in progress."),
+    ('_task_worker.py', "Task work item processed, id=%d, result=success, "
+                        "elapsed=12ms."),
+]
+
+
+def generate_log(file_name, size_mb):
+    """
+    Generate an nfv-vim log, one line in a few hundred is of interest
+    """
+    random.seed(1)
+    timestamp = START
+    size = size_mb * 1024 * 1024
+    written = 0
+    with open(file_name, 'w') as f:
+        idx = 0
+        while written < size:
+            lines = list()
+            for _ in range(1000):
+                timestamp += datetime.timedelta(
+                    milliseconds=random.randint(1, 20))
+                if 0 == idx % 500:
+                    filename, message = MESSAGES[idx // 500 % 2]
+                else:
+                    filename, message = MESSAGES[random.randint(2, 4)]
+                lines.append("%s.%03d controller-0 VIM_Thread[12345] INFO "
+                             "%s.%d %s\n"
+                             % (timestamp.strftime('%Y-%m-%dT%H:%M:%S'),
+                                timestamp.microsecond // 1000, filename,
+                                random.randint(10, 999),
+                                message % random.randint(0, 99)))
+                idx += 1
+            data = ''.join(lines)
+            f.write(data)
+            written += len(data)
+    return timestamp
+
+
+def legacy_evidence(file_name, start_date, end_date, max_bytes):
+    """
+    Gather evidence the way it was before, count the lines then parse every
+    line, returns the records and the bytes read
+    """
+    parser = _parsers.parser_get('nfv-vim')
+    total_lines = sum(1 for _ in open(file_name))
+    assert total_lines
+    records = list()
+    bytes_read = 0
+    with open(file_name) as f:
+        for line in f:
+            record = parser.parse(start_date, end_date, line)
+            if record is not None:
+                records.append(record)
+            bytes_read += len(line)
+            if bytes_read >= max_bytes:
+                break
+    return records, bytes_read
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-s', '--size-mb', type=int, default=1024)
+    arg_parser.add_argument('-l', '--legacy-mb', type=int, default=16,
+                            help='bytes the old way is timed over')
+    arg_parser.add_argument('-f', '--file', help='log file to reuse')
+    args = arg_parser.parse_args()
+
+    forensic.forensic_initialize()
+
+    file_name = args.file
+    if file_name is None:
+        file_name = os.path.join(tempfile.gettempdir(),
+                                 'nfv-vim-%dmb.log' % args.size_mb)
+    if not os.path.exists(file_name):
+        print("Generating %s" % file_name)
+        generate_log(file_name, args.size_mb)
+    size_mb = os.path.getsize(file_name) / (1024.0 * 1024)
+
+    with open(file_name, 'rb') as f:
+        f.seek(-4096, os.SEEK_END)
+        last_line = f.read().splitlines()[-1]
+    end = _parsers.parser_get('nfv-vim').parse_timestamp(last_line)
+    middle = START + (end - START) // 2
+
+    start = time.time()
+    records, bytes_read = legacy_evidence(file_name, START, end,
+                                          args.legacy_mb * 1024 * 1024)
+    legacy_rate = bytes_read / (1024.0 * 1024) / (time.time() - start)
+    print("%.0fMB log, old way %.1f MB/s, a full scan would take ~%.0fs"
+          % (size_mb, legacy_rate, size_mb / legacy_rate))
+
+    print("%-14s %-10s %-10s %-10s" % ("window", "processes", "seconds",
+                                       "records"))
+    windows = [('10 minutes', middle, middle + datetime.timedelta(minutes=10)),
+               ('everything', START, end)]
+    for name, start_date, end_date in windows:
+        for processes in sorted(set([1, multiprocessing.cpu_count()])):
+            start = time.time()
+            records = forensic.evidence_from_files({'nfv-vim': file_name},
+                                                   start_date, end_date,
+                                                   processes=processes)
+            print("%-14s %-10d %-10.2f %-10d" % (name, processes,
+                                                 time.time() - start,
+                                                 len(records)))
+
+    index_file = file_name + '.db'
+    if os.path.exists(index_file):
+        os.remove(index_file)
+
+    def query(name, **kwargs):
+        start = time.time()
+        records = forensic.evidence_from_index(index_file,
+                                               {'nfv-vim': file_name},
+                                               START, end, **kwargs)
+        print("%-34s %-10.2f %-10d" % (name, time.time() - start,
+                                       len(records)))
+
+    print("%-34s %-10s %-10s" % ("index", "seconds", "records"))
+    query("build")
+    for idx in range(3):
+        query("instance-%d, nothing new" % idx,
+              instance_name='instance-%d' % idx)
+    with open(file_name, 'rb') as f:
+        f.seek(-1024 * 1024, os.SEEK_END)
+        tail = f.read()
+    size = os.path.getsize(file_name)
+    try:
+        with open(file_name, 'ab') as f:
+            f.write(tail[tail.index(b'\n') + 1:])
+        query("instance-3, 1MB appended", instance_name='instance-3')
+    finally:
+        with open(file_name, 'ab') as f:
+            f.truncate(size)
+        os.remove(index_file)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import random
+import timeit
+
+from nfv_common import histogram
+from nfv_common.histogram import HistogramData
+
+
+def exact_percentile(samples, percentile):
+    """
+    Returns the value the given percentage of sorted samples are at or below
+    """
+    idx = max(1, -(-len(samples) * percentile // 100)) - 1
+    return samples[int(idx)]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-n', '--samples', type=int, default=100000)
+    arg_parser.add_argument('--seed', type=int, default=1)
+    args = arg_parser.parse_args()
+
+    # Latencies in milliseconds, mostly a few milliseconds with a long tail
+    rng = random.Random(args.seed)
+    samples = [int(rng.lognormvariate(1.5, 1.2)) for _ in range(args.samples)]
+    sorted_samples = sorted(samples)
+
+    print("%-6s %-8s %s"
+          % ("digits", "add (us)",
+             " ".join("%-16s" % ("p%g err (%%)" % percentile)
+                      for percentile in histogram.PERCENTILES)))
+    for significant_digits in [1, 2, 3]:
+        data = HistogramData(significant_digits)
+        elapsed = timeit.timeit(lambda: [data.add_data(sample)
+                                         for sample in samples], number=1)
+        errors = list()
+        for percentile in histogram.PERCENTILES:
+            exact = exact_percentile(sorted_samples, percentile)
+            value = data.value_at_percentile(percentile)
+            errors.append(abs(value - exact) * 100.0 / max(1, exact))
+        print("%-6d %-8.2f %s"
+              % (significant_digits, elapsed * 1e6 / len(samples),
+                 " ".join("%-16.3f" % error for error in errors)))
+
+    # Samples added through the module, with the rolling window slices
+    elapsed = timeit.timeit(
+        lambda: [histogram.add_histogram_data('benchmark', sample, 'ms')
+                 for sample in samples], number=1)
+    print("")
+    print("add_histogram_data, per sample: %.2f us"
+          % (elapsed * 1e6 / len(samples)))
+
+
+if __name__ == '__main__':
+    main()
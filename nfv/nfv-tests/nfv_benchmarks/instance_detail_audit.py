@@ -0,0 +1,250 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import collections
+import random
+import time
+import uuid
+
+from nfv_plugins.nfvi_plugins.nfvi_compute_api import instance_from_server_data
+
+from nfv_vim.audits import _vim_nfvi_audits
+from nfv_vim import nfvi
+from nfv_vim.tables import _instance_table
+
+# Seconds between runs of the per-instance audit timer
+INSTANCE_AUDIT_INTERVAL_SECS = 10
+
+
+class StubNova(object):
+    """
+    Nova (and the neutron port lookup) answering from memory, counting the
+    requests made
+    """
+    def __init__(self, num_servers, page_limit, seed):
+        rng = random.Random(seed)
+        self.page_limit = page_limit
+        self.calls = collections.Counter()
+        self.pending = list()
+        self.servers = collections.OrderedDict()
+        for idx in range(num_servers):
+            server_uuid = str(uuid.UUID(int=rng.getrandbits(128)))
+            self.servers[server_uuid] = {
+                'id': server_uuid,
+                'name': 'vm-%d' % idx,
+                'tenant_id': uuid.UUID(int=idx % 10).hex,
+                'updated': '2020-01-01T00:00:00Z',
+                'flavor': {'original_name': 'small', 'vcpus': 1, 'ram': 512,
+                           'disk': 1, 'ephemeral': 0, 'swap': 0,
+                           'extra_specs': {}},
+                'image': {'id': 'image-%d' % (idx % 5)},
+                'metadata': {},
+                'os-extended-volumes:volumes_attached': [],
+                'OS-EXT-SRV-ATTR:host': 'compute-%d' % (idx % 50),
+                'OS-EXT-STS:vm_state': 'active',
+                'OS-EXT-STS:task_state': None,
+                'OS-EXT-STS:power_state': 1,
+            }
+
+    def list_servers(self, next_page, detail):
+        self.calls['servers/detail' if detail else 'servers'] += 1
+        start = next_page or 0
+        servers = list(self.servers.values())[start:start + self.page_limit]
+        if start + self.page_limit < len(self.servers):
+            next_page = start + self.page_limit
+        else:
+            next_page = None
+        return servers, next_page
+
+    def get_server(self, server_uuid):
+        self.calls['servers/<id>'] += 1
+        self.calls['ports?device_id=<id>'] += 1
+        return self.servers[server_uuid]
+
+
+class FakeInstance(object):
+    """
+    The parts of a VIM instance the audits look at
+    """
+    def __init__(self, nfvi_instance, action_running):
+        self.uuid = nfvi_instance.uuid
+        self.nfvi_instance = nfvi_instance
+        self.nfvi_instance_audit_in_progress = False
+        self.updates = 0
+        self._action_running = action_running
+
+    @property
+    def host_name(self):
+        return self.nfvi_instance.host_name
+
+    @property
+    def tenant_uuid(self):
+        return self.nfvi_instance.tenant_id
+
+    @property
+    def instance_type_original_name(self):
+        return self.nfvi_instance.instance_type_original_name
+
+    def nfvi_instance_is_deleted(self):
+        return False
+
+    def is_action_running(self):
+        return self._action_running
+
+    @property
+    def action_data(self):
+        return self
+
+    def is_inprogress(self):
+        return False
+
+    def nfvi_instance_update(self, nfvi_instance):
+        self.nfvi_instance = nfvi_instance
+        self.updates += 1
+
+
+def _send(callback, response):
+    try:
+        callback.send(response)
+    except StopIteration:
+        pass
+
+
+def install_stub(nova):
+    """
+    Answer the audits straight from the stub rather than the plugin
+    """
+    def get_instances(paging, callback, detail=False):
+        servers, paging.next_page = nova.list_servers(paging.next_page,
+                                                      detail)
+        response = dict()
+        response['completed'] = True
+        response['page-request-id'] = paging.page_request_id
+        if detail:
+            response['result-data'] = [instance_from_server_data(server)
+                                       for server in servers]
+            response['incomplete-instances'] = list()
+        else:
+            response['result-data'] = [(server['id'], server['name'])
+                                       for server in servers]
+        _send(callback, response)
+
+    def get_instance(instance_uuid, callback):
+        response = dict()
+        response['completed'] = True
+        response['result-data'] = instance_from_server_data(
+            nova.get_server(instance_uuid), list())
+        # Answered once the timer is done, as the plugin would
+        nova.pending.append((callback, response))
+
+    nfvi.nfvi_get_instances = get_instances
+    nfvi.nfvi_get_instances_detail = \
+        lambda paging, callback: get_instances(paging, callback, True)
+    nfvi.nfvi_get_instance = get_instance
+
+
+def build_cache(nova, num_changed, num_busy, seed):
+    """
+    Fill the instance table from nova, then change the host of some of the
+    servers and mark some of the instances as running an action
+    """
+    rng = random.Random(seed)
+    instance_table = _instance_table.InstanceTable()
+    instance_table.persist = False
+    _instance_table._instance_table = instance_table
+
+    server_uuids = list(nova.servers)
+    busy = set(rng.sample(server_uuids, num_busy))
+    for server_uuid, server in nova.servers.items():
+        instance_table[server_uuid] = FakeInstance(
+            instance_from_server_data(server, list()), server_uuid in busy)
+
+    for server_uuid in rng.sample(server_uuids, num_changed):
+        nova.servers[server_uuid]['OS-EXT-SRV-ATTR:host'] = 'compute-moved'
+    return instance_table
+
+
+def full_refresh(nova, detail, latency_ms):
+    """
+    Run a full instance audit cycle and the per-instance audits it queues,
+    returns the modelled wall time, the processing time and the number of
+    instances updated
+    """
+    paging = nfvi.objects.v1.Paging(page_limit=nova.page_limit)
+    audit = _vim_nfvi_audits._NFVIAudit(
+        'instances', _vim_nfvi_audits._audit_nfvi_instances,
+        INSTANCE_AUDIT_INTERVAL_SECS, 120, paging=paging)
+    _vim_nfvi_audits._nfvi_audits.clear()
+    _vim_nfvi_audits._nfvi_audits['instances'] = audit
+    _vim_nfvi_audits._nfvi_instances_paging = paging
+    _vim_nfvi_audits._nfvi_instances_watermark = \
+        _vim_nfvi_audits._AuditWatermark('instances', paging)
+    _vim_nfvi_audits._nfvi_instances_to_audit.clear()
+    _vim_nfvi_audits._nfvi_instance_outstanding.clear()
+    _vim_nfvi_audits._deletable_instances = None
+    _vim_nfvi_audits._audit_instance_detail = detail
+
+    start = time.time()
+    audit.start(0)
+    while audit.busy:
+        audit.start(0)
+    pages = sum(nova.calls.values())
+
+    # Up to four instances are fetched each time the timer fires, each
+    # fetch being a server and a port lookup made one after the other
+    timer = _vim_nfvi_audits._audit_nfvi_instance()
+    ticks = 0
+    while _vim_nfvi_audits._nfvi_instances_to_audit:
+        timer.send(ticks)
+        ticks += 1
+        for callback, response in nova.pending:
+            _send(callback, response)
+        del nova.pending[:]
+    elapsed = time.time() - start
+
+    wall_secs = pages * latency_ms / 1000.0
+    if ticks:
+        wall_secs += ((ticks - 1) * INSTANCE_AUDIT_INTERVAL_SECS +
+                      2 * latency_ms / 1000.0)
+    updates = sum(instance.updates
+                  for instance in _instance_table._instance_table.values())
+    return wall_secs, elapsed, updates
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-s', '--sizes', default='1000,5000',
+                            help='number of instances of each run')
+    arg_parser.add_argument('-p', '--page-limit', type=int, default=32)
+    arg_parser.add_argument('-l', '--latency-ms', type=float, default=50,
+                            help='modelled time of a request to nova')
+    arg_parser.add_argument('-c', '--changed', type=float, default=0.05,
+                            help='share of the servers changed in nova')
+    arg_parser.add_argument('-b', '--busy', type=float, default=0.005,
+                            help='share of the instances running an action')
+    arg_parser.add_argument('--seed', type=int, default=1)
+    args = arg_parser.parse_args()
+
+    print("%-10s %-8s %-14s %-14s %-10s %-8s %s"
+          % ("instances", "audit", "wall (s)", "process (s)", "requests",
+             "updated", "requests by type"))
+    for num_instances in [int(size) for size in args.sizes.split(',')]:
+        for detail in [False, True]:
+            nova = StubNova(num_instances, args.page_limit, args.seed)
+            install_stub(nova)
+            build_cache(nova, int(num_instances * args.changed),
+                        int(num_instances * args.busy), args.seed)
+            wall_secs, elapsed, updates = full_refresh(nova, detail,
+                                                       args.latency_ms)
+            print("%-10d %-8s %-14.1f %-14.2f %-10d %-8d %s"
+                  % (num_instances, 'detail' if detail else 'ids',
+                     wall_secs, elapsed, sum(nova.calls.values()), updates,
+                     ', '.join('%s=%d' % item
+                               for item in sorted(nova.calls.items()))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import gc
+import io
+import json
+import timeit
+
+from nfv_plugins.nfvi_plugins.openstack.rest_api import RestAPIListDecoder
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+def build_payload(num_servers):
+    """
+    Build a nova servers/detail style listing
+    """
+    servers = list()
+    for idx in range(num_servers):
+        uuid = '%08x-0000-4000-8000-%012x' % (idx, idx)
+        servers.append({
+            'id': uuid,
+            'name': 'vm-%d' % idx,
+            'status': 'ACTIVE',
+            'tenant_id': 'tenant-%d' % (idx % 10),
+            'user_id': 'user-%d' % (idx % 10),
+            'hostId': 'host-%d' % (idx % 50),
+            'created': '2016-01-01T00:00:00Z',
+            'updated': '2016-01-01T00:00:00Z',
+            'flavor': {'id': 'flavor-%d' % (idx % 5),
+                       'links': [{'rel': 'bookmark',
+                                  'href': 'http://nova/flavors/%d' % idx}]},
+            'image': {'id': 'image-%d' % (idx % 5),
+                      'links': [{'rel': 'bookmark',
+                                 'href': 'http://nova/images/%d' % idx}]},
+            'addresses': {'net-0': [{'addr': '10.0.%d.%d' % (idx // 256,
+                                                             idx % 256),
+                                     'version': 4,
+                                     'OS-EXT-IPS:type': 'fixed'}]},
+            'metadata': {'key-%d' % key: 'value' for key in range(5)},
+            'links': [{'rel': 'self', 'href': 'http://nova/servers/%s' % uuid},
+                      {'rel': 'bookmark',
+                       'href': 'http://nova/servers/%s' % uuid}],
+            'OS-EXT-SRV-ATTR:host': 'compute-%d' % (idx % 50),
+            'OS-EXT-STS:vm_state': 'active',
+            'OS-EXT-STS:power_state': 1,
+        })
+    data = {'servers': servers,
+            'servers_links': [{'rel': 'next', 'href': 'http://nova/next'}]}
+    return json.dumps(data).encode('utf-8')
+
+
+def full_decode(payload):
+    """
+    Read the whole body, decode it and walk the dicts, as list calls did
+    """
+    response = json.loads(io.BytesIO(payload).read())
+    return [(server['id'], server['name']) for server in response['servers']]
+
+
+def stream_decode(payload):
+    """
+    Decode the body as it is read, keeping only the fields needed
+    """
+    stream = io.BytesIO(payload)
+    decoder = RestAPIListDecoder(stream.read, 'servers', ('id', 'name'))
+    return decoder.decode()['servers']
+
+
+def peak_memory_kb(fn, payload):
+    if tracemalloc is None:
+        return float('nan')
+    gc.collect()
+    tracemalloc.start()
+    result = fn(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 1024.0
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-n', '--num-servers', type=int, default=10000)
+    arg_parser.add_argument('-r', '--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    payload = build_payload(args.num_servers)
+    assert full_decode(payload) == stream_decode(payload)
+
+    print("payload: %d servers, %d KiB" % (args.num_servers,
+                                           len(payload) // 1024))
+    print("%-10s %-12s %-16s" % ("decode", "ms/page", "peak mem (KiB)"))
+    for name, fn in [('full', full_decode), ('stream', stream_decode)]:
+        elapsed_ms = timeit.timeit(lambda: fn(payload),
+                                   number=args.repeat) * 1000 / args.repeat
+        print("%-10s %-12.1f %-16.0f" % (name, elapsed_ms,
+                                         peak_memory_kb(fn, payload)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+#
+# Needs nova_api_proxy to be importable as well:
+#
+#   PYTHONPATH=../../nova-api-proxy/nova-api-proxy \
+#       python -m nfv_benchmarks.nova_api_proxy_overhead
+#
+import eventlet
+eventlet.monkey_patch(all=False, socket=True, time=True, select=True,
+                      thread=True, os=False)
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+from six.moves import http_client as httplib  # noqa: E402
+import time  # noqa: E402
+
+import eventlet.wsgi  # noqa: E402
+from oslo_config import cfg  # noqa: E402
+from oslo_log import log as logging  # noqa: E402
+import webob  # noqa: E402
+
+from nova_api_proxy.apps import acceptor  # noqa: E402
+from nova_api_proxy.apps import proxy  # noqa: E402
+
+TENANT_ID = 'f9e1b4a0a4a54b0c9a3b9e7c1d2e3f40'
+SERVER_ID = '5d1b0a3e-8c55-4d7f-9b1e-0e6f3b2a9c11'
+
+HEADERS = {'Content-Type': 'application/json',
+           'X-User': 'admin',
+           'X-Tenant': 'admin'}
+
+REQUESTS = [
+    ('server list', 'GET', '/v2.1/%s/servers/detail' % TENANT_ID, None),
+    ('server action', 'POST', '/v2.1/%s/servers/%s/action'
+     % (TENANT_ID, SERVER_ID), {'os-stop': None}),
+    ('server create', 'POST', '/v2.1/%s/servers' % TENANT_ID,
+     {'server': {'name': 'vm-1', 'imageRef': SERVER_ID, 'flavorRef': '1',
+                 'metadata': dict(('key-%d' % idx, 'value-%d' % idx)
+                                  for idx in range(100)),
+                 'networks': [{'uuid': SERVER_ID}] * 4}}),
+]
+
+
+def nova_api(environ, start_response):
+    """
+    Fake nova-api and VIM, answers every request with a small body
+    """
+    length = int(environ.get('CONTENT_LENGTH') or 0)
+    environ['wsgi.input'].read(length)
+    body = b'{"servers": []}'
+    start_response('200 OK', [('Content-Type', 'application/json'),
+                              ('Content-Length', str(len(body)))])
+    return [body]
+
+
+def serve(app):
+    """
+    Serve an application on a green thread, returns the port
+    """
+    sock = eventlet.listen(('127.0.0.1', 0))
+    eventlet.spawn(eventlet.wsgi.server, sock, app,
+                   log=open(os.devnull, 'w'))
+    return sock.getsockname()[1]
+
+
+def pipeline(app):
+    """
+    Returns the nova-api-proxy pipeline, without the keystone
+    authentication
+    """
+    conf = dict()
+    return acceptor.VersionAcceptor(acceptor.Acceptor(app, conf), conf)
+
+
+def in_process(app, num_requests):
+    """
+    Returns the microseconds per request spent in the pipeline, with the
+    proxy replaced by an application that answers straight away, the
+    version requests always go to their own proxy so only the others are
+    measured
+    """
+    results = list()
+    for name, method, path, body in REQUESTS:
+        if 'GET' == method:
+            continue
+        data = b'' if body is None else json.dumps(body).encode('utf-8')
+        start = time.time()
+        for _ in range(num_requests):
+            request = webob.Request.blank(path, method=method,
+                                          headers=HEADERS, body=data)
+            request.environ['REMOTE_ADDR'] = '127.0.0.1'
+            request.get_response(app)
+        results.append((name, (time.time() - start) * 1e6 / num_requests))
+    return results
+
+
+def over_http(port, num_requests):
+    """
+    Returns the microseconds per request seen by a client over a
+    keep-alive connection
+    """
+    results = list()
+    for name, method, path, body in REQUESTS:
+        data = None if body is None else json.dumps(body)
+        connection = httplib.HTTPConnection('127.0.0.1', port)
+        start = time.time()
+        for _ in range(num_requests):
+            connection.request(method, path, data, HEADERS)
+            response = connection.getresponse()
+            response.read()
+            assert httplib.OK == response.status, response.status
+        results.append((name, (time.time() - start) * 1e6 / num_requests))
+        connection.close()
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-n', '--num-requests', type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    logging.register_options(cfg.CONF)
+    cfg.CONF([], project='nova-api-proxy')
+    nova_api_port = serve(nova_api)
+    for name, value in [('osapi_compute_listen', '127.0.0.1'),
+                        ('osapi_compute_listen_port', nova_api_port),
+                        ('nfvi_compute_listen', '127.0.0.1'),
+                        ('nfvi_compute_listen_port', nova_api_port)]:
+        cfg.CONF.set_override(name, value)
+
+    print("%-14s %-14s" % ("request", "pipeline (us)"))
+    for name, elapsed in in_process(pipeline(nova_api), args.num_requests):
+        print("%-14s %-14.1f" % (name, elapsed))
+
+    proxy_port = serve(pipeline(proxy.Proxy()))
+    direct = over_http(nova_api_port, args.num_requests)
+    proxied = over_http(proxy_port, args.num_requests)
+
+    print("%-14s %-14s %-14s %-14s" % ("request", "direct (us)",
+                                       "proxied (us)", "overhead (us)"))
+    for (name, direct_us), (_, proxied_us) in zip(direct, proxied):
+        print("%-14s %-14.1f %-14.1f %-14.1f" % (name, direct_us, proxied_us,
+                                                 proxied_us - direct_us))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import re
+import timeit
+
+from nfv_plugins.nfvi_plugins.openstack.rest_api import RestAPIRouteTable
+
+
+def search_dispatch(handlers, request_path):
+    """
+    Dispatch the way the Rest-API dispatcher did before routes were
+    compiled
+    """
+    path_list = list(handlers.keys())
+    path_list.sort(key=len, reverse=True)
+    for path in path_list:
+        if re.search(path, request_path) is not None:
+            return handlers[path]
+    return None
+
+
+def build_routes(num_routes):
+    handlers = dict()
+    for idx in range(num_routes):
+        handlers['/nfvi-plugins/v1/resource-%d/(?P<uuid>[^/]+)' % idx] = idx
+    return handlers
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-r', '--repeat', type=int, default=1000)
+    args = arg_parser.parse_args()
+
+    print("%-8s %-16s %-16s %-8s" % ("routes", "search (us/req)",
+                                     "table (us/req)", "speedup"))
+    for num_routes in [4, 16, 64, 256, 1024]:
+        handlers = build_routes(num_routes)
+        route_table = RestAPIRouteTable()
+        for path, handler in handlers.items():
+            route_table.add(path, handler)
+
+        # Requests spread over all the routes, plus one that misses
+        request_paths = ['/nfvi-plugins/v1/resource-%d/uuid-%d' % (idx, idx)
+                         for idx in range(0, num_routes,
+                                          max(num_routes // 16, 1))]
+        request_paths.append('/nfvi-plugins/v1/unknown')
+
+        for request_path in request_paths:
+            assert search_dispatch(handlers, request_path) == \
+                route_table.match(request_path)[0]
+
+        def search():
+            for request_path in request_paths:
+                search_dispatch(handlers, request_path)
+
+        def table():
+            for request_path in request_paths:
+                route_table.match(request_path)
+
+        number = max(args.repeat // num_routes, 2)
+        requests = number * len(request_paths)
+        search_us = timeit.timeit(search, number=number) * 1e6 / requests
+        table_us = timeit.timeit(table, number=number) * 1e6 / requests
+        print("%-8d %-16.2f %-16.2f %-8.1f" % (num_routes, search_us,
+                                               table_us, search_us / table_us))
+
+
+if __name__ == '__main__':
+    main()
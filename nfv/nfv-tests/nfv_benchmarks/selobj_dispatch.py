@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import os
+import resource
+import timeit
+
+from nfv_common import selobj
+from nfv_common.helpers import coroutine
+
+# select() cannot watch file descriptors at or above FD_SETSIZE
+FD_SETSIZE = 1024
+
+
+@coroutine
+def drain_callback():
+    """
+    Read callback that drains the pipe it is called for
+    """
+    while True:
+        read_fd = (yield)
+        os.read(read_fd, 64)
+
+
+def benchmark(backend, num_fds, repeat):
+    """
+    Returns the dispatch time in microseconds with num_fds registered
+    and one of them ready, or None if the backend cannot handle num_fds
+    """
+    if selobj.SELOBJ_BACKEND.SELECT == backend and num_fds >= FD_SETSIZE:
+        return None
+
+    selobj.selobj_initialize(backend)
+    pipes = [os.pipe() for _ in range(num_fds)]
+    try:
+        for read_fd, _ in pipes:
+            selobj.selobj_add_read_obj(read_fd, drain_callback)
+
+        _, write_fd = pipes[num_fds // 2]
+
+        def dispatch():
+            os.write(write_fd, b'x')
+            selobj.selobj_dispatch(1000)
+
+        return timeit.timeit(dispatch, number=repeat) * 1e6 / repeat
+    finally:
+        for read_fd, write_fd in pipes:
+            selobj.selobj_del_read_obj(read_fd)
+            os.close(read_fd)
+            os.close(write_fd)
+        selobj.selobj_finalize()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-r', '--repeat', type=int, default=1000)
+    args = arg_parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < 8192 and (hard == resource.RLIM_INFINITY or hard >= 8192):
+        resource.setrlimit(resource.RLIMIT_NOFILE, (8192, hard))
+
+    print("%-8s %-22s %-22s" % ("fds", "select (us/dispatch)",
+                                "epoll (us/dispatch)"))
+    for num_fds in [10, 100, 2000]:
+        results = list()
+        for backend in [selobj.SELOBJ_BACKEND.SELECT,
+                        selobj.SELOBJ_BACKEND.EPOLL]:
+            elapsed_us = benchmark(backend, num_fds, args.repeat)
+            if elapsed_us is None:
+                results.append("n/a (FD_SETSIZE)")
+            else:
+                results.append("%.2f" % elapsed_us)
+        print("%-8d %-22s %-22s" % (num_fds, results[0], results[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import random
+import time
+import uuid
+
+from nfv_vim.objects import HOST_PERSONALITY
+from nfv_vim.objects import INSTANCE_GROUP_POLICY
+from nfv_vim.objects import SW_UPDATE_ALARM_RESTRICTION
+from nfv_vim.objects import SW_UPDATE_APPLY_TYPE
+from nfv_vim.objects import SW_UPDATE_INSTANCE_ACTION
+from nfv_vim.strategy import _strategy_batching
+from nfv_vim.strategy import SwPatchStrategy
+from nfv_vim.tables import _host_aggregate_table
+from nfv_vim.tables import _host_table
+from nfv_vim.tables import _instance_group_table
+from nfv_vim.tables import _instance_table
+
+
+class FakeHost(object):
+    def __init__(self, name):
+        self.name = name
+        self.personality = HOST_PERSONALITY.WORKER
+
+
+class FakeInstance(object):
+    def __init__(self, name, host_name):
+        self.uuid = str(uuid.uuid4())
+        self.name = name
+        self.host_name = host_name
+        self.tenant_uuid = 'tenant'
+        self.instance_type_original_name = 'small'
+
+    def is_locked(self):
+        return False
+
+
+class FakeInstanceGroup(object):
+    def __init__(self, name, member_uuids, policies):
+        self.uuid = str(uuid.uuid4())
+        self.name = name
+        self.member_uuids = member_uuids
+        self.policies = policies
+
+
+class FakeHostAggregate(object):
+    def __init__(self, name, host_names):
+        self.name = name
+        self.host_names = host_names
+
+
+def build_topology(num_hosts, seed):
+    """
+    Fill the tables with hosts running a few instances each, instances of
+    a tenant spread by anti-affinity groups of two to six members, and the
+    hosts split into four aggregates plus one that overlaps them
+    """
+    rng = random.Random(seed)
+
+    host_table = _host_table.HostTable()
+    instance_table = _instance_table.InstanceTable()
+    instance_group_table = _instance_group_table.InstanceGroupTable()
+    host_aggregate_table = _host_aggregate_table.HostAggregateTable()
+    for table in [host_table, instance_table, instance_group_table,
+                  host_aggregate_table]:
+        table.persist = False
+    _host_table._host_table = host_table
+    _instance_table._instance_table = instance_table
+    _instance_group_table._instance_group_table = instance_group_table
+    _host_aggregate_table._host_aggregate_table = host_aggregate_table
+
+    hosts = list()
+    for idx in range(num_hosts):
+        host = FakeHost('compute-%d' % idx)
+        host_table[host.name] = host
+        hosts.append(host)
+
+    instances = list()
+    for host in hosts:
+        if rng.random() < 0.1:
+            continue
+        for idx in range(rng.randint(1, 4)):
+            instance = FakeInstance('%s-vm-%d' % (host.name, idx), host.name)
+            instance_table[instance.uuid] = instance
+            instances.append(instance)
+
+    rng.shuffle(instances)
+    pos = 0
+    while pos < len(instances) * 0.8:
+        size = rng.randint(2, 6)
+        members = instances[pos:pos + size]
+        pos += size
+        policy = rng.choice([INSTANCE_GROUP_POLICY.ANTI_AFFINITY,
+                             INSTANCE_GROUP_POLICY.ANTI_AFFINITY_BEST_EFFORT])
+        group = FakeInstanceGroup('group-%d' % pos,
+                                  [instance.uuid for instance in members],
+                                  [policy])
+        instance_group_table[group.uuid] = group
+
+    host_names = [host.name for host in hosts]
+    for idx in range(4):
+        aggregate = FakeHostAggregate('aggregate-%d' % idx,
+                                      host_names[idx::4])
+        host_aggregate_table[aggregate.name] = aggregate
+    aggregate = FakeHostAggregate('aggregate-overlap',
+                                  rng.sample(host_names, num_hosts // 10))
+    host_aggregate_table[aggregate.name] = aggregate
+    return hosts
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-s', '--sizes', default='50,200,1000',
+                            help='number of hosts of each topology')
+    arg_parser.add_argument('-p', '--max-parallel', type=int, default=0,
+                            help='hosts patched at once, a tenth of the '
+                                 'hosts when not given')
+    arg_parser.add_argument('--seed', type=int, default=1)
+    args = arg_parser.parse_args()
+
+    # Remember what the hosts with instances were batched from, to show
+    # the stages first-fit alone gives and the least there can be
+    problems = list()
+    host_batches = _strategy_batching.host_batches
+
+    def recording_host_batches(*args):
+        batches = host_batches(*args)
+        problems.append((args, batches))
+        return batches
+
+    _strategy_batching.host_batches = recording_host_batches
+
+    print("%-8s %-14s %-10s %-10s %-12s %-10s"
+          % ("hosts", "max-parallel", "stages", "build (s)", "first-fit",
+             "at least"))
+    for num_hosts in [int(size) for size in args.sizes.split(',')]:
+        hosts = build_topology(num_hosts, args.seed)
+        max_parallel = args.max_parallel or max(2, num_hosts // 10)
+        strategy = SwPatchStrategy(
+            uuid=str(uuid.uuid4()),
+            controller_apply_type=SW_UPDATE_APPLY_TYPE.IGNORE,
+            storage_apply_type=SW_UPDATE_APPLY_TYPE.IGNORE,
+            swift_apply_type=SW_UPDATE_APPLY_TYPE.IGNORE,
+            worker_apply_type=SW_UPDATE_APPLY_TYPE.PARALLEL,
+            max_parallel_worker_hosts=max_parallel,
+            default_instance_action=SW_UPDATE_INSTANCE_ACTION.MIGRATE,
+            alarm_restrictions=SW_UPDATE_ALARM_RESTRICTION.STRICT,
+            ignore_alarms=[],
+            single_controller=False)
+
+        start = time.time()
+        host_lists, reason = strategy._create_worker_host_lists(hosts, True)
+        elapsed = time.time() - start
+        assert host_lists is not None, reason
+
+        (num_batched, max_batch_size, conflict_groups, aggregates), \
+            batches = problems.pop()
+        first_fit = _strategy_batching._first_fit(
+            num_batched, max_batch_size, conflict_groups, aggregates)
+        lower_bound = first_fit.lower_bound(conflict_groups, aggregates)
+        num_other = len(host_lists) - len(batches)
+        print("%-8d %-14d %-10d %-10.3f %-12d %-10d"
+              % (num_hosts, max_parallel, len(host_lists), elapsed,
+                 num_other + first_fit.num_batches(),
+                 num_other + lower_bound))
+
+
+if __name__ == '__main__':
+    main()
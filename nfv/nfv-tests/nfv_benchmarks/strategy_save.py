@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import json
+import mock
+import shutil
+import tempfile
+import time
+
+from nfv_vim import database
+from nfv_vim.database import model
+from nfv_vim.database._database import database_create
+from nfv_vim.database._database import database_get
+from nfv_vim import objects
+from nfv_vim import strategy
+
+
+def fake_timer(a, b, c, d):
+    return 1234
+
+
+def build_sw_patch(num_stages, num_steps):
+    """
+    Returns a software patch with an apply phase of stages of steps
+    """
+    strategy_obj = strategy.SwPatchStrategy(
+        uuid='strategy-uuid',
+        controller_apply_type=objects.SW_UPDATE_APPLY_TYPE.SERIAL,
+        storage_apply_type=objects.SW_UPDATE_APPLY_TYPE.SERIAL,
+        swift_apply_type=objects.SW_UPDATE_APPLY_TYPE.IGNORE,
+        worker_apply_type=objects.SW_UPDATE_APPLY_TYPE.PARALLEL,
+        max_parallel_worker_hosts=10,
+        default_instance_action=objects.SW_UPDATE_INSTANCE_ACTION.MIGRATE,
+        alarm_restrictions=objects.SW_UPDATE_ALARM_RESTRICTION.STRICT,
+        ignore_alarms=[],
+        single_controller=False)
+    for stage_idx in range(num_stages):
+        stage = strategy.StrategyStage('sw-patch-worker-hosts')
+        for step_idx in range(num_steps):
+            step = strategy.SystemStabilizeStep()
+            step.result_reason = 'compute-%d' % (stage_idx * num_steps +
+                                                 step_idx)
+            stage.add_step(step)
+        strategy_obj.apply_phase.add_stage(stage)
+
+    sw_patch = objects.SwPatch('sw-patch-uuid')
+    sw_patch._strategy = strategy_obj
+    strategy_obj.sw_update_obj = sw_patch
+    return sw_patch
+
+
+def whole_save(db, sw_patch):
+    """
+    Save the way it was before, the whole strategy as one row, returns the
+    bytes written
+    """
+    strategy_data = json.dumps(sw_patch.strategy.as_dict())
+    db.write_row(model.SoftwareUpdate, sw_patch.uuid, dict(
+        uuid=sw_patch.uuid, sw_update_type=sw_patch.sw_update_type,
+        strategy_data=strategy_data))
+    db.flush()
+    return len(strategy_data)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-s', '--stages', type=int, default=100)
+    arg_parser.add_argument('-t', '--steps', type=int, default=30,
+                            help='steps per stage')
+    args = arg_parser.parse_args()
+
+    database_dir = tempfile.mkdtemp()
+    try:
+        with mock.patch('nfv_common.timers.timers_create_timer', fake_timer):
+            database_create(database_dir)
+            db = database_get()
+            sw_patch = build_sw_patch(args.stages, args.steps)
+            steps = [(stage, step)
+                     for stage in sw_patch.strategy.apply_phase.stages
+                     for step in stage.steps]
+            print("%d stages of %d steps" % (args.stages, args.steps))
+            print("%-12s %-18s %-18s" % ("save", "per step (ms)",
+                                         "per step (bytes)"))
+
+            start = time.time()
+            total_bytes = 0
+            for stage, step in steps:
+                step.result = strategy.STRATEGY_STEP_RESULT.WAIT
+                total_bytes += whole_save(db, sw_patch)
+            print("%-12s %-18.2f %-18d"
+                  % ("whole", (time.time() - start) * 1000 / len(steps),
+                     total_bytes // len(steps)))
+
+            # The first save of a strategy writes all of it
+            sw_patch.save()
+            stage.phase.stage_save(stage)
+
+            written = list()
+            write_row = db.write_row
+
+            def counting_write_row(table_class, key, row):
+                if write_row(table_class, key, row):
+                    written.append(sum(len(str(value))
+                                       for value in row.values()))
+                    return True
+                return False
+
+            db.write_row = counting_write_row
+            start = time.time()
+            for stage, step in steps:
+                step.result = strategy.STRATEGY_STEP_RESULT.SUCCESS
+                stage.phase.stage_save(stage)
+            print("%-12s %-18.2f %-18d"
+                  % ("incremental", (time.time() - start) * 1000 / len(steps),
+                     sum(written) // len(steps)))
+            db.write_row = write_row
+
+            start = time.time()
+            sw_update_objs = database.database_sw_update_get_list()
+            assert sw_patch.strategy.as_dict() == \
+                sw_update_objs[0].strategy.as_dict()
+            print("load %.2f s" % (time.time() - start))
+    finally:
+        shutil.rmtree(database_dir)
+
+
+if __name__ == '__main__':
+    main()
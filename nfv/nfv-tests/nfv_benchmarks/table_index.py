@@ -0,0 +1,71 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import timeit
+import uuid
+
+from nfv_vim.tables._instance_table import InstanceTable
+
+
+class FakeInstance(object):
+    """
+    Fake Instance, only carries the attributes the instance table indexes
+    """
+    def __init__(self, host_name):
+        self.uuid = str(uuid.uuid4())
+        self.host_name = host_name
+
+    def on_host(self, host_name):
+        return host_name == self.host_name
+
+
+def scan_on_host(instance_table, host_name):
+    """
+    Lookup the way the instance table did before secondary indexes
+    """
+    for instance in instance_table.values():
+        if instance.on_host(host_name):
+            yield instance
+
+
+def build_table(num_instances, num_hosts):
+    instance_table = InstanceTable()
+    instance_table.persist = False
+    for idx in range(num_instances):
+        instance = FakeInstance('compute-%d' % (idx % num_hosts))
+        instance_table[instance.uuid] = instance
+    return instance_table
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-n', '--num-hosts', type=int, default=50)
+    arg_parser.add_argument('-r', '--repeat', type=int, default=20)
+    args = arg_parser.parse_args()
+
+    print("%-10s %-16s %-16s %-8s" % ("instances", "scan (us/host)",
+                                      "index (us/host)", "speedup"))
+    for num_instances in [100, 1000, 10000]:
+        instance_table = build_table(num_instances, args.num_hosts)
+        host_names = ['compute-%d' % idx for idx in range(args.num_hosts)]
+
+        def scan():
+            for host_name in host_names:
+                list(scan_on_host(instance_table, host_name))
+
+        def index():
+            for host_name in host_names:
+                list(instance_table.on_host(host_name))
+
+        lookups = args.repeat * len(host_names)
+        scan_us = timeit.timeit(scan, number=args.repeat) * 1e6 / lookups
+        index_us = timeit.timeit(index, number=args.repeat) * 1e6 / lookups
+        print("%-10d %-16.2f %-16.2f %-8.1f" % (num_instances, scan_us,
+                                                index_us, scan_us / index_us))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import os
+import select
+import time
+
+from nfv_common import debug
+from nfv_common.helpers import Result
+from nfv_common import selobj
+from nfv_common import tasks
+from nfv_common import timers
+
+from nfv_common.tasks._task_work import TaskWork
+
+
+def no_op():
+    return None
+
+
+def server_list(size):
+    """
+    Returns a result of the given size and the time it was returned at
+    """
+    return Result('x' * size, time.time())
+
+
+def _memory_kb(pid):
+    """
+    Returns the proportional set size of a process, the resident set size
+    if that is not known
+    """
+    for file_name, key in [('smaps_rollup', 'Pss:'), ('status', 'VmRSS:')]:
+        try:
+            with open('/proc/%s/%s' % (pid, file_name)) as f:
+                for line in f:
+                    if line.startswith(key):
+                        return int(line.split()[1])
+        except IOError:
+            pass
+    return 0
+
+
+def _footprint_kb(workers):
+    pids = [os.getpid()]
+    pids.extend(worker._process.pid for worker in workers
+                if hasattr(worker, '_process'))
+    return sum(_memory_kb(pid) for pid in pids)
+
+
+def _run(worker, target, *args):
+    """
+    Run task work on a worker and wait for its result
+    """
+    worker.submit_task_work(TaskWork(60, target, *args))
+    while True:
+        select.select([worker.selobj], [], [], 60)
+        task_work = worker.get_task_work_result()
+        if task_work is not None:
+            return task_work
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-n', '--tasks', type=int, default=1000,
+                            help='number of tasks run to time the overhead')
+    arg_parser.add_argument('-w', '--workers', type=int, default=4,
+                            help='number of workers started to measure '
+                                 'the memory footprint')
+    arg_parser.add_argument('-r', '--repeat', type=int, default=20,
+                            help='number of results of each size sent')
+    arg_parser.add_argument('-s', '--sizes', default='1024,5242880',
+                            help='result sizes in bytes')
+    args = arg_parser.parse_args()
+
+    debug.debug_initialize(None)
+    selobj.selobj_initialize()
+    timers.timers_initialize(500, 1000, 1000)
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    print("%-8s %-16s %-16s %s"
+          % ("backend", "per task (us)", "memory (KiB)",
+             " ".join("%-20s" % ("latency %dB (ms)" % size)
+                       for size in sizes)))
+
+    for backend in [tasks.TASK_WORKER_BACKEND.PROCESS,
+                    tasks.TASK_WORKER_BACKEND.THREAD]:
+        before_kb = _footprint_kb([])
+        pool = tasks.TaskWorkerPool(backend, num_workers=args.workers,
+                                    backend=backend)
+        workers = list(pool._workers)
+        time.sleep(1)
+        memory_kb = _footprint_kb(workers) - before_kb
+
+        worker = pool.claim_worker()
+        _run(worker, no_op)
+        start = time.time()
+        for _ in range(args.tasks):
+            _run(worker, no_op)
+        per_task_us = (time.time() - start) * 1000000 / args.tasks
+
+        latencies = list()
+        for size in sizes:
+            samples = list()
+            for _ in range(args.repeat):
+                task_work = _run(worker, server_list, size)
+                samples.append(time.time() -
+                               task_work.ancillary_result_data)
+                assert size == len(task_work.result)
+            latencies.append(sorted(samples)[len(samples) // 2] * 1000)
+
+        pool.release_worker(worker)
+        pool.shutdown()
+        print("%-8s %-16.1f %-16d %s"
+              % (backend, per_task_us, memory_kb,
+                 " ".join("%-20.3f" % latency for latency in latencies)))
+
+    timers.timers_finalize()
+    selobj.selobj_finalize()
+    debug.debug_finalize()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import socket
+import struct
+import threading
+import time
+import timeit
+
+from nfv_common import tcp
+
+
+def legacy_send(sock, payload):
+    """
+    Send a message the way the connection did before, one buffer
+    """
+    sock.sendall(struct.pack('!L', socket.htonl(len(payload))) + payload)
+
+
+def legacy_receive(sock):
+    """
+    Receive a message the way the connection did before, a recv for each
+    part of the message and a join of the parts
+    """
+    msg_parts = list()
+    data = sock.recv(4)
+    if not data:
+        return None
+    msg_len_remaining = socket.ntohl(struct.unpack('!L', data)[0])
+    while msg_len_remaining:
+        msg_part = sock.recv(msg_len_remaining)
+        if not msg_part:
+            return None
+        msg_parts.append(msg_part)
+        msg_len_remaining -= len(msg_part)
+    return b"".join(msg_parts)
+
+
+def stream(framing, payload, num_msgs):
+    """
+    Stream messages over a local connection, returns the messages
+    received per second
+    """
+    listen = socket.socket()
+    listen.bind(('127.0.0.1', 0))
+    listen.listen(1)
+
+    connection = tcp.TCPConnection('127.0.0.1', 0)
+    connection.connect('127.0.0.1', listen.getsockname()[1])
+    peer, _ = listen.accept()
+    peer.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    listen.close()
+
+    if 'socket' == framing:
+        def send():
+            for _ in range(num_msgs):
+                legacy_send(connection.sock, payload)
+
+        def receive():
+            return legacy_receive(peer)
+    else:
+        peer_connection = tcp.TCPConnection('127.0.0.1', 0, sock=peer)
+
+        def send():
+            for _ in range(num_msgs):
+                connection.send(payload)
+
+        def receive():
+            return peer_connection.receive(timeout_in_secs=30)
+
+    sender = threading.Thread(target=send)
+    start = time.time()
+    sender.start()
+    for _ in range(num_msgs):
+        assert len(payload) == len(receive())
+    elapsed = time.time() - start
+    sender.join()
+
+    connection.close()
+    peer.close()
+    return num_msgs / elapsed
+
+
+def rpc_message():
+    """
+    Returns a typical vim-api rpc response
+    """
+    item = {'uuid': '8f1c0e7e-53f5-4b55-a2c6-b6a1f1c2e6ab',
+            'name': 'instance-1', 'admin_state': 'unlocked',
+            'oper_state': 'enabled', 'avail_status': [],
+            'action': '', 'host_uuid': '1b3f9a2c-5d0e-4c1b-9b65-9a3fdc2a9f10',
+            'host_name': 'compute-0', 'instance_type_vcpus': 2,
+            'instance_type_mem_mb': 2048, 'instance_type_disk_gb': 20,
+            'live_migration_support': True}
+    return {'version': 1, 'type': 'get-instances-response',
+            'result': 'success', 'items': [item] * 10,
+            'next_marker': None, 'end_of_stream': True}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-n', '--num-msgs', type=int, default=20000)
+    arg_parser.add_argument('-l', '--num-large-msgs', type=int, default=2000)
+    arg_parser.add_argument('-r', '--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print("%-10s %-10s %-12s" % ("payload", "framing", "msgs/s"))
+    for name, payload, num_msgs in [
+            ('64B', b'x' * 64, args.num_msgs),
+            ('64KB', b'x' * 65536, args.num_large_msgs)]:
+        for framing in ('socket', 'connection'):
+            rate = max(stream(framing, payload, num_msgs)
+                       for _ in range(args.repeat))
+            print("%-10s %-10s %-12.0f" % (name, framing, rate))
+
+    msg = rpc_message()
+    print("")
+    print("%-10s %-10s %-16s %-16s" % ("codec", "bytes", "encode (us)",
+                                       "decode (us)"))
+    for codec in (tcp.TCP_CODEC.JSON, tcp.TCP_CODEC.COMPACT):
+        data = tcp.tcp_codec_encode(msg, codec)
+        encode = min(timeit.repeat(lambda: tcp.tcp_codec_encode(msg, codec),
+                                   number=2000, repeat=args.repeat))
+        decode = min(timeit.repeat(lambda: tcp.tcp_codec_decode(data),
+                                   number=2000, repeat=args.repeat))
+        print("%-10s %-10d %-16.1f %-16.1f" % (codec, len(data),
+                                               encode / 2000 * 1e6,
+                                               decode / 2000 * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import timeit
+
+from nfv_common.timers._timer import Timer
+from nfv_common.timers._timer_scheduler import TimerScheduler
+
+
+def idle_callback():
+    """
+    Timer callback that never needs to do any work
+    """
+    while True:
+        (yield)
+
+
+def build_scheduler(num_timers, num_due):
+    """
+    Create a scheduler with num_timers idle timers and num_due timers that
+    expire on every tick
+    """
+    scheduler = TimerScheduler(0, 1000000, 0)
+    for idx in range(num_timers):
+        target = idle_callback()
+        target.send(None)
+        scheduler.add_timer(Timer('idle-%d' % idx, None, 3600,
+                                  lambda target=target: target))
+
+    for idx in range(num_due):
+        target = idle_callback()
+        target.send(None)
+        scheduler.add_timer(Timer('due-%d' % idx, 0, 0,
+                                  lambda target=target: target))
+    return scheduler
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-d', '--num-due', type=int, default=10)
+    arg_parser.add_argument('-r', '--repeat', type=int, default=200)
+    args = arg_parser.parse_args()
+
+    print("%-10s %-22s %-22s" % ("timers", "schedule (us/tick)",
+                                 "add+delete (us/timer)"))
+    for num_timers in [100, 1000, 10000, 100000]:
+        scheduler = build_scheduler(num_timers, args.num_due)
+        tick_us = (timeit.timeit(scheduler.schedule, number=args.repeat) *
+                   1e6 / args.repeat)
+
+        target = idle_callback()
+        target.send(None)
+
+        def add_delete():
+            timer = Timer('churn', None, 60, lambda: target)
+            scheduler.add_timer(timer)
+            scheduler.delete_timer(timer.timer_id)
+
+        churn_us = (timeit.timeit(add_delete, number=args.repeat) *
+                    1e6 / args.repeat)
+        print("%-10d %-22.2f %-22.2f" % (num_timers, tick_us, churn_us))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+from six.moves import http_client as httplib
+from six.moves import queue
+import threading
+import time
+
+import pecan
+
+from nfv_common import config
+from nfv_common import selobj
+from nfv_common import tcp
+
+from nfv_vim import api
+from nfv_vim import rpc
+from nfv_vim.api import _application
+from nfv_vim.api import _hooks
+
+STRATEGY_URL = '/api/orchestration/sw-patch/strategy'
+
+
+class FakeVim(object):
+    """
+    Fake VIM, answers sw-update strategy queries after a delay, the way a
+    VIM busy with other work would
+    """
+    def __init__(self, rpc_delay_in_secs):
+        self._rpc_delay_in_secs = rpc_delay_in_secs
+        self._stop = threading.Event()
+        selobj.selobj_initialize()
+        self._server = tcp.TCPServer('127.0.0.1', 0, self._message_handler,
+                                     max_connections=128)
+        self._thread = threading.Thread(target=self._dispatch)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def port(self):
+        return self._server._socket.getsockname()[1]
+
+    def _dispatch(self):
+        while not self._stop.is_set():
+            selobj.selobj_dispatch(10)
+
+    def _message_handler(self, connection, msg):
+        request = rpc.RPCMessage.deserialize(msg)
+        response = rpc.APIResponseGetSwUpdateStrategy()
+        response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
+        assert rpc.RPC_MSG_TYPE.GET_SW_UPDATE_STRATEGY_REQUEST == request.type
+
+        def reply():
+            connection.send(response.serialize(connection.codec))
+            connection.close()
+
+        threading.Timer(self._rpc_delay_in_secs, reply).start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self._server.shutdown()
+        selobj.selobj_finalize()
+
+
+def create_app():
+    """
+    Returns the vim-api pecan application, without the keystone
+    authentication in front of it
+    """
+    pecan_conf = _application.get_pecan_config()
+    pecan.configuration.set_config(dict(pecan_conf), overwrite=True)
+    app_hooks = [_hooks.ConnectionHook(), _hooks.ContextHook([])]
+    return pecan.make_app(pecan_conf.app.root, static_root='', debug=False,
+                          force_canonical=False, hooks=app_hooks)
+
+
+def load(port, num_requests, num_clients):
+    """
+    Send requests from a number of clients over keep-alive connections,
+    returns the latency of each request in milliseconds and the number
+    of requests refused
+    """
+    work = queue.Queue()
+    for idx in range(num_requests):
+        work.put(idx)
+    latencies = list()
+    refused = list()
+
+    def client():
+        connection = httplib.HTTPConnection('127.0.0.1', port, timeout=60)
+        while True:
+            try:
+                work.get_nowait()
+            except queue.Empty:
+                break
+            start = time.time()
+            connection.request('GET', STRATEGY_URL)
+            response = connection.getresponse()
+            response.read()
+            if httplib.SERVICE_UNAVAILABLE == response.status:
+                refused.append(1)
+                connection.close()
+                continue
+            assert httplib.OK == response.status
+            latencies.append((time.time() - start) * 1000)
+        connection.close()
+
+    clients = [threading.Thread(target=client) for _ in range(num_clients)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    return sorted(latencies), len(refused)
+
+
+def percentile(latencies, pct):
+    if not latencies:
+        return 0
+    return latencies[min(len(latencies) - 1, int(len(latencies) * pct / 100))]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-n', '--num-requests', type=int, default=400)
+    arg_parser.add_argument('-c', '--num-clients', type=int, default=16)
+    arg_parser.add_argument('-w', '--workers', type=int, default=8)
+    arg_parser.add_argument('-q', '--queue-size', type=int, default=64)
+    arg_parser.add_argument('-d', '--rpc-delay-ms', type=float, default=5)
+    args = arg_parser.parse_args()
+
+    vim = FakeVim(args.rpc_delay_ms / 1000.0)
+    config.CONF['vim'] = {'rpc_host': '127.0.0.1', 'rpc_port': vim.port}
+    config.CONF['vim-api'] = {'rpc_host': '127.0.0.1', 'rpc_port': 0}
+    app = create_app()
+
+    print("%d requests from %d clients, rpc delay %.1fms"
+          % (args.num_requests, args.num_clients, args.rpc_delay_ms))
+    print("%-10s %-10s %-10s %-10s %-10s" % ("workers", "req/s", "p50 (ms)",
+                                             "p99 (ms)", "refused"))
+    for num_workers in (0, args.workers):
+        server = api.make_server('127.0.0.1', 0, app, num_workers,
+                                 args.queue_size)
+        server.start()
+        thread = threading.Thread(target=server.serve_forever,
+                                  kwargs={'poll_interval': 0.05})
+        thread.start()
+
+        start = time.time()
+        latencies, refused = load(server.server_address[1],
+                                  args.num_requests, args.num_clients)
+        total = time.time() - start
+        print("%-10d %-10.0f %-10.2f %-10.2f %-10d"
+              % (num_workers, len(latencies) / total,
+                 percentile(latencies, 50), percentile(latencies, 99),
+                 refused))
+
+        server.shutdown()
+        thread.join()
+        server.server_close()
+        server.drain()
+
+    vim.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import threading
+import time
+
+from six.moves import queue
+
+from nfv_common import selobj
+from nfv_common import tcp
+
+
+def message_handler(connection, msg):
+    connection.send(msg)
+    connection.close()
+
+
+def connection_request(connect, payload):
+    """
+    Send a request over its own connection, as the vim-api did
+    """
+    connection = tcp.TCPConnection('127.0.0.1', 0)
+    connection.connect('127.0.0.1', connect)
+    connection.send(payload)
+    msg = connection.receive(timeout_in_secs=30)
+    connection.close()
+    return msg
+
+
+def channel_request(pool, payload):
+    """
+    Send a request over a long-lived channel
+    """
+    request = pool.request()
+    request.send(payload)
+    msg = request.receive(timeout_in_secs=30)
+    request.close()
+    return msg
+
+
+def burst(send, num_requests, num_clients):
+    """
+    Send a burst of requests from a number of clients, returns the latency
+    of each request in milliseconds
+    """
+    work = queue.Queue()
+    for idx in range(num_requests):
+        work.put(('{"type": "instance-action", "idx": %d}' % idx).encode())
+    latencies = list()
+
+    def client():
+        while True:
+            try:
+                payload = work.get_nowait()
+            except queue.Empty:
+                return
+            start = time.time()
+            assert payload == send(payload)
+            latencies.append((time.time() - start) * 1000)
+
+    clients = [threading.Thread(target=client) for _ in range(num_clients)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    return sorted(latencies)
+
+
+def percentile(latencies, pct):
+    return latencies[min(len(latencies) - 1, int(len(latencies) * pct / 100))]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('-n', '--num-requests', type=int, default=500)
+    arg_parser.add_argument('-c', '--num-clients', type=int, default=16)
+    arg_parser.add_argument('-p', '--num-channels', type=int, default=2)
+    args = arg_parser.parse_args()
+
+    selobj.selobj_initialize()
+    server = tcp.TCPServer('127.0.0.1', 0, message_handler,
+                           max_connections=128)
+    port = server._socket.getsockname()[1]
+    stop = threading.Event()
+
+    def dispatch():
+        while not stop.is_set():
+            selobj.selobj_dispatch(10)
+
+    thread = threading.Thread(target=dispatch)
+    thread.daemon = True
+    thread.start()
+
+    pool = tcp.TCPChannelPool('127.0.0.1', 0, '127.0.0.1', port,
+                              num_channels=args.num_channels)
+
+    print("%d requests from %d clients" % (args.num_requests,
+                                            args.num_clients))
+    print("%-12s %-10s %-10s %-10s %-8s" % ("transport", "p50 (ms)",
+                                            "p99 (ms)", "total (s)",
+                                            "sockets"))
+    for name, send in [
+            ('connection', lambda payload: connection_request(port, payload)),
+            ('channel', lambda payload: channel_request(pool, payload))]:
+        start = time.time()
+        latencies = burst(send, args.num_requests, args.num_clients)
+        total = time.time() - start
+        if 'connection' == name:
+            sockets = args.num_requests
+        else:
+            sockets = sum(channel.connects for channel in pool.channels)
+        print("%-12s %-10.2f %-10.2f %-10.2f %-8d"
+              % (name, percentile(latencies, 50), percentile(latencies, 99),
+                 total, sockets))
+
+    pool.close()
+    stop.set()
+    thread.join()
+    server.shutdown()
+    selobj.selobj_finalize()
+
+
+if __name__ == '__main__':
+    main()
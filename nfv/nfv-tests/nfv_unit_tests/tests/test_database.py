@@ -0,0 +1,298 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+import json
+import mock
+import os
+
+from nfv_vim import database
+from nfv_vim import objects
+from nfv_vim import strategy
+
+from nfv_vim.database import model
+from nfv_vim.database._database import database_create
+from nfv_vim.database._database import database_get
+
+from . import testcase  # noqa: H304
+
+
+def fake_timer(a, b, c, d):
+    return 1234
+
+
+@mock.patch('nfv_common.timers.timers_create_timer', fake_timer)
+class TestDatabaseWriteBehind(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestDatabaseWriteBehind, self).setUp()
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_vim.database._database._db_obj', None))
+        database_dir = self.useFixture(fixtures.TempDir()).path
+        database_create(database_dir)
+        self._db = database_get()
+        self.addCleanup(self._db.end_session)
+
+    def _count_rows(self):
+        return self._db.session.query(model.Tenant).count()
+
+    def test_writes_are_deferred_until_flush(self):
+        """
+        Test rows are only written on a flush
+        """
+        tenant = objects.Tenant('tenant-uuid', 'tenant', 'description', True)
+        database.database_tenant_add(tenant)
+        assert 0 == self._count_rows()
+
+        database.database_flush()
+        assert 1 == self._count_rows()
+
+        tenant_objs = database.database_tenant_get_list()
+        assert 'tenant-uuid' == tenant_objs[0].uuid
+        assert 'description' == tenant_objs[0].description
+
+    def test_writes_are_coalesced(self):
+        """
+        Test unchanged rows are skipped and repeated writes are coalesced
+        """
+        tenant = objects.Tenant('tenant-uuid', 'tenant', 'first', True)
+        assert self._db.write_row(model.Tenant, tenant.uuid, dict(
+            uuid=tenant.uuid, name=tenant.name, description='first',
+            enabled=True))
+        assert not self._db.write_row(model.Tenant, tenant.uuid, dict(
+            uuid=tenant.uuid, name=tenant.name, description='first',
+            enabled=True))
+
+        tenant.description = 'second'
+        database.database_tenant_add(tenant)
+        database.database_flush()
+
+        tenant_objs = database.database_tenant_get_list()
+        assert 1 == len(tenant_objs)
+        assert 'second' == tenant_objs[0].description
+
+        # Content already written is not queued again
+        database.database_tenant_add(tenant)
+        assert 0 == len(self._db._dirty_rows)
+
+    def test_delete(self):
+        """
+        Test deletes are deferred and a re-added row is written again
+        """
+        tenant = objects.Tenant('tenant-uuid', 'tenant', 'description', True)
+        database.database_tenant_add(tenant)
+        database.database_flush()
+
+        database.database_tenant_delete(tenant.uuid)
+        assert 1 == self._count_rows()
+        database.database_flush()
+        assert 0 == self._count_rows()
+
+        database.database_tenant_add(tenant)
+        database.database_flush()
+        assert 1 == self._count_rows()
+
+        # Delete and re-add before a flush ends up with the row present
+        database.database_tenant_delete(tenant.uuid)
+        database.database_tenant_add(tenant)
+        database.database_flush()
+        assert 1 == self._count_rows()
+
+    def test_failed_commit(self):
+        """
+        Test a failed commit is rolled back and its rows written again
+        """
+        tenant = objects.Tenant('tenant-uuid', 'tenant', 'description', True)
+        database.database_tenant_add(tenant)
+
+        with mock.patch.object(self._db.session, 'commit',
+                               side_effect=Exception('disk I/O error')):
+            self.assertRaises(Exception, database.database_flush)
+        assert 0 == self._count_rows()
+
+        # The row is still queued, and written on the next flush
+        database.database_flush()
+        assert 1 == self._count_rows()
+
+    def test_failed_commit_delete(self):
+        """
+        Test a delete queued for a failed commit is applied on the next
+        flush, and rows queued since the failure win
+        """
+        tenant = objects.Tenant('tenant-uuid', 'tenant', 'description', True)
+        other_tenant = objects.Tenant('other-uuid', 'other', 'first', True)
+        database.database_tenant_add(tenant)
+        database.database_tenant_add(other_tenant)
+        database.database_flush()
+
+        database.database_tenant_delete(tenant.uuid)
+        other_tenant.description = 'second'
+        database.database_tenant_add(other_tenant)
+        with mock.patch.object(self._db.session, 'commit',
+                               side_effect=Exception('disk I/O error')):
+            self.assertRaises(Exception, database.database_flush)
+        assert 2 == self._count_rows()
+
+        other_tenant.description = 'third'
+        database.database_tenant_add(other_tenant)
+        database.database_flush()
+
+        tenant_objs = database.database_tenant_get_list()
+        assert ['other-uuid'] == [tenant_obj.uuid for tenant_obj in tenant_objs]
+        assert 'third' == tenant_objs[0].description
+        assert 0 == len(self._db._dirty_rows)
+
+
+@mock.patch('nfv_common.timers.timers_create_timer', fake_timer)
+class TestDatabaseSwUpdate(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestDatabaseSwUpdate, self).setUp()
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_vim.database._database._db_obj', None))
+        database_dir = self.useFixture(fixtures.TempDir()).path
+        database_create(database_dir)
+        self._db = database_get()
+        self.addCleanup(self._db.end_session)
+
+    def _sw_patch(self, num_stages=3, num_steps=4, uuid='sw-patch-uuid'):
+        """
+        Returns a software patch with a strategy of a few stages of steps
+        to apply
+        """
+        strategy_obj = strategy.SwPatchStrategy(
+            uuid='strategy-uuid',
+            controller_apply_type=objects.SW_UPDATE_APPLY_TYPE.SERIAL,
+            storage_apply_type=objects.SW_UPDATE_APPLY_TYPE.SERIAL,
+            swift_apply_type=objects.SW_UPDATE_APPLY_TYPE.IGNORE,
+            worker_apply_type=objects.SW_UPDATE_APPLY_TYPE.PARALLEL,
+            max_parallel_worker_hosts=2,
+            default_instance_action=objects.SW_UPDATE_INSTANCE_ACTION.MIGRATE,
+            alarm_restrictions=objects.SW_UPDATE_ALARM_RESTRICTION.STRICT,
+            ignore_alarms=[],
+            single_controller=False)
+        for stage_idx in range(num_stages):
+            stage = strategy.StrategyStage('stage-%d' % stage_idx)
+            for _ in range(num_steps):
+                stage.add_step(strategy.SystemStabilizeStep())
+            strategy_obj.apply_phase.add_stage(stage)
+
+        sw_patch = objects.SwPatch(uuid)
+        sw_patch._strategy = strategy_obj
+        strategy_obj.sw_update_obj = sw_patch
+        return sw_patch
+
+    def _loaded_strategy(self):
+        sw_update_objs = database.database_sw_update_get_list()
+        assert 1 == len(sw_update_objs)
+        return sw_update_objs[0].strategy
+
+    def test_round_trip(self):
+        """
+        Test a strategy saved as rows is loaded back the same
+        """
+        sw_patch = self._sw_patch()
+        sw_patch.save()
+        assert 3 == self._db.session.query(model.SoftwareUpdateStage).count()
+        assert 12 == self._db.session.query(model.SoftwareUpdateStep).count()
+
+        assert sw_patch.strategy.as_dict() == self._loaded_strategy().as_dict()
+
+    def test_step_transition(self):
+        """
+        Test a step transition writes only the step that changed
+        """
+        sw_patch = self._sw_patch()
+        stage = sw_patch.strategy.apply_phase.stages[1]
+        stage.phase.stage_save(stage)
+
+        step = stage.steps[2]
+        step.result = strategy.STRATEGY_STEP_RESULT.SUCCESS
+        with mock.patch.object(self._db, 'flush'):
+            stage.phase.stage_save(stage)
+        dirty = dict((table_class, list(rows.keys()))
+                     for table_class, rows in self._db._dirty_rows.items()
+                     if rows)
+        assert {model.SoftwareUpdateStep: ['sw-patch-uuid.apply.1.2']} == dirty
+        self._db.flush()
+
+        step_row = self._db.session.query(model.SoftwareUpdateStep).filter(
+            model.SoftwareUpdateStep.key.endswith('.apply.1.2')).one()
+        assert 'success' == json.loads(step_row.step_data)['result']
+        assert sw_patch.strategy.as_dict() == self._loaded_strategy().as_dict()
+
+    def test_stages_removed(self):
+        """
+        Test the rows of stages no longer in the strategy are deleted
+        """
+        sw_patch = self._sw_patch()
+        sw_patch.save()
+
+        sw_patch.strategy.apply_phase._stages.pop()
+        sw_patch.save()
+        assert 2 == self._db.session.query(model.SoftwareUpdateStage).count()
+        assert 8 == self._db.session.query(model.SoftwareUpdateStep).count()
+        assert sw_patch.strategy.as_dict() == self._loaded_strategy().as_dict()
+
+        database.database_sw_update_delete(sw_patch.uuid)
+        assert 0 == self._db.session.query(model.SoftwareUpdateStage).count()
+        assert [] == database.database_sw_update_get_list()
+
+    def test_saved_as_a_whole(self):
+        """
+        Test a strategy saved as one row by an earlier release is loaded
+        """
+        sw_patch = self._sw_patch()
+        self._db.write_row(model.SoftwareUpdate, sw_patch.uuid, dict(
+            uuid=sw_patch.uuid, sw_update_type=sw_patch.sw_update_type,
+            strategy_data=json.dumps(sw_patch.strategy.as_dict())))
+        self._db.flush()
+
+        assert sw_patch.strategy.as_dict() == self._loaded_strategy().as_dict()
+
+    def test_dump_and_load(self):
+        """
+        Test a strategy saved as rows is loaded back from a database dump
+        """
+        sw_patch = self._sw_patch()
+        sw_patch.save()
+        dump_dir = self.useFixture(fixtures.TempDir()).path
+        dump_file = os.path.join(dump_dir, 'nfv_vim_db_dump')
+        database.database_dump_data(dump_file)
+
+        database_create(os.path.join(dump_dir, 'database'))
+        self._db = database_get()
+        self.addCleanup(self._db.end_session)
+        database.database_load_data(dump_file)
+
+        assert 3 == self._db.session.query(model.SoftwareUpdateStage).count()
+        assert sw_patch.strategy.as_dict() == self._loaded_strategy().as_dict()
+
+    def test_stage_missing(self):
+        """
+        Test a strategy missing a stage row is dropped, without stopping
+        the other strategies from loading
+        """
+        sw_patch = self._sw_patch()
+        sw_patch.save()
+        other_sw_patch = self._sw_patch(uuid='other-sw-patch-uuid')
+        other_sw_patch.save()
+        self._db.delete_row(model.SoftwareUpdateStage,
+                            'sw-patch-uuid.apply.1')
+        self._db.flush()
+
+        sw_update_objs = dict((sw_update_obj.uuid, sw_update_obj) for
+                              sw_update_obj in
+                              database.database_sw_update_get_list())
+        assert ['other-sw-patch-uuid', 'sw-patch-uuid'] == \
+            sorted(sw_update_objs)
+        assert sw_update_objs['sw-patch-uuid'].strategy is None
+        assert other_sw_patch.strategy.as_dict() == \
+            sw_update_objs['other-sw-patch-uuid'].strategy.as_dict()
+
+        # The rows of the dropped strategy are deleted on the next save
+        sw_update_objs['sw-patch-uuid'].save()
+        assert 3 == self._db.session.query(model.SoftwareUpdateStage).count()
+        assert 12 == self._db.session.query(model.SoftwareUpdateStep).count()
@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2020 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+import logging
+import mock
+
+from nfv_common import debug
+from nfv_common.debug._debug_log import DebugLogger
+from nfv_common.debug._debug_thread import DebugLoggingThread
+
+from . import testcase  # noqa: H304
+
+
+class CountingArg(object):
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return 'counting-arg'
+
+
+class TestDebugLog(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestDebugLog, self).setUp()
+        logging_thread = DebugLoggingThread()
+        logging_thread.flush()
+        self._log_queue = mock.Mock()
+        patcher = mock.patch.object(logging_thread, '_log_queue',
+                                    self._log_queue)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # The overall debug level is kept by the debug singleton
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.debug._debug_module.Debug.debug_level',
+            debug.DEBUG_LEVEL.VERBOSE))
+
+    def _sent_records(self):
+        records = list()
+        for call in self._log_queue.put_nowait.call_args_list:
+            action, work = call[0][0]
+            assert 'log-records' == action
+            records.extend(work)
+        return records
+
+    def test_is_enabled_for(self):
+        """
+        Test a logger logs at its level and above, and not below the overall
+        debug level
+        """
+        logger = DebugLogger('test.debug.enabled')
+        logger.set_level(debug.DEBUG_LEVEL.INFO)
+        assert logger.is_enabled_for(debug.DEBUG_LEVEL.INFO)
+        assert logger.is_enabled_for(debug.DEBUG_LEVEL.ERROR)
+        assert not logger.is_enabled_for(debug.DEBUG_LEVEL.VERBOSE)
+
+        logger.set_level(debug.DEBUG_LEVEL.NONE)
+        assert not logger.is_enabled_for(debug.DEBUG_LEVEL.CRITICAL)
+
+    def test_disabled_not_formatted(self):
+        """
+        Test the arguments of a log that is not logged are not formatted
+        """
+        logger = DebugLogger('test.debug.disabled')
+        logger.set_level(debug.DEBUG_LEVEL.INFO)
+        arg = CountingArg()
+        logger.verbose("response=%s", arg)
+        logger.debug("response=%s", arg)
+        assert 0 == arg.formatted
+        assert [] == self._sent_records()
+
+    def test_records_batched(self):
+        """
+        Test records are sent together once flushed, warnings straight away
+        """
+        logger = DebugLogger('test.debug.batched')
+        logger.set_level(debug.DEBUG_LEVEL.VERBOSE)
+        arg = CountingArg()
+        logger.verbose("response=%s", arg)
+        logger.info("done")
+        assert 1 == arg.formatted
+        assert not self._log_queue.put_nowait.called
+
+        logger.warn("warning")
+        records = self._sent_records()
+        assert 3 == len(records)
+        assert records[0].msg.endswith('response=counting-arg')
+        assert logging.WARNING == records[2].levelno
+
+        logger.info("done again")
+        assert 1 == self._log_queue.put_nowait.call_count
+        debug.debug_flush()
+        assert 4 == len(self._sent_records())
+
+    def test_batch_full(self):
+        """
+        Test a full batch is sent without being flushed
+        """
+        logger = DebugLogger('test.debug.full')
+        logger.set_level(debug.DEBUG_LEVEL.INFO)
+        for idx in range(DebugLoggingThread.BATCH_MAX_RECORDS):
+            logger.info("record %s", idx)
+        assert DebugLoggingThread.BATCH_MAX_RECORDS == \
+            len(self._sent_records())
+
+    def test_caller_cached(self):
+        """
+        Test the caller is that of each call site
+        """
+        logger = DebugLogger('test.debug.caller')
+        logger.set_level(debug.DEBUG_LEVEL.INFO)
+        for _ in range(2):
+            logger.info("first")
+            logger.info("second")
+        debug.debug_flush()
+
+        records = self._sent_records()
+        assert 4 == len(records)
+        callers = [record.msg[:-len(text)] for record, text
+                   in zip(records, ['first', 'second'] * 2)]
+        assert callers[0] == callers[2]
+        assert callers[1] == callers[3]
+        assert callers[0] != callers[1]
+        assert 'test_debug_log.py' in callers[0]
@@ -0,0 +1,241 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import datetime
+import fixtures
+import mock
+import os
+import shutil
+import tempfile
+
+from nfv_common import forensic
+from nfv_common.forensic import _evidence
+from nfv_common.forensic import _nfv_vim_parser
+from nfv_common.forensic import _parsers
+
+from . import testcase  # noqa: H304
+
+START = datetime.datetime(2016, 2, 15, 10)
+
+
+def _line(seconds, filename, message):
+    timestamp = START + datetime.timedelta(seconds=seconds)
+    return ("%s.%03d controller-0 VIM_Thread[1234] INFO %s.%d %s\n"
+            % (timestamp.strftime('%Y-%m-%dT%H:%M:%S'),
+               timestamp.microsecond // 1000, filename, 100 + seconds,
+               message))
+
+
+class TestForensicEvidence(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestForensicEvidence, self).setUp()
+        forensic.forensic_initialize()
+        self.addCleanup(forensic.forensic_finalize)
+        self._parser = _parsers.parser_get('nfv-vim')
+
+    def _log(self, seconds_list, offset=0):
+        """
+        Write a log with a log of interest at each time given, and noise
+        around them
+        """
+        lines = list()
+        for seconds in seconds_list:
+            lines.append(_line(seconds, '_timer_scheduler.py',
+                               'Timer tick took 5 ms, timers=42, '
+                               'nothing to see here.'))
+            lines.append("    continuation line without a timestamp\n")
+            lines.append(_line(seconds, '_instance_state_start.py',
+                               'Entering state (start) for instance-%d.'
+                               % (seconds + offset)))
+        fd, file_name = tempfile.mkstemp(suffix='.log')
+        with os.fdopen(fd, 'w') as f:
+            f.write(''.join(lines))
+        self.addCleanup(os.remove, file_name)
+        return file_name
+
+    def _parse_all(self, file_name, start_date, end_date):
+        """
+        Returns the records of every line of a file, parsed one by one
+        """
+        records = list()
+        for line in open(file_name):
+            record = self._parser.parse(start_date, end_date, line)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def test_literal_prefix(self):
+        """
+        Test the text a regex starts with is found
+        """
+        assert 'Entering state (start) for ' == \
+            _nfv_vim_parser._regex_literal_prefix(
+                'Entering state \\(start\\) for (.*).')
+        assert 'Evacuate of instance ' == \
+            _nfv_vim_parser._regex_literal_prefix(
+                'Evacuate of instance (.*) from host')
+        assert 'Migrat' == \
+            _nfv_vim_parser._regex_literal_prefix('Migrate?d? (.*)')
+        assert 'Host ' == \
+            _nfv_vim_parser._regex_literal_prefix('Host \\d+ failed')
+        assert '' == _nfv_vim_parser._regex_literal_prefix('(.*) failed')
+
+    def test_window(self):
+        """
+        Test the records between the start and end dates are found, the
+        same as parsing every line
+        """
+        file_name = self._log(range(0, 600, 7))
+        start_date = START + datetime.timedelta(seconds=100)
+        end_date = START + datetime.timedelta(seconds=200)
+
+        records = forensic.evidence_from_files({'nfv-vim': file_name},
+                                               start_date, end_date)
+        assert 14 == len(records)
+        assert self._parse_all(file_name, start_date, end_date) == records
+        assert 'instance-105' == records[0]['data']['instance_name']
+
+    def test_seek(self):
+        """
+        Test the range searched starts and ends on the lines at the start
+        and end dates
+        """
+        file_name = self._log(range(0, 600, 10))
+        start, end = _evidence._file_range(
+            self._parser, file_name,
+            START + datetime.timedelta(seconds=95),
+            START + datetime.timedelta(seconds=200))
+
+        with open(file_name, 'rb') as f:
+            data = f.read()
+        assert data[start:].startswith(_line(100, '_timer_scheduler.py',
+                                             '').encode()[:24])
+        assert data[end:].startswith(_line(210, '_timer_scheduler.py',
+                                           '').encode()[:24])
+        assert 0 == start or b'\n' == data[start - 1:start]
+
+        start, end = _evidence._file_range(
+            self._parser, file_name, START + datetime.timedelta(hours=1),
+            START + datetime.timedelta(hours=2))
+        assert start == end == len(data)
+
+    def test_merge_files(self):
+        """
+        Test the records of several files are merged in timestamp order
+        """
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.forensic._parsers._parsers',
+            {'nfv-vim': self._parser, 'other': self._parser}))
+        odd = self._log(range(1, 100, 2))
+        even = self._log(range(0, 100, 2), offset=1000)
+        end_date = START + datetime.timedelta(hours=1)
+
+        records = forensic.evidence_from_files({'nfv-vim': odd,
+                                                'other': even},
+                                               START, end_date)
+        assert 100 == len(records)
+        timestamps = [record['timestamp'] for record in records]
+        assert sorted(timestamps) == timestamps
+
+    def test_parallel(self):
+        """
+        Test worker processes find the same records, with progress reported
+        up to 100%
+        """
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.forensic._evidence.PARALLEL_MIN_BYTES', 0))
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.forensic._evidence.CHUNK_MIN_BYTES', 4096))
+        file_name = self._log(range(0, 3000, 3))
+        end_date = START + datetime.timedelta(hours=1)
+
+        progress = list()
+        records = forensic.evidence_from_files({'nfv-vim': file_name},
+                                               START, end_date,
+                                               progress=progress.append,
+                                               processes=3)
+        assert self._parse_all(file_name, START, end_date) == records
+        assert 3 == len(progress)
+        assert 100 == progress[-1]
+
+    def _index_file(self):
+        fd, index_file = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        self.addCleanup(os.remove, index_file)
+        return index_file
+
+    def test_index(self):
+        """
+        Test the records of the index are the same as parsing the files
+        """
+        file_name = self._log(range(0, 600, 7))
+        index_file = self._index_file()
+        start_date = START + datetime.timedelta(seconds=100)
+        end_date = START + datetime.timedelta(seconds=200)
+
+        for _ in range(2):
+            records = forensic.evidence_from_index(
+                index_file, {'nfv-vim': file_name}, start_date, end_date)
+            assert forensic.evidence_from_files({'nfv-vim': file_name},
+                                                start_date, end_date) \
+                == records
+
+        records = forensic.evidence_from_index(
+            index_file, {'nfv-vim': file_name}, START, end_date,
+            instance_uuid='unknown', instance_name='instance-105')
+        assert 1 == len(records)
+        assert 'instance-105' == records[0]['data']['instance_name']
+
+        records = forensic.evidence_from_index(
+            index_file, {'nfv-vim': file_name}, START, end_date,
+            record_types=['unknown'])
+        assert [] == records
+
+    def test_index_append(self):
+        """
+        Test only the lines appended since the last update are parsed, and
+        a line still being written is left for later
+        """
+        file_name = self._log(range(0, 100, 2))
+        index_file = self._index_file()
+        end_date = START + datetime.timedelta(hours=1)
+        assert 50 == len(forensic.evidence_from_index(
+            index_file, {'nfv-vim': file_name}, START, end_date))
+
+        line = _line(200, '_instance_state_start.py',
+                     'Entering state (start) for instance-200.')
+        with open(file_name, 'a') as f:
+            f.write(line[:-10])
+        parse = mock.Mock(wraps=self._parser.parse)
+        self.useFixture(fixtures.MockPatchObject(self._parser, 'parse',
+                                                 parse))
+        assert 50 == len(forensic.evidence_from_index(
+            index_file, {'nfv-vim': file_name}, START, end_date))
+        assert 0 == parse.call_count
+
+        with open(file_name, 'a') as f:
+            f.write(line[-10:])
+        records = forensic.evidence_from_index(
+            index_file, {'nfv-vim': file_name}, START, end_date)
+        assert 51 == len(records)
+        assert 'instance-200' == records[-1]['data']['instance_name']
+        assert 1 == parse.call_count
+
+    def test_index_replaced(self):
+        """
+        Test a file that was rewritten is indexed again
+        """
+        file_name = self._log(range(0, 100, 2))
+        index_file = self._index_file()
+        end_date = START + datetime.timedelta(hours=1)
+        forensic.evidence_from_index(index_file, {'nfv-vim': file_name},
+                                     START, end_date)
+
+        shutil.copyfile(self._log(range(1, 301, 3), offset=1000),
+                        file_name)
+        records = forensic.evidence_from_index(
+            index_file, {'nfv-vim': file_name}, START, end_date)
+        assert self._parse_all(file_name, START, end_date) == records
@@ -0,0 +1,216 @@
+#
+# Copyright (c) 2020 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+import os
+import random
+
+from nfv_common import histogram
+from nfv_common.histogram import Histogram
+from nfv_common.histogram import HistogramData
+
+from . import testcase  # noqa: H304
+
+
+class TestHistogramData(testcase.NFVTestCase):
+
+    def test_bucket_precision(self):
+        """
+        Test each value falls into a bucket kept to the significant digits
+        """
+        for significant_digits in [1, 2, 3]:
+            data = HistogramData(significant_digits)
+            rng = random.Random(significant_digits)
+            for value in [0, 1, 2, 90, 255, 256, 257, 1000, 2 ** 40] + \
+                    [rng.randint(0, 10 ** 7) for _ in range(1000)]:
+                bucket_idx = data._bucket_index(value)
+                low, high = data._bucket_range(bucket_idx)
+                assert low <= value <= high
+                assert (high - low) <= value / float(10 ** significant_digits)
+
+    def test_small_samples_distinct(self):
+        """
+        Test samples well under a second are told apart
+        """
+        data = HistogramData()
+        for sample in [2] * 50 + [90] * 49 + [1500]:
+            data.add_data(sample)
+
+        assert 2 == data.value_at_percentile(50)
+        assert 90 == data.value_at_percentile(99)
+        assert 1500 == data.value_at_percentile(99.9)
+        assert ['p50', 'p90', 'p99', 'p999'] == list(data.percentiles())
+
+    def test_percentiles(self):
+        """
+        Test percentiles are within the precision of the histogram
+        """
+        data = HistogramData()
+        for sample in range(1, 100001):
+            data.add_data(sample)
+
+        for percentile, expected in [(50, 50000), (90, 90000),
+                                     (99, 99000), (99.9, 99900)]:
+            value = data.value_at_percentile(percentile)
+            assert expected <= value <= expected * 1.01
+        assert 100000 == data.value_at_percentile(100)
+        assert 1 == data.min_sample
+        assert 50000.5 == data.average_sample
+
+    def test_large_samples_not_clamped(self):
+        """
+        Test samples larger than any previous bucket are still counted
+        """
+        data = HistogramData()
+        data.add_data(10)
+        data.add_data(10 ** 9)
+        assert 10 ** 9 == data.value_at_percentile(100)
+        assert 2 == sum(count for _, _, count in data.buckets())
+
+    def test_no_samples(self):
+        """
+        Test percentiles of a histogram without samples
+        """
+        data = HistogramData()
+        assert data.value_at_percentile(50) is None
+        assert data.average_sample is None
+
+    def test_merge(self):
+        """
+        Test merged data is the same as data with all the samples
+        """
+        first = HistogramData()
+        second = HistogramData()
+        combined = HistogramData()
+        for sample in range(0, 5000, 7):
+            first.add_data(sample)
+            combined.add_data(sample)
+        for sample in range(3, 90000, 11):
+            second.add_data(sample)
+            combined.add_data(sample)
+
+        merged = first.copy()
+        merged.merge(second)
+        assert combined.as_dict() == merged.as_dict()
+        assert combined.as_dict() != first.as_dict()
+
+        self.assertRaises(ValueError, merged.merge, HistogramData(3))
+
+    def test_significant_digits(self):
+        """
+        Test the precision must be supported
+        """
+        self.assertRaises(ValueError, HistogramData, 0)
+        self.assertRaises(ValueError, HistogramData, 6)
+
+
+class TestHistogram(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestHistogram, self).setUp()
+        self._now_ms = 0
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.histogram._now_ms', lambda: self._now_ms))
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.histogram._histograms', dict()))
+
+    def test_windows(self):
+        """
+        Test rolling windows only have the samples of the window
+        """
+        test_histogram = Histogram('test', 'ms')
+        for now_secs, sample in [(0, 1), (100, 2), (270, 3), (310, 4)]:
+            self._now_ms = now_secs * 1000
+            test_histogram.add_data(sample)
+
+        assert 4 == test_histogram.snapshot().num_samples
+        assert 2 == test_histogram.snapshot(60).num_samples
+        assert 3 == test_histogram.snapshot(60).min_sample
+        assert 3 == test_histogram.snapshot(300).num_samples
+
+        self._now_ms = 1000 * 1000
+        assert 0 == test_histogram.snapshot(300).num_samples
+        assert 4 == test_histogram.snapshot().num_samples
+
+        windows = test_histogram.as_dict()['windows']
+        assert ['all', '1m', '5m'] == list(windows)
+
+        test_histogram.reset_data()
+        assert 0 == test_histogram.snapshot().num_samples
+
+    def test_display_snapshot(self):
+        """
+        Test the samples displayed are those of the snapshot taken under
+        the lock, not of samples added while displaying
+        """
+        logged = list()
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.histogram.DLOG.info', logged.append))
+        histogram.add_histogram_data('test', 3, 'ms')
+
+        def add_while_displayed(test_histogram, pretty_format, data):
+            histogram.add_histogram_data('test', 5, 'ms')
+            display_data(test_histogram, pretty_format, data)
+
+        display_data = Histogram.display_data
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.histogram.Histogram.display_data',
+            add_while_displayed))
+        histogram.display_histogram_data()
+
+        assert [line for line in logged if 'total: 1' in line]
+        assert 2 == histogram._histograms['test'].snapshot().num_samples
+
+    def test_prometheus_format(self):
+        """
+        Test histograms are formatted as prometheus summaries
+        """
+        histogram.add_histogram_data('selobj read: "rpc"', 12, 'ms')
+        text = histogram.format_histogram_data_prometheus(
+            [histogram.get_histogram_data('nfv-vim')])
+
+        lines = text.splitlines()
+        assert '# TYPE nfv_histogram summary' in lines
+        labels = ('process="nfv-vim",name="selobj read: \\"rpc\\"",'
+                  'units="ms",window="1m"')
+        assert ('nfv_histogram{%s,quantile="0.999"} 12' % labels) in lines
+        assert ('nfv_histogram_count{%s} 1' % labels) in lines
+        assert ('nfv_histogram_sum{%s} 12' % labels) in lines
+
+    def test_export(self):
+        """
+        Test histograms are exported to the directory configured once per
+        export interval
+        """
+        export_dir = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                  'histograms')
+        histogram.histogram_initialize(
+            {'export_dir': export_dir, 'export_interval': '60'}, 'nfv-vim')
+        self.addCleanup(histogram.histogram_initialize, None, None)
+
+        histogram.add_histogram_data('database-flush', 4, 'ms')
+        histogram.export_histogram_data()
+        histogram.add_histogram_data('database-flush', 5, 'ms')
+        histogram.export_histogram_data()
+
+        exported = histogram.load_histogram_data(export_dir)
+        assert 1 == len(exported)
+        assert 'nfv-vim' == exported[0]['process']
+        window = exported[0]['histograms'][0]['windows']['all']
+        assert 1 == window['count']
+        assert os.path.exists(os.path.join(export_dir, 'nfv-vim.prom'))
+
+        histogram.export_histogram_data(force=True)
+        exported = histogram.load_histogram_data(export_dir)
+        assert 2 == exported[0]['histograms'][0]['windows']['all']['count']
+
+    def test_export_not_configured(self):
+        """
+        Test nothing is exported without an export directory
+        """
+        histogram.histogram_initialize(None, 'nfv-vim')
+        histogram.add_histogram_data('database-flush', 4, 'ms')
+        histogram.export_histogram_data(force=True)
+        assert histogram._last_export_ms is None
@@ -365,3 +365,35 @@ class TestInstance(testcase.NFVTestCase):
                                         'image_0',
                                         'compute-0')
         assert 120 == instance.max_live_migrate_wait_in_secs
+
+    def test_host_changed_reindexed_before_event(self):
+        """
+        Test the instance is found on its new host when the host changed
+        event is handled
+        """
+        self.create_instance_type('small')
+        self.create_image('image_0')
+        instance = self.create_instance('test_instance_0', 'small', 'image_0',
+                                        'compute-0')
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_vim.database.database_instance_add', lambda instance: None))
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_vim.alarm.instance_manage_alarms', lambda instance: None))
+
+        on_host = dict()
+
+        def handle_event(event, event_data=None):
+            for host_name in ['compute-0', 'compute-1']:
+                on_host[host_name] = \
+                    list(self._instance_table.on_host(host_name))
+
+        self.useFixture(fixtures.MockPatchObject(
+            instance._action_fsm, 'handle_event', side_effect=handle_event))
+
+        instance.nfvi_instance_state_change(instance.nfvi_instance.admin_state,
+                                            instance.nfvi_instance.oper_state,
+                                            instance.nfvi_instance.avail_status,
+                                            instance.nfvi_instance.action,
+                                            'compute-1')
+        assert [] == on_host['compute-0']
+        assert [instance] == on_host['compute-1']
@@ -0,0 +1,304 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import collections
+import fixtures
+import mock
+
+from nfv_common import timers
+
+from nfv_vim import nfvi
+
+from nfv_vim.audits import _vim_nfvi_audits
+from nfv_vim.tables._instance_table import InstanceTable
+
+from . import testcase  # noqa: H304
+
+_AUDITS = 'nfv_vim.audits._vim_nfvi_audits'
+
+
+def _fake_instance(uuid):
+    instance = mock.Mock()
+    instance.uuid = uuid
+    instance.is_deleted.return_value = True
+    return instance
+
+
+def _nfvi_instance(uuid, host_name='compute-0', live_migration_support=True,
+                   last_update_timestamp='2020-01-01T00:00:00Z'):
+    return nfvi.objects.v1.Instance(
+        uuid, uuid, 'tenant', nfvi.objects.v1.INSTANCE_ADMIN_STATE.UNLOCKED,
+        nfvi.objects.v1.INSTANCE_OPER_STATE.ENABLED, [],
+        nfvi.objects.v1.INSTANCE_ACTION.NONE, host_name, dict(),
+        live_migration_support=live_migration_support,
+        nfvi_data=dict(vm_state='active',
+                       last_update_timestamp=last_update_timestamp))
+
+
+def _fake_detailed_instance(nfvi_instance, action_running=False):
+    instance = _fake_instance(nfvi_instance.uuid)
+    instance.nfvi_instance = nfvi_instance
+    instance.nfvi_instance_is_deleted.return_value = False
+    instance.nfvi_instance_audit_in_progress = False
+    instance.is_action_running.return_value = action_running
+    instance.action_data.is_inprogress.return_value = False
+    return instance
+
+
+@mock.patch('nfv_common.timers.timers_reschedule_timer', mock.Mock())
+@mock.patch('nfv_vim.directors.get_instance_director', mock.Mock())
+class TestNFVIAudits(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestNFVIAudits, self).setUp()
+        self._instance_table = InstanceTable()
+        self._instance_table.persist = False
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_vim.tables._instance_table._instance_table',
+            self._instance_table))
+
+        self._paging = nfvi.objects.v1.Paging(page_limit=32)
+        self._watermark = _vim_nfvi_audits._AuditWatermark('instances',
+                                                           self._paging)
+        self._to_audit = collections.OrderedDict()
+        self._audit = _vim_nfvi_audits._NFVIAudit(
+            'instances', _vim_nfvi_audits._audit_nfvi_instances, 10, 120,
+            paging=self._paging)
+        audits = collections.OrderedDict()
+        audits['instances'] = self._audit
+        for name, value in [('_nfvi_audits', audits),
+                            ('_nfvi_instances_paging', self._paging),
+                            ('_nfvi_instances_watermark', self._watermark),
+                            ('_nfvi_instances_to_audit', self._to_audit),
+                            ('_nfvi_instance_outstanding',
+                             collections.OrderedDict()),
+                            ('_deletable_instances', None),
+                            ('_audit_instance_detail', False),
+                            ('_audit_incremental', True),
+                            ('_audit_full_reconcile_cycles', 3),
+                            ('_audit_detail_sweep_cycles', 2),
+                            ('_nfvi_instances_sweep_cycles', 0)]:
+            self.useFixture(fixtures.MonkeyPatch('%s.%s' % (_AUDITS, name),
+                                                 value))
+
+    def _start_audit(self, detail=False):
+        """
+        Start an instance audit, returns the callback given to the plugin
+        """
+        if detail:
+            get_instances_name = 'nfv_vim.nfvi.nfvi_get_instances_detail'
+        else:
+            get_instances_name = 'nfv_vim.nfvi.nfvi_get_instances'
+        with mock.patch(get_instances_name) as get_instances:
+            self._audit.start(timers.get_monotonic_timestamp_in_ms())
+        return get_instances.call_args[0][1]
+
+    def _audit_instances(self, instances, completed=True, next_page=None,
+                         detail=False, incomplete_instances=None):
+        """
+        Run a single page instance audit
+        """
+        self.useFixture(fixtures.MonkeyPatch(
+            '%s._audit_instance_detail' % _AUDITS, detail))
+        callback = self._start_audit(detail)
+        changes_since = self._paging.changes_since
+
+        response = dict()
+        response['completed'] = completed
+        response['page-request-id'] = self._paging.page_request_id
+        if detail:
+            response['result-data'] = instances
+            response['incomplete-instances'] = [
+                (uuid, uuid) for uuid in incomplete_instances or list()]
+        else:
+            response['result-data'] = [(uuid, uuid) for uuid in instances]
+        if completed:
+            self._paging.next_page = next_page
+
+        try:
+            callback.send(response)
+        except StopIteration:
+            pass
+        return changes_since
+
+    def test_full_reconcile_every_n_cycles(self):
+        """
+        Test changes-since is only left unset for the full cycles
+        """
+        assert self._audit_instances([]) is None
+        assert self._audit_instances([]) is not None
+        assert self._audit_instances([]) is not None
+        assert self._audit_instances([]) is None
+        assert self._audit_instances([]) is not None
+
+    def test_watermark_kept_on_failure(self):
+        """
+        Test the watermark only advances when a cycle completes
+        """
+        self._audit_instances([])
+        watermark = self._watermark.watermark
+        assert watermark is not None
+
+        assert watermark == self._audit_instances([], completed=False)
+        assert watermark == self._watermark.watermark
+        assert watermark == self._audit_instances([])
+
+    def test_incremental_mode_disabled(self):
+        """
+        Test every cycle is a full cycle when incremental audits are off
+        """
+        self.useFixture(fixtures.MonkeyPatch(
+            '%s._audit_incremental' % _AUDITS, False))
+        for _ in range(3):
+            assert self._audit_instances([]) is None
+
+    def test_deletes_only_on_full_cycle(self):
+        """
+        Test instances missing from a listing are only deleted by a full
+        cycle and changed instances are queued for a detailed audit
+        """
+        instance_a = _fake_instance('a')
+        self._instance_table['a'] = instance_a
+        self._instance_table['b'] = _fake_instance('b')
+
+        self._audit_instances(['a', 'b'])
+        assert ['a', 'b'] == sorted(self._to_audit)
+        self._to_audit.clear()
+
+        # Incremental cycles only list what changed
+        self._audit_instances(['b'])
+        assert ['b'] == list(self._to_audit)
+        self._to_audit.clear()
+        self._audit_instances([])
+        assert ['a', 'b'] == sorted(self._instance_table)
+        instance_a.nfvi_instance_deleted.assert_not_called()
+
+        # Full reconciliation removes what is no longer listed
+        self._audit_instances(['b'])
+        assert ['b'] == list(self._instance_table)
+        instance_a.nfvi_instance_deleted.assert_called_once_with()
+
+    def test_pages_requested_back_to_back(self):
+        """
+        Test the next page is requested right away and the cycle only
+        completes on the last page
+        """
+        self._audit_instances(['a'], next_page='page-2')
+        assert 0 == self._audit.cycles
+        assert self._audit.busy
+        assert self._audit.ready(timers.get_monotonic_timestamp_in_ms())
+
+        self._audit_instances(['b'])
+        assert 1 == self._audit.cycles
+        assert not self._audit.busy
+        assert not self._audit.ready(timers.get_monotonic_timestamp_in_ms())
+
+    def test_late_response_ignored_after_timeout(self):
+        """
+        Test a response arriving after the audit timed out is ignored
+        """
+        callback = self._start_audit()
+        assert self._audit.in_flight
+
+        self._audit.check_timeout(
+            timers.get_monotonic_timestamp_in_ms() + 120 * 1000)
+        assert not self._audit.in_flight
+        assert 1 == self._audit.cycles
+
+        response = dict()
+        response['completed'] = True
+        response['page-request-id'] = self._paging.page_request_id
+        response['result-data'] = [('a', 'a')]
+        try:
+            callback.send(response)
+        except StopIteration:
+            pass
+        assert 0 == len(self._to_audit)
+
+    def test_dependencies_audited_first(self):
+        """
+        Test an audit does not start a cycle until the audits it depends
+        on have completed a cycle and are idle
+        """
+        started = list()
+        hosts = _vim_nfvi_audits._NFVIAudit(
+            'hosts', lambda audit_id: started.append('hosts'), 10, 120)
+        hypervisors = _vim_nfvi_audits._NFVIAudit(
+            'hypervisors', lambda audit_id: started.append('hypervisors'),
+            10, 120, depends_on=[hosts])
+
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        assert not hypervisors.ready(now_ms)
+        assert hosts.ready(now_ms)
+
+        hosts.start(now_ms)
+        assert not hypervisors.ready(now_ms)
+        hosts.complete(True)
+        assert hypervisors.ready(now_ms)
+        hypervisors.start(now_ms)
+
+        # Each audit keeps its own cadence once started
+        assert not hosts.ready(now_ms)
+        assert ['hosts', 'hypervisors'] == started
+
+    def test_detail_updates_changed_instances(self):
+        """
+        Test the listed details only update the instances that changed
+        """
+        instance_a = _fake_detailed_instance(_nfvi_instance('a'))
+        instance_b = _fake_detailed_instance(_nfvi_instance('b'))
+        self._instance_table['a'] = instance_a
+        self._instance_table['b'] = instance_b
+
+        # A newer timestamp and an unknown live migration support are not
+        # changes
+        moved_b = _nfvi_instance('b', host_name='compute-1')
+        self._audit_instances(
+            [_nfvi_instance('a', live_migration_support=None,
+                            last_update_timestamp='2020-01-02T00:00:00Z'),
+             moved_b], detail=True)
+
+        instance_a.nfvi_instance_update.assert_not_called()
+        instance_b.nfvi_instance_update.assert_called_once_with(moved_b)
+        assert 0 == len(self._to_audit)
+        assert ['a', 'b'] == sorted(self._instance_table)
+
+    def test_detail_audits_new_and_busy_instances(self):
+        """
+        Test new instances, instances running an action and instances
+        missing details are left to a detailed audit of their own
+        """
+        instance_b = _fake_detailed_instance(_nfvi_instance('b'),
+                                             action_running=True)
+        self._instance_table['b'] = instance_b
+
+        self._audit_instances(
+            [_nfvi_instance('a'), _nfvi_instance('b', host_name='compute-1')],
+            detail=True, incomplete_instances=['c'])
+
+        instance_b.nfvi_instance_update.assert_not_called()
+        assert ['a', 'b', 'c'] == list(self._to_audit)
+        assert ['b'] == list(self._instance_table)
+
+    def test_detail_sweep_every_n_cycles(self):
+        """
+        Test instances that look unchanged are still given a detailed audit
+        every so many cycles
+        """
+        instance_a = _fake_detailed_instance(_nfvi_instance('a'))
+        instance_b = _fake_detailed_instance(_nfvi_instance('b'))
+        instance_b.nfvi_instance_is_deleted.return_value = True
+        self._instance_table['a'] = instance_a
+        self._instance_table['b'] = instance_b
+
+        self._audit_instances([_nfvi_instance('a')], detail=True)
+        assert 0 == len(self._to_audit)
+
+        self._audit_instances([], detail=True)
+        assert ['a'] == list(self._to_audit)
+
+        self._to_audit.clear()
+        self._audit_instances([], detail=True)
+        assert 0 == len(self._to_audit)
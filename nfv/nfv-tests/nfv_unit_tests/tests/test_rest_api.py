@@ -0,0 +1,384 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+import io
+import json
+import re
+from six.moves import BaseHTTPServer
+from six.moves import socketserver as SocketServer
+import threading
+
+from nfv_common.helpers import Object
+
+from nfv_plugins.nfvi_plugins.openstack import exceptions
+from nfv_plugins.nfvi_plugins.openstack import rest_api
+
+from . import testcase  # noqa: H304
+
+
+class _RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        self.server.requests.append((self.command, self.path))
+        if self.path.startswith('/partial'):
+            # Start the response, then drop the connection
+            self.wfile.write(b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n'
+                             b'\r\n{"pa')
+            self.close_connection = True
+            return
+
+        if self.path.startswith('/redirect'):
+            self.send_response(302)
+            self.send_header('Location', '/servers')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if self.path.startswith('/missing'):
+            status = 404
+            body = json.dumps({'badRequest': {'message': 'Not There.'}})
+        elif self.path.startswith('/servers/detail'):
+            status = 200
+            body = json.dumps(_SERVERS)
+        else:
+            status = 200
+            body = json.dumps({'path': self.path})
+        body = body.encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+        if self.server.close_connections:
+            # Close without telling the client, as an idle timeout would
+            self.close_connection = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.do_GET()
+
+
+class _Server(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+_SERVERS = {
+    'servers': [{'id': 'uuid-%d' % idx, 'name': u'vm-\u00e9-%d' % idx,
+                 'status': 'ACTIVE', 'metadata': {'key': [1, 2.5, None]}}
+                for idx in range(100)],
+    'servers_links': [{'rel': 'next', 'href': 'http://nova/servers?m=1'}]
+}
+
+
+class TestRestAPIConnectionPool(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestRestAPIConnectionPool, self).setUp()
+        self._server = _Server(('127.0.0.1', 0), _RequestHandler)
+        self._server.connections = set()
+        self._server.close_connections = False
+        self._server.requests = list()
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self._server.server_close)
+        self.addCleanup(self._server.shutdown)
+
+        self._pool = rest_api.RestAPIConnectionPool(max_idle_per_endpoint=1)
+        self.addCleanup(self._pool.clear)
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_plugins.nfvi_plugins.openstack.rest_api._connection_pool',
+            self._pool))
+
+        self._netloc = '127.0.0.1:%s' % self._server.server_address[1]
+        self._context = Object(token_id='token')
+
+    def _get(self, path):
+        return rest_api.rest_api_request_with_context(
+            self._context, "GET", "http://%s%s" % (self._netloc, path))
+
+    def _post(self, path):
+        return rest_api.rest_api_request_with_context(
+            self._context, "POST", "http://%s%s" % (self._netloc, path),
+            api_cmd_payload='{}')
+
+    def test_connection_reused(self):
+        """
+        Test requests to the same endpoint share a connection
+        """
+        first = self._get('/servers')
+        second = self._get('/servers?limit=1')
+
+        assert {'path': '/servers'} == first.result_data
+        assert {'path': '/servers?limit=1'} == second.result_data
+        assert not first.ancillary_data.connection_reused
+        assert second.ancillary_data.connection_reused
+        assert 1 == len(self._server.connections)
+
+    def test_stale_connection_reconnects(self):
+        """
+        Test a request on a connection closed by the server is retried on
+        a new connection
+        """
+        self._server.close_connections = True
+        self._get('/servers')
+        assert 1 == self._pool.idle_count('http', self._netloc)
+
+        response = self._get('/servers')
+        assert {'path': '/servers'} == response.result_data
+        assert not response.ancillary_data.connection_reused
+        assert 2 == len(self._server.connections)
+
+    def test_stale_connection_post_reconnects(self):
+        """
+        Test a post the server closed the connection on without answering
+        is retried on a new connection
+        """
+        self._server.close_connections = True
+        self._get('/servers')
+
+        response = self._post('/servers')
+        assert {'path': '/servers'} == response.result_data
+        assert 2 == len(self._server.connections)
+
+    def test_post_not_resent_after_response_started(self):
+        """
+        Test a post is not sent again once the server started answering,
+        while a get is
+        """
+        self._get('/servers')
+        self.assertRaises(exceptions.OpenStackException,
+                          self._post, '/partial')
+        assert [('GET', '/servers'), ('POST', '/partial')] == \
+            self._server.requests
+
+        del self._server.requests[:]
+        self._get('/servers')
+        self.assertRaises(exceptions.OpenStackException,
+                          self._get, '/partial')
+        assert [('GET', '/servers'), ('GET', '/partial'),
+                ('GET', '/partial')] == self._server.requests
+
+    def test_redirect(self):
+        """
+        Test a get follows a redirect, other methods are given the redirect
+        """
+        response = self._get('/redirect')
+        assert {'path': '/servers'} == response.result_data
+        assert 200 == response.ancillary_data.status_code
+
+        response = self._post('/redirect')
+        assert 302 == response.ancillary_data.status_code
+        assert ('POST', '/servers') not in self._server.requests
+
+    def test_http_error(self):
+        """
+        Test an error status raises an exception and keeps the connection
+        """
+        try:
+            self._get('/missing')
+            assert False, "exception not raised"
+        except exceptions.OpenStackRestAPIException as e:
+            assert 404 == e.http_status_code
+            assert 'not there' == e.http_response_reason
+
+        assert 1 == self._pool.idle_count('http', self._netloc)
+
+    def test_idle_connections_bounded_and_evicted(self):
+        """
+        Test the idle connections kept are bounded and expire
+        """
+        first, _, _ = self._pool.acquire('http', self._netloc, 5)
+        second, _, _ = self._pool.acquire('http', self._netloc, 5)
+        self._pool.release('http', self._netloc, first)
+        self._pool.release('http', self._netloc, second)
+        assert 1 == self._pool.idle_count('http', self._netloc)
+        assert second.sock is None
+
+        pool = rest_api.RestAPIConnectionPool(idle_timeout_in_secs=0)
+        connection, _, _ = pool.acquire('http', self._netloc, 5)
+        pool.release('http', self._netloc, connection)
+        _, reused, _ = pool.acquire('http', self._netloc, 5)
+        assert not reused
+        assert connection.sock is None
+        pool.clear()
+
+    def test_list_request(self):
+        """
+        Test a list request returns the projected items and the other
+        members, and the connection is reused afterwards
+        """
+        response = rest_api.rest_api_list_request_with_context(
+            self._context, "http://%s/servers/detail" % self._netloc,
+            'servers', ('id', 'name'))
+
+        assert [(server['id'], server['name'])
+                for server in _SERVERS['servers']] == \
+            response.result_data['servers']
+        assert _SERVERS['servers_links'] == \
+            response.result_data['servers_links']
+        assert response.ancillary_data.response is None
+
+        assert self._get('/servers').ancillary_data.connection_reused
+
+
+class TestRestAPIListDecoder(testcase.NFVTestCase):
+
+    def _decode(self, data, list_key='servers', fields=None, chunk_size=7):
+        stream = io.BytesIO(data.encode('utf-8'))
+        decoder = rest_api.RestAPIListDecoder(stream.read, list_key, fields,
+                                              chunk_size)
+        return decoder.decode()
+
+    def test_decode_chunked(self):
+        """
+        Test a list split across many chunks, including in the middle of
+        numbers and multi-byte characters, decodes the same as json.loads
+        """
+        data = json.dumps(_SERVERS, ensure_ascii=False, indent=1)
+        for chunk_size in [1, 2, 3, 7, 64, 65536]:
+            assert _SERVERS == self._decode(data, chunk_size=chunk_size)
+
+        data = json.dumps({'servers': [{'id': 12345678}], 'count': 1234})
+        assert {'servers': [(12345678,)], 'count': 1234} == \
+            self._decode(data, fields=('id',), chunk_size=3)
+
+    def test_decode_projection(self):
+        """
+        Test items are projected to the fields asked for, missing fields
+        are returned as None
+        """
+        result = self._decode(json.dumps(_SERVERS),
+                              fields=('id', 'status', 'missing'))
+        assert ('uuid-7', 'ACTIVE', None) == result['servers'][7]
+        assert 100 == len(result['servers'])
+
+    def test_decode_empty(self):
+        """
+        Test empty objects and lists
+        """
+        assert {'servers': []} == self._decode('{}')
+        assert {'servers': [], 'a': 1} == self._decode('{"servers": [],"a":1}')
+
+    def test_decode_invalid(self):
+        """
+        Test malformed or truncated data raises a ValueError
+        """
+        for data in ['', '[]', '{"servers": [{"id": 1}', '{"servers": [1 2]}',
+                     '{"servers" [1]}']:
+            self.assertRaises(ValueError, self._decode, data)
+
+
+class TestRestAPIRouteTable(testcase.NFVTestCase):
+
+    def _search(self, routes, request_path):
+        """
+        Match the way the dispatcher did before routes were compiled
+        """
+        for path in sorted(routes, key=len, reverse=True):
+            if re.search(path, request_path) is not None:
+                return routes[path]
+        return None
+
+    def test_longest_path_wins(self):
+        """
+        Test the route chosen is the same as searching each path, longest
+        path first
+        """
+        routes = {'/nfvi-plugins/v1/hosts*': 'hosts',
+                  '/nfvi-plugins/v1/instances*': 'instances',
+                  '/v2/*': 'v2', '/v2.1/*': 'v2.1', '^/health$': 'health',
+                  '/v2/(?P<tenant>\\w+)/servers': 'servers',
+                  '[.]json$': 'json'}
+        route_table = rest_api.RestAPIRouteTable()
+        for path, handler in routes.items():
+            route_table.add(path, handler)
+
+        for request_path in ['/nfvi-plugins/v1/hosts', '/v2.1/tenant/servers',
+                             '/v2/tenant/servers/1/action', '/health',
+                             '/health/x', '/nfvi-plugins/v1/instances/1',
+                             '/nfvi-plugins/v1/host', '/unknown', '/v2',
+                             '/v2/x.json', '/v2/tenant/servers.json']:
+            handler, _ = route_table.match(request_path)
+            assert self._search(routes, request_path) == handler
+
+    def test_paths_matched_from_start(self):
+        """
+        Test a path starting with '/' only matches the start of a request
+        """
+        route_table = rest_api.RestAPIRouteTable()
+        route_table.add('/v2/*', 'v2')
+        assert 'v2' == route_table.match('/v2/servers')[0]
+        assert route_table.match('/x/v2/servers')[0] is None
+
+    def test_alternation(self):
+        """
+        Test a path with alternatives matches each of them, as searching
+        the path did
+        """
+        routes = {'/a|/b': 'a-or-b', '^/c|d$': 'c-or-d',
+                  '/(e|f)/g': 'e-or-f', '/h[|]': 'h'}
+        route_table = rest_api.RestAPIRouteTable()
+        for path, handler in routes.items():
+            route_table.add(path, handler)
+
+        for request_path in ['/a', '/b/1', '/x/b', '/c', '/x/d', '/x/c',
+                             '/e/g', '/f/g', '/h|', '/h']:
+            handler, _ = route_table.match(request_path)
+            assert self._search(routes, request_path) == handler
+
+        assert 'a-or-b' == route_table.match('/b/1')[0]
+        assert route_table.match('/h')[0] is None
+
+    def test_path_params(self):
+        """
+        Test named groups are returned as path parameters, for the route
+        that matched only
+        """
+        route_table = rest_api.RestAPIRouteTable()
+        route_table.add('/hosts/(?P<uuid>[^/]+)$', 'host')
+        route_table.add('/hosts/(?P<uuid>[^/]+)/(?P<action>\\w+)', 'action')
+        route_table.add('/(?P<a>x)(?P=a)', 'repeat')
+
+        assert ('host', {'uuid': 'h1'}) == route_table.match('/hosts/h1')
+        assert ('action', {'uuid': 'h1', 'action': 'lock'}) == \
+            route_table.match('/hosts/h1/lock')
+        assert ('repeat', {'a': 'x'}) == route_table.match('/xx')
+        assert (None, {}) == route_table.match('/x')
+
+    def test_add_and_delete(self):
+        """
+        Test the routes are recompiled when the table changes
+        """
+        route_table = rest_api.RestAPIRouteTable()
+        assert (None, {}) == route_table.match('/hosts')
+        route_table.add('/hosts', 'hosts')
+        route_table.add('/hosts/lock', 'lock')
+        assert 'lock' == route_table.match('/hosts/lock')[0]
+
+        route_table.delete('/hosts/lock')
+        route_table.delete('/not-there')
+        assert 'hosts' == route_table.match('/hosts/lock')[0]
+        assert 1 == len(route_table)
+        assert '/hosts' in route_table
+
+    def test_numbered_references(self):
+        """
+        Test paths with numbered back-references still match
+        """
+        route_table = rest_api.RestAPIRouteTable()
+        route_table.add('/hosts', 'hosts')
+        route_table.add('/(\\d)\\1', 'repeat')
+        assert 'repeat' == route_table.match('/11')[0]
+        assert route_table.match('/12')[0] is None
+        assert 'hosts' == route_table.match('/hosts')[0]
@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import socket
+
+from nfv_common import selobj
+from nfv_common.helpers import coroutine
+
+from . import testcase  # noqa: H304
+
+
+@coroutine
+def read_callback(received):
+    """
+    Read callback recording the data received
+    """
+    while True:
+        select_obj = (yield)
+        received.append(select_obj.recv(64))
+
+
+@coroutine
+def write_callback(written):
+    """
+    Write callback that stops after being called once
+    """
+    select_obj = (yield)
+    written.append(select_obj)
+
+
+class SelobjTestMixin(object):
+    """
+    Selection object tests, run against each backend
+    """
+    backend = None
+
+    def setUp(self):
+        super(SelobjTestMixin, self).setUp()
+        selobj.selobj_initialize(self.backend)
+        self.addCleanup(selobj.selobj_finalize)
+        self._sockets = list()
+
+    def tearDown(self):
+        super(SelobjTestMixin, self).tearDown()
+        for sock in self._sockets:
+            sock.close()
+
+    def _socketpair(self):
+        sock_a, sock_b = socket.socketpair()
+        self._sockets.extend([sock_a, sock_b])
+        return sock_a, sock_b
+
+    def test_read(self):
+        """
+        Test only readable selection objects are dispatched
+        """
+        received_1 = list()
+        received_2 = list()
+        sock_1, peer_1 = self._socketpair()
+        sock_2, peer_2 = self._socketpair()
+        selobj.selobj_add_read_obj(sock_1, read_callback, received_1)
+        selobj.selobj_add_read_obj(sock_2, read_callback, received_2)
+
+        peer_2.send(b'hello')
+        selobj.selobj_dispatch(100)
+        assert [] == received_1
+        assert [b'hello'] == received_2
+
+        selobj.selobj_dispatch(0)
+        assert [b'hello'] == received_2
+
+    def test_delete_read(self):
+        """
+        Test deleted selection objects are no longer dispatched
+        """
+        received = list()
+        sock, peer = self._socketpair()
+        selobj.selobj_add_read_obj(sock, read_callback, received)
+        selobj.selobj_del_read_obj(sock)
+
+        peer.send(b'hello')
+        selobj.selobj_dispatch(0)
+        assert [] == received
+
+        selobj.selobj_add_read_obj(sock, read_callback, received)
+        selobj.selobj_dispatch(100)
+        assert [b'hello'] == received
+
+    def test_read_and_write(self):
+        """
+        Test a selection object registered for read and write, with a
+        write callback that stops
+        """
+        received = list()
+        written = list()
+        sock, peer = self._socketpair()
+        selobj.selobj_add_read_obj(sock, read_callback, received)
+        selobj.selobj_add_write_obj(sock, write_callback, written)
+
+        selobj.selobj_dispatch(100)
+        assert [sock] == written
+        assert [] == received
+
+        peer.send(b'hello')
+        selobj.selobj_dispatch(100)
+        assert [sock] == written
+        assert [b'hello'] == received
+
+
+class TestSelobjSelect(SelobjTestMixin, testcase.NFVTestCase):
+    backend = selobj.SELOBJ_BACKEND.SELECT
+
+
+class TestSelobjEpoll(SelobjTestMixin, testcase.NFVTestCase):
+    backend = selobj.SELOBJ_BACKEND.EPOLL
+
+    def test_fd_reused(self):
+        """
+        Test a closed selection object whose file descriptor is reused
+        before it was deleted
+        """
+        received = list()
+        sock, peer = self._socketpair()
+        selobj.selobj_add_read_obj(sock, read_callback, list())
+        sock.close()
+
+        sock, peer = self._socketpair()
+        selobj.selobj_add_read_obj(sock, read_callback, received)
+        peer.send(b'hello')
+        selobj.selobj_dispatch(100)
+        assert [b'hello'] == received
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2020 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import random
+
+from nfv_vim.strategy import _strategy_batching
+
+from . import testcase  # noqa: H304
+
+
+def _random_problem(seed, num_hosts=60):
+    rng = random.Random(seed)
+    hosts = list(range(num_hosts))
+    conflict_groups = [rng.sample(hosts, rng.randint(2, 5))
+                       for _ in range(num_hosts // 2)]
+    aggregates = [(hosts[idx::3], rng.randint(1, 4)) for idx in range(3)]
+    aggregates.append((rng.sample(hosts, num_hosts // 5), 2))
+    return num_hosts, rng.randint(3, 12), conflict_groups, aggregates
+
+
+class TestStrategyBatching(testcase.NFVTestCase):
+
+    def _check(self, batches, num_hosts, max_batch_size, conflict_groups,
+               aggregates):
+        """
+        Check every host is in one batch and no batch breaks a rule
+        """
+        assert list(range(num_hosts)) == sorted(sum(batches, []))
+        for batch in batches:
+            assert len(batch) <= max_batch_size
+            for group in conflict_groups:
+                assert len(set(group) & set(batch)) <= 1
+            for hosts, limit in aggregates:
+                assert len(set(hosts) & set(batch)) <= limit
+
+    def test_first_fit_kept(self):
+        """
+        Test the hosts stay in order when first-fit is as good as it gets
+        """
+        assert [[0, 1, 2], [3, 4, 5], [6]] == \
+            _strategy_batching.host_batches(7, 3)
+        assert [[0, 2, 3], [1, 4, 5]] == \
+            _strategy_batching.host_batches(6, 3, [[0, 1]])
+        assert [[0, 2, 3], [1]] == \
+            _strategy_batching.host_batches(4, 3, aggregates=[([0, 1], 1)])
+
+    def test_fewer_batches(self):
+        """
+        Test fewer batches than first-fit are found, each of hosts 0, 2, 4
+        conflicts with each of hosts 1, 3, 5 but its partner
+        """
+        conflict_groups = [[0, 3], [0, 5], [2, 1], [2, 5], [4, 1], [4, 3]]
+        first_fit = _strategy_batching._first_fit(6, 10, conflict_groups, [])
+        assert 3 == first_fit.num_batches()
+
+        batches = _strategy_batching.host_batches(6, 10, conflict_groups)
+        assert [[0, 2, 4], [1, 3, 5]] == batches
+
+    def test_random(self):
+        """
+        Test the batches keep to the rules and are never more than
+        first-fit gives, nor fewer than the lower bound
+        """
+        for seed in range(20):
+            problem = _random_problem(seed)
+            batches = _strategy_batching.host_batches(*problem)
+            self._check(batches, *problem)
+
+            first_fit = _strategy_batching._first_fit(*problem)
+            assert len(batches) <= first_fit.num_batches()
+            assert len(batches) >= first_fit.lower_bound(*problem[2:])
+
+    def test_deterministic(self):
+        """
+        Test the same hosts give the same batches, whatever the order of
+        the conflict groups
+        """
+        num_hosts, max_batch_size, conflict_groups, aggregates = \
+            _random_problem(3, num_hosts=200)
+        batches = _strategy_batching.host_batches(
+            num_hosts, max_batch_size, conflict_groups, aggregates)
+        assert batches == _strategy_batching.host_batches(
+            num_hosts, max_batch_size, list(reversed(conflict_groups)),
+            aggregates)
+
+    def test_max_moves(self):
+        """
+        Test the improvement pass stops once out of moves
+        """
+        problem = _random_problem(5, num_hosts=200)
+        batches = _strategy_batching.host_batches(*problem, max_moves=0)
+        self._check(batches, *problem)
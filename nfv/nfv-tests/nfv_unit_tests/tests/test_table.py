@@ -0,0 +1,128 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import uuid
+
+from nfv_vim.tables._hypervisor_table import HypervisorTable
+from nfv_vim.tables._instance_table import InstanceTable
+from nfv_vim.tables._subnet_table import SubnetTable
+
+from . import testcase  # noqa: H304
+
+
+class FakeObject(object):
+    """
+    Fake table value, carries whatever attributes a table indexes on
+    """
+    def __init__(self, **kwargs):
+        self.uuid = str(uuid.uuid4())
+        self.__dict__.update(kwargs)
+
+
+def fake_instance(host_name):
+    return FakeObject(host_name=host_name)
+
+
+class TestTableIndex(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestTableIndex, self).setUp()
+        self._instance_table = InstanceTable()
+        self._instance_table.persist = False
+
+    def _add(self, instance):
+        self._instance_table[instance.uuid] = instance
+        return instance
+
+    def test_lookup_by_host(self):
+        """
+        Test instances are found by host in insertion order
+        """
+        instance_1 = self._add(fake_instance('compute-0'))
+        instance_2 = self._add(fake_instance('compute-1'))
+        instance_3 = self._add(fake_instance('compute-0'))
+
+        assert [instance_1, instance_3] == \
+            list(self._instance_table.on_host('compute-0'))
+        assert [instance_2] == list(self._instance_table.on_host('compute-1'))
+        assert [] == list(self._instance_table.on_host('compute-2'))
+        assert self._instance_table.exist_on_host('compute-0')
+        assert not self._instance_table.exist_on_host('compute-2')
+
+    def test_delete(self):
+        """
+        Test deleted instances are removed from the indexes
+        """
+        instance_1 = self._add(fake_instance('compute-0'))
+        instance_2 = self._add(fake_instance('compute-0'))
+
+        del self._instance_table[instance_1.uuid]
+        assert [instance_2] == list(self._instance_table.on_host('compute-0'))
+
+        self._instance_table.clear()
+        assert not self._instance_table.exist_on_host('compute-0')
+        assert [] == list(self._instance_table.on_host('compute-0'))
+
+    def test_replace(self):
+        """
+        Test replacing a value re-files it under the new index keys
+        """
+        instance_1 = self._add(fake_instance('compute-0'))
+        instance_2 = fake_instance('compute-1')
+        instance_2.uuid = instance_1.uuid
+        self._add(instance_2)
+
+        assert not self._instance_table.exist_on_host('compute-0')
+        assert [instance_2] == list(self._instance_table.on_host('compute-1'))
+
+    def test_reindex(self):
+        """
+        Test an indexed attribute changing in place, e.g. a migration
+        """
+        instance_1 = self._add(fake_instance('compute-0'))
+        instance_2 = self._add(fake_instance('compute-0'))
+        instance_3 = self._add(fake_instance('compute-0'))
+
+        # No change keeps the order instances were indexed in
+        self._instance_table.reindex(instance_2.uuid)
+        assert [instance_1, instance_2, instance_3] == \
+            list(self._instance_table.on_host('compute-0'))
+
+        instance_2.host_name = 'compute-1'
+        self._instance_table.reindex(instance_2.uuid)
+        assert [instance_1, instance_3] == \
+            list(self._instance_table.on_host('compute-0'))
+        assert [instance_2] == list(self._instance_table.on_host('compute-1'))
+
+        # Reindexing an unknown key is ignored
+        self._instance_table.reindex(str(uuid.uuid4()))
+
+    def test_hypervisor_and_subnet_lookups(self):
+        """
+        Test the hypervisor and subnet table lookups
+        """
+        hypervisor_table = HypervisorTable()
+        hypervisor_table.persist = False
+        hypervisor = FakeObject(host_name='compute-0')
+        hypervisor_table[hypervisor.uuid] = hypervisor
+
+        assert hypervisor is hypervisor_table.get_by_host_name('compute-0')
+        assert hypervisor_table.get_by_host_name('compute-1') is None
+
+        subnet_table = SubnetTable()
+        subnet_table.persist = False
+        subnet_1 = FakeObject(name='subnet-1', network_uuid='network-0',
+                              subnet_ip='10.0.0.0', subnet_prefix=24)
+        subnet_2 = FakeObject(name='subnet-2', network_uuid='network-0',
+                              subnet_ip='10.0.1.0', subnet_prefix=24)
+        subnet_table[subnet_1.uuid] = subnet_1
+        subnet_table[subnet_2.uuid] = subnet_2
+
+        assert subnet_2 is subnet_table.get_by_name('subnet-2')
+        assert [subnet_1, subnet_2] == list(subnet_table.on_network('network-0'))
+        assert subnet_2 is subnet_table.get_by_network_and_ip(
+            'network-0', '10.0.1.0', '24')
+        assert subnet_table.get_by_network_and_ip(
+            'network-1', '10.0.1.0', '24') is None
@@ -0,0 +1,80 @@
+#
+# Copyright (c) 2020 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import select
+import threading
+
+from nfv_common.tasks._task_work import TaskWork
+from nfv_common.tasks._task_worker import TaskWorkerLocalThread
+
+from . import testcase  # noqa: H304
+
+
+def _wait_readable(fd, timeout_secs=5):
+    readable, _, _ = select.select([fd], [], [], timeout_secs)
+    return fd in readable
+
+
+class TestTaskWorkerLocalThread(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestTaskWorkerLocalThread, self).setUp()
+        self._worker = TaskWorkerLocalThread('Test-Worker')
+        self._worker.start()
+
+    def test_result_by_reference(self):
+        """
+        Test task work runs on the thread and comes back as the same object
+        """
+        result = ['a'] * 1024
+
+        def get_servers(name):
+            return (name, threading.current_thread().name, result)
+
+        task_work = TaskWork(10, get_servers, 'vm-0')
+        self._worker.submit_task_work(task_work)
+        assert _wait_readable(self._worker.selobj)
+
+        completed = self._worker.get_task_work_result()
+        assert completed is task_work
+        assert 'vm-0' == completed.result[0]
+        assert 'Test-Worker' == completed.result[1]
+        assert completed.result[2] is result
+        self._worker.stop(1)
+
+    def test_exception_result(self):
+        """
+        Test an exception raised by task work is its result
+        """
+        def get_servers():
+            raise KeyError('servers')
+
+        self._worker.submit_task_work(TaskWork(10, get_servers))
+        assert _wait_readable(self._worker.selobj)
+        assert isinstance(self._worker.get_task_work_result().result,
+                          Exception)
+        self._worker.stop(1)
+
+    def test_stop_busy_worker(self):
+        """
+        Test a worker stopped while busy drops the result once done
+        """
+        started = threading.Event()
+        release = threading.Event()
+        done = list()
+
+        def get_servers():
+            started.set()
+            release.wait(5)
+            done.append(True)
+
+        self._worker.submit_task_work(TaskWork(10, get_servers))
+        assert started.wait(5)
+        self._worker.stop(0)
+
+        release.set()
+        self._worker._thread.join(5)
+        assert not self._worker._thread.is_alive()
+        assert [True] == done
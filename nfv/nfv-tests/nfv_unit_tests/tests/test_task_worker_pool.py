@@ -0,0 +1,185 @@
+#
+# Copyright (c) 2020 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+import itertools
+import mock
+
+from nfv_common.tasks._task_worker import TASK_WORKER_BACKEND
+from nfv_common.tasks._task_worker_pool import TaskWorkerPool
+
+from . import testcase  # noqa: H304
+
+_POOL = 'nfv_common.tasks._task_worker_pool'
+
+
+class FakeWorker(object):
+    _ids = itertools.count(1)
+
+    def __init__(self, name):
+        self.id = next(FakeWorker._ids)
+        self.name = name
+        self.backend = TASK_WORKER_BACKEND.PROCESS
+        self.started = False
+        self.stopped = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self, max_wait_in_seconds):
+        self.stopped = True
+
+
+class FakeLocalWorker(FakeWorker):
+
+    def __init__(self, name):
+        super(FakeLocalWorker, self).__init__(name)
+        self.backend = TASK_WORKER_BACKEND.THREAD
+
+
+class TestTaskWorkerPool(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestTaskWorkerPool, self).setUp()
+        self._now_ms = 1000
+        self.useFixture(fixtures.MonkeyPatch(
+            '%s.TaskWorkerThread' % _POOL, FakeWorker))
+        self.useFixture(fixtures.MonkeyPatch(
+            '%s.TaskWorkerLocalThread' % _POOL, FakeLocalWorker))
+        self.useFixture(fixtures.MonkeyPatch(
+            '%s.timers.get_monotonic_timestamp_in_ms' % _POOL,
+            lambda: self._now_ms))
+        self._histogram = mock.Mock()
+        self.useFixture(fixtures.MonkeyPatch(
+            '%s.histogram.add_histogram_data' % _POOL, self._histogram))
+
+    def test_fixed_size(self):
+        """
+        Test a pool without a larger maximum never adds workers
+        """
+        pool = TaskWorkerPool('Test', num_workers=2)
+        assert not pool.autoscale
+        assert 2 == pool.num_workers
+
+        pool.claim_worker()
+        pool.claim_worker()
+        assert pool.claim_worker() is None
+        assert not pool.check(60000)
+        assert 2 == pool.num_workers
+
+    def test_scale_up(self):
+        """
+        Test a worker is added once work has waited long enough, up to the
+        maximum
+        """
+        pool = TaskWorkerPool('Test', num_workers=1, max_workers=3,
+                              scale_up_wait_secs=2)
+        assert pool.autoscale
+        pool.claim_worker()
+
+        assert not pool.check(1999)
+        assert 1 == pool.num_workers
+
+        assert pool.check(2000)
+        assert 2 == pool.num_workers
+        worker = pool.claim_worker()
+        assert worker.started
+
+        assert pool.check(5000)
+        assert not pool.check(5000)
+        assert 3 == pool.num_workers
+
+    def test_scale_down(self):
+        """
+        Test workers idle for long enough are stopped, the least recently
+        used first, down to the minimum
+        """
+        pool = TaskWorkerPool('Test', num_workers=1, max_workers=3,
+                              scale_up_wait_secs=0, scale_down_idle_secs=60)
+        pool.check(0)
+        pool.check(0)
+        assert 3 == pool.num_workers
+        workers = [pool.claim_worker() for _ in range(3)]
+
+        pool.release_worker(workers[0])
+        self._now_ms += 30000
+        pool.release_worker(workers[1])
+        pool.release_worker(workers[2])
+
+        self._now_ms += 30000
+        pool.check()
+        assert [True, False, False] == [x.stopped for x in workers]
+        assert 2 == pool.num_workers
+
+        self._now_ms += 30000
+        pool.check()
+        assert [True, True, False] == [x.stopped for x in workers]
+        assert 1 == pool.num_workers
+        assert workers[2] is pool.claim_worker()
+
+    def test_busy_workers_kept(self):
+        """
+        Test busy workers are not stopped however long the pool is idle
+        """
+        pool = TaskWorkerPool('Test', num_workers=1, max_workers=2,
+                              scale_up_wait_secs=0, scale_down_idle_secs=1)
+        pool.check(0)
+        workers = [pool.claim_worker(), pool.claim_worker()]
+
+        self._now_ms += 60000
+        pool.check()
+        assert 2 == pool.num_workers
+        assert not any(x.stopped for x in workers)
+
+    def test_timeout_worker_replaced(self):
+        """
+        Test a timed out worker is stopped and replaced, the other workers
+        are kept
+        """
+        pool = TaskWorkerPool('Test', num_workers=2)
+        worker_a = pool.claim_worker()
+        worker_b = pool.claim_worker()
+
+        pool.timeout_worker(worker_a)
+        assert worker_a.stopped
+        assert 2 == pool.num_workers
+
+        replacement = pool.claim_worker()
+        assert replacement.name == worker_a.name
+        assert worker_b in pool._workers
+
+    def test_utilisation(self):
+        """
+        Test the share of time the workers were busy is recorded
+        """
+        pool = TaskWorkerPool('Test', num_workers=2)
+        pool.check()
+        worker = pool.claim_worker()
+        self._now_ms += 1000
+        pool.release_worker(worker)
+        self._now_ms += 1000
+        pool.check()
+
+        self._histogram.assert_called_with('Test [worker-utilisation]', 25,
+                                           'percent')
+
+    def test_backend(self):
+        """
+        Test the backend selects what runs the task work
+        """
+        pool = TaskWorkerPool('Test', num_workers=2)
+        assert TASK_WORKER_BACKEND.PROCESS == pool.backend
+        assert TASK_WORKER_BACKEND.PROCESS == pool.claim_worker().backend
+
+        pool = TaskWorkerPool('Test', num_workers=2, max_workers=3,
+                              scale_up_wait_secs=0,
+                              backend=TASK_WORKER_BACKEND.THREAD)
+        workers = [pool.claim_worker(), pool.claim_worker()]
+        assert pool.check(0)
+        workers.append(pool.claim_worker())
+        assert all(TASK_WORKER_BACKEND.THREAD == x.backend for x in workers)
+
+        self.assertRaises(ValueError, TaskWorkerPool, 'Test',
+                          backend='coroutine')
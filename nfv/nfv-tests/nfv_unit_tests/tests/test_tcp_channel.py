@@ -0,0 +1,193 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+import mock
+import socket
+import threading
+
+from nfv_common import selobj
+from nfv_common import tcp
+
+from . import testcase  # noqa: H304
+
+
+class TestTCPChannel(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestTCPChannel, self).setUp()
+        selobj.selobj_initialize()
+        self.addCleanup(selobj.selobj_finalize)
+        self._deferred = list()
+        self._stop = threading.Event()
+        self._server = None
+
+    def _start_server(self, auth_key=None, num_deferred=0):
+        """
+        Start a server answering messages from a thread, the messages
+        are: 'echo <text>', 'multi <count>', 'defer <text>' and 'drop'
+        """
+        self._num_deferred = num_deferred
+        self._server = tcp.TCPServer('127.0.0.1', 0, self._message_handler,
+                                     auth_key=auth_key)
+        thread = threading.Thread(target=self._dispatch)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self._stop.set)
+        return self._server._socket.getsockname()[1]
+
+    def _dispatch(self):
+        while not self._stop.is_set():
+            selobj.selobj_dispatch(20)
+        self._server.shutdown()
+
+    def _message_handler(self, connection, msg):
+        command, _, text = msg.decode('utf-8').partition(' ')
+        if 'echo' == command:
+            connection.send('reply ' + text)
+            connection.close()
+
+        elif 'multi' == command:
+            for idx in range(int(text)):
+                connection.send('reply %d' % idx)
+            connection.close()
+
+        elif 'defer' == command:
+            # Answered in reverse order once all have arrived
+            self._deferred.append((connection, text))
+            if self._num_deferred == len(self._deferred):
+                for connection, text in reversed(self._deferred):
+                    connection.send('reply ' + text)
+                    connection.close()
+
+        elif 'drop' == command:
+            connection._connection.close()
+
+    def _channel(self, port, auth_key=None):
+        channel = tcp.TCPChannel('127.0.0.1', 0, '127.0.0.1', port, auth_key)
+        self.addCleanup(channel.close)
+        return channel
+
+    def test_concurrent_requests(self):
+        """
+        Test requests outstanding at the same time over one connection get
+        their own responses
+        """
+        port = self._start_server(num_deferred=20)
+        channel = self._channel(port)
+        requests = list()
+        for idx in range(20):
+            request = channel.request()
+            request.send('defer %d' % idx)
+            requests.append(request)
+
+        for idx, request in enumerate(requests):
+            assert b'reply %d' % idx == request.receive(timeout_in_secs=5)
+            assert request.receive(timeout_in_secs=5) is None
+            request.close()
+
+        assert 1 == channel.connects
+        assert 0 == channel.outstanding
+
+    def test_multiple_responses(self):
+        """
+        Test all the responses to a request are received, followed by the
+        end of the request
+        """
+        port = self._start_server()
+        request = self._channel(port).request()
+        request.send('multi 3')
+
+        responses = list()
+        while True:
+            msg = request.receive(timeout_in_secs=5)
+            if msg is None:
+                break
+            responses.append(msg)
+        assert [b'reply 0', b'reply 1', b'reply 2'] == responses
+
+    def test_legacy_connection(self):
+        """
+        Test a connection per request is still served, and closed after
+        the response
+        """
+        port = self._start_server()
+        connection = tcp.TCPConnection('127.0.0.1', 0)
+        connection.connect('127.0.0.1', port)
+        connection.send('echo legacy')
+        assert b'reply legacy' == connection.receive(timeout_in_secs=5)
+        assert connection.receive(timeout_in_secs=5) is None
+        assert connection.is_shutdown()
+
+    def test_auth_vector(self):
+        """
+        Test requests are authorized with the auth vector, including the
+        request identifier
+        """
+        port = self._start_server(auth_key=b'secret')
+        request = self._channel(port, auth_key=b'secret').request()
+        request.send('echo authorized')
+        assert b'reply authorized' == request.receive(timeout_in_secs=5)
+
+        request = self._channel(port, auth_key=b'other').request()
+        request.send('echo unauthorized')
+        assert request.receive(timeout_in_secs=0.2) is None
+
+    def test_reconnect(self):
+        """
+        Test outstanding requests end when the connection drops, and the
+        next request reconnects
+        """
+        port = self._start_server()
+        channel = self._channel(port)
+        request = channel.request()
+        request.send('drop')
+        assert request.receive(timeout_in_secs=5) is None
+
+        request = channel.request()
+        request.send('echo again')
+        assert b'reply again' == request.receive(timeout_in_secs=5)
+        assert 2 == channel.connects
+
+    def test_reconnect_backoff(self):
+        """
+        Test connecting is not retried until the back-off has passed
+        """
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+
+        channel = self._channel(port)
+        self.assertRaises(socket.error, channel.request)
+        with mock.patch('nfv_common.tcp._tcp_channel.TCPConnection') as \
+                mock_connection:
+            self.assertRaises(socket.error, channel.request)
+            assert not mock_connection.called
+
+    def test_latency_histogram(self):
+        """
+        Test the latency of a named request is recorded on its first
+        response
+        """
+        histogram = mock.Mock()
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.tcp._tcp_channel.histogram.add_histogram_data',
+            histogram))
+        port = self._start_server()
+        pool = tcp.TCPChannelPool('127.0.0.1', 0, '127.0.0.1', port,
+                                  num_channels=2)
+        self.addCleanup(pool.close)
+        request = pool.request()
+        request.set_name('rpc echo')
+        request.send('multi 2')
+        while request.receive(timeout_in_secs=5) is not None:
+            pass
+
+        samples = [call[0] for call in histogram.call_args_list
+                   if 'rpc echo' == call[0][0]]
+        assert 1 == len(samples)
+        assert 'ms' == samples[0][2]
@@ -0,0 +1,246 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import socket
+import struct
+import threading
+
+from nfv_common import selobj
+from nfv_common import tcp
+
+from nfv_vim import rpc
+
+from . import testcase  # noqa: H304
+
+
+def _frame(payload, request_id=None):
+    """
+    Returns a message framed the way it is sent
+    """
+    if request_id is None:
+        return struct.pack('!L', socket.htonl(len(payload))) + payload
+    return struct.pack('!LL', socket.htonl(len(payload) | 0x80000000),
+                       request_id) + payload
+
+
+class TestTCPCodec(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestTCPCodec, self).setUp()
+        self._listen = socket.socket()
+        self._listen.bind(('127.0.0.1', 0))
+        self._listen.listen(1)
+        self.addCleanup(self._listen.close)
+
+    def _connection_pair(self):
+        """
+        Returns a connection and the raw socket at the other end of it
+        """
+        connection = tcp.TCPConnection('127.0.0.1', 0)
+        connection.connect('127.0.0.1', self._listen.getsockname()[1])
+        self.addCleanup(connection.close)
+        peer, _ = self._listen.accept()
+        self.addCleanup(peer.close)
+        return connection, peer
+
+    def test_codec_round_trip(self):
+        """
+        Test values decode to what was encoded, with either codec
+        """
+        value = {'version': 1, 'type': 'get-instances-response',
+                 'result': 'success', 'uuid': None, 'items': [
+                     {'name': u'instance-é', 'vcpus': 4, 'ram': 65536,
+                      'load': 0.25, 'negative': -1, 'live': True,
+                      'locked': False, 'long': 'x' * 300}],
+                 'empty': {}, 'tuple': (1, 2)}
+        expected = dict(value, tuple=[1, 2])
+
+        for codec in (tcp.TCP_CODEC.JSON, tcp.TCP_CODEC.COMPACT):
+            data = tcp.tcp_codec_encode(value, codec)
+            assert codec == tcp.tcp_codec_detect(data)
+            assert expected == tcp.tcp_codec_decode(data)
+
+        compact = tcp.tcp_codec_encode(value, tcp.TCP_CODEC.COMPACT)
+        assert len(compact) < len(tcp.tcp_codec_encode(value))
+        assert b'\x01\x02' == tcp.tcp_codec_decode(
+            tcp.tcp_codec_encode(b'\x01\x02', tcp.TCP_CODEC.COMPACT))
+
+    def test_codec_malformed(self):
+        """
+        Test malformed compact messages are refused
+        """
+        compact = tcp.tcp_codec_encode([1, 2], tcp.TCP_CODEC.COMPACT)
+        self.assertRaises(ValueError, tcp.tcp_codec_decode, compact + b'\x01')
+        self.assertRaises(ValueError, tcp.tcp_codec_decode, b'\xc1\xc4')
+        self.assertRaises(TypeError, tcp.tcp_codec_encode, object(),
+                          tcp.TCP_CODEC.COMPACT)
+        self.assertRaises(TypeError, tcp.tcp_codec_encode, 2 ** 63,
+                          tcp.TCP_CODEC.COMPACT)
+        assert -2 ** 63 == tcp.tcp_codec_decode(
+            tcp.tcp_codec_encode(-2 ** 63, tcp.TCP_CODEC.COMPACT))
+
+    def test_rpc_message_codec(self):
+        """
+        Test rpc messages deserialize whichever codec they were
+        serialized with
+        """
+        request = rpc.APIRequestGetInstances()
+        request.limit = 10
+        request.marker = 'uuid-01'
+        request.filters = {'host': 'compute-0'}
+
+        for codec in (None, tcp.TCP_CODEC.JSON, tcp.TCP_CODEC.COMPACT):
+            msg = rpc.RPCMessage.deserialize(request.serialize(codec))
+            assert rpc.RPC_MSG_TYPE.GET_INSTANCES_REQUEST == msg.type
+            assert 10 == msg.limit
+            assert 'uuid-01' == msg.marker
+            assert {'host': 'compute-0'} == msg.filters
+
+    def test_receive_partial_frames(self):
+        """
+        Test frames trickling in a byte at a time, and several frames
+        arriving at once, are received whole and in order
+        """
+        connection, peer = self._connection_pair()
+        data = _frame(b'first') + _frame(b'second', 7) + _frame(b'')
+        for idx in range(len(data)):
+            peer.sendall(data[idx:idx + 1])
+            if idx < 8:
+                assert (None, None) == connection.receive_frame(
+                    blocking=False)
+
+        assert (None, b'first') == connection.receive_frame(timeout_in_secs=1)
+        assert (7, b'second') == connection.receive_frame(timeout_in_secs=1)
+        assert (None, b'') == connection.receive_frame(timeout_in_secs=1)
+        assert (None, None) == connection.receive_frame(blocking=False)
+
+    def test_receive_exact_bytes(self):
+        """
+        Test the payload received is the bytes sent, with and without an
+        authorization vector
+        """
+        payload = b'{"hello": 1}'
+        connection, peer = self._connection_pair()
+        peer.sendall(_frame(payload))
+        received = connection.receive(timeout_in_secs=1)
+        assert isinstance(received, bytes)
+        assert payload == received
+
+        for request_id in [None, 9]:
+            sender = tcp.TCPConnection('127.0.0.1', 0, sock=peer,
+                                       auth_key=b'key')
+            receiver = tcp.TCPConnection('127.0.0.1', 0,
+                                         sock=connection._socket,
+                                         auth_key=b'key')
+            sender.send(payload, request_id)
+            assert (request_id, payload) == receiver.receive_frame(
+                timeout_in_secs=1)
+            assert (None, None) == receiver.receive_frame(blocking=False)
+
+        assert b'\x01\x02' == tcp.tcp_codec_decode(tcp.tcp_codec_encode(
+            memoryview(b'\x00\x01\x02')[1:], tcp.TCP_CODEC.COMPACT))
+
+    def test_receive_large_frame(self):
+        """
+        Test a frame larger than the receive buffer is received, and the
+        buffer goes back to its size afterwards
+        """
+        connection, peer = self._connection_pair()
+        payload = b'x' * (tcp.TCPConnection.RECEIVE_BUFFER_MAX_SIZE + 3)
+        sender = threading.Thread(
+            target=peer.sendall,
+            args=(_frame(payload) + _frame(b'small'),))
+        sender.start()
+        self.addCleanup(sender.join)
+
+        assert payload == connection.receive(timeout_in_secs=5)
+        assert b'small' == connection.receive(timeout_in_secs=5)
+        assert tcp.TCPConnection.RECEIVE_BUFFER_SIZE == \
+            len(connection._rx_buffer)
+
+    def test_send_partial(self):
+        """
+        Test a message larger than the socket will take at once is queued
+        by a non-blocking connection and sent whole once writeable, the
+        connection closes once the queue is sent
+        """
+        selobj.selobj_initialize()
+        self.addCleanup(selobj.selobj_finalize)
+
+        connection = tcp.TCPConnection('127.0.0.1', 0, blocking=False)
+        connection.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        connection.sock.setblocking(True)
+        connection.connect('127.0.0.1', self._listen.getsockname()[1])
+        self.addCleanup(connection.close)
+        peer, _ = self._listen.accept()
+        self.addCleanup(peer.close)
+
+        payload = b'y' * (8 * 1024 * 1024)
+        assert len(payload) + 4 == connection.send(payload)
+        assert 9 == connection.send(b'small')
+        assert connection._tx_buffer
+        connection.close()
+        assert connection.is_shutdown()
+        assert 0 == connection.send(b'late')
+
+        received = list()
+
+        def receive():
+            peer_connection = tcp.TCPConnection('127.0.0.1', 0, sock=peer)
+            received.append(peer_connection.receive(timeout_in_secs=10))
+            received.append(peer_connection.receive(timeout_in_secs=10))
+            received.append(peer_connection.receive(timeout_in_secs=1))
+
+        receiver = threading.Thread(target=receive)
+        receiver.start()
+        while connection.sock is not None:
+            selobj.selobj_dispatch(100)
+        receiver.join()
+        assert [payload, b'small', None] == received
+
+    def test_server_answers_in_request_codec(self):
+        """
+        Test the server tells the handler the codec of the request
+        """
+        selobj.selobj_initialize()
+        self.addCleanup(selobj.selobj_finalize)
+
+        def message_handler(connection, msg):
+            connection.send(tcp.tcp_codec_encode(tcp.tcp_codec_decode(msg),
+                                                 connection.codec))
+            connection.close()
+
+        server = tcp.TCPServer('127.0.0.1', 0, message_handler)
+        stop = threading.Event()
+
+        def dispatch():
+            while not stop.is_set():
+                selobj.selobj_dispatch(20)
+            server.shutdown()
+
+        thread = threading.Thread(target=dispatch)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(stop.set)
+
+        port = server._socket.getsockname()[1]
+        channel = tcp.TCPChannel('127.0.0.1', 0, '127.0.0.1', port)
+        self.addCleanup(channel.close)
+
+        for codec in (tcp.TCP_CODEC.COMPACT, tcp.TCP_CODEC.JSON):
+            request = channel.request()
+            request.send(tcp.tcp_codec_encode({'echo': codec}, codec))
+            msg = request.receive(timeout_in_secs=5)
+            request.close()
+            assert codec == tcp.tcp_codec_detect(msg)
+            assert {'echo': codec} == tcp.tcp_codec_decode(msg)
+
+        connection = tcp.TCPConnection('127.0.0.1', 0)
+        connection.connect('127.0.0.1', port)
+        self.addCleanup(connection.close)
+        connection.send(tcp.tcp_codec_encode([1], tcp.TCP_CODEC.COMPACT))
+        msg = connection.receive(timeout_in_secs=5)
+        assert tcp.TCP_CODEC.COMPACT == tcp.tcp_codec_detect(msg)
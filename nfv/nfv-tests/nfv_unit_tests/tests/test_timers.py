@@ -0,0 +1,151 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+
+from nfv_common.timers._timer import Timer
+from nfv_common.timers._timer_scheduler import TimerScheduler
+
+from . import testcase  # noqa: H304
+
+
+class FakeClock(object):
+    """
+    Fake monotonic clock driven by the testcase
+    """
+    def __init__(self):
+        self.now_ms = 1000
+
+    def __call__(self):
+        return self.now_ms
+
+
+def timer_callback(fired, name):
+    """
+    Timer callback recording the ticks it fired on
+    """
+    while True:
+        timer_id = (yield)
+        fired.append((name, timer_id))
+
+
+def one_shot_callback(fired, name):
+    """
+    Timer callback that only fires once
+    """
+    timer_id = (yield)
+    fired.append((name, timer_id))
+
+
+class TestTimerScheduler(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestTimerScheduler, self).setUp()
+        self._clock = FakeClock()
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.timers._timer.get_monotonic_timestamp_in_ms',
+            self._clock))
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_common.timers._timer_scheduler.get_monotonic_timestamp_in_ms',
+            self._clock))
+        self._scheduler = TimerScheduler(100, 1000, 2000)
+        self._fired = list()
+
+    def _create_timer(self, name, interval_secs, callback=timer_callback):
+        target = callback(self._fired, name)
+        target.send(None)
+        timer = Timer(name, None, interval_secs, lambda: target)
+        self._scheduler.add_timer(timer)
+        return timer.timer_id
+
+    def _advance(self, ms):
+        self._clock.now_ms += ms
+        self._scheduler.schedule()
+
+    def test_only_expired_timers_fire(self):
+        """
+        Test timers fire once their interval has elapsed, in expiry order
+        """
+        slow_id = self._create_timer('slow', 5)
+        fast_id = self._create_timer('fast', 1)
+
+        self._advance(500)
+        assert [] == self._fired
+
+        self._advance(600)
+        assert [('fast', fast_id)] == self._fired
+
+        self._advance(5000)
+        assert [('fast', fast_id), ('fast', fast_id),
+                ('slow', slow_id)] == self._fired
+
+    def test_delete_and_reschedule(self):
+        """
+        Test deleted timers no longer fire and rescheduled timers use the
+        new interval
+        """
+        timer_id_1 = self._create_timer('one', 1)
+        timer_id_2 = self._create_timer('two', 1)
+
+        self._scheduler.delete_timer(timer_id_1)
+        self._scheduler.reschedule_timer(timer_id_2, 10)
+
+        self._advance(2000)
+        assert [] == self._fired
+
+        self._advance(9000)
+        assert [('two', timer_id_2)] == self._fired
+
+        # Deleting or rescheduling an unknown timer is ignored
+        self._scheduler.delete_timer(timer_id_1)
+        self._scheduler.reschedule_timer(timer_id_1, 1)
+
+    def test_one_shot_timer(self):
+        """
+        Test a timer whose callback stops is removed
+        """
+        timer_id = self._create_timer('once', 1, one_shot_callback)
+
+        self._advance(1500)
+        self._advance(1500)
+        assert [('once', timer_id)] == self._fired
+        assert timer_id not in self._scheduler._timers
+
+    def test_delete_from_callback(self):
+        """
+        Test a callback deleting another expired timer in the same tick
+        """
+        timer_ids = list()
+
+        def deleting_callback(fired, name):
+            while True:
+                timer_id = (yield)
+                fired.append((name, timer_id))
+                self._scheduler.delete_timer(timer_ids[1])
+
+        timer_ids.append(self._create_timer('deleter', 1, deleting_callback))
+        timer_ids.append(self._create_timer('victim', 1))
+
+        self._advance(1500)
+        self._advance(1500)
+        assert [('deleter', timer_ids[0]),
+                ('deleter', timer_ids[0])] == self._fired
+
+    def test_scheduling_on_time(self):
+        """
+        Test late scheduling is detected and debounced
+        """
+        self._advance(100)
+        assert self._scheduler.scheduling_on_time
+
+        self._advance(1500)
+        assert not self._scheduler.scheduling_on_time
+
+        self._advance(100)
+        assert not self._scheduler.scheduling_on_time
+
+        for _ in range(25):
+            self._advance(100)
+        assert self._scheduler.scheduling_on_time
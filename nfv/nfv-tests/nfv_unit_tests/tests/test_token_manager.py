@@ -0,0 +1,224 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import datetime
+import fixtures
+import mock
+
+from nfv_common import tasks
+
+from nfv_plugins.nfvi_plugins.openstack import openstack
+from nfv_plugins.nfvi_plugins.openstack.objects import Directory
+from nfv_plugins.nfvi_plugins.openstack.objects import Token
+
+from . import testcase  # noqa: H304
+
+_OPENSTACK = 'nfv_plugins.nfvi_plugins.openstack.openstack'
+
+
+def _directory(service_category='openstack'):
+    return Directory(service_category, 'keyring', 'http', 'keystone', 5000,
+                     'admin', 'admin', 'password', 'Default', 'Default')
+
+
+def _token(token_id, expires_in_secs=3600):
+    expires_at = datetime.datetime.utcnow() + \
+        datetime.timedelta(seconds=expires_in_secs)
+    token_data = {'token': {'expires_at': expires_at.isoformat() + 'Z'}}
+    return Token(token_data, _directory(), token_id)
+
+
+class _Plugin(object):
+    _token = openstack.SharedToken('_directory')
+
+    def __init__(self, directory):
+        self._directory = directory
+
+
+class TestTokenManager(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestTokenManager, self).setUp()
+        # The refresh thread is driven by hand in these tests
+        self.useFixture(fixtures.MonkeyPatch(
+            '%s.TokenManager._start' % _OPENSTACK, lambda self: None))
+        self._manager = openstack.TokenManager(refresh_before_secs=900)
+        self.useFixture(fixtures.MonkeyPatch(
+            '%s._token_manager' % _OPENSTACK, self._manager))
+        self._histogram = mock.Mock()
+        self.useFixture(fixtures.MonkeyPatch(
+            '%s.histogram.add_histogram_data' % _OPENSTACK, self._histogram))
+
+    def _histogram_names(self):
+        return [call[0][0] for call in self._histogram.call_args_list]
+
+    def test_token_shared_by_directory(self):
+        """
+        Test a token obtained by one plugin is used by the others with the
+        same directory, and not by plugins with another directory
+        """
+        compute = _Plugin(_directory())
+        network = _Plugin(_directory())
+        platform = _Plugin(_directory('platform'))
+        assert compute._token is None
+
+        token = _token('token-1')
+        compute._token = token
+        assert token is network._token
+        assert platform._token is None
+        assert ['token-manager openstack (re-auth-avoided)'] == \
+            self._histogram_names()
+
+        # Only counted once per plugin
+        assert token is network._token
+        assert token is compute._token
+        assert 1 == len(self._histogram_names())
+
+    def test_refresh_due(self):
+        """
+        Test tokens are refreshed before they expire
+        """
+        directory = _directory()
+        platform_directory = _directory('platform')
+        self._manager.get_token(platform_directory)
+        self._manager.set_token(directory, _token('token-1'))
+        assert [platform_directory] == \
+            [due for _, due in self._manager.refresh_due()]
+
+        self._manager.set_token(platform_directory, _token('token-2', 600))
+        assert [platform_directory] == \
+            [due for _, due in self._manager.refresh_due()]
+
+        self._manager.set_token(platform_directory, _token('token-3'))
+        assert [] == self._manager.refresh_due()
+
+        self._manager.get_token(directory).set_expired()
+        assert [directory] == [due for _, due in self._manager.refresh_due()]
+
+    def test_refresh_coalesced(self):
+        """
+        Test a refresh asked for while one is in progress does not make
+        another keystone request
+        """
+        directory = _directory()
+        assert self._manager.get_token(directory) is None
+        key, _ = self._manager.refresh_due()[0]
+        new_token = _token('token-2')
+
+        def get_token(directory):
+            assert [] == self._manager.refresh_due()
+            self._manager.refresh_token(key, directory)
+            return new_token
+
+        with mock.patch('%s.get_token' % _OPENSTACK,
+                        side_effect=get_token) as mock_get_token:
+            self._manager.refresh_token(key, directory)
+
+        mock_get_token.assert_called_once_with(directory)
+        assert new_token is self._manager.get_token(directory)
+        assert 'token-manager openstack (refresh-latency)' in \
+            self._histogram_names()
+
+        self._manager.set_token(directory, _token('token-3'))
+        assert 'token-manager openstack (token-age)' in \
+            self._histogram_names()
+
+    def _wait_token(self, directory):
+        token_queue = self._manager.wait_token(directory)
+        self.addCleanup(token_queue.close)
+        return token_queue
+
+    def test_wait_coalesced(self):
+        """
+        Test callers waiting on a missing token share a single refresh
+        """
+        directory = _directory()
+        first_queue = self._wait_token(directory)
+        second_queue = self._wait_token(directory)
+        assert self._manager._wakeup.is_set()
+
+        new_token = _token('token-1')
+        with mock.patch('%s.get_token' % _OPENSTACK,
+                        return_value=new_token) as mock_get_token:
+            for key, due in self._manager.refresh_due():
+                self._manager.refresh_token(key, due)
+            assert [] == self._manager.refresh_due()
+
+        mock_get_token.assert_called_once_with(directory)
+        assert new_token is first_queue.get_nowait()
+        assert new_token is second_queue.get_nowait()
+
+        # A valid token is given straight away
+        assert new_token is self._wait_token(directory).get_nowait()
+
+    def test_wait_refresh_failed(self):
+        """
+        Test callers waiting on a token are given none if the refresh fails
+        """
+        directory = _directory()
+        self._manager.set_token(directory, _token('token-1'))
+        self._manager.get_token(directory).set_expired()
+        token_queue = self._wait_token(directory)
+
+        key, _ = self._manager.refresh_due()[0]
+        with mock.patch('%s.get_token' % _OPENSTACK, return_value=None):
+            self._manager.refresh_token(key, directory)
+        assert token_queue.get_nowait() is None
+
+    def test_refresh_woken(self):
+        """
+        Test the refresh thread is woken when the shared token is missing,
+        expired or discarded
+        """
+        compute = _Plugin(_directory())
+        assert compute._token is None
+        assert self._manager._wakeup.is_set()
+
+        token = _token('token-1')
+        compute._token = token
+        self._manager._wakeup.clear()
+        _token('token-2').set_expired()
+        assert not self._manager._wakeup.is_set()
+        token.set_expired()
+        assert self._manager._wakeup.is_set()
+
+        self._manager._wakeup.clear()
+        compute._token = None
+        assert self._manager._wakeup.is_set()
+        assert compute._token is None
+
+    def test_task_waits_on_token(self):
+        """
+        Test a task waiting on the token queue is given the token
+        """
+        results = list()
+
+        def target():
+            while True:
+                results.append((yield))
+
+        coroutine = target()
+        next(coroutine)
+        scheduler = mock.Mock()
+        task = tasks.Task(scheduler, tasks.TASK_PRIORITY.MED, coroutine)
+        scheduler.running_task = task
+
+        directory = _directory()
+        token_queue = self._manager.wait_token(directory)
+        tasks.TaskFuture(scheduler).queue_wait(token_queue)
+        scheduler.add_task_io_read_wait.assert_called_once_with(
+            token_queue.selobj, task)
+
+        new_token = _token('token-1')
+        with mock.patch('%s.get_token' % _OPENSTACK, return_value=new_token):
+            key, _ = self._manager.refresh_due()[0]
+            self._manager.refresh_token(key, directory)
+
+        selobj = token_queue.selobj
+        task.io_wait_complete(selobj)
+        scheduler.cancel_task_io_read_wait.assert_called_once_with(selobj,
+                                                                   task)
+        assert results[-1].is_complete()
+        assert new_token is results[-1].data
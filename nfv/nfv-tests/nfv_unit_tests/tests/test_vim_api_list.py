@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+
+from nfv_common import tcp
+
+from nfv_common.helpers import Object
+
+from nfv_vim import rpc
+from nfv_vim.events import _vim_api_list
+
+from . import testcase  # noqa: H304
+
+
+class _Connection(object):
+    """
+    Connection recording the messages sent
+    """
+    def __init__(self):
+        self.messages = list()
+        self.closed = False
+        self.codec = tcp.TCP_CODEC.JSON
+
+    def send(self, payload):
+        self.messages.append(rpc.RPCMessage.deserialize(payload))
+
+    def close(self):
+        self.closed = True
+
+
+def _volume_response(volume):
+    response = rpc.APIResponseGetVolume()
+    response.uuid = volume.uuid
+    response.name = volume.name
+    response.avail_status = volume.avail_status
+    return response
+
+
+_VOLUMES = [Object(uuid='uuid-%02d' % idx, name='volume-%d' % idx,
+                   avail_status=['available'] if idx % 3 else ['in-use'])
+            for idx in range(25)]
+
+_FILTERS = {'state': lambda volume: volume.avail_status}
+
+
+class TestVimApiList(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestVimApiList, self).setUp()
+        self.useFixture(fixtures.MonkeyPatch(
+            'nfv_vim.events._vim_api_list.LIST_BATCH_SIZE', 10))
+
+    def _list(self, limit=None, marker=None, fields=None, filters=None):
+        request = rpc.APIRequestGetVolumes()
+        request.limit = limit
+        request.marker = marker
+        request.fields = fields
+        if filters is not None:
+            request.filters = filters
+        request = rpc.RPCMessage.deserialize(request.serialize())
+
+        connection = _Connection()
+        _vim_api_list.vim_api_send_list(connection, request,
+                                        rpc.APIResponseGetVolumes,
+                                        reversed(_VOLUMES), _volume_response,
+                                        _FILTERS)
+        assert connection.closed
+        return connection.messages
+
+    def test_batches_end_of_stream(self):
+        """
+        Test all the resources are sent in batches, in uuid order, only the
+        last batch marked as the end of the stream
+        """
+        messages = self._list()
+        assert [10, 10, 5] == [len(message.items) for message in messages]
+        assert [False, False, True] == \
+            [message.end_of_stream for message in messages]
+        assert messages[-1].next_marker is None
+
+        items = [item for message in messages for item in message.get_items()]
+        assert [volume.uuid for volume in _VOLUMES] == \
+            [item.uuid for item in items]
+        assert rpc.RPC_MSG_TYPE.GET_VOLUMES_RESPONSE == messages[0].type
+
+    def test_pages(self):
+        """
+        Test following the markers lists every resource once
+        """
+        uuids = list()
+        marker = None
+        while True:
+            messages = self._list(limit=7, marker=marker)
+            uuids.extend(item.uuid for message in messages
+                         for item in message.get_items())
+            marker = messages[-1].next_marker
+            if marker is None:
+                break
+        assert [volume.uuid for volume in _VOLUMES] == uuids
+
+        assert [] == self._list(limit=0)[-1].items
+
+    def test_projection_and_filters(self):
+        """
+        Test only the fields asked for are sent, and only the resources
+        matching the filters
+        """
+        messages = self._list(fields=['uuid'], filters={'state': 'in-use'})
+        items = [item for message in messages for item in message.items]
+        assert [{'uuid': volume.uuid} for volume in _VOLUMES
+                if 'in-use' in volume.avail_status] == items
+
+        item = messages[0].get_items()[0]
+        assert 'uuid-00' == item.uuid
+        assert item.name is None
+
+    def test_unknown_filter(self):
+        """
+        Test a filter that is not supported fails the request
+        """
+        messages = self._list(filters={'host': 'compute-0'})
+        assert 1 == len(messages)
+        assert rpc.RPC_MSG_RESULT.FAILED == messages[0].result
+        assert messages[0].end_of_stream
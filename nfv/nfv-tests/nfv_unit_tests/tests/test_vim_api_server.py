@@ -0,0 +1,174 @@
+#
+# Copyright (c) 2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from six.moves import http_client as httplib
+import threading
+import time
+
+from nfv_vim import api
+
+from . import testcase  # noqa: H304
+
+
+class TestVimApiServer(testcase.NFVTestCase):
+
+    def setUp(self):
+        super(TestVimApiServer, self).setUp()
+        self._release = threading.Event()
+        self._started = threading.Semaphore(0)
+
+    def _app(self, environ, start_response):
+        """
+        Answers /slow once released, anything else straight away
+        """
+        if '/slow' == environ['PATH_INFO']:
+            self._started.release()
+            self._release.wait(10)
+        body = environ['wsgi.input'].read()
+        start_response('200 OK', [('Content-Type', 'text/plain'),
+                                  ('Content-Length', str(len(body) + 2))])
+        return [b'ok' + body]
+
+    def _server(self, num_workers=2, queue_size=4,
+                keepalive_timeout_in_secs=5):
+        server = api.make_server('127.0.0.1', 0, self._app, num_workers,
+                                 queue_size, keepalive_timeout_in_secs)
+        server.start()
+        thread = threading.Thread(target=server.serve_forever,
+                                  kwargs={'poll_interval': 0.05})
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.drain, 5)
+        self.addCleanup(thread.join)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(self._release.set)
+        return server
+
+    def _connection(self, server):
+        connection = httplib.HTTPConnection('127.0.0.1',
+                                            server.server_address[1],
+                                            timeout=10)
+        self.addCleanup(connection.close)
+        return connection
+
+    def _slow_request(self, server):
+        """
+        Start a request that holds a worker until released
+        """
+        connection = self._connection(server)
+        connection.request('GET', '/slow')
+        assert self._started.acquire(timeout=5)
+        return connection
+
+    def test_concurrent_requests(self):
+        """
+        Test a slow request does not hold up the others
+        """
+        server = self._server()
+        slow = self._slow_request(server)
+
+        connection = self._connection(server)
+        connection.request('POST', '/fast', body=b'-body')
+        response = connection.getresponse()
+        assert httplib.OK == response.status
+        assert b'ok-body' == response.read()
+
+        self._release.set()
+        assert b'ok' == slow.getresponse().read()
+
+    def test_keep_alive(self):
+        """
+        Test requests are served one after the other over a connection
+        """
+        server = self._server()
+        connection = self._connection(server)
+        for idx in range(3):
+            connection.request('GET', '/fast')
+            response = connection.getresponse()
+            assert b'ok' == response.read()
+            assert response.getheader('Connection') is None
+            if 0 == idx:
+                sock = connection.sock
+            assert sock is connection.sock
+
+    def test_busy(self):
+        """
+        Test connections are refused with a 503 once the workers are busy
+        and the queue is full
+        """
+        server = self._server(num_workers=1, queue_size=1)
+        slow = self._slow_request(server)
+
+        queued = self._connection(server)
+        queued.request('GET', '/fast')
+        time.sleep(0.2)
+
+        refused = self._connection(server)
+        refused.request('GET', '/fast')
+        response = refused.getresponse()
+        assert httplib.SERVICE_UNAVAILABLE == response.status
+        assert 'close' == response.getheader('Connection')
+        assert 1 == server.rejected
+
+        self._release.set()
+        assert httplib.OK == slow.getresponse().status
+        assert httplib.OK == queued.getresponse().status
+
+    def test_idle_connection_makes_room(self):
+        """
+        Test a connection queued while the workers sit on idle connections
+        kept alive is served without waiting for the keep-alive timeout
+        """
+        server = self._server(num_workers=1, keepalive_timeout_in_secs=30)
+        idle = self._connection(server)
+        idle.request('GET', '/fast')
+        assert b'ok' == idle.getresponse().read()
+        time.sleep(0.1)
+
+        start = time.time()
+        queued = self._connection(server)
+        queued.request('GET', '/fast')
+        assert b'ok' == queued.getresponse().read()
+        assert 5 > time.time() - start
+        assert b'' == idle.sock.recv(1)
+
+    def test_drain(self):
+        """
+        Test draining lets the request in progress finish and closes the
+        connections kept alive without waiting for them to time out
+        """
+        server = self._server(keepalive_timeout_in_secs=30)
+        idle = self._connection(server)
+        idle.request('GET', '/fast')
+        assert b'ok' == idle.getresponse().read()
+        slow = self._slow_request(server)
+
+        drained = list()
+        thread = threading.Thread(target=lambda: drained.append(
+            server.drain(10)))
+        thread.start()
+        time.sleep(0.2)
+        assert [] == drained
+
+        self._release.set()
+        response = slow.getresponse()
+        assert b'ok' == response.read()
+        assert 'close' == response.getheader('Connection')
+        thread.join(5)
+        assert [True] == drained
+
+    def test_recycle(self):
+        """
+        Test recycling closes the connections kept alive
+        """
+        server = self._server(keepalive_timeout_in_secs=30)
+        connection = self._connection(server)
+        connection.request('GET', '/fast')
+        assert b'ok' == connection.getresponse().read()
+        time.sleep(0.1)
+
+        server.recycle()
+        assert b'' == connection.sock.recv(1)
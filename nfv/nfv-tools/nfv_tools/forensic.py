@@ -21,6 +21,12 @@ def process_main():
         arg_parser.add_argument('-c', '--config', help='configuration file')
         arg_parser.add_argument('-s', '--start_date', help='start date')
         arg_parser.add_argument('-e', '--end_date', help='end date')
+        arg_parser.add_argument('-i', '--index',
+                                help='index file, reused across runs so '
+                                     'only new log lines are parsed')
+        arg_parser.add_argument('-u', '--instance',
+                                help='instance uuid or name, requires an '
+                                     'index')
 
         args = arg_parser.parse_args()
 
@@ -43,11 +49,11 @@ def process_main():
 
         if args.end_date:
             try:
-                end_date = datetime.datetime.strptime(args.start_date,
+                end_date = datetime.datetime.strptime(args.end_date,
                                                       "%Y-%m-%d %H:%M:%S")
             except ValueError:
                 print("End-Date '%s' is invalid, "
-                       "expected=<YYYY-MM-DD HH:MM:SS>" % args.start_date)
+                       "expected=<YYYY-MM-DD HH:MM:SS>" % args.end_date)
                 sys.exit(1)
         else:
             end_date = datetime.datetime.max
@@ -61,8 +67,18 @@ def process_main():
             sys.stdout.write("\r  Complete: {0:.0f}%".format(percentage))
             sys.stdout.flush()
 
-        records = forensic.evidence_from_files(config.CONF.get('files'),
-                                               start_date, end_date, progress)
+        if args.index:
+            records = forensic.evidence_from_index(
+                args.index, config.CONF.get('files'), start_date, end_date,
+                instance_uuid=args.instance, instance_name=args.instance,
+                progress=progress)
+        elif args.instance:
+            print("An instance can only be given with an index.")
+            sys.exit(1)
+        else:
+            records = forensic.evidence_from_files(config.CONF.get('files'),
+                                                   start_date, end_date,
+                                                   progress)
         forensic.analysis_stdout(records)
 
     except Exception as e:
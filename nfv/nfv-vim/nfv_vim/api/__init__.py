@@ -4,3 +4,5 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 from nfv_vim.api._application import Application  # noqa: F401
+from nfv_vim.api._server import make_server  # noqa: F401
+from nfv_vim.api._server import WSGIServer  # noqa: F401
@@ -4,12 +4,66 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 from pecan import hooks
+import threading
 
 from nfv_common import config
+from nfv_common import debug
 from nfv_common import tcp
 
 from nfv_common.helpers import Object
 
+from nfv_vim import rpc
+
+DLOG = debug.debug_get_logger('nfv_vim.api.hooks')
+
+_channel_pool = None
+_channel_pool_lock = threading.Lock()
+
+
+def _get_channel_pool():
+    """
+    Returns the pool of long-lived channels to the VIM
+    """
+    global _channel_pool
+
+    with _channel_pool_lock:
+        if _channel_pool is None:
+            section = config.CONF['vim-api']
+            num_channels = int(section.get('rpc_channels', 2))
+            _channel_pool = tcp.TCPChannelPool(
+                section['rpc_host'], section['rpc_port'],
+                config.CONF['vim']['rpc_host'], config.CONF['vim']['rpc_port'],
+                num_channels=num_channels)
+        return _channel_pool
+
+
+class VimConnection(object):
+    """
+    VIM Connection, a request to the VIM over a long-lived channel
+    """
+    def __init__(self, request, codec=tcp.TCP_CODEC.JSON):
+        self._request = request
+        self._codec = codec
+
+    def send(self, rpc_request):
+        """
+        Send an rpc request to the VIM, in the codec configured
+        """
+        self._request.set_name('vim-api-rpc %s' % rpc_request.type)
+        return self._request.send(rpc_request.serialize(self._codec))
+
+    def receive(self, blocking=True, timeout_in_secs=5):
+        """
+        Receive a message from the VIM
+        """
+        return self._request.receive(blocking, timeout_in_secs)
+
+    def close(self):
+        """
+        Close the connection to the VIM, the channel stays open
+        """
+        self._request.close()
+
 
 class VimConnectionMgmt(object):
     """
@@ -24,13 +78,44 @@ class VimConnectionMgmt(object):
         """
         Open a connection to the VIM
         """
-        connection = tcp.TCPConnection(config.CONF['vim-api']['rpc_host'],
-                                       config.CONF['vim-api']['rpc_port'])
-        connection.connect(config.CONF['vim']['rpc_host'],
-                           config.CONF['vim']['rpc_port'])
+        codec = config.CONF['vim-api'].get('rpc_codec', tcp.TCP_CODEC.JSON)
+        connection = VimConnection(_get_channel_pool().request(), codec)
         self._connections.append(connection)
         return connection
 
+    def list_resources(self, rpc_request, response_type, timeout_in_secs=30):
+        """
+        Returns the resources of the page asked for by a list request and
+        the marker of the next page, None on failure
+        """
+        connection = self.open_connection()
+        connection.send(rpc_request)
+
+        resources = list()
+        while True:
+            msg = connection.receive(timeout_in_secs=timeout_in_secs)
+            if msg is None:
+                DLOG.error("List ended before the end of the stream, "
+                           "request=%s." % rpc_request)
+                return None, None
+
+            response = rpc.RPCMessage.deserialize(msg)
+            if response_type != response.type:
+                DLOG.error("Unexpected message type received, msg_type=%s."
+                           % response.type)
+                return None, None
+
+            if rpc.RPC_MSG_RESULT.SUCCESS != response.result:
+                DLOG.error("Unexpected result received, result=%s."
+                           % response.result)
+                return None, None
+
+            resources.extend(response.get_items())
+            if response.end_of_stream:
+                DLOG.verbose("Received %s resources, next_marker=%s."
+                             % (len(resources), response.next_marker))
+                return resources, response.next_marker
+
     def close_connection(self, connection):
         """
         Close a connection to the VIM
@@ -0,0 +1,315 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import six
+from six.moves import queue
+import socket
+import threading
+import time
+from wsgiref import simple_server
+
+from nfv_common import debug
+
+DLOG = debug.debug_get_logger('nfv_vim.api.server')
+
+_BUSY_RESPONSE = (b"HTTP/1.1 503 Service Unavailable\r\n"
+                  b"Content-Type: text/plain\r\n"
+                  b"Content-Length: 12\r\n"
+                  b"Retry-After: 1\r\n"
+                  b"Connection: close\r\n"
+                  b"\r\n"
+                  b"Server busy\n")
+
+
+class _ServerHandler(simple_server.ServerHandler, object):
+    """
+    WSGI Server Handler, tells the client when the connection will be
+    closed after the response
+    """
+    http_version = '1.1'
+
+    def cleanup_headers(self):
+        simple_server.ServerHandler.cleanup_headers(self)
+        request_handler = self.request_handler
+        if ('Content-Length' not in self.headers or
+                request_handler.close_connection or
+                not request_handler.keep_alive()):
+            # The end of the response is the end of the connection
+            self.headers['Connection'] = 'close'
+            request_handler.close_connection = True
+
+
+class WSGIRequestHandler(simple_server.WSGIRequestHandler, object):
+    """
+    WSGI Request Handler, serves the requests of a connection until the
+    client closes it or it sits idle for longer than the keep-alive timeout
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        self.timeout = self.server.keepalive_timeout_in_secs
+        self._generation = self.server.generation
+        simple_server.WSGIRequestHandler.setup(self)
+        # Responses are written in pieces, do not hold them back waiting
+        # for the acknowledgement of the previous piece
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def address_string(self):
+        # In the future, we could provide a config option to allow
+        # reverse DNS lookups.
+        return self.client_address[0]
+
+    def keep_alive(self):
+        """
+        Returns true if the connection can be kept open for another request
+        """
+        return self.server.keep_alive(self._generation)
+
+    def handle(self):
+        """
+        Handle the requests of a connection
+        """
+        self.close_connection = True
+        idle = False
+        while True:
+            if idle:
+                self.server.connection_idle(self.connection, True)
+            try:
+                self.raw_requestline = self.rfile.readline(65537)
+            except (socket.timeout, socket.error):
+                break
+            finally:
+                if idle:
+                    self.server.connection_idle(self.connection, False)
+
+            if not self.raw_requestline:
+                break
+
+            if len(self.raw_requestline) > 65536:
+                self.requestline = ''
+                self.request_version = ''
+                self.command = ''
+                self.send_error(414)
+                break
+
+            if not self.parse_request():
+                break
+
+            self._handle_request()
+            if self.close_connection:
+                # Decided when the response headers were sent, the client
+                # has been told
+                break
+            idle = True
+
+    def _handle_request(self):
+        """
+        Handle a request, the body is read before the application is called
+        so the next request on the connection is found where expected
+        """
+        transfer_encoding = self.headers.get('Transfer-Encoding', '')
+        if 'chunked' in transfer_encoding.lower():
+            self.close_connection = True
+            stdin = self.rfile
+        else:
+            content_length = int(self.headers.get('Content-Length') or 0)
+            stdin = six.BytesIO(self.rfile.read(content_length))
+
+        handler = _ServerHandler(stdin, self.wfile, self.get_stderr(),
+                                 self.get_environ())
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+
+
+class WSGIServer(simple_server.WSGIServer, object):
+    """
+    WSGI Server, connections accepted are served by a bounded pool of
+    worker threads, connections are refused with a 503 when all the workers
+    are busy and the queue of connections waiting for them is full. Idle
+    connections kept alive are closed to make room for those queued.
+    """
+    def __init__(self, server_address, handler_class=WSGIRequestHandler,
+                 num_workers=0, queue_size=64, keepalive_timeout_in_secs=5):
+        simple_server.WSGIServer.__init__(self, server_address, handler_class)
+        self.keepalive_timeout_in_secs = keepalive_timeout_in_secs
+        self.generation = 0
+        self._num_workers = num_workers
+        self._connections = queue.Queue(maxsize=queue_size)
+        self._idle_connections = set()
+        self._free_workers = 0
+        self._lock = threading.Lock()
+        self._draining = False
+        self._workers = list()
+        self._rejected = 0
+
+    @property
+    def num_workers(self):
+        """
+        Returns the number of worker threads
+        """
+        return self._num_workers
+
+    @property
+    def rejected(self):
+        """
+        Returns the number of connections refused because all the workers
+        were busy
+        """
+        return self._rejected
+
+    def start(self):
+        """
+        Start the worker threads
+        """
+        for idx in range(self._num_workers):
+            worker = threading.Thread(target=self._worker,
+                                      name='vim-api-worker-%d' % idx)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+        DLOG.info("Serving with %s workers, queue_size=%s, "
+                  "keepalive_timeout=%s." % (self._num_workers,
+                                             self._connections.maxsize,
+                                             self.keepalive_timeout_in_secs))
+
+    def _worker(self):
+        """
+        Serve the connections queued until told to stop
+        """
+        while True:
+            with self._lock:
+                self._free_workers += 1
+            item = self._connections.get()
+            with self._lock:
+                self._free_workers -= 1
+            if item is None:
+                break
+
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def process_request(self, request, client_address):
+        """
+        Queue a connection for the workers, served inline when there are no
+        workers
+        """
+        if 0 == self._num_workers:
+            simple_server.WSGIServer.process_request(self, request,
+                                                     client_address)
+            return
+
+        try:
+            self._connections.put_nowait((request, client_address))
+        except queue.Full:
+            self._rejected += 1
+            DLOG.info("All workers busy, refusing connection from %s."
+                      % client_address[0])
+            try:
+                request.settimeout(1)
+                request.sendall(_BUSY_RESPONSE)
+            except socket.error:
+                pass
+            self.shutdown_request(request)
+            return
+
+        self._make_room()
+
+    def _make_room(self):
+        """
+        Close a connection kept alive when the connections queued outnumber
+        the free workers, its worker serves the queued connection rather
+        than waiting for the keep-alive timeout
+        """
+        with self._lock:
+            if (self._idle_connections and
+                    self._connections.qsize() > self._free_workers):
+                self._close_idle(self._idle_connections.pop())
+
+    def keep_alive(self, generation):
+        """
+        Returns true if a connection can be kept open for another request,
+        connections are given up when others are waiting for a worker
+        """
+        if 0 == self._num_workers:
+            # Served inline, the next connection waits on this one
+            return False
+        return (not self._draining and self.generation == generation and
+                self._connections.empty())
+
+    def connection_idle(self, connection, idle):
+        """
+        Track the connections waiting for their next request
+        """
+        with self._lock:
+            if idle:
+                if self._draining:
+                    self._close_idle(connection)
+                self._idle_connections.add(connection)
+            else:
+                self._idle_connections.discard(connection)
+
+    @staticmethod
+    def _close_idle(connection):
+        """
+        End an idle connection, the worker waiting on it sees the end of it
+        """
+        try:
+            connection.shutdown(socket.SHUT_RD)
+        except socket.error:
+            pass
+
+    def recycle(self):
+        """
+        Close the connections kept alive, connections with a request in
+        progress are closed once the response has been sent
+        """
+        with self._lock:
+            self.generation += 1
+            for connection in self._idle_connections:
+                self._close_idle(connection)
+        DLOG.info("Recycled connections, generation=%s." % self.generation)
+
+    def drain(self, timeout_in_secs=30):
+        """
+        Stop the workers once the requests in progress and the connections
+        queued have been served, returns true if all the workers stopped
+        """
+        with self._lock:
+            self._draining = True
+            for connection in self._idle_connections:
+                self._close_idle(connection)
+
+        for _ in self._workers:
+            self._connections.put(None)
+
+        deadline = time.time() + timeout_in_secs
+        for worker in self._workers:
+            worker.join(max(0, deadline - time.time()))
+
+        busy = [worker.name for worker in self._workers if worker.is_alive()]
+        if busy:
+            DLOG.error("Workers still busy after %s seconds, workers=%s."
+                       % (timeout_in_secs, busy))
+            return False
+
+        DLOG.info("Drained %s workers." % len(self._workers))
+        del self._workers[:]
+        return True
+
+
+def make_server(ip, port, app, num_workers=0, queue_size=64,
+                keepalive_timeout_in_secs=5):
+    """
+    Create a WSGI server, the workers are started by the caller
+    """
+    server = WSGIServer((ip, port), WSGIRequestHandler, num_workers,
+                        queue_size, keepalive_timeout_in_secs)
+    server.set_app(app)
+    return server
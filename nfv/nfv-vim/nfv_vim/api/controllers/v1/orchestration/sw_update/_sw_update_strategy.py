@@ -307,7 +307,7 @@ class SwUpdateStrategyActionAPI(rest.RestController):
                 pecan.request.path)
             rpc_request.stage_id = request_data.stage_id
             vim_connection = pecan.request.vim.open_connection()
-            vim_connection.send(rpc_request.serialize())
+            vim_connection.send(rpc_request)
             msg = vim_connection.receive(timeout_in_secs=30)
             if msg is None:
                 DLOG.error("No response received.")
@@ -339,7 +339,7 @@ class SwUpdateStrategyActionAPI(rest.RestController):
                 pecan.request.path)
             rpc_request.stage_id = request_data.stage_id
             vim_connection = pecan.request.vim.open_connection()
-            vim_connection.send(rpc_request.serialize())
+            vim_connection.send(rpc_request)
             msg = vim_connection.receive(timeout_in_secs=30)
             if msg is None:
                 DLOG.error("No response received.")
@@ -384,7 +384,7 @@ class SwUpdateStrategyAPI(rest.RestController):
         rpc_request = rpc.APIRequestGetSwUpdateStrategy()
         rpc_request.uuid = strategy_uuid
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive(timeout_in_secs=30)
         if msg is None:
             DLOG.error("No response received.")
@@ -416,7 +416,7 @@ class SwUpdateStrategyAPI(rest.RestController):
         rpc_request.sw_update_type = _get_sw_update_type_from_path(
             pecan.request.path)
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive(timeout_in_secs=30)
         if msg is None:
             DLOG.error("No response received.")
@@ -450,7 +450,7 @@ class SwUpdateStrategyAPI(rest.RestController):
             pecan.request.path)
         rpc_request.force = request_data.force
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive(timeout_in_secs=30)
         if msg is None:
             DLOG.error("No response received.")
@@ -507,7 +507,7 @@ class SwPatchStrategyAPI(SwUpdateStrategyAPI):
         rpc_request.default_instance_action = request_data.default_instance_action
         rpc_request.alarm_restrictions = request_data.alarm_restrictions
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive(timeout_in_secs=30)
         if msg is None:
             DLOG.error("No response received.")
@@ -561,7 +561,7 @@ class SwUpgradeStrategyAPI(SwUpdateStrategyAPI):
         rpc_request.start_upgrade = False
         rpc_request.complete_upgrade = request_data.complete_upgrade
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive(timeout_in_secs=30)
         if msg is None:
             DLOG.error("No response received.")
@@ -611,7 +611,7 @@ class FwUpdateStrategyAPI(SwUpdateStrategyAPI):
         rpc_request.default_instance_action = request_data.default_instance_action
         rpc_request.alarm_restrictions = request_data.alarm_restrictions
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive(timeout_in_secs=30)
         if msg is None:
             DLOG.error("No response received.")
@@ -40,7 +40,7 @@ class ComputeOperateAPI(pecan.rest.RestController):
         Return an image details
         """
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for %s." % rpc_request)
@@ -136,7 +136,7 @@ class ComputeMigrateAPI(pecan.rest.RestController):
         Return an image details
         """
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for %s." % rpc_request)
@@ -354,7 +354,7 @@ class ComputesAPI(pecan.rest.RestController):
         vim_connection = pecan.request.vim.open_connection()
         rpc_request = rpc.APIRequestGetInstance()
         rpc_request.filter_by_uuid = compute_id
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for compute %s." % compute_id)
@@ -416,35 +416,37 @@ class ComputesAPI(pecan.rest.RestController):
         else:
             return pecan.abort(http_response)
 
-    @wsme_pecan.wsexpose([ComputeQueryData], status_code=httplib.OK)
-    def get_all(self):
-        DLOG.verbose("Compute-API get-all called.")
-
-        vim_connection = pecan.request.vim.open_connection()
-        rpc_request = rpc.APIRequestGetInstance()
-        rpc_request.get_all = True
-        vim_connection.send(rpc_request.serialize())
+    @wsme_pecan.wsexpose([ComputeQueryData], int, six.text_type,
+                         six.text_type, six.text_type, six.text_type,
+                         status_code=httplib.OK)
+    def get_all(self, limit=None, marker=None, host=None, tenant=None,
+                state=None):
+        DLOG.verbose("Compute-API get-all called, limit=%s, marker=%s, "
+                     "host=%s, tenant=%s, state=%s."
+                     % (limit, marker, host, tenant, state))
+
+        rpc_request = rpc.APIRequestGetInstances()
+        rpc_request.limit = limit
+        rpc_request.marker = marker
+        rpc_request.fields = ['uuid', 'host_uuid', 'image_uuid', 'vcpus',
+                              'memory_mb', 'instance_type_original_name',
+                              'sw:wrs:auto_recovery',
+                              'hw:wrs:live_migration_timeout',
+                              'hw:wrs:live_migration_max_downtime']
+        if host is not None:
+            rpc_request.filters['host'] = host
+        if tenant is not None:
+            rpc_request.filters['tenant'] = tenant
+        if state is not None:
+            rpc_request.filters['state'] = state
+
+        responses, _ = pecan.request.vim.list_resources(
+            rpc_request, rpc.RPC_MSG_TYPE.GET_INSTANCES_RESPONSE)
+        if responses is None:
+            return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
 
         computes = list()
-        while True:
-            msg = vim_connection.receive()
-            if msg is None:
-                DLOG.verbose("Done receiving.")
-                break
-
-            response = rpc.RPCMessage.deserialize(msg)
-            if rpc .RPC_MSG_TYPE.GET_INSTANCE_RESPONSE != response.type:
-                DLOG.error("Unexpected message type received, msg_type=%s."
-                           % response.type)
-                return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
-
-            if rpc.RPC_MSG_RESULT.SUCCESS != response.result:
-                DLOG.error("Unexpected result received, result=%s."
-                           % response.result)
-                return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
-
-            DLOG.verbose("Received response=%s." % response)
-
+        for response in responses:
             virtual_memory = ComputeQueryVirtualMemoryType()
             virtual_memory.virtual_mem_size = response.memory_mb
 
@@ -508,7 +510,7 @@ class ComputesAPI(pecan.rest.RestController):
             = meta_data.get("hw:wrs:live_migration_timeout", None)
         rpc_request.live_migration_max_downtime \
             = meta_data.get("hw:wrs:live_migration_max_downtime", None)
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for compute %s."
@@ -563,7 +565,7 @@ class ComputesAPI(pecan.rest.RestController):
         vim_connection = pecan.request.vim.open_connection()
         rpc_request = rpc.APIRequestDeleteInstance()
         rpc_request.uuid = compute_id
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for instance %s." % compute_id)
@@ -134,7 +134,7 @@ class ImageAPI(rest.RestController):
         vim_connection = pecan.request.vim.open_connection()
         rpc_request = rpc.APIRequestGetImage()
         rpc_request.filter_by_uuid = image_uuid
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for image %s." % image_uuid)
@@ -188,30 +188,13 @@ class ImageAPI(rest.RestController):
     def get_all(self):
         DLOG.verbose("Image-API get-all called.")
 
-        vim_connection = pecan.request.vim.open_connection()
-        rpc_request = rpc.APIRequestGetImage()
-        rpc_request.get_all = True
-        vim_connection.send(rpc_request.serialize())
+        responses, _ = pecan.request.vim.list_resources(
+            rpc.APIRequestGetImages(), rpc.RPC_MSG_TYPE.GET_IMAGES_RESPONSE)
+        if responses is None:
+            return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
 
         images = list()
-        while True:
-            msg = vim_connection.receive()
-            if msg is None:
-                DLOG.verbose("Done receiving.")
-                break
-
-            response = rpc.RPCMessage.deserialize(msg)
-            if rpc .RPC_MSG_TYPE.GET_IMAGE_RESPONSE != response.type:
-                DLOG.error("Unexpected message type received, msg_type=%s."
-                           % response.type)
-                return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
-
-            if rpc.RPC_MSG_RESULT.SUCCESS != response.result:
-                DLOG.error("Unexpected result received, result=%s."
-                           % response.result)
-                return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
-
-            DLOG.verbose("Received response=%s." % response)
+        for response in responses:
             image = ImageQueryData()
             image.uuid = response.uuid
             image.name = response.name
@@ -257,7 +240,7 @@ class ImageAPI(rest.RestController):
         rpc_request.protected = image_create_data.protected
         rpc_request.properties = properties
         rpc_request.image_data_ref = image_create_data.image_data_ref
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive(timeout_in_secs=180)
         if msg is None:
             DLOG.error("No response received for image %s."
@@ -343,7 +326,7 @@ class ImageAPI(rest.RestController):
                            % image_update_data.properties)
                 return pecan.abort(httplib.BAD_REQUEST)
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for image %s." % image_uuid)
@@ -386,7 +369,7 @@ class ImageAPI(rest.RestController):
         vim_connection = pecan.request.vim.open_connection()
         rpc_request = rpc.APIRequestDeleteImage()
         rpc_request.uuid = image_uuid
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for image %s." % image_uuid)
@@ -29,7 +29,7 @@ def subnet_allocate(network_resource_id, subnet_type):
     rpc_request.gateway_ip = subnet_type.gateway_ip
     rpc_request.is_dhcp_enabled = subnet_type.is_dhcp_enabled
 
-    vim_connection.send(rpc_request.serialize())
+    vim_connection.send(rpc_request)
     msg = vim_connection.receive()
     if msg is None:
         DLOG.error("No response received for subnet %s/%s for network %s."
@@ -80,7 +80,7 @@ def subnet_update(network_resource_id, subnet_type):
         rpc_request.delete_gateway = True
     rpc_request.is_dhcp_enabled = subnet_type.is_dhcp_enabled
 
-    vim_connection.send(rpc_request.serialize())
+    vim_connection.send(rpc_request)
     msg = vim_connection.receive()
     if msg is None:
         DLOG.error("No response received for subnet %s/%s for network %s."
@@ -124,7 +124,7 @@ def subnet_delete(network_resource_id, subnet_type):
     rpc_request.network_name = network_resource_id
     rpc_request.subnet_ip = subnet_type.wrs_subnet_ip
     rpc_request.subnet_prefix = subnet_type.wrs_subnet_prefix
-    vim_connection.send(rpc_request.serialize())
+    vim_connection.send(rpc_request)
     msg = vim_connection.receive()
     if msg is None:
         DLOG.error("No response received for network %s subnet %s/%s."
@@ -153,49 +153,40 @@ def subnet_delete(network_resource_id, subnet_type):
     return httplib.INTERNAL_SERVER_ERROR
 
 
-def subnet_get_all(network_resource_id):
+def _subnet_resource_type(response):
     """
-    Get all subnets
+    Returns the subnet resource type for a Get-Subnet response
     """
-    vim_connection = pecan.request.vim.open_connection()
-    rpc_request = rpc.APIRequestGetSubnet()
-    rpc_request.filter_by_network_name = network_resource_id
-    rpc_request.get_all = True
-    vim_connection.send(rpc_request.serialize())
-
-    subnet_resource_types = list()
-    while True:
-        msg = vim_connection.receive()
-        if msg is None:
-            DLOG.verbose("Done receiving.")
-            break
-
-        response = rpc.RPCMessage.deserialize(msg)
-        if rpc.RPC_MSG_TYPE.GET_SUBNET_RESPONSE != response.type:
-            DLOG.error("Unexpected message type received, msg_type=%s."
-                       % response.type)
-            return httplib.INTERNAL_SERVER_ERROR, None
+    subnet_attributes = NetworkSubnetType()
+    subnet_attributes.network_id = response.network_uuid
+    subnet_attributes.ip_version = str(response.ip_version)
+    subnet_attributes.gateway_ip = response.gateway_ip
+    subnet_attributes.is_dhcp_enabled = response.is_dhcp_enabled
+    subnet_attributes.wrs_subnet_ip = response.subnet_ip
+    subnet_attributes.wrs_subnet_prefix = response.subnet_prefix
 
-        if rpc.RPC_MSG_RESULT.SUCCESS != response.result:
-            DLOG.error("Unexpected result received, result=%s."
-                       % response.result)
-            return httplib.INTERNAL_SERVER_ERROR, None
+    subnet_resource_type = NetworkSubnetResourceType()
+    subnet_resource_type.resource_id = response.name
+    subnet_resource_type.subnet_attributes = subnet_attributes
+    return subnet_resource_type
 
-        DLOG.verbose("Received response=%s." % response)
 
-        subnet_attributes = NetworkSubnetType()
-        subnet_attributes.network_id = response.network_uuid
-        subnet_attributes.ip_version = str(response.ip_version)
-        subnet_attributes.gateway_ip = response.gateway_ip
-        subnet_attributes.is_dhcp_enabled = response.is_dhcp_enabled
-        subnet_attributes.wrs_subnet_ip = response.subnet_ip
-        subnet_attributes.wrs_subnet_prefix = response.subnet_prefix
+def subnet_get_all(network_resource_id=None):
+    """
+    Get all subnets, of a network if one is given
+    """
+    rpc_request = rpc.APIRequestGetSubnets()
+    if network_resource_id is not None:
+        rpc_request.filters['network_name'] = network_resource_id
 
-        subnet_resource_type = NetworkSubnetResourceType()
-        subnet_resource_type.resource_id = response.name
-        subnet_resource_type.subnet_attributes = subnet_attributes
+    responses, _ = pecan.request.vim.list_resources(
+        rpc_request, rpc.RPC_MSG_TYPE.GET_SUBNETS_RESPONSE)
+    if responses is None:
+        return httplib.INTERNAL_SERVER_ERROR, None
 
-        subnet_resource_types.append(subnet_resource_type)
+    subnet_resource_types = list()
+    for response in responses:
+        subnet_resource_types.append(_subnet_resource_type(response))
 
     return httplib.OK, subnet_resource_types
 
@@ -212,7 +203,7 @@ def network_allocate(network_resource_id, network_type):
     rpc_request.is_shared = network_type.is_shared
     rpc_request.physical_network = network_type.wrs_physical_network
 
-    vim_connection.send(rpc_request.serialize())
+    vim_connection.send(rpc_request)
     msg = vim_connection.receive()
     if msg is None:
         DLOG.error("No response received for network %s." % network_resource_id)
@@ -272,7 +263,7 @@ def network_update(network_resource_id, network_type):
     rpc_request.name = network_resource_id
     rpc_request.is_shared = network_type.is_shared
 
-    vim_connection.send(rpc_request.serialize())
+    vim_connection.send(rpc_request)
     msg = vim_connection.receive()
     if msg is None:
         DLOG.error("No response received for network %s." % network_resource_id)
@@ -399,7 +390,7 @@ def network_delete(network_resource_ids):
         vim_connection = pecan.request.vim.open_connection()
         rpc_request = rpc.APIRequestDeleteNetwork()
         rpc_request.by_name = network_resource_id
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for network %s."
@@ -427,7 +418,7 @@ def network_get(network_resource_id):
     vim_connection = pecan.request.vim.open_connection()
     rpc_request = rpc.APIRequestGetNetwork()
     rpc_request.filter_by_name = network_resource_id
-    vim_connection.send(rpc_request.serialize())
+    vim_connection.send(rpc_request)
     msg = vim_connection.receive()
     if msg is None:
         DLOG.error("No response received for network %s." % network_resource_id)
@@ -476,48 +467,32 @@ def network_get_all():
     """
     Get all networks
     """
-    vim_connection = pecan.request.vim.open_connection()
-    rpc_request = rpc.APIRequestGetNetwork()
-    rpc_request.get_all = True
-    vim_connection.send(rpc_request.serialize())
-
-    network_resource_types = list()
-    while True:
-        msg = vim_connection.receive()
-        if msg is None:
-            DLOG.verbose("Done receiving.")
-            break
-
-        response = rpc.RPCMessage.deserialize(msg)
-        if rpc .RPC_MSG_TYPE.GET_NETWORK_RESPONSE != response.type:
-            DLOG.error("Unexpected message type received, msg_type=%s."
-                       % response.type)
-            return httplib.INTERNAL_SERVER_ERROR, None
+    responses, _ = pecan.request.vim.list_resources(
+        rpc.APIRequestGetNetworks(), rpc.RPC_MSG_TYPE.GET_NETWORKS_RESPONSE)
+    if responses is None:
+        return httplib.INTERNAL_SERVER_ERROR, None
 
-        if rpc.RPC_MSG_RESULT.SUCCESS != response.result:
-            DLOG.error("Unexpected result received, result=%s."
-                       % response.result)
-            return httplib.INTERNAL_SERVER_ERROR, None
+    # Get the subnets of all the networks at once
+    (http_status_code, subnet_resource_types) = subnet_get_all()
+    if httplib.OK != http_status_code:
+        DLOG.error("Failed to get subnets, status_code=%s."
+                   % http_status_code)
+        return http_status_code, None
 
-        DLOG.verbose("Received response=%s." % response)
+    layer3_attributes_by_network = dict()
+    for subnet_resource_type in subnet_resource_types:
+        subnet_attributes = subnet_resource_type.subnet_attributes
+        layer3_attributes_by_network.setdefault(
+            subnet_attributes.network_id, list()).append(subnet_attributes)
 
+    network_resource_types = list()
+    for response in responses:
         network_attributes = NetworkType()
         network_attributes.type_of_network = response.network_type
         network_attributes.type_of_segment = str(response.segmentation_id)
         network_attributes.is_shared = response.is_shared
-
-        (http_status_code, subnet_resource_types) \
-            = subnet_get_all(response.name)
-        if httplib.OK == http_status_code:
-            layer3_attributes = list()
-            for subnet_resource_type in subnet_resource_types:
-                layer3_attributes.append(subnet_resource_type.subnet_attributes)
-
-            network_attributes.layer3_attributes = layer3_attributes
-        else:
-            DLOG.error("Failed to get subnets for network %s, status_code=%s."
-                       % (response.name, http_status_code))
-            return http_status_code, None
+        network_attributes.layer3_attributes \
+            = layer3_attributes_by_network.get(response.uuid, list())
 
         network_resource_type = NetworkResourceType()
         network_resource_type.resource_id = response.name
@@ -78,7 +78,7 @@ class VolumeAPI(pecan.rest.RestController):
         vim_connection = pecan.request.vim.open_connection()
         rpc_request = rpc.APIRequestGetVolume()
         rpc_request.filter_by_uuid = volume_uuid
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for volume %s." % volume_uuid)
@@ -128,30 +128,13 @@ class VolumeAPI(pecan.rest.RestController):
     def get_all(self):
         DLOG.verbose("Volume-API get-all called.")
 
-        vim_connection = pecan.request.vim.open_connection()
-        rpc_request = rpc.APIRequestGetVolume()
-        rpc_request.get_all = True
-        vim_connection.send(rpc_request.serialize())
+        responses, _ = pecan.request.vim.list_resources(
+            rpc.APIRequestGetVolumes(), rpc.RPC_MSG_TYPE.GET_VOLUMES_RESPONSE)
+        if responses is None:
+            return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
 
         volumes = list()
-        while True:
-            msg = vim_connection.receive()
-            if msg is None:
-                DLOG.verbose("Done receiving.")
-                break
-
-            response = rpc.RPCMessage.deserialize(msg)
-            if rpc .RPC_MSG_TYPE.GET_VOLUME_RESPONSE != response.type:
-                DLOG.error("Unexpected message type received, msg_type=%s."
-                           % response.type)
-                return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
-
-            if rpc.RPC_MSG_RESULT.SUCCESS != response.result:
-                DLOG.error("Unexpected result received, result=%s."
-                           % response.result)
-                return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
-
-            DLOG.verbose("Received response=%s." % response)
+        for response in responses:
             volume = VolumeQueryData()
             volume.uuid = response.uuid
             volume.name = response.name
@@ -183,7 +166,7 @@ class VolumeAPI(pecan.rest.RestController):
         rpc_request.description = volume_create_data.description
         rpc_request.size_gb = volume_create_data.disk_size
         rpc_request.image_uuid = volume_create_data.image_uuid
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for volume %s."
@@ -234,7 +217,7 @@ class VolumeAPI(pecan.rest.RestController):
             rpc_request.description = volume_update_data.description
 
         vim_connection = pecan.request.vim.open_connection()
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for volume %s." % volume_uuid)
@@ -273,7 +256,7 @@ class VolumeAPI(pecan.rest.RestController):
         vim_connection = pecan.request.vim.open_connection()
         rpc_request = rpc.APIRequestDeleteVolume()
         rpc_request.uuid = volume_uuid
-        vim_connection.send(rpc_request.serialize())
+        vim_connection.send(rpc_request)
         msg = vim_connection.receive()
         if msg is None:
             DLOG.error("No response received for volume %s." % volume_uuid)
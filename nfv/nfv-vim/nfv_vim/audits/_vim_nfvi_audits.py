@@ -4,7 +4,9 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import collections
+import datetime
 
+from nfv_common import config
 from nfv_common import debug
 from nfv_common import histogram
 from nfv_common import timers
@@ -18,7 +20,248 @@ from nfv_vim import tables
 
 DLOG = debug.debug_get_logger('nfv_vim.vim_nfvi_audits')
 
-_main_audit_inprogress = False
+_nfvi_audits = collections.OrderedDict()
+_audit_timeout_secs = 120
+
+_audit_incremental = True
+_audit_full_reconcile_cycles = 10
+_audit_changes_since_skew_secs = 60
+_audit_instance_detail = True
+_audit_detail_sweep_cycles = 30
+
+
+class _AuditWatermark(object):
+    """
+    Audit Watermark, tracks when a paged resource audit last listed the
+    resources so that following audits only list the resources changed
+    since, all resources are listed every so many cycles to reconcile
+    """
+    def __init__(self, name, paging):
+        self._name = name
+        self._paging = paging
+        self._watermark = None
+        self._next_watermark = None
+        self._incremental_cycles = 0
+        self._full = True
+        self._touched = 0
+        self._pages = 0
+
+    @property
+    def name(self):
+        """
+        Returns the name of the resource being audited
+        """
+        return self._name
+
+    @property
+    def watermark(self):
+        """
+        Returns the timestamp of the last completed cycle
+        """
+        return self._watermark
+
+    @property
+    def full(self):
+        """
+        Returns true if the current cycle lists all resources
+        """
+        return self._full
+
+    def begin_page(self):
+        """
+        Called before a page is requested, starts a new cycle when the
+        first page is requested
+        """
+        if self._paging.next_page is not None:
+            return
+
+        self._full = (not _audit_incremental or self._watermark is None or
+                      _audit_full_reconcile_cycles <=
+                      self._incremental_cycles + 1)
+
+        # Overlap cycles to allow for clock differences with the NFVI
+        next_watermark = (datetime.datetime.utcnow() - datetime.timedelta(
+            seconds=_audit_changes_since_skew_secs))
+        self._next_watermark = next_watermark.strftime('%Y-%m-%dT%H:%M:%SZ')
+        self._touched = 0
+        self._pages = 0
+
+        if self._full:
+            self._paging.changes_since = None
+        else:
+            self._paging.changes_since = self._watermark
+
+    def page_received(self, num_resources):
+        """
+        Called for each page of resources received
+        """
+        self._touched += num_resources
+        self._pages += 1
+
+    def cycle_complete(self):
+        """
+        Called once the last page is received, the watermark is only
+        advanced when a cycle completes
+        """
+        self._watermark = self._next_watermark
+        if self._full:
+            self._incremental_cycles = 0
+            cycle_type = 'full'
+        else:
+            self._incremental_cycles += 1
+            cycle_type = 'incremental'
+
+        histogram.add_histogram_data(
+            "audit-nfvi-%s (%s touched)" % (self._name, cycle_type),
+            self._touched, "resources")
+        histogram.add_histogram_data(
+            "audit-nfvi-%s (%s pages)" % (self._name, cycle_type),
+            self._pages, "pages")
+
+        DLOG.verbose("Audit-%s %s cycle complete, touched=%s, pages=%s.",
+                     self._name, cycle_type, self._touched, self._pages)
+
+
+class _NFVIAudit(object):
+    """
+    NFVI Audit, audits one type of resource on its own cadence so that a
+    slow service does not hold up the audits of the other resources
+    """
+    def __init__(self, name, start_audit, interval_secs, timeout_secs,
+                 depends_on=None, paging=None):
+        self._name = name
+        self._start_audit = start_audit
+        self._interval_ms = interval_secs * 1000
+        self._timeout_ms = timeout_secs * 1000
+        self._depends_on = list() if depends_on is None else depends_on
+        self._paging = paging
+        self._audit_id = 0
+        self._in_flight = False
+        self._mid_cycle = False
+        self._cycles = 0
+        self._start_ms = 0
+        self._next_audit_ms = 0
+        self._last_success_ms = None
+
+    @property
+    def name(self):
+        """
+        Returns the name of the audit
+        """
+        return self._name
+
+    @property
+    def in_flight(self):
+        """
+        Returns true if an audit request is outstanding
+        """
+        return self._in_flight
+
+    @property
+    def cycles(self):
+        """
+        Returns the number of audit cycles completed
+        """
+        return self._cycles
+
+    @property
+    def busy(self):
+        """
+        Returns true if an audit request is outstanding or more pages are
+        still to be requested
+        """
+        return self._in_flight or self._mid_cycle
+
+    def is_current(self, audit_id):
+        """
+        Returns true if the audit identifier is for the outstanding request
+        """
+        return self._in_flight and self._audit_id == audit_id
+
+    def ready(self, now_ms):
+        """
+        Returns true if the audit can be started, a new cycle is not started
+        until the audits it depends on have completed a cycle and are idle
+        """
+        if self._in_flight or now_ms < self._next_audit_ms:
+            return False
+
+        if not self._mid_cycle:
+            for dependency in self._depends_on:
+                if 0 == dependency.cycles or dependency.busy:
+                    return False
+        return True
+
+    def start(self, now_ms):
+        """
+        Start the audit
+        """
+        self._audit_id += 1
+        self._in_flight = True
+        self._start_ms = now_ms
+        self._start_audit(self._audit_id)
+
+    def complete(self, success, more_pages=False):
+        """
+        Audit request completed, more pages are requested right away
+        """
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        elapsed_ms = now_ms - self._start_ms
+        histogram.add_histogram_data("audit-nfvi-%s (latency)" % self._name,
+                                     elapsed_ms, "ms")
+        self._in_flight = False
+        self._mid_cycle = more_pages
+        if more_pages:
+            self._next_audit_ms = now_ms
+            return
+
+        if success:
+            if self._last_success_ms is not None:
+                histogram.add_histogram_data(
+                    "audit-nfvi-%s (staleness)" % self._name,
+                    (now_ms - self._last_success_ms) / 1000, "secs")
+            self._last_success_ms = now_ms
+
+        self._cycles += 1
+        self._next_audit_ms = now_ms + self._interval_ms
+
+    def check_timeout(self, now_ms):
+        """
+        Abandon the outstanding request if it has taken too long, a late
+        response is ignored
+        """
+        if not self._in_flight or now_ms - self._start_ms < self._timeout_ms:
+            return
+
+        DLOG.error("Audit-%s timed out after %s ms, audit_id=%s."
+                   % (self._name, now_ms - self._start_ms, self._audit_id))
+        self._audit_id += 1
+        if self._paging is not None:
+            self._paging.first_page()
+            self._paging.set_page_request_id()
+        self.complete(False)
+
+
+def _audit_is_stale(name, audit_id):
+    """
+    Returns true if an audit response is no longer expected
+    """
+    audit = _nfvi_audits.get(name, None)
+    if audit is None or not audit.is_current(audit_id):
+        DLOG.info("Audit-%s ignoring stale response, audit_id=%s."
+                  % (name, audit_id))
+        return True
+    return False
+
+
+def _audit_complete(name, success, more_pages=False):
+    """
+    Mark an audit request as complete
+    """
+    audit = _nfvi_audits.get(name, None)
+    if audit is not None:
+        audit.complete(success, more_pages)
+
 
 _nfvi_hypervisors_to_audit = collections.OrderedDict()
 
@@ -32,23 +275,29 @@ _nfvi_instance_types_outstanding = collections.OrderedDict()
 
 _deletable_instances = None
 _nfvi_instances_paging = nfvi.objects.v1.Paging(page_limit=32)
+_nfvi_instances_watermark = _AuditWatermark('instances', _nfvi_instances_paging)
 _nfvi_instances_to_audit = collections.OrderedDict()
 _nfvi_instance_outstanding = collections.OrderedDict()
+_nfvi_instances_sweep_cycles = 0
 
 _deletable_images = None
 _nfvi_images_paging = nfvi.objects.v1.Paging(page_limit=32)
+_nfvi_images_watermark = _AuditWatermark('images', _nfvi_images_paging)
 
 _added_volumes = None
 _deletable_volumes = None
 _nfvi_volumes_paging = nfvi.objects.v1.Paging(page_limit=32)
+_nfvi_volumes_watermark = _AuditWatermark('volumes', _nfvi_volumes_paging)
 _nfvi_volumes_to_audit = collections.OrderedDict()
 _nfvi_volumes_outstanding = collections.OrderedDict()
 
 _deletable_subnets = None
 _nfvi_subnets_paging = nfvi.objects.v1.Paging(page_limit=32)
+_nfvi_subnets_watermark = _AuditWatermark('subnets', _nfvi_subnets_paging)
 
 _deletable_networks = None
 _nfvi_networks_paging = nfvi.objects.v1.Paging(page_limit=32)
+_nfvi_networks_watermark = _AuditWatermark('networks', _nfvi_networks_paging)
 
 _audit_debug_dump_back_off_ms = 0
 _last_audit_debug_dump_ms = 0
@@ -76,19 +325,21 @@ def _audit_dump_debug_info(do_dump=True):
 
 
 @coroutine
-def _audit_nfvi_system_info_callback(timer_id):
+def _audit_nfvi_system_info_callback(audit_id):
     """
     Audit System Information
     """
-    global _main_audit_inprogress
 
     response = (yield)
-    DLOG.verbose("Audit-System callback, responses=%s." % response)
+    if _audit_is_stale('system-info', audit_id):
+        return
+
+    DLOG.verbose("Audit-System callback, responses=%s.", response)
 
     if response['completed']:
         nfvi_system = response['result-data']
         system_table = tables.tables_get_system_table()
-        deletable_systems = list(system_table)
+        deletable_systems = set(system_table)
 
         if nfvi_system is not None:
             system = system_table.get(nfvi_system.name, None)
@@ -105,27 +356,28 @@ def _audit_nfvi_system_info_callback(timer_id):
         DLOG.error("Audit-System callback, not completed, responses=%s."
                    % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('system-info', response['completed'])
 
 
 @coroutine
-def _audit_nfvi_hosts_callback(timer_id):
+def _audit_nfvi_hosts_callback(audit_id):
     """
     Audit Hosts
     """
-    global _main_audit_inprogress
 
     response = (yield)
-    DLOG.verbose("Audit-Hosts callback, responses=%s." % response)
+    if _audit_is_stale('hosts', audit_id):
+        return
+
+    DLOG.verbose("Audit-Hosts callback, responses=%s.", response)
 
     if response['completed']:
         host_table = tables.tables_get_host_table()
-        deletable_host_groups = list(host_table)
+        deletable_host_groups = set(host_table)
 
         for host_name in response['incomplete-hosts']:
             if host_name in deletable_host_groups:
-                deletable_host_groups.remove(host_name)
+                deletable_host_groups.discard(host_name)
                 DLOG.info("Not deleting host %s, incomplete information "
                           "returned." % host_name)
 
@@ -157,14 +409,14 @@ def _audit_nfvi_hosts_callback(timer_id):
 
         # Manage host groups
         host_group_table = tables.tables_get_host_group_table()
-        deletable_host_groups = list(host_group_table)
+        deletable_host_groups = set(host_group_table)
 
         for host_name in response['incomplete-hosts']:
             host_group = next((x for x in host_group_table
                                if host_name in x.member_names), None)
             if host_group is not None:
                 if host_group.name in deletable_host_groups:
-                    deletable_host_groups.remove(host_group.name)
+                    deletable_host_groups.discard(host_group.name)
                     DLOG.info("Not deleting host group %s, incomplete information "
                               "returned for host %s." % (host_group.name,
                                                          host_name))
@@ -186,23 +438,24 @@ def _audit_nfvi_hosts_callback(timer_id):
         DLOG.error("Audit-Hosts callback, not completed, responses=%s."
                    % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('hosts', response['completed'])
 
 
 @coroutine
-def _audit_nfvi_host_aggregates_callback(timer_id):
+def _audit_nfvi_host_aggregates_callback(audit_id):
     """
     Audit Host Aggregates
     """
-    global _main_audit_inprogress
 
     response = (yield)
-    DLOG.verbose("Audit-Host Aggregates callback, responses=%s." % response)
+    if _audit_is_stale('host-aggregates', audit_id):
+        return
+
+    DLOG.verbose("Audit-Host Aggregates callback, responses=%s.", response)
 
     if response['completed']:
         host_aggregate_table = tables.tables_get_host_aggregate_table()
-        deletable_host_aggregates = list(host_aggregate_table)
+        deletable_host_aggregates = set(host_aggregate_table)
 
         for nfvi_host_aggregate in response['result-data']:
             host_aggregate = host_aggregate_table.get(
@@ -212,36 +465,36 @@ def _audit_nfvi_host_aggregates_callback(timer_id):
                 host_aggregate_table[host_aggregate.name] = host_aggregate
             else:
                 host_aggregate.nfvi_host_aggregate_update(nfvi_host_aggregate)
-                if nfvi_host_aggregate.name in deletable_host_aggregates:
-                    deletable_host_aggregates.remove(nfvi_host_aggregate.name)
+                deletable_host_aggregates.discard(nfvi_host_aggregate.name)
 
         for host_aggregate_name in deletable_host_aggregates:
-            if host_aggregate_name in list(host_aggregate_table):
+            if host_aggregate_name in host_aggregate_table:
                 del host_aggregate_table[host_aggregate_name]
 
     else:
         DLOG.error("Audit-Host Aggregates callback, not completed, responses=%s."
                    % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('host-aggregates', response['completed'])
 
 
 @coroutine
-def _audit_nfvi_hypervisors_callback(timer_id):
+def _audit_nfvi_hypervisors_callback(audit_id):
     """
     Audit Hypervisors
     """
-    global _main_audit_inprogress
     global _nfvi_hypervisors_to_audit
 
     response = (yield)
-    DLOG.verbose("Audit-Hypervisors callback, response=%s." % response)
+    if _audit_is_stale('hypervisors', audit_id):
+        return
+
+    DLOG.verbose("Audit-Hypervisors callback, response=%s.", response)
 
     trigger_recovery = False
     if response['completed']:
         hypervisor_table = tables.tables_get_hypervisor_table()
-        deletable_hypervisors = list(hypervisor_table)
+        deletable_hypervisors = set(hypervisor_table)
 
         for nfvi_hypervisor in response['result-data']:
             hypervisor = hypervisor_table.get(nfvi_hypervisor.uuid, None)
@@ -273,8 +526,7 @@ def _audit_nfvi_hypervisors_callback(timer_id):
         DLOG.error("Audit-Hypervisors callback, not completed, responses=%s."
                    % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('hypervisors', response['completed'])
 
     if trigger_recovery:
         # Hypervisor is now available, there is potential to recover instances.
@@ -284,18 +536,20 @@ def _audit_nfvi_hypervisors_callback(timer_id):
 
 
 @coroutine
-def _audit_nfvi_tenants_callback(timer_id):
+def _audit_nfvi_tenants_callback(audit_id):
     """
     Audit Tenants
     """
-    global _main_audit_inprogress
 
     response = (yield)
-    DLOG.verbose("Audit-Tenants callback, responses=%s." % response)
+    if _audit_is_stale('tenants', audit_id):
+        return
+
+    DLOG.verbose("Audit-Tenants callback, responses=%s.", response)
 
     if response['completed']:
         tenant_table = tables.tables_get_tenant_table()
-        deletable_tenants = list(tenant_table)
+        deletable_tenants = set(tenant_table)
 
         for nfvi_tenant in response['result-data']:
             tenant = tenant_table.get(nfvi_tenant.uuid, None)
@@ -317,22 +571,25 @@ def _audit_nfvi_tenants_callback(timer_id):
         DLOG.error("Audit-Tenants callback, not completed, responses=%s."
                    % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('tenants', response['completed'])
 
 
 @coroutine
-def _audit_nfvi_instance_types_callback(timer_id):
+def _audit_nfvi_instance_types_callback(audit_id):
     """
     Audit Instance Types
     """
-    global _main_audit_inprogress
     global _deletable_instance_types, _nfvi_instance_types_paging
     global _nfvi_instance_types_to_audit, _nfvi_instance_types_outstanding
 
     response = (yield)
-    DLOG.verbose("Audit-Instance-Types callback, response=%s." % response)
+    if _audit_is_stale('instance-types', audit_id):
+        return
 
+    DLOG.verbose("Audit-Instance-Types callback, response=%s.", response)
+
+    success = False
+    more_pages = False
     if response['completed']:
         if response['page-request-id'] == \
                 _nfvi_instance_types_paging.page_request_id:
@@ -340,7 +597,7 @@ def _audit_nfvi_instance_types_callback(timer_id):
             instance_type_table = tables.tables_get_instance_type_table()
 
             if _deletable_instance_types is None:
-                _deletable_instance_types = list(instance_type_table)
+                _deletable_instance_types = set(instance_type_table)
 
             for nfvi_instance_type in response['result-data']:
                 instance_type = instance_type_table.get(nfvi_instance_type.uuid,
@@ -350,8 +607,7 @@ def _audit_nfvi_instance_types_callback(timer_id):
                                                          nfvi_instance_type.name)
                     instance_type_table[nfvi_instance_type.uuid] = instance_type
                 else:
-                    if nfvi_instance_type.uuid in _deletable_instance_types:
-                        _deletable_instance_types.remove(nfvi_instance_type.uuid)
+                    _deletable_instance_types.discard(nfvi_instance_type.uuid)
 
                 if nfvi_instance_type.uuid not in _nfvi_instance_types_to_audit:
                     _nfvi_instance_types_to_audit[nfvi_instance_type.uuid] \
@@ -375,92 +631,192 @@ def _audit_nfvi_instance_types_callback(timer_id):
                     if instance_type_uuid in _nfvi_instance_types_outstanding:
                         del _nfvi_instance_types_outstanding[instance_type_uuid]
 
-                _deletable_instance_types = list(instance_type_table)
+                _deletable_instance_types = set(instance_type_table)
                 _nfvi_instance_types_paging.first_page()
+                success = True
+            else:
+                more_pages = True
         else:
             DLOG.error("Audit-Instance-Types callback, page-request-id mismatch, "
                        "responses=%s, page-request-id=%s."
                        % (response, _nfvi_instance_types_paging.page_request_id))
             instance_type_table = tables.tables_get_instance_type_table()
-            _deletable_instance_types = list(instance_type_table)
+            _deletable_instance_types = set(instance_type_table)
             _nfvi_instance_types_paging.first_page()
     else:
         DLOG.error("Audit-Instance-Types callback, not completed, "
                    "responses=%s." % response)
         instance_type_table = tables.tables_get_instance_type_table()
-        _deletable_instance_types = list(instance_type_table)
+        _deletable_instance_types = set(instance_type_table)
         _nfvi_instance_types_paging.first_page()
 
     _nfvi_instance_types_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('instance-types', success, more_pages)
+
+
+def _nfvi_instance_changed(instance, nfvi_instance):
+    """
+    Returns true if the listed details of an instance differ from the
+    details last received for it, the time of the last update and an
+    unknown live migration support are not compared
+    """
+    last_nfvi_instance = instance.nfvi_instance
+    for key, value in nfvi_instance.items():
+        last_value = last_nfvi_instance.get(key, None)
+        if 'live_migration_support' == key:
+            if value is None:
+                continue
+        elif 'nfvi_data' == key:
+            if value is not None and last_value is not None:
+                value = dict(value)
+                value.pop('last_update_timestamp', None)
+                last_value = dict(last_value)
+                last_value.pop('last_update_timestamp', None)
+        if value != last_value:
+            return True
+    return False
+
+
+def _audit_nfvi_instances_sweep(instance_table):
+    """
+    Queue every instance for a detailed audit once every so many cycles,
+    the incremental and detailed listings skip instances that look unchanged
+    and would never catch drift in fields the listings do not carry
+    """
+    global _nfvi_instances_sweep_cycles
+
+    if not (_audit_incremental or _audit_instance_detail):
+        return
+
+    if 0 >= _audit_detail_sweep_cycles:
+        return
+
+    _nfvi_instances_sweep_cycles += 1
+    if _audit_detail_sweep_cycles > _nfvi_instances_sweep_cycles:
+        return
+
+    _nfvi_instances_sweep_cycles = 0
+    DLOG.info("Audit-Instances, sweeping %s instances for a detailed audit."
+              % len(instance_table))
+    for instance_uuid, instance in instance_table.items():
+        if instance.nfvi_instance_is_deleted():
+            continue
+        if instance_uuid not in _nfvi_instances_to_audit:
+            _nfvi_instances_to_audit[instance_uuid] = instance.name
+
+
+def _audit_nfvi_instance_details(instance_table, nfvi_instance):
+    """
+    Update an instance from its listed details, returns false if the
+    instance is to be audited on its own instead
+    """
+    instance = instance_table.get(nfvi_instance.uuid, None)
+    if instance is None:
+        # New instances are audited on their own, their ports are needed
+        # to know if they can be live migrated
+        return (nfvi.objects.v1.INSTANCE_AVAIL_STATUS.DELETED
+                in nfvi_instance.avail_status)
+
+    if instance.nfvi_instance_is_deleted() or \
+            instance.nfvi_instance_audit_in_progress:
+        return True
+
+    # An action in progress may be waiting on state the listing does not
+    # carry, leave it to a detailed audit
+    if instance.is_action_running() or instance.action_data.is_inprogress():
+        return False
+
+    if _nfvi_instance_changed(instance, nfvi_instance):
+        DLOG.info("Audit-Instances updating instance %s." % instance.uuid)
+        instance.nfvi_instance_update(nfvi_instance)
+    return True
 
 
 @coroutine
-def _audit_nfvi_instances_callback(timer_id):
+def _audit_nfvi_instances_callback(audit_id):
     """
     Audit Instances
     """
-    global _main_audit_inprogress
     global _deletable_instances, _nfvi_instances_paging
     global _nfvi_instances_to_audit, _nfvi_instance_outstanding
 
     response = (yield)
-    DLOG.verbose("Audit-Instances callback, response=%s." % response)
+    if _audit_is_stale('instances', audit_id):
+        return
+
+    DLOG.verbose("Audit-Instances callback, response=%s.", response)
 
     trigger_recovery = False
+    success = False
+    more_pages = False
     if response['completed']:
         if response['page-request-id'] == _nfvi_instances_paging.page_request_id:
             instance_table = tables.tables_get_instance_table()
 
-            if _deletable_instances is None:
-                _deletable_instances = list(instance_table)
+            if _deletable_instances is None and _nfvi_instances_watermark.full:
+                _deletable_instances = set(instance_table)
+
+            _nfvi_instances_watermark.page_received(len(response['result-data']))
+
+            if _audit_instance_detail:
+                instances = list()
+                for nfvi_instance in response['result-data']:
+                    if _deletable_instances is not None:
+                        _deletable_instances.discard(nfvi_instance.uuid)
+                    if not _audit_nfvi_instance_details(instance_table,
+                                                        nfvi_instance):
+                        instances.append((nfvi_instance.uuid,
+                                          nfvi_instance.name))
+                instances.extend(response.get('incomplete-instances', list()))
+            else:
+                instances = response['result-data']
 
-            for instance_uuid, instance_name in response['result-data']:
-                instance = instance_table.get(instance_uuid, None)
-                if instance is not None:
-                    if instance.uuid in _deletable_instances:
-                        _deletable_instances.remove(instance.uuid)
+            for instance_uuid, instance_name in instances:
+                if _deletable_instances is not None:
+                    _deletable_instances.discard(instance_uuid)
                 if instance_uuid not in _nfvi_instances_to_audit:
                     _nfvi_instances_to_audit[instance_uuid] = instance_name
 
             if _nfvi_instances_paging.done:
-                for instance_uuid in _deletable_instances:
-                    instance = instance_table.get(instance_uuid, None)
-                    if instance is not None:
-                        DLOG.info("Deleting instance %s, audit mismatch"
-                                  % instance_uuid)
-
-                        instance.nfvi_instance_deleted()
-                        if instance.is_deleted():
-                            trigger_recovery = True
-                            del instance_table[instance_uuid]
-                            if instance_uuid in _nfvi_instances_to_audit:
-                                del _nfvi_instances_to_audit[instance_uuid]
-                            if instance_uuid in _nfvi_instance_outstanding:
-                                del _nfvi_instance_outstanding[instance_uuid]
-
-                _deletable_instances = list(instance_table)
+                # Deleted instances are only detected by a full listing
+                if _nfvi_instances_watermark.full:
+                    for instance_uuid in _deletable_instances:
+                        instance = instance_table.get(instance_uuid, None)
+                        if instance is not None:
+                            DLOG.info("Deleting instance %s, audit mismatch"
+                                      % instance_uuid)
+
+                            instance.nfvi_instance_deleted()
+                            if instance.is_deleted():
+                                trigger_recovery = True
+                                del instance_table[instance_uuid]
+                                if instance_uuid in _nfvi_instances_to_audit:
+                                    del _nfvi_instances_to_audit[instance_uuid]
+                                if instance_uuid in _nfvi_instance_outstanding:
+                                    del _nfvi_instance_outstanding[instance_uuid]
+
+                _nfvi_instances_watermark.cycle_complete()
+                _audit_nfvi_instances_sweep(instance_table)
+                _deletable_instances = None
                 _nfvi_instances_paging.first_page()
+                success = True
             else:
                 DLOG.verbose("Paging is not done for instances.")
+                more_pages = True
         else:
             DLOG.error("Audit-Instances callback, page-request-id mismatch, "
                        "responses=%s, page-request-id=%s."
                        % (response, _nfvi_instances_paging.page_request_id))
-            instance_table = tables.tables_get_instance_table()
-            _deletable_instances = list(instance_table)
+            _deletable_instances = None
             _nfvi_instances_paging.first_page()
     else:
         DLOG.error("Audit-Instances callback, not completed, responses=%s."
                    % response)
-        instance_table = tables.tables_get_instance_table()
-        _deletable_instances = list(instance_table)
+        _deletable_instances = None
         _nfvi_instances_paging.first_page()
 
     _nfvi_instances_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('instances', success, more_pages)
 
     if trigger_recovery:
         # Resources have been freed, there is potential to recover instances.
@@ -470,19 +826,21 @@ def _audit_nfvi_instances_callback(timer_id):
 
 
 @coroutine
-def _audit_nfvi_instance_groups_callback(timer_id):
+def _audit_nfvi_instance_groups_callback(audit_id):
     """
     Audit Instance Groups
     """
-    global _main_audit_inprogress
 
     response = (yield)
-    DLOG.verbose("Audit-Instance-Groups callback, response=%s." % response)
+    if _audit_is_stale('instance-groups', audit_id):
+        return
+
+    DLOG.verbose("Audit-Instance-Groups callback, response=%s.", response)
 
     if response['completed']:
         instance_group_table = tables.tables_get_instance_group_table()
 
-        _deletable_instance_groups = list(instance_group_table)
+        _deletable_instance_groups = set(instance_group_table)
 
         for nfvi_instance_group in response['result-data']:
             instance_group = instance_group_table.get(nfvi_instance_group.uuid,
@@ -492,11 +850,10 @@ def _audit_nfvi_instance_groups_callback(timer_id):
                 instance_group_table[nfvi_instance_group.uuid] = instance_group
             else:
                 instance_group.nfvi_instance_group_update(nfvi_instance_group)
-                if nfvi_instance_group.uuid in _deletable_instance_groups:
-                    _deletable_instance_groups.remove(nfvi_instance_group.uuid)
+                _deletable_instance_groups.discard(nfvi_instance_group.uuid)
 
         for instance_group_uuid in _deletable_instance_groups:
-            if instance_group_uuid in list(instance_group_table):
+            if instance_group_uuid in instance_group_table:
                 instance_group = instance_group_table[instance_group_uuid]
                 instance_group.clear_alarms()
                 del instance_group_table[instance_group_uuid]
@@ -505,27 +862,32 @@ def _audit_nfvi_instance_groups_callback(timer_id):
         DLOG.error("Audit-Instance-Groups callback, not completed, "
                    "responses=%s." % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('instance-groups', response['completed'])
 
 
 @coroutine
-def _audit_nfvi_images_callback(timer_id):
+def _audit_nfvi_images_callback(audit_id):
     """
     Audit Images
     """
-    global _main_audit_inprogress
     global _deletable_images, _nfvi_images_paging
 
     response = (yield)
-    DLOG.verbose("Audit-Images callback, response=%s." % response)
+    if _audit_is_stale('images', audit_id):
+        return
+
+    DLOG.verbose("Audit-Images callback, response=%s.", response)
 
+    success = False
+    more_pages = False
     if response['completed']:
         if response['page-request-id'] == _nfvi_images_paging.page_request_id:
             image_table = tables.tables_get_image_table()
 
-            if _deletable_images is None:
-                _deletable_images = list(image_table)
+            if _deletable_images is None and _nfvi_images_watermark.full:
+                _deletable_images = set(image_table)
+
+            _nfvi_images_watermark.page_received(len(response['result-data']))
 
             for nfvi_image in response['result-data']:
                 image = image_table.get(nfvi_image.uuid, None)
@@ -534,132 +896,138 @@ def _audit_nfvi_images_callback(timer_id):
                     image_table[nfvi_image.uuid] = image
                 else:
                     if not image.is_deleted():
-                        if nfvi_image.uuid in _deletable_images:
-                            _deletable_images.remove(nfvi_image.uuid)
+                        if _deletable_images is not None:
+                            _deletable_images.discard(nfvi_image.uuid)
                 image.nfvi_image_update(nfvi_image)
 
             if _nfvi_images_paging.done:
-                for image_uuid in _deletable_images:
-                    image = image_table.get(image_uuid, None)
-                    image.nfvi_image_deleted()
-                    if image.is_deleted():
-                        del image_table[image_uuid]
-
-                _deletable_images = list(image_table)
+                # Deleted images are only detected by a full listing
+                if _nfvi_images_watermark.full:
+                    for image_uuid in _deletable_images:
+                        image = image_table.get(image_uuid, None)
+                        image.nfvi_image_deleted()
+                        if image.is_deleted():
+                            del image_table[image_uuid]
+
+                _nfvi_images_watermark.cycle_complete()
+                _deletable_images = None
                 _nfvi_images_paging.first_page()
+                success = True
+            else:
+                more_pages = True
         else:
             DLOG.error("Audit-Images callback, page-request-id mismatch, "
                        "responses=%s, page-request-id=%s."
                        % (response, _nfvi_images_paging.page_request_id))
-            image_table = tables.tables_get_image_table()
-            _deletable_images = list(image_table)
+            _deletable_images = None
             _nfvi_images_paging.first_page()
     else:
         DLOG.error("Audit-Images callback, not completed, responses=%s."
                    % response)
-        image_table = tables.tables_get_image_table()
-        _deletable_images = list(image_table)
+        _deletable_images = None
         _nfvi_images_paging.first_page()
 
     _nfvi_images_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('images', success, more_pages)
 
 
 @coroutine
-def _audit_nfvi_volumes_callback(timer_id):
+def _audit_nfvi_volumes_callback(audit_id):
     """
     Audit Volumes
     """
-    global _main_audit_inprogress
     global _added_volumes, _deletable_volumes, _nfvi_volumes_paging
     global _nfvi_volumes_to_audit, _nfvi_volumes_outstanding
 
     response = (yield)
-    DLOG.verbose("Audit-Volumes callback, response=%s." % response)
+    if _audit_is_stale('volumes', audit_id):
+        return
 
+    DLOG.verbose("Audit-Volumes callback, response=%s.", response)
+
+    success = False
+    more_pages = False
     if response['completed']:
         if response['page-request-id'] == _nfvi_volumes_paging.page_request_id:
             volume_table = tables.tables_get_volume_table()
 
             if _added_volumes is None:
-                _added_volumes = list()
+                _added_volumes = set()
+
+            if _deletable_volumes is None and _nfvi_volumes_watermark.full:
+                _deletable_volumes = set(volume_table)
 
-            if _deletable_volumes is None:
-                _deletable_volumes = list(volume_table)
+            _nfvi_volumes_watermark.page_received(len(response['result-data']))
 
             for volume_uuid, volume_name in response['result-data']:
-                volume = volume_table.get(volume_uuid, None)
-                if volume is not None:
-                    if volume.uuid in _deletable_volumes:
-                        _deletable_volumes.remove(volume.uuid)
+                if _deletable_volumes is not None:
+                    _deletable_volumes.discard(volume_uuid)
                 if volume_uuid not in _nfvi_volumes_to_audit:
                     _nfvi_volumes_to_audit[volume_uuid] = volume_name
-                    _added_volumes.append(volume_uuid)
+                    _added_volumes.add(volume_uuid)
 
             if _nfvi_volumes_paging.done:
-                for volume_uuid in _deletable_volumes:
-                    volume = volume_table[volume_uuid]
-                    volume.nfvi_volume_deleted()
-                    if volume.is_deleted():
-                        del volume_table[volume_uuid]
-                        if volume_uuid in _nfvi_volumes_to_audit:
-                            del _nfvi_volumes_to_audit[volume_uuid]
-                        if volume_uuid in _nfvi_volumes_outstanding:
-                            del _nfvi_volumes_outstanding[volume_uuid]
-
-                for volume_uuid in _nfvi_volumes_to_audit:
-                    if volume_uuid not in _added_volumes:
-                        volume = volume_table.get(volume_uuid, None)
-                        if volume is None:
-                            del _nfvi_volumes_to_audit[volume_uuid]
+                # Deleted volumes are only detected by a full listing
+                if _nfvi_volumes_watermark.full:
+                    for volume_uuid in _deletable_volumes:
+                        volume = volume_table[volume_uuid]
+                        volume.nfvi_volume_deleted()
+                        if volume.is_deleted():
+                            del volume_table[volume_uuid]
+                            if volume_uuid in _nfvi_volumes_to_audit:
+                                del _nfvi_volumes_to_audit[volume_uuid]
                             if volume_uuid in _nfvi_volumes_outstanding:
                                 del _nfvi_volumes_outstanding[volume_uuid]
 
-                _added_volumes[:] = []
-                _deletable_volumes = list(volume_table)
+                    for volume_uuid in list(_nfvi_volumes_to_audit):
+                        if volume_uuid not in _added_volumes:
+                            volume = volume_table.get(volume_uuid, None)
+                            if volume is None:
+                                del _nfvi_volumes_to_audit[volume_uuid]
+                                if volume_uuid in _nfvi_volumes_outstanding:
+                                    del _nfvi_volumes_outstanding[volume_uuid]
+
+                _nfvi_volumes_watermark.cycle_complete()
+                _added_volumes.clear()
+                _deletable_volumes = None
                 _nfvi_volumes_paging.first_page()
+                success = True
+            else:
+                more_pages = True
         else:
             DLOG.error("Audit-Volumes callback, page-request-id mismatch, "
                        "responses=%s, page-request-id=%s."
                        % (response, _nfvi_volumes_paging.page_request_id))
-            volume_table = tables.tables_get_volume_table()
-            if _added_volumes is None:
-                _added_volumes = list()
-            else:
-                _added_volumes[:] = []
-            _deletable_volumes = list(volume_table)
+            _added_volumes = set()
+            _deletable_volumes = None
             _nfvi_volumes_paging.first_page()
     else:
         DLOG.error("Audit-Volumes callback, not completed, responses=%s."
                    % response)
-        volume_table = tables.tables_get_volume_table()
-        if _added_volumes is None:
-            _added_volumes = list()
-        else:
-            _added_volumes[:] = []
-        _deletable_volumes = list(volume_table)
+        _added_volumes = set()
+        _deletable_volumes = None
         _nfvi_volumes_paging.first_page()
 
     _nfvi_volumes_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('volumes', success, more_pages)
 
 
 @coroutine
-def _audit_nfvi_volume_snapshots_callback(timer_id):
+def _audit_nfvi_volume_snapshots_callback(audit_id):
     """
     Audit Volume Snapshots
     """
-    global _main_audit_inprogress
 
     response = (yield)
-    DLOG.verbose("Audit-Volume-Snapshots callback, response=%s." % response)
+    if _audit_is_stale('volume-snapshots', audit_id):
+        return
+
+    DLOG.verbose("Audit-Volume-Snapshots callback, response=%s.", response)
 
     if response['completed']:
         volume_snapshot_table = tables.tables_get_volume_snapshot_table()
 
-        _deletable_volume_snapshots = list(volume_snapshot_table)
+        _deletable_volume_snapshots = set(volume_snapshot_table)
 
         for nfvi_volume_snapshot in response['result-data']:
             volume_snapshot = volume_snapshot_table.get(nfvi_volume_snapshot.uuid,
@@ -669,37 +1037,41 @@ def _audit_nfvi_volume_snapshots_callback(timer_id):
                 volume_snapshot_table[nfvi_volume_snapshot.uuid] = volume_snapshot
             else:
                 volume_snapshot.nfvi_volume_snapshot_update(nfvi_volume_snapshot)
-                if nfvi_volume_snapshot.uuid in _deletable_volume_snapshots:
-                    _deletable_volume_snapshots.remove(nfvi_volume_snapshot.uuid)
+                _deletable_volume_snapshots.discard(nfvi_volume_snapshot.uuid)
 
         for volume_snapshot_uuid in _deletable_volume_snapshots:
-            if volume_snapshot_uuid in list(volume_snapshot_table):
+            if volume_snapshot_uuid in volume_snapshot_table:
                 del volume_snapshot_table[volume_snapshot_uuid]
 
     else:
         DLOG.error("Audit-Volume-Snapshots callback, not completed, "
                    "responses=%s." % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('volume-snapshots', response['completed'])
 
 
 @coroutine
-def _audit_nfvi_subnets_callback(timer_id):
+def _audit_nfvi_subnets_callback(audit_id):
     """
     Audit Subnets
     """
-    global _main_audit_inprogress
     global _deletable_subnets, _nfvi_subnets_paging
 
     response = (yield)
-    DLOG.verbose("Audit-Subnets callback, response=%s." % response)
+    if _audit_is_stale('subnets', audit_id):
+        return
+
+    DLOG.verbose("Audit-Subnets callback, response=%s.", response)
+    success = False
+    more_pages = False
     if response['completed']:
         if response['page-request-id'] == _nfvi_subnets_paging.page_request_id:
             subnet_table = tables.tables_get_subnet_table()
 
-            if _deletable_subnets is None:
-                _deletable_subnets = list(subnet_table)
+            if _deletable_subnets is None and _nfvi_subnets_watermark.full:
+                _deletable_subnets = set(subnet_table)
+
+            _nfvi_subnets_watermark.page_received(len(response['result-data']))
 
             for nfvi_subnet in response['result-data']:
                 subnet = subnet_table.get(nfvi_subnet.uuid, None)
@@ -714,52 +1086,61 @@ def _audit_nfvi_subnets_callback(timer_id):
                     subnet_table[nfvi_subnet.uuid] = subnet
                 else:
                     subnet.is_dhcp_enabled = nfvi_subnet.is_dhcp_enabled
-                    if nfvi_subnet.uuid in _deletable_subnets:
-                        _deletable_subnets.remove(nfvi_subnet.uuid)
+                    if _deletable_subnets is not None:
+                        _deletable_subnets.discard(nfvi_subnet.uuid)
 
             if _nfvi_subnets_paging.done:
-                for subnet_uuid in _deletable_subnets:
-                    if subnet_uuid in list(subnet_table):
-                        del subnet_table[subnet_uuid]
-
-                _deletable_subnets = list(subnet_table)
+                # Deleted subnets are only detected by a full listing
+                if _nfvi_subnets_watermark.full:
+                    for subnet_uuid in _deletable_subnets:
+                        if subnet_uuid in subnet_table:
+                            del subnet_table[subnet_uuid]
+
+                _nfvi_subnets_watermark.cycle_complete()
+                _deletable_subnets = None
                 _nfvi_subnets_paging.first_page()
+                success = True
+            else:
+                more_pages = True
         else:
             DLOG.error("Audit-Subnets callback, page-request-id mismatch, "
                        "responses=%s, page-request-id=%s."
                        % (response, _nfvi_subnets_paging.page_request_id))
-            subnet_table = tables.tables_get_subnet_table()
-            _deletable_subnets = list(subnet_table)
+            _deletable_subnets = None
             _nfvi_subnets_paging.first_page()
     else:
         DLOG.error("Audit-Subnets callback, not completed, responses=%s."
                    % response)
-        subnet_table = tables.tables_get_subnet_table()
-        _deletable_subnets = list(subnet_table)
+        _deletable_subnets = None
         _nfvi_subnets_paging.first_page()
 
     _nfvi_subnets_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_complete('subnets', success, more_pages)
 
 
 @coroutine
-def _audit_nfvi_networks_callback(timer_id):
+def _audit_nfvi_networks_callback(audit_id):
     """
     Audit Networks
     """
-    global _main_audit_inprogress
     global _deletable_networks, _nfvi_networks_paging
 
     response = (yield)
-    DLOG.verbose("Audit-Networks callback, response=%s." % response)
+    if _audit_is_stale('networks', audit_id):
+        return
+
+    DLOG.verbose("Audit-Networks callback, response=%s.", response)
 
+    success = False
+    more_pages = False
     if response['completed']:
         if response['page-request-id'] == _nfvi_networks_paging.page_request_id:
             network_table = tables.tables_get_network_table()
 
-            if _deletable_networks is None:
-                _deletable_networks = list(network_table)
+            if _deletable_networks is None and _nfvi_networks_watermark.full:
+                _deletable_networks = set(network_table)
+
+            _nfvi_networks_watermark.page_received(len(response['result-data']))
 
             for nfvi_network in response['result-data']:
                 network = network_table.get(nfvi_network.uuid, None)
@@ -780,156 +1161,205 @@ def _audit_nfvi_networks_callback(timer_id):
                     network.is_shared = nfvi_network.is_shared
                     network.provider_data = nfvi_network.provider_data
 
-                    if nfvi_network.uuid in _deletable_networks:
-                        _deletable_networks.remove(nfvi_network.uuid)
+                    if _deletable_networks is not None:
+                        _deletable_networks.discard(nfvi_network.uuid)
 
             if _nfvi_networks_paging.done:
-                for network_uuid in _deletable_networks:
-                    if network_uuid in list(network_table):
-                        del network_table[network_uuid]
-
-                _deletable_networks = list(network_table)
+                # Deleted networks are only detected by a full listing
+                if _nfvi_networks_watermark.full:
+                    for network_uuid in _deletable_networks:
+                        if network_uuid in network_table:
+                            del network_table[network_uuid]
+
+                _nfvi_networks_watermark.cycle_complete()
+                _deletable_networks = None
                 _nfvi_networks_paging.first_page()
+                success = True
+            else:
+                more_pages = True
         else:
             DLOG.error("Audit-Networks callback, page-request-id mismatch, "
                        "responses=%s, page-request-id=%s."
                        % (response, _nfvi_networks_paging.page_request_id))
-            network_table = tables.tables_get_network_table()
-            _deletable_networks = list(network_table)
+            _deletable_networks = None
             _nfvi_networks_paging.first_page()
     else:
         DLOG.error("Audit-Networks callback, not completed, responses=%s."
                    % response)
-        network_table = tables.tables_get_network_table()
-        _deletable_networks = list(network_table)
+        _deletable_networks = None
         _nfvi_networks_paging.first_page()
 
     _nfvi_networks_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 20)  # 20 seconds later
+    _audit_complete('networks', success, more_pages)
 
 
-@timers.interval_timer('audit_nfvi', initial_delay_secs=1, interval_secs=1)
-def _audit_nfvi():
+def _audit_nfvi_system_info(audit_id):
     """
-    Audit NFVI
+    Audit System Information
     """
-    global _main_audit_inprogress
+    DLOG.verbose("Audit system information called, audit_id=%s.", audit_id)
+    nfvi.nfvi_get_system_info(_audit_nfvi_system_info_callback(audit_id))
 
-    while True:
-        timer_id = (yield)
 
-        DLOG.verbose("Audit system information called, timer_id=%s."
-                     % timer_id)
-        nfvi.nfvi_get_system_info(_audit_nfvi_system_info_callback(timer_id))
-
-        _main_audit_inprogress = True
-        while _main_audit_inprogress:
-            timer_id = (yield)
-
-        DLOG.verbose("Audit hosts called, timer_id=%s." % timer_id)
-        nfvi.nfvi_get_hosts(_audit_nfvi_hosts_callback(timer_id))
-
-        _main_audit_inprogress = True
-        while _main_audit_inprogress:
-            timer_id = (yield)
+def _audit_nfvi_hosts(audit_id):
+    """
+    Audit Hosts
+    """
+    DLOG.verbose("Audit hosts called, audit_id=%s.", audit_id)
+    nfvi.nfvi_get_hosts(_audit_nfvi_hosts_callback(audit_id))
 
-        if not nfvi.nfvi_compute_plugin_disabled():
-            DLOG.verbose("Audit host aggregates called, timer_id=%s."
-                         % timer_id)
-            nfvi.nfvi_get_host_aggregates(
-                _audit_nfvi_host_aggregates_callback(timer_id))
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+def _audit_nfvi_host_aggregates(audit_id):
+    """
+    Audit Host Aggregates
+    """
+    DLOG.verbose("Audit host aggregates called, audit_id=%s.", audit_id)
+    nfvi.nfvi_get_host_aggregates(
+        _audit_nfvi_host_aggregates_callback(audit_id))
 
-            DLOG.verbose("Audit hypervisors called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_hypervisors(
-                _audit_nfvi_hypervisors_callback(timer_id))
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+def _audit_nfvi_hypervisors(audit_id):
+    """
+    Audit Hypervisors
+    """
+    DLOG.verbose("Audit hypervisors called, audit_id=%s.", audit_id)
+    nfvi.nfvi_get_hypervisors(_audit_nfvi_hypervisors_callback(audit_id))
 
-        DLOG.verbose("Audit tenants called, timer_id=%s." % timer_id)
-        nfvi.nfvi_get_tenants(_audit_nfvi_tenants_callback(timer_id))
 
-        _main_audit_inprogress = True
-        while _main_audit_inprogress:
-            timer_id = (yield)
+def _audit_nfvi_tenants(audit_id):
+    """
+    Audit Tenants
+    """
+    DLOG.verbose("Audit tenants called, audit_id=%s.", audit_id)
+    nfvi.nfvi_get_tenants(_audit_nfvi_tenants_callback(audit_id))
 
-        if not nfvi.nfvi_compute_plugin_disabled():
-            DLOG.verbose("Audit instance types called, timer_id=%s."
-                         % timer_id)
-            nfvi.nfvi_get_instance_types(
-                _nfvi_instance_types_paging,
-                _audit_nfvi_instance_types_callback(timer_id))
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+def _audit_nfvi_instance_types(audit_id):
+    """
+    Audit Instance Types
+    """
+    DLOG.verbose("Audit instance types called, audit_id=%s.", audit_id)
+    nfvi.nfvi_get_instance_types(_nfvi_instance_types_paging,
+                                 _audit_nfvi_instance_types_callback(audit_id))
 
-            DLOG.info("Audit instances called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_instances(_nfvi_instances_paging,
-                                    _audit_nfvi_instances_callback(timer_id))
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+def _audit_nfvi_instances(audit_id):
+    """
+    Audit Instances
+    """
+    DLOG.info("Audit instances called, audit_id=%s." % audit_id)
+    _nfvi_instances_watermark.begin_page()
+    if _audit_instance_detail:
+        nfvi.nfvi_get_instances_detail(
+            _nfvi_instances_paging, _audit_nfvi_instances_callback(audit_id))
+    else:
+        nfvi.nfvi_get_instances(_nfvi_instances_paging,
+                                _audit_nfvi_instances_callback(audit_id))
 
-            DLOG.verbose("Audit instance groups called, timer_id=%s."
-                         % timer_id)
-            nfvi.nfvi_get_instance_groups(
-                _audit_nfvi_instance_groups_callback(timer_id))
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+def _audit_nfvi_instance_groups(audit_id):
+    """
+    Audit Instance Groups
+    """
+    DLOG.verbose("Audit instance groups called, audit_id=%s.", audit_id)
+    nfvi.nfvi_get_instance_groups(
+        _audit_nfvi_instance_groups_callback(audit_id))
 
-        if not nfvi.nfvi_image_plugin_disabled():
-            DLOG.verbose("Audit images called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_images(_nfvi_images_paging,
-                                 _audit_nfvi_images_callback(timer_id))
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+def _audit_nfvi_images(audit_id):
+    """
+    Audit Images
+    """
+    DLOG.verbose("Audit images called, audit_id=%s.", audit_id)
+    _nfvi_images_watermark.begin_page()
+    nfvi.nfvi_get_images(_nfvi_images_paging,
+                         _audit_nfvi_images_callback(audit_id))
 
-        if not nfvi.nfvi_block_storage_plugin_disabled():
-            DLOG.verbose("Audit volumes called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_volumes(_nfvi_volumes_paging,
-                                  _audit_nfvi_volumes_callback(timer_id))
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+def _audit_nfvi_volumes(audit_id):
+    """
+    Audit Volumes
+    """
+    DLOG.verbose("Audit volumes called, audit_id=%s.", audit_id)
+    _nfvi_volumes_watermark.begin_page()
+    nfvi.nfvi_get_volumes(_nfvi_volumes_paging,
+                          _audit_nfvi_volumes_callback(audit_id))
 
-            DLOG.verbose("Audit volume snapshots called, timer_id=%s."
-                         % timer_id)
-            nfvi.nfvi_get_volume_snapshots(
-                _audit_nfvi_volume_snapshots_callback(timer_id))
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+def _audit_nfvi_volume_snapshots(audit_id):
+    """
+    Audit Volume Snapshots
+    """
+    DLOG.verbose("Audit volume snapshots called, audit_id=%s.", audit_id)
+    nfvi.nfvi_get_volume_snapshots(
+        _audit_nfvi_volume_snapshots_callback(audit_id))
+
+
+def _audit_nfvi_subnets(audit_id):
+    """
+    Audit Subnets
+    """
+    DLOG.verbose("Audit subnets called, audit_id=%s.", audit_id)
+    _nfvi_subnets_watermark.begin_page()
+    nfvi.nfvi_get_subnets(_nfvi_subnets_paging,
+                          _audit_nfvi_subnets_callback(audit_id))
+
+
+def _audit_nfvi_networks(audit_id):
+    """
+    Audit Networks
+    """
+    DLOG.verbose("Audit networks called, audit_id=%s.", audit_id)
+    _nfvi_networks_watermark.begin_page()
+    nfvi.nfvi_get_networks(_nfvi_networks_paging,
+                           _audit_nfvi_networks_callback(audit_id))
 
-        if not nfvi.nfvi_network_plugin_disabled():
-            DLOG.verbose("Audit subnets called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_subnets(_nfvi_subnets_paging,
-                                  _audit_nfvi_subnets_callback(timer_id))
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+@timers.interval_timer('audit_nfvi', initial_delay_secs=1, interval_secs=1)
+def _audit_nfvi():
+    """
+    Audit NFVI, starts each resource audit that is due, the audits run
+    concurrently on the plugin task workers
+    """
+    while True:
+        timer_id = (yield)
+        DLOG.verbose("Audit NFVI called, timer_id=%s.", timer_id)
 
-            DLOG.verbose("Audit networks called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_networks(_nfvi_networks_paging,
-                                   _audit_nfvi_networks_callback(timer_id))
+        now_ms = timers.get_monotonic_timestamp_in_ms()
 
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = (yield)
+        for audit in _nfvi_audits.values():
+            audit.check_timeout(now_ms)
+
+        for audit in _nfvi_audits.values():
+            if audit.ready(now_ms):
+                audit.start(now_ms)
+
+
+def _audit_nfvi_register(name, start_audit, interval_secs, depends_on=None,
+                         paging=None):
+    """
+    Register an audit of a type of resource, the interval and timeout can
+    be overridden in the nfvi-audit configuration section
+    """
+    timeout_secs = _audit_timeout_secs
+
+    if config.section_exists('nfvi-audit'):
+        section = config.CONF['nfvi-audit']
+        option_name = name.replace('-', '_')
+        interval_secs = int(section.get('%s_interval_secs' % option_name,
+                                        interval_secs))
+        timeout_secs = int(section.get('%s_timeout_secs' % option_name,
+                                       timeout_secs))
+
+    dependencies = list()
+    if depends_on is not None:
+        for dependency_name in depends_on:
+            dependency = _nfvi_audits.get(dependency_name, None)
+            if dependency is not None:
+                dependencies.append(dependency)
+
+    _nfvi_audits[name] = _NFVIAudit(name, start_audit, interval_secs,
+                                    timeout_secs, dependencies, paging)
 
 
 @coroutine
@@ -980,10 +1410,10 @@ def _audit_nfvi_instance():
 
     while True:
         timer_id = (yield)
-        DLOG.verbose("Audit instance called, timer_id=%s." % timer_id)
+        DLOG.verbose("Audit instance called, timer_id=%s.", timer_id)
 
         instance_table = tables.tables_get_instance_table()
-        for instance_uuid in _nfvi_instance_outstanding.keys():
+        for instance_uuid in list(_nfvi_instance_outstanding):
             instance = instance_table.get(instance_uuid, None)
             if instance is None:
                 del _nfvi_instance_outstanding[instance_uuid]
@@ -995,7 +1425,7 @@ def _audit_nfvi_instance():
         else:
             _audit_dump_debug_info(do_dump=False)
 
-        for instance_uuid in _nfvi_instances_to_audit.keys():
+        for instance_uuid in list(_nfvi_instances_to_audit):
             if 4 <= len(_nfvi_instance_outstanding):
                 break
 
@@ -1024,7 +1454,7 @@ def _audit_nfvi_hypervisor_callback():
     Audit Hypervisor
     """
     response = (yield)
-    DLOG.verbose("Audit-Hypervisor callback, response=%s." % response)
+    DLOG.verbose("Audit-Hypervisor callback, response=%s.", response)
 
     if response['completed']:
         nfvi_hypervisor = response['result-data']
@@ -1050,7 +1480,7 @@ def _audit_nfvi_hypervisor_details():
 
     while True:
         timer_id = (yield)
-        DLOG.verbose("Audit hypervisor details called, timer_id=%s." % timer_id)
+        DLOG.verbose("Audit hypervisor details called, timer_id=%s.", timer_id)
 
         for hypervisor_uuid in _nfvi_hypervisors_to_audit.keys():
             nfvi.nfvi_get_hypervisor(hypervisor_uuid,
@@ -1067,7 +1497,7 @@ def _audit_nfvi_instance_type_callback(instance_type_uuid):
     global _nfvi_instance_types_outstanding
 
     response = (yield)
-    DLOG.verbose("Audit-Instance-Type callback, response=%s." % response)
+    DLOG.verbose("Audit-Instance-Type callback, response=%s.", response)
 
     if instance_type_uuid in _nfvi_instance_types_outstanding:
         del _nfvi_instance_types_outstanding[instance_type_uuid]
@@ -1103,8 +1533,8 @@ def _audit_nfvi_instance_type_details():
 
     while True:
         timer_id = (yield)
-        DLOG.verbose("Audit instance type details called, timer_id=%s."
-                     % timer_id)
+        DLOG.verbose("Audit instance type details called, timer_id=%s.",
+                     timer_id)
 
         for instance_type_uuid in _nfvi_instance_types_outstanding.keys():
             instance_type_table = tables.tables_get_instance_type_table()
@@ -1134,7 +1564,7 @@ def _audit_nfvi_volume_callback(volume_uuid):
     global _nfvi_volumes_outstanding
 
     response = (yield)
-    DLOG.verbose("Audit-Volume callback, response=%s." % response)
+    DLOG.verbose("Audit-Volume callback, response=%s.", response)
 
     if volume_uuid in _nfvi_volumes_outstanding:
         del _nfvi_volumes_outstanding[volume_uuid]
@@ -1163,7 +1593,7 @@ def _audit_nfvi_volume():
 
     while True:
         timer_id = (yield)
-        DLOG.verbose("Audit volume called, timer_id=%s." % timer_id)
+        DLOG.verbose("Audit volume called, timer_id=%s.", timer_id)
 
         for volume_uuid in _nfvi_volumes_outstanding.keys():
             volume_table = tables.tables_get_volume_table()
@@ -1175,7 +1605,7 @@ def _audit_nfvi_volume():
             if 4 <= len(_nfvi_volumes_outstanding):
                 break
 
-            DLOG.verbose("Auditing volume %s." % volume_uuid)
+            DLOG.verbose("Auditing volume %s.", volume_uuid)
             nfvi.nfvi_get_volume(volume_uuid,
                                  _audit_nfvi_volume_callback(volume_uuid))
 
@@ -1191,7 +1621,7 @@ def _audit_nfvi_guest_services_callback():
     Audit Guest Services
     """
     response = (yield)
-    DLOG.verbose("Audit-Guest-Services callback, response=%s." % response)
+    DLOG.verbose("Audit-Guest-Services callback, response=%s.", response)
 
     if response['completed']:
         result_data = response.get('result-data', None)
@@ -1218,7 +1648,7 @@ def _audit_nfvi_guest_services():
     """
     while True:
         timer_id = (yield)
-        DLOG.verbose("Audit guest services called, timer_id=%s." % timer_id)
+        DLOG.verbose("Audit guest services called, timer_id=%s.", timer_id)
         instance_table = tables.tables_get_instance_table()
         for instance_uuid in instance_table.keys():
             instance = instance_table[instance_uuid]
@@ -1233,6 +1663,79 @@ def vim_nfvi_audits_initialize():
     """
     Initialize nfvi audits
     """
+    global _audit_incremental, _audit_full_reconcile_cycles
+    global _audit_changes_since_skew_secs, _audit_timeout_secs
+    global _audit_instance_detail, _audit_detail_sweep_cycles
+
+    if config.section_exists('nfvi-audit'):
+        section = config.CONF['nfvi-audit']
+        _audit_timeout_secs = int(section.get('timeout_secs', 120))
+        _audit_incremental = \
+            section.get('incremental', 'true') in ['True', 'true']
+        _audit_full_reconcile_cycles = int(
+            section.get('full_reconcile_cycles', 10))
+        _audit_changes_since_skew_secs = int(
+            section.get('changes_since_skew_secs', 60))
+        _audit_instance_detail = \
+            section.get('instance_detail', 'true') in ['True', 'true']
+        _audit_detail_sweep_cycles = int(
+            section.get('detail_sweep_cycles', 30))
+        if _audit_full_reconcile_cycles < 1:
+            DLOG.warn("Invalid setting for full_reconcile_cycles: %s, "
+                      "forcing to 1" % _audit_full_reconcile_cycles)
+            _audit_full_reconcile_cycles = 1
+    else:
+        _audit_timeout_secs = 120
+        _audit_incremental = True
+        _audit_full_reconcile_cycles = 10
+        _audit_changes_since_skew_secs = 60
+        _audit_instance_detail = True
+        _audit_detail_sweep_cycles = 30
+
+    DLOG.info("NFVI audit incremental=%s, full_reconcile_cycles=%s, "
+              "instance_detail=%s, detail_sweep_cycles=%s."
+              % (_audit_incremental, _audit_full_reconcile_cycles,
+                 _audit_instance_detail, _audit_detail_sweep_cycles))
+
+    _nfvi_audits.clear()
+    _audit_nfvi_register('system-info', _audit_nfvi_system_info, 30)
+    _audit_nfvi_register('hosts', _audit_nfvi_hosts, 10)
+
+    if not nfvi.nfvi_compute_plugin_disabled():
+        _audit_nfvi_register('host-aggregates', _audit_nfvi_host_aggregates,
+                             30, depends_on=['hosts'])
+        _audit_nfvi_register('hypervisors', _audit_nfvi_hypervisors, 10,
+                             depends_on=['hosts'])
+
+    _audit_nfvi_register('tenants', _audit_nfvi_tenants, 30)
+
+    if not nfvi.nfvi_compute_plugin_disabled():
+        _audit_nfvi_register('instance-types', _audit_nfvi_instance_types,
+                             30, paging=_nfvi_instance_types_paging)
+        _audit_nfvi_register('instances', _audit_nfvi_instances, 10,
+                             depends_on=['hypervisors', 'instance-types'],
+                             paging=_nfvi_instances_paging)
+        _audit_nfvi_register('instance-groups', _audit_nfvi_instance_groups,
+                             30, depends_on=['instances'])
+
+    if not nfvi.nfvi_image_plugin_disabled():
+        _audit_nfvi_register('images', _audit_nfvi_images, 10,
+                             paging=_nfvi_images_paging)
+
+    if not nfvi.nfvi_block_storage_plugin_disabled():
+        _audit_nfvi_register('volumes', _audit_nfvi_volumes, 10,
+                             paging=_nfvi_volumes_paging)
+        _audit_nfvi_register('volume-snapshots',
+                             _audit_nfvi_volume_snapshots, 30,
+                             depends_on=['volumes'])
+
+    if not nfvi.nfvi_network_plugin_disabled():
+        _audit_nfvi_register('networks', _audit_nfvi_networks, 20,
+                             paging=_nfvi_networks_paging)
+        _audit_nfvi_register('subnets', _audit_nfvi_subnets, 20,
+                             depends_on=['networks'],
+                             paging=_nfvi_subnets_paging)
+
     audits = list()
 
     audits.append(_audit_nfvi)
@@ -1255,4 +1758,4 @@ def vim_nfvi_audits_finalize():
     """
     Finalize nfvi audits
     """
-    pass
+    _nfvi_audits.clear()
@@ -44,6 +44,7 @@ from nfv_vim.database._database_infrastructure_module import database_system_del
 from nfv_vim.database._database_infrastructure_module import database_system_get_list  # noqa: F401
 from nfv_vim.database._database_module import database_dump_data  # noqa: F401
 from nfv_vim.database._database_module import database_finalize  # noqa: F401
+from nfv_vim.database._database_module import database_flush  # noqa: F401
 from nfv_vim.database._database_module import database_initialize  # noqa: F401
 from nfv_vim.database._database_module import database_load_data  # noqa: F401
 from nfv_vim.database._database_module import database_migrate_data  # noqa: F401
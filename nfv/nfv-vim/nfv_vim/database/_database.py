@@ -3,9 +3,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import collections
 import errno
+import hashlib
 import json
 import os
+import six
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
@@ -14,6 +17,7 @@ from sqlalchemy import MetaData
 from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm import sessionmaker
 
+from nfv_common import debug
 from nfv_common.helpers import coroutine
 from nfv_common import histogram
 from nfv_common import timers
@@ -23,6 +27,8 @@ from nfv_vim.database._database_upgrades import upgrade_table_row_data
 from nfv_vim.database.model import Base
 from nfv_vim.database.model import lookup_class_by_table
 
+DLOG = debug.debug_get_logger('nfv_vim.database')
+
 _db_version = 1
 _db_name = 'vim_db_v%s' % _db_version
 _db_obj = None
@@ -32,14 +38,21 @@ class Database(object):
     """
     Database
     """
+    # Stay below the SQLite limit on bound parameters per statement
+    _MAX_DELETE_KEYS = 500
+
     def __init__(self, database_url):
         self._engine = create_engine(database_url)
         Base.metadata.create_all(self._engine)
         self._session = scoped_session(sessionmaker(bind=self._engine))
         self._commit_timer_id = None
         self._commit_inline = False
+        self._dirty_rows = collections.OrderedDict()
+        self._row_digests = dict()
 
     def dump_data(self, filename):
+        self.flush()
+
         db_data = dict()
         db_data['version'] = _db_version
         db_data['tables'] = dict()
@@ -88,24 +101,113 @@ class Database(object):
     def end_session(self):
         self._session.remove()
 
+    def write_row(self, table_class, key, row):
+        """
+        Queue a full row to be written to a table on the next commit. Writes
+        to the same key are coalesced and rows whose content has not changed
+        since they were last written are skipped.
+        """
+        digest = hashlib.sha1(
+            repr(sorted(row.items())).encode('utf-8')).hexdigest()
+        if self._row_digests.get((table_class, key), None) == digest:
+            return False
+
+        self._row_digests[(table_class, key)] = digest
+        table_rows = self._dirty_rows.setdefault(table_class,
+                                                 collections.OrderedDict())
+        table_rows[key] = row
+        return True
+
+    def delete_row(self, table_class, key):
+        """
+        Queue a row to be deleted from a table on the next commit
+        """
+        self._row_digests.pop((table_class, key), None)
+        table_rows = self._dirty_rows.setdefault(table_class,
+                                                 collections.OrderedDict())
+        table_rows[key] = None
+
+    def _flush_rows(self, dirty_rows):
+        """
+        Write the given queued rows into the current transaction, one
+        executemany per table for the writes and one delete per table for
+        the deletes
+        """
+        if not dirty_rows:
+            return
+
+        start_ms = timers.get_monotonic_timestamp_in_ms()
+        total_rows = 0
+        for table_class, table_rows in six.iteritems(dirty_rows):
+            table = table_class.__table__
+            primary_key = list(table.primary_key.columns)[0]
+
+            deleted_keys = [key for key, row in six.iteritems(table_rows)
+                            if row is None]
+            for idx in range(0, len(deleted_keys), self._MAX_DELETE_KEYS):
+                self._session.execute(table.delete().where(primary_key.in_(
+                    deleted_keys[idx:idx + self._MAX_DELETE_KEYS])))
+
+            rows = [row for row in table_rows.values() if row is not None]
+            if rows:
+                self._session.execute(table.insert().prefix_with('OR REPLACE'),
+                                      rows)
+            total_rows += len(table_rows)
+
+        elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
+        histogram.add_histogram_data("database-flush", elapsed_ms, "ms")
+        DLOG.verbose("Database flushed %s rows in %d ms." % (total_rows,
+                                                              elapsed_ms))
+
+    def _commit_rows(self):
+        """
+        Write all queued rows and commit the transaction. If the commit
+        fails it is rolled back and the rows go back in the queue, behind
+        any row queued for the same key since.
+        """
+        dirty_rows = self._dirty_rows
+        self._dirty_rows = collections.OrderedDict()
+        try:
+            self._flush_rows(dirty_rows)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            for table_class, table_rows in six.iteritems(self._dirty_rows):
+                dirty_rows.setdefault(table_class,
+                                      collections.OrderedDict()).update(
+                                          table_rows)
+            self._dirty_rows = dirty_rows
+            raise
+
+    def flush(self):
+        """
+        Write all queued rows and commit them now, used by callers that
+        cannot wait for the periodic commit
+        """
+        start_ms = timers.get_monotonic_timestamp_in_ms()
+        self._commit_rows()
+        elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
+        histogram.add_histogram_data("database-commits (flush)",
+                                     elapsed_ms, "ms")
+
     @coroutine
     def auto_commit(self):
         timer_id = (yield)
         if timer_id == self._commit_timer_id:
+            self._commit_timer_id = None
             start_ms = timers.get_monotonic_timestamp_in_ms()
-            self._session.commit()
+            self._commit_rows()
             elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
             histogram.add_histogram_data("database-commits (periodic)",
-                                         elapsed_ms / 100, "decisecond")
-            self._commit_timer_id = None
+                                         elapsed_ms, "ms")
 
     def commit(self):
         if self._commit_inline:
             start_ms = timers.get_monotonic_timestamp_in_ms()
-            self._session.commit()
+            self._commit_rows()
             elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
             histogram.add_histogram_data("database-commits (inline)",
-                                         elapsed_ms / 100, "decisecond")
+                                         elapsed_ms, "ms")
         else:
             if self._commit_timer_id is None:
                 self._commit_timer_id \
@@ -17,35 +17,21 @@ def database_volume_add(volume_obj):
     """
     Add a volume object to the database
     """
+    volume = dict()
+    volume['uuid'] = volume_obj.uuid
+    volume['name'] = volume_obj.name
+    volume['description'] = volume_obj.description
+    volume['avail_status'] = json.dumps(volume_obj.avail_status)
+    volume['action'] = volume_obj.action
+    volume['size_gb'] = volume_obj.size_gb
+    volume['bootable'] = volume_obj.bootable
+    volume['encrypted'] = volume_obj.encrypted
+    volume['image_uuid'] = volume_obj.image_uuid
+    volume['nfvi_volume_data'] = json.dumps(volume_obj.nfvi_volume.as_dict())
+
     db = database_get()
-    session = db.session()
-    query = session.query(model.Volume)
-    query = query.filter(model.Volume.uuid == volume_obj.uuid)
-    volume = query.first()
-    if not volume:
-        volume = model.Volume()
-        volume.uuid = volume_obj.uuid
-        volume.name = volume_obj.name
-        volume.description = volume_obj.description
-        volume.avail_status = json.dumps(volume_obj.avail_status)
-        volume.action = volume_obj.action
-        volume.size_gb = volume_obj.size_gb
-        volume.bootable = volume_obj.bootable
-        volume.encrypted = volume_obj.encrypted
-        volume.image_uuid = volume_obj.image_uuid
-        volume.nfvi_volume_data = json.dumps(volume_obj.nfvi_volume.as_dict())
-        session.add(volume)
-    else:
-        volume.name = volume_obj.name
-        volume.description = volume_obj.description
-        volume.avail_status = json.dumps(volume_obj.avail_status)
-        volume.action = volume_obj.action
-        volume.size_gb = volume_obj.size_gb
-        volume.bootable = volume_obj.bootable
-        volume.encrypted = volume_obj.encrypted
-        volume.image_uuid = volume_obj.image_uuid
-        volume.nfvi_volume_data = json.dumps(volume_obj.nfvi_volume.as_dict())
-    db.commit()
+    if db.write_row(model.Volume, volume_obj.uuid, volume):
+        db.commit()
 
 
 def database_volume_delete(volume_uuid):
@@ -53,10 +39,8 @@ def database_volume_delete(volume_uuid):
     Delete a volume object from the database
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.Volume)
-    query.filter(model.Volume.uuid == volume_uuid).delete()
-    session.commit()
+    db.delete_row(model.Volume, volume_uuid)
+    db.commit()
 
 
 def database_volume_get_list():
@@ -89,29 +73,19 @@ def database_volume_snapshot_add(volume_snapshot_obj):
     """
     Add a volume snapshot object to the database
     """
+    volume_snapshot = dict()
+    volume_snapshot['uuid'] = volume_snapshot_obj.uuid
+    volume_snapshot['name'] = volume_snapshot_obj.name
+    volume_snapshot['description'] = volume_snapshot_obj.description
+    volume_snapshot['size_gb'] = volume_snapshot_obj.size_gb
+    volume_snapshot['volume_uuid'] = volume_snapshot_obj.volume_uuid
+    volume_snapshot['nfvi_volume_snapshot_data'] = \
+        json.dumps(volume_snapshot_obj.nfvi_volume_snapshot.as_dict())
+
     db = database_get()
-    session = db.session()
-    query = session.query(model.VolumeSnapshot)
-    query = query.filter(model.VolumeSnapshot.uuid == volume_snapshot_obj.uuid)
-    volume_snapshot = query.first()
-    if not volume_snapshot:
-        volume_snapshot = model.VolumeSnapshot()
-        volume_snapshot.uuid = volume_snapshot_obj.uuid
-        volume_snapshot.name = volume_snapshot_obj.name
-        volume_snapshot.description = volume_snapshot_obj.description
-        volume_snapshot.size_gb = volume_snapshot_obj.size_gb
-        volume_snapshot.volume_uuid = volume_snapshot_obj.volume_uuid
-        volume_snapshot.nfvi_volume_snapshot_data = \
-            json.dumps(volume_snapshot_obj.nfvi_volume_snapshot.as_dict())
-        session.add(volume_snapshot)
-    else:
-        volume_snapshot.name = volume_snapshot_obj.name
-        volume_snapshot.description = volume_snapshot_obj.description
-        volume_snapshot.size_gb = volume_snapshot_obj.size_gb
-        volume_snapshot.volume_uuid = volume_snapshot_obj.volume_uuid
-        volume_snapshot.nfvi_volume_snapshot_data = \
-            json.dumps(volume_snapshot_obj.nfvi_volume_snapshot.as_dict())
-    db.commit()
+    if db.write_row(model.VolumeSnapshot, volume_snapshot_obj.uuid,
+                    volume_snapshot):
+        db.commit()
 
 
 def database_volume_snapshot_delete(volume_snapshot_uuid):
@@ -119,10 +93,8 @@ def database_volume_snapshot_delete(volume_snapshot_uuid):
     Delete a volume snapshot object from the database
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.VolumeSnapshot)
-    query.filter(model.VolumeSnapshot.uuid == volume_snapshot_uuid).delete()
-    session.commit()
+    db.delete_row(model.VolumeSnapshot, volume_snapshot_uuid)
+    db.commit()
 
 
 def database_volume_snapshot_get_list():
@@ -63,46 +63,26 @@ def database_hypervisor_add(hypervisor_obj):
     """
     Add a hypervisor object to the database
     """
+    hypervisor = dict()
+    hypervisor['uuid'] = hypervisor_obj.uuid
+    hypervisor['admin_state'] = hypervisor_obj.admin_state
+    hypervisor['oper_state'] = hypervisor_obj.oper_state
+    hypervisor['host_name'] = hypervisor_obj.host_name
+    hypervisor['stats_available'] = hypervisor_obj.have_stats()
+    hypervisor['vcpus_used'] = hypervisor_obj.vcpus_used
+    hypervisor['vcpus_max'] = hypervisor_obj.vcpus_max
+    hypervisor['mem_used_mb'] = hypervisor_obj.mem_used_mb
+    hypervisor['mem_free_mb'] = hypervisor_obj.mem_free_mb
+    hypervisor['mem_max_mb'] = hypervisor_obj.mem_max_mb
+    hypervisor['disk_used_gb'] = hypervisor_obj.disk_used_gb
+    hypervisor['disk_max_gb'] = hypervisor_obj.disk_max_gb
+    hypervisor['running_instances'] = hypervisor_obj.running_instances
+    hypervisor['nfvi_hypervisor_data'] \
+        = json.dumps(hypervisor_obj.nfvi_hypervisor.as_dict())
+
     db = database_get()
-    session = db.session()
-    query = session.query(model.Hypervisor)
-    query = query.filter(model.Hypervisor.uuid == hypervisor_obj.uuid)
-    hypervisor = query.first()
-    if not hypervisor:
-        hypervisor = model.Hypervisor()
-        hypervisor.uuid = hypervisor_obj.uuid
-        hypervisor.admin_state = hypervisor_obj.admin_state
-        hypervisor.oper_state = hypervisor_obj.oper_state
-        hypervisor.host_name = hypervisor_obj.host_name
-        if hypervisor_obj.have_stats():
-            hypervisor.stats_available = True
-            hypervisor.vcpus_used = hypervisor_obj.vcpus_used
-            hypervisor.vcpus_max = hypervisor_obj.vcpus_max
-            hypervisor.mem_used_mb = hypervisor_obj.mem_used_mb
-            hypervisor.mem_free_mb = hypervisor_obj.mem_free_mb
-            hypervisor.mem_max_mb = hypervisor_obj.mem_max_mb
-            hypervisor.disk_used_gb = hypervisor_obj.disk_used_gb
-            hypervisor.disk_max_gb = hypervisor_obj.disk_max_gb
-            hypervisor.running_instances = hypervisor_obj.running_instances
-        hypervisor.nfvi_hypervisor_data \
-            = json.dumps(hypervisor_obj.nfvi_hypervisor.as_dict())
-        session.add(hypervisor)
-    else:
-        hypervisor.admin_state = hypervisor_obj.admin_state
-        hypervisor.oper_state = hypervisor_obj.oper_state
-        if hypervisor_obj.have_stats():
-            hypervisor.stats_available = True
-            hypervisor.vcpus_used = hypervisor_obj.vcpus_used
-            hypervisor.vcpus_max = hypervisor_obj.vcpus_max
-            hypervisor.mem_used_mb = hypervisor_obj.mem_used_mb
-            hypervisor.mem_free_mb = hypervisor_obj.mem_free_mb
-            hypervisor.mem_max_mb = hypervisor_obj.mem_max_mb
-            hypervisor.disk_used_gb = hypervisor_obj.disk_used_gb
-            hypervisor.disk_max_gb = hypervisor_obj.disk_max_gb
-            hypervisor.running_instances = hypervisor_obj.running_instances
-        hypervisor.nfvi_hypervisor_data \
-            = json.dumps(hypervisor_obj.nfvi_hypervisor.as_dict())
-    db.commit()
+    if db.write_row(model.Hypervisor, hypervisor_obj.uuid, hypervisor):
+        db.commit()
 
 
 def database_hypervisor_delete(hypervisor_uuid):
@@ -110,10 +90,8 @@ def database_hypervisor_delete(hypervisor_uuid):
     Delete a hypervisor object from the database
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.Hypervisor)
-    query.filter(model.Hypervisor.uuid == hypervisor_uuid).delete()
-    session.commit()
+    db.delete_row(model.Hypervisor, hypervisor_uuid)
+    db.commit()
 
 
 def database_hypervisor_get_list():
@@ -244,55 +222,31 @@ def database_instance_add(instance_obj):
     """
     Add an instance object to the database
     """
+    instance = dict()
+    instance['uuid'] = instance_obj.uuid
+    instance['name'] = instance_obj.name
+    instance['admin_state'] = instance_obj.admin_state
+    instance['oper_state'] = instance_obj.oper_state
+    instance['avail_status'] = json.dumps(instance_obj.avail_status)
+    instance['action'] = instance_obj.action
+    instance['host_name'] = instance_obj.host_name
+    instance['image_uuid'] = instance_obj.image_uuid
+    instance['live_migration_support'] = instance_obj.supports_live_migration()
+    instance['elapsed_time_in_state'] = instance_obj.elapsed_time_in_state
+    instance['elapsed_time_on_host'] = instance_obj.elapsed_time_on_host
+    instance['action_data'] = json.dumps(instance_obj.action_data.as_dict())
+    instance['last_action_data'] \
+        = json.dumps(instance_obj.last_action_data.as_dict())
+    instance['guest_services'] \
+        = json.dumps(instance_obj.guest_services.as_dict())
+    instance['recoverable'] = instance_obj.recoverable
+    instance['unlock_to_recover'] = instance_obj.unlock_to_recover
+    instance['nfvi_instance_data'] \
+        = json.dumps(instance_obj.nfvi_instance.as_dict())
+
     db = database_get()
-    session = db.session()
-    query = session.query(model.Instance_v5)
-    query = query.filter(model.Instance_v5.uuid == instance_obj.uuid)
-    instance = query.first()
-    if not instance:
-        instance = model.Instance_v5()
-        instance.uuid = instance_obj.uuid
-        instance.name = instance_obj.name
-        instance.admin_state = instance_obj.admin_state
-        instance.oper_state = instance_obj.oper_state
-        instance.avail_status = json.dumps(instance_obj.avail_status)
-        instance.action = instance_obj.action
-        instance.host_name = instance_obj.host_name
-        instance.image_uuid = instance_obj.image_uuid
-        instance.live_migration_support = instance_obj.supports_live_migration()
-        instance.elapsed_time_in_state = instance_obj.elapsed_time_in_state
-        instance.elapsed_time_on_host = instance_obj.elapsed_time_on_host
-        instance.action_data = json.dumps(instance_obj.action_data.as_dict())
-        instance.last_action_data \
-            = json.dumps(instance_obj.last_action_data.as_dict())
-        instance.guest_services \
-            = json.dumps(instance_obj.guest_services.as_dict())
-        instance.recoverable = instance_obj.recoverable
-        instance.unlock_to_recover = instance_obj.unlock_to_recover
-        instance.nfvi_instance_data \
-            = json.dumps(instance_obj.nfvi_instance.as_dict())
-        session.add(instance)
-    else:
-        instance.name = instance_obj.name
-        instance.admin_state = instance_obj.admin_state
-        instance.oper_state = instance_obj.oper_state
-        instance.avail_status = json.dumps(instance_obj.avail_status)
-        instance.action = instance_obj.action
-        instance.host_name = instance_obj.host_name
-        instance.image_uuid = instance_obj.image_uuid
-        instance.live_migration_support = instance_obj.supports_live_migration()
-        instance.elapsed_time_in_state = instance_obj.elapsed_time_in_state
-        instance.elapsed_time_on_host = instance_obj.elapsed_time_on_host
-        instance.action_data = json.dumps(instance_obj.action_data.as_dict())
-        instance.last_action_data \
-            = json.dumps(instance_obj.last_action_data.as_dict())
-        instance.guest_services \
-            = json.dumps(instance_obj.guest_services.as_dict())
-        instance.recoverable = instance_obj.recoverable
-        instance.unlock_to_recover = instance_obj.unlock_to_recover
-        instance.nfvi_instance_data \
-            = json.dumps(instance_obj.nfvi_instance.as_dict())
-    db.commit()
+    if db.write_row(model.Instance_v5, instance_obj.uuid, instance):
+        db.commit()
 
 
 def database_instance_delete(instance_uuid):
@@ -300,10 +254,8 @@ def database_instance_delete(instance_uuid):
     Delete an instance object from the database
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.Instance_v5)
-    query.filter(model.Instance_v5.uuid == instance_uuid).delete()
-    session.commit()
+    db.delete_row(model.Instance_v5, instance_uuid)
+    db.commit()
 
 
 def database_instance_get_list():
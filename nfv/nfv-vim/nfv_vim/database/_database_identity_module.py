@@ -14,21 +14,15 @@ def database_tenant_add(tenant_obj):
     """
     Add a tenant object to the database
     """
+    tenant = dict()
+    tenant['uuid'] = tenant_obj.uuid
+    tenant['name'] = tenant_obj.name
+    tenant['description'] = tenant_obj.description
+    tenant['enabled'] = tenant_obj.enabled
+
     db = database_get()
-    session = db.session()
-    query = session.query(model.Tenant)
-    tenant = query.filter(model.Tenant.uuid == tenant_obj.uuid).first()
-    if not tenant:
-        tenant = model.Tenant()
-        tenant.uuid = tenant_obj.uuid
-        tenant.name = tenant_obj.name
-        tenant.description = tenant_obj.description
-        tenant.enabled = tenant_obj.enabled
-        session.add(tenant)
-    else:
-        tenant.description = tenant_obj.description
-        tenant.enabled = tenant_obj.enabled
-    db.commit()
+    if db.write_row(model.Tenant, tenant_obj.uuid, tenant):
+        db.commit()
 
 
 def database_tenant_delete(tenant_uuid):
@@ -36,10 +30,8 @@ def database_tenant_delete(tenant_uuid):
     Delete a tenant object from the database
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.Tenant)
-    query.filter(model.Tenant.uuid == tenant_uuid).delete()
-    session.commit()
+    db.delete_row(model.Tenant, tenant_uuid)
+    db.commit()
 
 
 def database_tenant_get_list():
@@ -17,38 +17,24 @@ def database_image_add(image_obj):
     """
     Add an image object to the database
     """
+    image = dict()
+    image['uuid'] = image_obj.uuid
+    image['name'] = image_obj.name
+    image['description'] = image_obj.description
+    image['avail_status'] = json.dumps(image_obj.avail_status)
+    image['action'] = image_obj.action
+    image['container_format'] = image_obj.container_format
+    image['disk_format'] = image_obj.disk_format
+    image['min_disk_size_gb'] = image_obj.min_disk_size_gb
+    image['min_memory_size_mb'] = image_obj.min_memory_size_mb
+    image['visibility'] = image_obj.visibility
+    image['protected'] = image_obj.protected
+    image['properties'] = json.dumps(image_obj.properties)
+    image['nfvi_image_data'] = json.dumps(image_obj.nfvi_image.as_dict())
+
     db = database_get()
-    session = db.session()
-    query = session.query(model.Image)
-    query = query.filter(model.Image.uuid == image_obj.uuid)
-    image = query.first()
-    if not image:
-        image = model.Image()
-        image.uuid = image_obj.uuid
-        image.name = image_obj.name
-        image.description = image_obj.description
-        image.avail_status = json.dumps(image_obj.avail_status)
-        image.action = image_obj.action
-        image.container_format = image_obj.container_format
-        image.disk_format = image_obj.disk_format
-        image.min_disk_size_gb = image_obj.min_disk_size_gb
-        image.min_memory_size_mb = image_obj.min_memory_size_mb
-        image.visibility = image_obj.visibility
-        image.protected = image_obj.protected
-        image.properties = json.dumps(image_obj.properties)
-        image.nfvi_image_data = json.dumps(image_obj.nfvi_image.as_dict())
-        session.add(image)
-    else:
-        image.description = image_obj.description
-        image.avail_status = json.dumps(image_obj.avail_status)
-        image.action = image_obj.action
-        image.min_disk_size_gb = image_obj.min_disk_size_gb
-        image.min_memory_size_mb = image_obj.min_memory_size_mb
-        image.visibility = image_obj.visibility
-        image.protected = image_obj.protected
-        image.properties = json.dumps(image_obj.properties)
-        image.nfvi_image_data = json.dumps(image_obj.nfvi_image.as_dict())
-    db.commit()
+    if db.write_row(model.Image, image_obj.uuid, image):
+        db.commit()
 
 
 def database_image_delete(image_uuid):
@@ -56,10 +42,8 @@ def database_image_delete(image_uuid):
     Delete an image object from the database
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.Image)
-    query.filter(model.Image.uuid == image_uuid).delete()
-    session.commit()
+    db.delete_row(model.Image, image_uuid)
+    db.commit()
 
 
 def database_image_get_list():
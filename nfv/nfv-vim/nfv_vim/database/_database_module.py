@@ -31,6 +31,14 @@ def database_migrate_data():
     database.migrate_data()
 
 
+def database_flush():
+    """
+    Write all pending changes to the database and commit them now
+    """
+    database = database_get()
+    database.flush()
+
+
 def database_initialize(config):
     """
     Initialize the database package
@@ -42,4 +50,6 @@ def database_finalize():
     """
     Finalize the database package
     """
-    return
+    database = database_get()
+    if database is not None:
+        database.flush()
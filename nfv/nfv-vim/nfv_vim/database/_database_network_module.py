@@ -16,25 +16,19 @@ def database_subnet_add(subnet_obj):
     """
     Add a subnet object to the database
     """
+    subnet = dict()
+    subnet['uuid'] = subnet_obj.uuid
+    subnet['name'] = subnet_obj.name
+    subnet['ip_version'] = subnet_obj.ip_version
+    subnet['subnet_ip'] = subnet_obj.subnet_ip
+    subnet['subnet_prefix'] = subnet_obj.subnet_prefix
+    subnet['gateway_ip'] = subnet_obj.gateway_ip
+    subnet['network_uuid'] = subnet_obj.network_uuid
+    subnet['is_dhcp_enabled'] = subnet_obj.is_dhcp_enabled
+
     db = database_get()
-    session = db.session()
-    query = session.query(model.Subnet)
-    query = query.filter(model.Subnet.uuid == subnet_obj.uuid)
-    subnet = query.first()
-    if not subnet:
-        subnet = model.Subnet()
-        subnet.uuid = subnet_obj.uuid
-        subnet.name = subnet_obj.name
-        subnet.ip_version = subnet_obj.ip_version
-        subnet.subnet_ip = subnet_obj.subnet_ip
-        subnet.subnet_prefix = subnet_obj.subnet_prefix
-        subnet.gateway_ip = subnet_obj.gateway_ip
-        subnet.network_uuid = subnet_obj.network_uuid
-        subnet.is_dhcp_enabled = subnet_obj.is_dhcp_enabled
-        session.add(subnet)
-    else:
-        subnet.is_dhcp_enabled = subnet_obj.is_dhcp_enabled
-    db.commit()
+    if db.write_row(model.Subnet, subnet_obj.uuid, subnet):
+        db.commit()
 
 
 def database_subnet_delete(subnet_uuid):
@@ -42,10 +36,8 @@ def database_subnet_delete(subnet_uuid):
     Delete a subnet object from the database
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.Subnet)
-    query.filter(model.Subnet.uuid == subnet_uuid).delete()
-    session.commit()
+    db.delete_row(model.Subnet, subnet_uuid)
+    db.commit()
 
 
 def database_subnet_get_list():
@@ -73,35 +65,21 @@ def database_network_add(network_obj):
     """
     provider_data = network_obj.provider_data
 
+    network = dict()
+    network['uuid'] = network_obj.uuid
+    network['name'] = network_obj.name
+    network['admin_state'] = network_obj.admin_state
+    network['oper_state'] = network_obj.oper_state
+    network['avail_status'] = json.dumps(network_obj.avail_status)
+    network['is_shared'] = network_obj.is_shared
+    network['mtu'] = network_obj.mtu
+    network['physical_network'] = provider_data.physical_network
+    network['network_type'] = provider_data.network_type
+    network['segmentation_id'] = provider_data.segmentation_id
+
     db = database_get()
-    session = db.session()
-    query = session.query(model.Network)
-    query = query.filter(model.Network.uuid == network_obj.uuid)
-    network = query.first()
-    if not network:
-        network = model.Network()
-        network.uuid = network_obj.uuid
-        network.name = network_obj.name
-        network.admin_state = network_obj.admin_state
-        network.oper_state = network_obj.oper_state
-        network.avail_status = json.dumps(network_obj.avail_status)
-        network.is_shared = network_obj.is_shared
-        network.mtu = network_obj.mtu
-        network.physical_network = provider_data.physical_network
-        network.network_type = provider_data.network_type
-        network.segmentation_id = provider_data.segmentation_id
-        session.add(network)
-    else:
-
-        network.admin_state = network_obj.admin_state
-        network.oper_state = network_obj.oper_state
-        network.avail_status = json.dumps(network_obj.avail_status)
-        network.is_shared = network_obj.is_shared
-        network.mtu = network_obj.mtu
-        network.physical_network = provider_data.physical_network
-        network.network_type = provider_data.network_type
-        network.segmentation_id = provider_data.segmentation_id
-    db.commit()
+    if db.write_row(model.Network, network_obj.uuid, network):
+        db.commit()
 
 
 def database_network_delete(network_uuid):
@@ -109,10 +87,8 @@ def database_network_delete(network_uuid):
     Delete a network object from the database
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.Network)
-    query.filter(model.Network.uuid == network_uuid).delete()
-    session.commit()
+    db.delete_row(model.Network, network_uuid)
+    db.commit()
 
 
 def database_network_get_list():
@@ -5,37 +5,128 @@
 #
 import json
 
+from nfv_common import debug
+from nfv_common import histogram
+from nfv_common import timers
+
 from nfv_vim import objects
 
 from nfv_vim.database import model
 
 from nfv_vim.database._database import database_get
 
+DLOG = debug.debug_get_logger('nfv_vim.database')
+
+_PHASE_KEYS = ['build_phase', 'apply_phase', 'abort_phase']
+
+
+def _stage_key(sw_update_uuid, phase_name, stage_id):
+    return "%s.%s.%s" % (sw_update_uuid, phase_name, stage_id)
+
+
+def _step_key(sw_update_uuid, phase_name, stage_id, step_id):
+    return "%s.%s.%s.%s" % (sw_update_uuid, phase_name, stage_id, step_id)
+
+
+def _write_stage(db, sw_update_uuid, phase_name, stage):
+    """
+    Queue the rows of a stage and its steps that changed, returns the number
+    of bytes queued
+    """
+    bytes_written = 0
+
+    stage_data = json.dumps(stage.as_dict(include_steps=False))
+    key = _stage_key(sw_update_uuid, phase_name, stage.id)
+    if db.write_row(model.SoftwareUpdateStage, key, dict(
+            key=key, sw_update_uuid=sw_update_uuid, phase_name=phase_name,
+            stage_id=stage.id, stage_data=stage_data)):
+        bytes_written += len(stage_data)
+
+    for step in stage.steps:
+        step_data = json.dumps(step.as_dict())
+        key = _step_key(sw_update_uuid, phase_name, stage.id, step.id)
+        if db.write_row(model.SoftwareUpdateStep, key, dict(
+                key=key, sw_update_uuid=sw_update_uuid, phase_name=phase_name,
+                stage_id=stage.id, step_id=step.id, step_data=step_data)):
+            bytes_written += len(step_data)
+
+    return bytes_written
+
+
+def _delete_stages(db, sw_update_uuid, stage_keys=None, step_keys=None):
+    """
+    Queue the deletion of the stage and step rows of a software update,
+    other than those given
+    """
+    session = db.session()
+    for table_class, keys in [(model.SoftwareUpdateStage, stage_keys),
+                              (model.SoftwareUpdateStep, step_keys)]:
+        query = session.query(table_class.key)
+        for (key,) in query.filter(table_class.sw_update_uuid ==
+                                   sw_update_uuid):
+            if keys is None or key not in keys:
+                db.delete_row(table_class, key)
+
 
 def database_sw_update_add(sw_update_obj):
     """
     Add a software update object to the database
+
+    The strategy is saved as one row, its stages and steps as a row each.
+    Only the stages the strategy reports as changed are looked at, and only
+    the rows whose content changed are written.
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.SoftwareUpdate)
-    sw_update = query.filter(model.SoftwareUpdate.uuid ==
-                             sw_update_obj.uuid).first()
-    if not sw_update:
-        sw_update = model.SoftwareUpdate()
-        sw_update.uuid = sw_update_obj.uuid
-        sw_update.sw_update_type = sw_update_obj.sw_update_type
-        if sw_update_obj.strategy is None:
-            sw_update.strategy_data = json.dumps(dict())
-        else:
-            sw_update.strategy_data = json.dumps(sw_update_obj.strategy.as_dict())
-        session.add(sw_update)
+    start_ms = timers.get_monotonic_timestamp_in_ms()
+    bytes_written = 0
+
+    strategy_obj = sw_update_obj.strategy
+    if strategy_obj is None:
+        strategy_data = json.dumps(dict())
+        _delete_stages(db, sw_update_obj.uuid)
     else:
-        if sw_update_obj.strategy is None:
-            sw_update.strategy_data = json.dumps(dict())
-        else:
-            sw_update.strategy_data = json.dumps(sw_update_obj.strategy.as_dict())
-    db.commit()
+        strategy_data = json.dumps(strategy_obj.as_dict(include_stages=False))
+        phases = dict((phase.name, phase) for phase in
+                      [strategy_obj.build_phase, strategy_obj.apply_phase,
+                       strategy_obj.abort_phase])
+
+        changed_stages = strategy_obj.changed_stages
+        if changed_stages is None:
+            changed_stages = list()
+            stage_keys = set()
+            step_keys = set()
+            for phase in phases.values():
+                for stage in phase.stages:
+                    changed_stages.append((phase.name, stage.id))
+                    stage_keys.add(_stage_key(sw_update_obj.uuid, phase.name,
+                                              stage.id))
+                    step_keys.update(_step_key(sw_update_obj.uuid, phase.name,
+                                               stage.id, step.id)
+                                     for step in stage.steps)
+            # Stages of phases rebuilt since the last save
+            _delete_stages(db, sw_update_obj.uuid, stage_keys, step_keys)
+
+        for phase_name, stage_id in changed_stages:
+            bytes_written += _write_stage(db, sw_update_obj.uuid, phase_name,
+                                          phases[phase_name].stages[stage_id])
+
+    sw_update = dict()
+    sw_update['uuid'] = sw_update_obj.uuid
+    sw_update['sw_update_type'] = sw_update_obj.sw_update_type
+    sw_update['strategy_data'] = strategy_data
+    if db.write_row(model.SoftwareUpdate, sw_update_obj.uuid, sw_update):
+        bytes_written += len(strategy_data)
+
+    # Strategy progress is committed immediately, along with any pending
+    # writes, so a restart resumes from the last saved step.
+    db.flush()
+
+    elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
+    histogram.add_histogram_data("sw-update save (latency)", elapsed_ms, "ms")
+    histogram.add_histogram_data("sw-update save (written)",
+                                 -(-bytes_written // 1024), "KiB")
+    DLOG.verbose("Software update %s saved, %s bytes written in %d ms."
+                 % (sw_update_obj.uuid, bytes_written, elapsed_ms))
 
 
 def database_sw_update_delete(sw_update_uuid):
@@ -43,10 +134,32 @@ def database_sw_update_delete(sw_update_uuid):
     Delete a software update object from the database
     """
     db = database_get()
-    session = db.session()
-    query = session.query(model.SoftwareUpdate)
-    query.filter(model.SoftwareUpdate.uuid == sw_update_uuid).delete()
-    session.commit()
+    _delete_stages(db, sw_update_uuid)
+    db.delete_row(model.SoftwareUpdate, sw_update_uuid)
+    db.flush()
+
+
+def _strategy_data(sw_update_uuid, strategy_data, stages):
+    """
+    Put the stages back into the phases of a strategy, strategies saved
+    as a whole are returned as they are. Returns None if any of the stages
+    are missing.
+    """
+    for phase_key in _PHASE_KEYS:
+        phase_data = strategy_data.get(phase_key, None)
+        if phase_data and 'stages' not in phase_data:
+            phase_stages = list()
+            for stage_id in range(phase_data['total_stages']):
+                stage_data = stages.get((phase_data['name'], stage_id), None)
+                if stage_data is None:
+                    DLOG.error("Software update %s is missing stage %s of "
+                               "its %s phase, strategy dropped."
+                               % (sw_update_uuid, stage_id,
+                                  phase_data['name']))
+                    return None
+                phase_stages.append(stage_data)
+            phase_data['stages'] = phase_stages
+    return strategy_data
 
 
 def database_sw_update_get_list():
@@ -55,11 +168,33 @@ def database_sw_update_get_list():
     """
     db = database_get()
     session = db.session()
+
+    stages = dict()
+    for stage in session.query(model.SoftwareUpdateStage):
+        stage_data = json.loads(stage.stage_data)
+        stage_data['steps'] = list()
+        stages.setdefault(stage.sw_update_uuid, dict())[
+            (stage.phase_name, stage.stage_id)] = stage_data
+
+    query = session.query(model.SoftwareUpdateStep).order_by(
+        model.SoftwareUpdateStep.step_id)
+    for step in query:
+        stage_data = stages.get(step.sw_update_uuid, dict()).get(
+            (step.phase_name, step.stage_id), None)
+        if stage_data is not None:
+            stage_data['steps'].append(json.loads(step.step_data))
+
     query = session.query(model.SoftwareUpdate)
 
     sw_update_objs = list()
     for sw_update in query.all():
-        strategy_data = json.loads(sw_update.strategy_data)
+        strategy_data = _strategy_data(sw_update.uuid,
+                                       json.loads(sw_update.strategy_data),
+                                       stages.get(sw_update.uuid, dict()))
+        if strategy_data is None:
+            # Loaded without its strategy, the rows left are deleted on
+            # the next save
+            strategy_data = dict()
         if objects.SW_UPDATE_TYPE.SW_PATCH == sw_update.sw_update_type:
             sw_patch_obj = objects.SwPatch(sw_update.uuid, strategy_data)
             sw_update_objs.append(sw_patch_obj)
@@ -20,6 +20,8 @@ from nfv_vim.database.model._network import Network  # noqa: F401
 from nfv_vim.database.model._service_host import ServiceHost  # noqa: F401
 from nfv_vim.database.model._subnet import Subnet  # noqa: F401
 from nfv_vim.database.model._sw_update import SoftwareUpdate  # noqa: F401
+from nfv_vim.database.model._sw_update import SoftwareUpdateStage  # noqa: F401
+from nfv_vim.database.model._sw_update import SoftwareUpdateStep  # noqa: F401
 from nfv_vim.database.model._system import System  # noqa: F401
 from nfv_vim.database.model._tenant import Tenant  # noqa: F401
 from nfv_vim.database.model._volume import Volume  # noqa: F401
@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 from sqlalchemy import Column
+from sqlalchemy import Integer
 from sqlalchemy import String
 
 from nfv_vim.database.model._base import AsDictMixin
@@ -26,3 +27,36 @@ class SoftwareUpdate(AsDictMixin, Base):
 
     def __repr__(self):
         return "<SwUpdate(%r)>" % self.uuid
+
+
+class SoftwareUpdateStage(AsDictMixin, Base):
+    """
+    Software Update Strategy Stage Database Table, a stage without its steps
+    """
+    __tablename__ = 'sw_update_stages'
+
+    key = Column(String(255), nullable=False, primary_key=True)
+    sw_update_uuid = Column(String(64), nullable=False, index=True)
+    phase_name = Column(String(64), nullable=False)
+    stage_id = Column(Integer, nullable=False)
+    stage_data = Column(String(2147483647), nullable=False)
+
+    def __repr__(self):
+        return "<SwUpdateStage(%r)>" % self.key
+
+
+class SoftwareUpdateStep(AsDictMixin, Base):
+    """
+    Software Update Strategy Step Database Table
+    """
+    __tablename__ = 'sw_update_steps'
+
+    key = Column(String(255), nullable=False, primary_key=True)
+    sw_update_uuid = Column(String(64), nullable=False, index=True)
+    phase_name = Column(String(64), nullable=False)
+    stage_id = Column(Integer, nullable=False)
+    step_id = Column(Integer, nullable=False)
+    step_data = Column(String(2147483647), nullable=False)
+
+    def __repr__(self):
+        return "<SwUpdateStep(%r)>" % self.key
@@ -14,6 +14,7 @@ from nfv_vim.events._vim_image_api_events import vim_image_api_finalize
 from nfv_vim.events._vim_image_api_events import vim_image_api_get_image
 from nfv_vim.events._vim_image_api_events import vim_image_api_get_images
 from nfv_vim.events._vim_image_api_events import vim_image_api_initialize
+from nfv_vim.events._vim_image_api_events import vim_image_api_list_images
 from nfv_vim.events._vim_image_api_events import vim_image_api_update_image
 
 from nfv_vim.events._vim_volume_api_events import vim_volume_api_create_volume
@@ -22,6 +23,7 @@ from nfv_vim.events._vim_volume_api_events import vim_volume_api_finalize
 from nfv_vim.events._vim_volume_api_events import vim_volume_api_get_volume
 from nfv_vim.events._vim_volume_api_events import vim_volume_api_get_volumes
 from nfv_vim.events._vim_volume_api_events import vim_volume_api_initialize
+from nfv_vim.events._vim_volume_api_events import vim_volume_api_list_volumes
 from nfv_vim.events._vim_volume_api_events import vim_volume_api_update_volume
 
 from nfv_vim.events._vim_instance_api_events import vim_instance_api_cold_migrate_instance
@@ -32,6 +34,7 @@ from nfv_vim.events._vim_instance_api_events import vim_instance_api_finalize
 from nfv_vim.events._vim_instance_api_events import vim_instance_api_get_instance
 from nfv_vim.events._vim_instance_api_events import vim_instance_api_get_instances
 from nfv_vim.events._vim_instance_api_events import vim_instance_api_initialize
+from nfv_vim.events._vim_instance_api_events import vim_instance_api_list_instances
 from nfv_vim.events._vim_instance_api_events import vim_instance_api_live_migrate_instance
 from nfv_vim.events._vim_instance_api_events import vim_instance_api_pause_instance
 from nfv_vim.events._vim_instance_api_events import vim_instance_api_reboot_instance
@@ -51,6 +54,8 @@ from nfv_vim.events._vim_network_api_events import vim_network_api_get_networks
 from nfv_vim.events._vim_network_api_events import vim_network_api_get_subnet
 from nfv_vim.events._vim_network_api_events import vim_network_api_get_subnets
 from nfv_vim.events._vim_network_api_events import vim_network_api_initialize
+from nfv_vim.events._vim_network_api_events import vim_network_api_list_networks
+from nfv_vim.events._vim_network_api_events import vim_network_api_list_subnets
 from nfv_vim.events._vim_network_api_events import vim_network_api_update_network
 from nfv_vim.events._vim_network_api_events import vim_network_api_update_subnet
 
@@ -92,6 +97,9 @@ def _vim_api_message_handler(connection, msg):
         else:
             vim_image_api_get_image(connection, msg)
 
+    elif rpc.RPC_MSG_TYPE.GET_IMAGES_REQUEST == msg.type:
+        vim_image_api_list_images(connection, msg)
+
     # Volume API Requests
     elif rpc.RPC_MSG_TYPE.CREATE_VOLUME_REQUEST == msg.type:
         vim_volume_api_create_volume(connection, msg)
@@ -108,6 +116,9 @@ def _vim_api_message_handler(connection, msg):
         else:
             vim_volume_api_get_volume(connection, msg)
 
+    elif rpc.RPC_MSG_TYPE.GET_VOLUMES_REQUEST == msg.type:
+        vim_volume_api_list_volumes(connection, msg)
+
     # Instance API Requests
     elif rpc.RPC_MSG_TYPE.CREATE_INSTANCE_REQUEST == msg.type:
         vim_instance_api_create_instance(connection, msg)
@@ -151,6 +162,9 @@ def _vim_api_message_handler(connection, msg):
         else:
             vim_instance_api_get_instance(connection, msg)
 
+    elif rpc.RPC_MSG_TYPE.GET_INSTANCES_REQUEST == msg.type:
+        vim_instance_api_list_instances(connection, msg)
+
     # Subnet API Requests
     elif rpc.RPC_MSG_TYPE.CREATE_SUBNET_REQUEST == msg.type:
         vim_network_api_create_subnet(connection, msg)
@@ -167,6 +181,9 @@ def _vim_api_message_handler(connection, msg):
         else:
             vim_network_api_get_subnet(connection, msg)
 
+    elif rpc.RPC_MSG_TYPE.GET_SUBNETS_REQUEST == msg.type:
+        vim_network_api_list_subnets(connection, msg)
+
     # Network API Requests
     elif rpc.RPC_MSG_TYPE.CREATE_NETWORK_REQUEST == msg.type:
         vim_network_api_create_network(connection, msg)
@@ -183,6 +200,9 @@ def _vim_api_message_handler(connection, msg):
         else:
             vim_network_api_get_network(connection, msg)
 
+    elif rpc.RPC_MSG_TYPE.GET_NETWORKS_REQUEST == msg.type:
+        vim_network_api_list_networks(connection, msg)
+
     # Software Update API Requests
     elif rpc.RPC_MSG_TYPE.CREATE_SW_UPDATE_STRATEGY_REQUEST == msg.type:
         vim_sw_update_api_create_strategy(connection, msg)
@@ -0,0 +1,78 @@
+#
+# Copyright (c) 2015-2016 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from nfv_common import debug
+from nfv_vim import rpc
+
+DLOG = debug.debug_get_logger('nfv_vim.vim_api_events')
+
+# Resources sent in each response of a list request
+LIST_BATCH_SIZE = 100
+
+
+def _filter_values(value):
+    """
+    Returns the values a filter is matched against
+    """
+    if isinstance(value, (list, tuple, set)):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+def vim_api_send_list(connection, msg, response_class, resources,
+                      item_response, filters=None):
+    """
+    Send the page of resources asked for by a list request
+
+    Resources are ordered by uuid so that a marker picks up where the
+    previous page finished. The page is sent in batches, the last batch is
+    marked as the end of the stream. Filters maps the filter names
+    supported to a function returning the value(s) of a resource to match.
+    """
+    if filters is None:
+        filters = dict()
+
+    unknown_filters = [name for name in msg.filters if name not in filters]
+    if unknown_filters:
+        DLOG.info("Unknown filters in list request, filters=%s."
+                  % unknown_filters)
+        response = response_class()
+        response.result = rpc.RPC_MSG_RESULT.FAILED
+        response.end_of_stream = True
+        connection.send(response.serialize(connection.codec))
+        connection.close()
+        return
+
+    match = [(filters[name], str(value))
+             for name, value in msg.filters.items()]
+
+    count = 0
+    last_uuid = msg.marker
+    response = response_class()
+    for resource in sorted(resources, key=lambda resource: resource.uuid):
+        if msg.marker is not None and resource.uuid <= msg.marker:
+            continue
+
+        if not all(value in _filter_values(get_value(resource))
+                   for get_value, value in match):
+            continue
+
+        if msg.limit is not None and count >= msg.limit:
+            response.next_marker = last_uuid
+            break
+
+        response.add_item(item_response(resource), msg.fields)
+        last_uuid = resource.uuid
+        count += 1
+
+        if LIST_BATCH_SIZE <= len(response.items):
+            connection.send(response.serialize(connection.codec))
+            response = response_class()
+
+    response.end_of_stream = True
+    connection.send(response.serialize(connection.codec))
+    DLOG.verbose("Sent %s resources, next_marker=%s."
+                 % (count, response.next_marker))
+    connection.close()
@@ -10,6 +10,8 @@ from nfv_vim import directors
 from nfv_vim import rpc
 from nfv_vim import tables
 
+from nfv_vim.events._vim_api_list import vim_api_send_list
+
 DLOG = debug.debug_get_logger('nfv_vim.vim_image_api_events')
 
 _image_create_operations = dict()
@@ -45,7 +47,7 @@ def _create_image_callback(success, image_uuid, image_name, image_description,
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _image_create_operations[image_name]
@@ -95,7 +97,7 @@ def _update_image_callback(success, image_uuid, image_name, image_description,
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _image_update_operations[image_uuid]
@@ -130,7 +132,7 @@ def _delete_image_callback(success, image_uuid):
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _image_delete_operations[image_uuid]
@@ -148,6 +150,27 @@ def vim_image_api_delete_image(connection, msg):
     image_director.image_delete(msg.uuid, _delete_image_callback)
 
 
+def _image_response(image, response=None):
+    """
+    Returns a Get-Image API response for an image
+    """
+    if response is None:
+        response = rpc.APIResponseGetImage()
+    response.uuid = image.uuid
+    response.name = image.name
+    response.description = image.description
+    response.container_format = image.container_format
+    response.disk_format = image.disk_format
+    response.min_disk_size_gb = image.min_disk_size_gb
+    response.min_memory_size_mb = image.min_memory_size_mb
+    response.visibility = image.visibility
+    response.protected = image.protected
+    response.avail_status = image.avail_status
+    response.action = image.action
+    response.properties = json.dumps(image.properties)
+    return response
+
+
 def vim_image_api_get_image(connection, msg):
     """
     Handle Get-Image API request
@@ -157,21 +180,10 @@ def vim_image_api_get_image(connection, msg):
     response = rpc.APIResponseGetImage()
     image = image_table.get(msg.filter_by_uuid, None)
     if image is not None:
-        response.uuid = image.uuid
-        response.name = image.name
-        response.description = image.description
-        response.container_format = image.container_format
-        response.disk_format = image.disk_format
-        response.min_disk_size_gb = image.min_disk_size_gb
-        response.min_memory_size_mb = image.min_memory_size_mb
-        response.visibility = image.visibility
-        response.protected = image.protected
-        response.avail_status = image.avail_status
-        response.action = image.action
-        response.properties = json.dumps(image.properties)
+        _image_response(image, response)
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -183,24 +195,26 @@ def vim_image_api_get_images(connection, msg):
     DLOG.verbose("Get image, all=%s." % msg.get_all)
     image_table = tables.tables_get_image_table()
     for image in image_table.values():
-        response = rpc.APIResponseGetImage()
-        response.uuid = image.uuid
-        response.name = image.name
-        response.description = image.description
-        response.container_format = image.container_format
-        response.disk_format = image.disk_format
-        response.min_disk_size_gb = image.min_disk_size_gb
-        response.min_memory_size_mb = image.min_memory_size_mb
-        response.visibility = image.visibility
-        response.protected = image.protected
-        response.avail_status = image.avail_status
-        response.action = image.action
-        response.properties = json.dumps(image.properties)
-        connection.send(response.serialize())
+        response = _image_response(image)
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
 
+def vim_image_api_list_images(connection, msg):
+    """
+    Handle List-Images API request
+    """
+    DLOG.verbose("List images, request=%s." % msg)
+    image_table = tables.tables_get_image_table()
+    filters = {
+        'state': lambda image: image.avail_status,
+        'visibility': lambda image: image.visibility,
+    }
+    vim_api_send_list(connection, msg, rpc.APIResponseGetImages,
+                      image_table.values(), _image_response, filters)
+
+
 def vim_image_api_initialize():
     """
     Initialize VIM Image API Handling
@@ -10,6 +10,8 @@ from nfv_vim import objects
 from nfv_vim import rpc
 from nfv_vim import tables
 
+from nfv_vim.events._vim_api_list import vim_api_send_list
+
 DLOG = debug.debug_get_logger('nfv_vim.vim_instance_api_events')
 
 _instance_create_operations = dict()
@@ -57,7 +59,7 @@ def _create_instance_callback(success, instance_name, instance_uuid):
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.info("Sent response=%s" % response)
         del _instance_create_operations[instance_name]
@@ -100,7 +102,7 @@ def vim_instance_api_start_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -118,7 +120,7 @@ def vim_instance_api_stop_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -136,7 +138,7 @@ def vim_instance_api_pause_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -154,7 +156,7 @@ def vim_instance_api_unpause_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -172,7 +174,7 @@ def vim_instance_api_suspend_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -190,7 +192,7 @@ def vim_instance_api_resume_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -208,7 +210,7 @@ def vim_instance_api_reboot_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -226,7 +228,7 @@ def vim_instance_api_live_migrate_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -244,7 +246,7 @@ def vim_instance_api_cold_migrate_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -262,7 +264,7 @@ def vim_instance_api_evacuate_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -281,11 +283,45 @@ def vim_instance_api_delete_instance(connection, msg):
         response.uuid = msg.uuid
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
 
+def _instance_response(instance, response=None):
+    """
+    Returns a Get-Instance API response for an instance
+    """
+    if response is None:
+        response = rpc.APIResponseGetInstance()
+    response.uuid = instance.uuid
+    response.name = instance.name
+    response.admin_state = instance.admin_state
+    response.oper_state = instance.oper_state
+    response.avail_status = instance.avail_status
+    response.action = instance.action
+    response.host_name = instance.host_name
+    response.instance_type_original_name \
+        = instance.instance_type_original_name
+    response.image_uuid = instance.image_uuid
+    response.vcpus = instance.vcpus
+    response.memory_mb = instance.memory_mb
+    response.disk_gb = instance.disk_gb
+    response.ephemeral_gb = instance.ephemeral_gb
+    response.swap_gb = instance.swap_gb
+    response.auto_recovery = instance.auto_recovery
+    response.live_migration_timeout \
+        = instance.max_live_migrate_wait_in_secs
+    response.live_migration_max_downtime \
+        = instance.max_live_migration_downtime_in_ms
+    if instance.host_name is not None:
+        host_table = tables.tables_get_host_table()
+        host = host_table.get(instance.host_name, None)
+        if host is not None:
+            response.host_uuid = host.uuid
+    return response
+
+
 def vim_instance_api_get_instance(connection, msg):
     """
     Handle Get-Instance API request
@@ -295,35 +331,10 @@ def vim_instance_api_get_instance(connection, msg):
     response = rpc.APIResponseGetInstance()
     instance = instance_table.get(msg.filter_by_uuid, None)
     if instance is not None:
-        response.uuid = instance.uuid
-        response.name = instance.name
-        response.admin_state = instance.admin_state
-        response.oper_state = instance.oper_state
-        response.avail_status = instance.avail_status
-        response.action = instance.action
-        response.host_name = instance.host_name
-        response.instance_type_original_name \
-            = instance.instance_type_original_name
-        response.image_uuid = instance.image_uuid
-        response.vcpus = instance.vcpus
-        response.memory_mb = instance.memory_mb
-        response.disk_gb = instance.disk_gb
-        response.ephemeral_gb = instance.ephemeral_gb
-        response.swap_gb = instance.swap_gb
-        response.auto_recovery = instance.auto_recovery
-        response.live_migration_timeout \
-            = instance.max_live_migrate_wait_in_secs
-        response.live_migration_max_downtime \
-            = instance.max_live_migration_downtime_in_ms
-        if instance.host_name is not None:
-            host_table = tables.tables_get_host_table()
-            host = host_table.get(instance.host_name, None)
-            if host is not None:
-                response.host_uuid = host.uuid
-
+        _instance_response(instance, response)
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -335,37 +346,29 @@ def vim_instance_api_get_instances(connection, msg):
     DLOG.verbose("Get instance, all=%s." % msg.get_all)
     instance_table = tables.tables_get_instance_table()
     for instance in instance_table.values():
-        response = rpc.APIResponseGetInstance()
-        response.uuid = instance.uuid
-        response.name = instance.name
-        response.admin_state = instance.admin_state
-        response.oper_state = instance.oper_state
-        response.avail_status = instance.avail_status
-        response.action = instance.action
-        response.host_name = instance.host_name
-        response.instance_type_original_name \
-            = instance.instance_type_original_name
-        response.image_uuid = instance.image_uuid
-        response.vcpus = instance.vcpus
-        response.memory_mb = instance.memory_mb
-        response.disk_gb = instance.disk_gb
-        response.ephemeral_gb = instance.ephemeral_gb
-        response.swap_gb = instance.swap_gb
-        response.auto_recovery = instance.auto_recovery
-        response.live_migration_timeout \
-            = instance.max_live_migrate_wait_in_secs
-        response.live_migration_max_downtime \
-            = instance.max_live_migration_downtime_in_ms
-        if instance.host_name is not None:
-            host_table = tables.tables_get_host_table()
-            host = host_table.get(instance.host_name, None)
-            if host is not None:
-                response.host_uuid = host.uuid
-        connection.send(response.serialize())
+        response = _instance_response(instance)
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
 
+def vim_instance_api_list_instances(connection, msg):
+    """
+    Handle List-Instances API request
+    """
+    DLOG.verbose("List instances, request=%s." % msg)
+    instance_table = tables.tables_get_instance_table()
+    filters = {
+        'host': lambda instance: instance.host_name,
+        'tenant': lambda instance: instance.tenant_uuid,
+        'state': lambda instance: ([instance.admin_state,
+                                    instance.oper_state] +
+                                   list(instance.avail_status or [])),
+    }
+    vim_api_send_list(connection, msg, rpc.APIResponseGetInstances,
+                      instance_table.values(), _instance_response, filters)
+
+
 def vim_instance_api_initialize():
     """
     Initialize VIM Instance API Handling
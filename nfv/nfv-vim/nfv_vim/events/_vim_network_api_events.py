@@ -8,6 +8,8 @@ from nfv_vim import directors
 from nfv_vim import rpc
 from nfv_vim import tables
 
+from nfv_vim.events._vim_api_list import vim_api_send_list
+
 DLOG = debug.debug_get_logger('nfv_vim.vim_network_api_events')
 
 _subnet_create_operations = dict()
@@ -53,7 +55,7 @@ def _create_subnet_callback(success, network_uuid, subnet_name, subnet_ip,
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _subnet_create_operations[op_index]
@@ -85,13 +87,13 @@ def vim_network_api_create_subnet(connection, msg):
         else:
             response = rpc.APIResponseCreateNetwork()
             response.result = rpc.RPC_MSG_RESULT.CONFLICT
-            connection.send(response.serialize())
+            connection.send(response.serialize(connection.codec))
             DLOG.verbose("Sent response=%s" % response)
             connection.close()
     else:
         response = rpc.APIResponseCreateSubnet()
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
         connection.close()
 
@@ -130,7 +132,7 @@ def _update_subnet_callback(success, network_uuid, subnet_uuid, subnet_name,
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _subnet_update_operations[op_index]
@@ -164,12 +166,12 @@ def vim_network_api_update_subnet(connection, msg):
         else:
             response = rpc.APIResponseUpdateSubnet()
             response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-            connection.send(response.serialize())
+            connection.send(response.serialize(connection.codec))
             connection.close()
     else:
         response = rpc.APIResponseUpdateSubnet()
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
 
 
@@ -195,7 +197,7 @@ def _delete_subnet_callback(success, network_uuid, subnet_uuid, subnet_name,
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _subnet_delete_operations[op_index]
@@ -227,17 +229,34 @@ def vim_network_api_delete_subnet(connection, msg):
         else:
             response = rpc.APIResponseDeleteSubnet()
             response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-            connection.send(response.serialize())
+            connection.send(response.serialize(connection.codec))
             DLOG.verbose("Sent response=%s" % response)
             connection.close()
     else:
         response = rpc.APIResponseDeleteSubnet()
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
         connection.close()
 
 
+def _subnet_response(subnet, response=None):
+    """
+    Returns a Get-Subnet API response for a subnet
+    """
+    if response is None:
+        response = rpc.APIResponseGetSubnet()
+    response.uuid = subnet.uuid
+    response.name = subnet.name
+    response.ip_version = subnet.ip_version
+    response.subnet_ip = subnet.subnet_ip
+    response.subnet_prefix = subnet.subnet_prefix
+    response.gateway_ip = subnet.gateway_ip
+    response.network_uuid = subnet.network_uuid
+    response.is_dhcp_enabled = subnet.is_dhcp_enabled
+    return response
+
+
 def vim_network_api_get_subnet(connection, msg):
     """
     Handle Get-Subnet API request
@@ -248,17 +267,10 @@ def vim_network_api_get_subnet(connection, msg):
     response = rpc.APIResponseGetSubnet()
     subnet = subnet_table.get(msg.filter_by_uuid, None)
     if subnet is not None:
-        response.uuid = subnet.uuid
-        response.name = subnet.name
-        response.ip_version = subnet.ip_version
-        response.subnet_ip = subnet.subnet_ip
-        response.subnet_prefix = subnet.subnet_prefix
-        response.gateway_ip = subnet.gateway_ip
-        response.network_uuid = subnet.network_uuid
-        response.is_dhcp_enabled = subnet.is_dhcp_enabled
+        _subnet_response(subnet, response)
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -283,20 +295,40 @@ def vim_network_api_get_subnets(connection, msg):
             subnets = list()
 
     for subnet in subnets:
-        response = rpc.APIResponseGetSubnet()
-        response.uuid = subnet.uuid
-        response.name = subnet.name
-        response.ip_version = subnet.ip_version
-        response.subnet_ip = subnet.subnet_ip
-        response.subnet_prefix = subnet.subnet_prefix
-        response.gateway_ip = subnet.gateway_ip
-        response.network_uuid = subnet.network_uuid
-        response.is_dhcp_enabled = subnet.is_dhcp_enabled
-        connection.send(response.serialize())
+        response = _subnet_response(subnet)
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
 
+def vim_network_api_list_subnets(connection, msg):
+    """
+    Handle List-Subnets API request
+    """
+    DLOG.verbose("List subnets, request=%s." % msg)
+    subnet_table = tables.tables_get_subnet_table()
+    network_table = tables.tables_get_network_table()
+
+    def network_name(subnet):
+        network = network_table.get(subnet.network_uuid, None)
+        if network is not None:
+            return network.name
+        return None
+
+    network_uuid = msg.filters.get('network_uuid', None)
+    if network_uuid is not None:
+        subnets = subnet_table.on_network(network_uuid)
+    else:
+        subnets = subnet_table.values()
+
+    filters = {
+        'network_uuid': lambda subnet: subnet.network_uuid,
+        'network_name': network_name,
+    }
+    vim_api_send_list(connection, msg, rpc.APIResponseGetSubnets, subnets,
+                      _subnet_response, filters)
+
+
 def _create_network_callback(success, network_name):
     """
     Handle Create-Network callback
@@ -327,7 +359,7 @@ def _create_network_callback(success, network_name):
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _network_create_operations[network_name]
@@ -354,7 +386,7 @@ def vim_network_api_create_network(connection, msg):
     else:
         response = rpc.APIResponseCreateNetwork()
         response.result = rpc.RPC_MSG_RESULT.CONFLICT
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
         connection.close()
 
@@ -389,7 +421,7 @@ def _update_network_callback(success, network_uuid):
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _network_update_operations[network_uuid]
@@ -413,7 +445,7 @@ def vim_network_api_update_network(connection, msg):
     else:
         response = rpc.APIResponseUpdateNetwork()
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
         connection.close()
 
@@ -430,7 +462,7 @@ def _delete_network_callback(success, network_uuid):
         if not success:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _network_delete_operations[network_uuid]
@@ -458,11 +490,30 @@ def vim_network_api_delete_network(connection, msg):
     else:
         response = rpc.APIResponseDeleteNetwork()
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
         connection.close()
 
 
+def _network_response(network, response=None):
+    """
+    Returns a Get-Network API response for a network
+    """
+    if response is None:
+        response = rpc.APIResponseGetNetwork()
+    response.uuid = network.uuid
+    response.name = network.name
+    response.admin_state = network.admin_state
+    response.oper_state = network.oper_state
+    response.avail_status = network.avail_status
+    response.is_shared = network.is_shared
+    response.mtu = network.mtu
+    response.network_type = network.provider_data.network_type
+    response.segmentation_id = network.provider_data.segmentation_id
+    response.physical_network = network.provider_data.physical_network
+    return response
+
+
 def vim_network_api_get_network(connection, msg):
     """
     Handle Get-Network API request
@@ -479,19 +530,10 @@ def vim_network_api_get_network(connection, msg):
     else:
         network = network_table.get_by_name(msg.filter_by_name)
     if network is not None:
-        response.uuid = network.uuid
-        response.name = network.name
-        response.admin_state = network.admin_state
-        response.oper_state = network.oper_state
-        response.avail_status = network.avail_status
-        response.is_shared = network.is_shared
-        response.mtu = network.mtu
-        response.network_type = network.provider_data.network_type
-        response.segmentation_id = network.provider_data.segmentation_id
-        response.physical_network = network.provider_data.physical_network
+        _network_response(network, response)
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -503,22 +545,27 @@ def vim_network_api_get_networks(connection, msg):
     DLOG.verbose("Get network, all=%s." % msg.get_all)
     network_table = tables.tables_get_network_table()
     for network in network_table.values():
-        response = rpc.APIResponseGetNetwork()
-        response.uuid = network.uuid
-        response.name = network.name
-        response.admin_state = network.admin_state
-        response.oper_state = network.oper_state
-        response.avail_status = network.avail_status
-        response.is_shared = network.is_shared
-        response.mtu = network.mtu
-        response.network_type = network.provider_data.network_type
-        response.segmentation_id = network.provider_data.segmentation_id
-        response.physical_network = network.provider_data.physical_network
-        connection.send(response.serialize())
+        response = _network_response(network)
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
 
+def vim_network_api_list_networks(connection, msg):
+    """
+    Handle List-Networks API request
+    """
+    DLOG.verbose("List networks, request=%s." % msg)
+    network_table = tables.tables_get_network_table()
+    filters = {
+        'state': lambda network: [network.admin_state, network.oper_state,
+                                  network.avail_status],
+        'network_type': lambda network: network.provider_data.network_type,
+    }
+    vim_api_send_list(connection, msg, rpc.APIResponseGetNetworks,
+                      network_table.values(), _network_response, filters)
+
+
 def vim_network_api_initialize():
     """
     Initialize VIM Network API Handling
@@ -34,7 +34,7 @@ def _vim_sw_update_api_create_strategy_callback(success, reason, strategy):
             else:
                 response.result = rpc.RPC_MSG_RESULT.FAILED
 
-            connection.send(response.serialize())
+            connection.send(response.serialize(connection.codec))
             DLOG.verbose("Sent response=%s." % response)
             connection.close()
             del _sw_update_strategy_create_operations[strategy.uuid]
@@ -117,7 +117,7 @@ def vim_sw_update_api_create_strategy(connection, msg):
         DLOG.error("Invalid message name: %s" % msg.sw_update_type)
         response = rpc.APIResponseCreateSwUpdateStrategy()
         response.result = rpc.RPC_MSG_RESULT.FAILED
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s." % response)
         connection.close()
         return
@@ -128,7 +128,7 @@ def vim_sw_update_api_create_strategy(connection, msg):
             response.result = rpc.RPC_MSG_RESULT.CONFLICT
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s." % response)
         connection.close()
         return
@@ -154,7 +154,7 @@ def _vim_sw_update_api_apply_strategy_callback(success, reason, strategy):
             else:
                 response.result = rpc.RPC_MSG_RESULT.FAILED
 
-            connection.send(response.serialize())
+            connection.send(response.serialize(connection.codec))
             connection.close()
             DLOG.verbose("Sent response=%s." % response)
             del _sw_update_strategy_apply_operations[strategy.uuid]
@@ -180,7 +180,7 @@ def vim_sw_update_api_apply_strategy(connection, msg):
         DLOG.info("No sw-update strategy to apply.")
         response = rpc.APIResponseApplySwUpdateStrategy()
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s." % response)
         connection.close()
         return
@@ -209,7 +209,7 @@ def _vim_sw_update_api_abort_strategy_callback(success, reason, strategy):
             else:
                 response.result = rpc.RPC_MSG_RESULT.FAILED
 
-            connection.send(response.serialize())
+            connection.send(response.serialize(connection.codec))
             connection.close()
             DLOG.verbose("Sent response=%s." % response)
             del _sw_update_strategy_abort_operations[strategy.uuid]
@@ -235,7 +235,7 @@ def vim_sw_update_api_abort_strategy(connection, msg):
         DLOG.info("No sw-update strategy to abort.")
         response = rpc.APIResponseAbortSwUpdateStrategy()
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s." % response)
         connection.close()
         return
@@ -261,7 +261,7 @@ def _vim_sw_update_api_delete_strategy_callback(success, reason, strategy_uuid):
         if not success:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s." % response)
         del _sw_update_strategy_delete_operations[strategy_uuid]
@@ -287,7 +287,7 @@ def vim_sw_update_api_delete_strategy(connection, msg):
         DLOG.info("No sw-update strategy to delete.")
         response = rpc.APIResponseDeleteSwUpdateStrategy()
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s." % response)
         connection.close()
         return
@@ -330,7 +330,7 @@ def vim_sw_update_api_get_strategy(connection, msg):
     else:
         response.strategy = strategy.as_json()
 
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s." % response)
     connection.close()
 
@@ -8,6 +8,8 @@ from nfv_vim import directors
 from nfv_vim import rpc
 from nfv_vim import tables
 
+from nfv_vim.events._vim_api_list import vim_api_send_list
+
 DLOG = debug.debug_get_logger('nfv_vim.vim_volume_api_events')
 
 _volume_create_operations = dict()
@@ -38,7 +40,7 @@ def _create_volume_callback(success, volume_uuid, volume_name,
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _volume_create_operations[volume_name]
@@ -80,7 +82,7 @@ def _update_volume_callback(success, volume_uuid, volume_name,
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _volume_update_operations[volume_uuid]
@@ -113,7 +115,7 @@ def _delete_volume_callback(success, volume_uuid):
         else:
             response.result = rpc.RPC_MSG_RESULT.FAILED
 
-        connection.send(response.serialize())
+        connection.send(response.serialize(connection.codec))
         connection.close()
         DLOG.verbose("Sent response=%s" % response)
         del _volume_delete_operations[volume_uuid]
@@ -131,6 +133,23 @@ def vim_volume_api_delete_volume(connection, msg):
     volume_director.volume_delete(msg.uuid, _delete_volume_callback)
 
 
+def _volume_response(volume, response=None):
+    """
+    Returns a Get-Volume API response for a volume
+    """
+    if response is None:
+        response = rpc.APIResponseGetVolume()
+    response.uuid = volume.uuid
+    response.name = volume.name
+    response.description = volume.description
+    response.size_gb = volume.size_gb
+    response.bootable = volume.bootable
+    response.encrypted = volume.encrypted
+    response.avail_status = volume.avail_status
+    response.action = volume.action
+    return response
+
+
 def vim_volume_api_get_volume(connection, msg):
     """
     Handle Get-Volume API request
@@ -140,17 +159,10 @@ def vim_volume_api_get_volume(connection, msg):
     response = rpc.APIResponseGetVolume()
     volume = volume_table.get(msg.filter_by_uuid, None)
     if volume is not None:
-        response.uuid = volume.uuid
-        response.name = volume.name
-        response.description = volume.description
-        response.size_gb = volume.size_gb
-        response.bootable = volume.bootable
-        response.encrypted = volume.encrypted
-        response.avail_status = volume.avail_status
-        response.action = volume.action
+        _volume_response(volume, response)
     else:
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
-    connection.send(response.serialize())
+    connection.send(response.serialize(connection.codec))
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
@@ -162,20 +174,25 @@ def vim_volume_api_get_volumes(connection, msg):
     DLOG.verbose("Get volume, all=%s." % msg.get_all)
     volume_table = tables.tables_get_volume_table()
     for volume in volume_table.values():
-        response = rpc.APIResponseGetVolume()
-        response.uuid = volume.uuid
-        response.name = volume.name
-        response.description = volume.description
-        response.size_gb = volume.size_gb
-        response.bootable = volume.bootable
-        response.encrypted = volume.encrypted
-        response.avail_status = volume.avail_status
-        response.action = volume.action
-        connection.send(response.serialize())
+        response = _volume_response(volume)
+        connection.send(response.serialize(connection.codec))
         DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
 
+def vim_volume_api_list_volumes(connection, msg):
+    """
+    Handle List-Volumes API request
+    """
+    DLOG.verbose("List volumes, request=%s." % msg)
+    volume_table = tables.tables_get_volume_table()
+    filters = {
+        'state': lambda volume: volume.avail_status,
+    }
+    vim_api_send_list(connection, msg, rpc.APIResponseGetVolumes,
+                      volume_table.values(), _volume_response, filters)
+
+
 def vim_volume_api_initialize():
     """
     Initialize VIM Volume API Handling
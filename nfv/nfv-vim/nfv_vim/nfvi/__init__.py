@@ -35,6 +35,7 @@ from nfv_vim.nfvi._nfvi_compute_module import nfvi_get_instance_groups  # noqa:
 from nfv_vim.nfvi._nfvi_compute_module import nfvi_get_instance_type  # noqa: F401
 from nfv_vim.nfvi._nfvi_compute_module import nfvi_get_instance_types  # noqa: F401
 from nfv_vim.nfvi._nfvi_compute_module import nfvi_get_instances  # noqa: F401
+from nfv_vim.nfvi._nfvi_compute_module import nfvi_get_instances_detail  # noqa: F401
 from nfv_vim.nfvi._nfvi_compute_module import nfvi_live_migrate_instance  # noqa: F401
 from nfv_vim.nfvi._nfvi_compute_module import nfvi_notify_compute_host_disabled  # noqa: F401
 from nfv_vim.nfvi._nfvi_compute_module import nfvi_notify_compute_host_enabled  # noqa: F401
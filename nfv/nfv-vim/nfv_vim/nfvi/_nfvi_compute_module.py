@@ -106,6 +106,15 @@ def nfvi_get_instances(paging, callback, context=None):
     return cmd_id
 
 
+def nfvi_get_instances_detail(paging, callback, context=None):
+    """
+    Get a list of instances with their details
+    """
+    cmd_id = _compute_plugin.invoke_plugin('get_instances_detail', paging,
+                                           context, callback=callback)
+    return cmd_id
+
+
 def nfvi_create_instance(instance_name, instance_type_uuid, image_uuid,
                          block_devices, networks, callback, context=None):
     """
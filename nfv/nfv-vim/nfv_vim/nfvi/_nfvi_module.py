@@ -32,6 +32,28 @@ _task_worker_pools = dict()
 DISABLED_LIST = ['Yes', 'yes', 'Y', 'y', 'True', 'true', 'T', 't', '1']
 
 
+def _create_task_worker_pool(config, plugin_name, pool_name, num_workers=1):
+    """
+    Create the task worker pool of a plugin, sized by the <plugin>_workers
+    and <plugin>_max_workers options. The pool autoscales if the maximum is
+    above the number of workers. The <plugin>_worker_backend option, or
+    worker_backend for all plugins, selects process or thread workers.
+    """
+    num_workers = int(config.get('%s_workers' % plugin_name, num_workers))
+    max_workers = int(config.get('%s_max_workers' % plugin_name, num_workers))
+    scale_up_wait_secs = int(config.get('worker_scale_up_wait_secs', 2))
+    scale_down_idle_secs = int(config.get('worker_scale_down_idle_secs', 60))
+    backend = config.get('%s_worker_backend' % plugin_name,
+                         config.get('worker_backend',
+                                    tasks.TASK_WORKER_BACKEND.PROCESS))
+
+    DLOG.info("Pool %s: workers=%s, max_workers=%s, backend=%s."
+              % (pool_name, num_workers, max_workers, backend))
+    return tasks.TaskWorkerPool(pool_name, num_workers, max_workers,
+                                scale_up_wait_secs, scale_down_idle_secs,
+                                backend)
+
+
 def nfvi_initialize(config):
     """
     Initialize the NFVI package
@@ -58,48 +80,49 @@ def nfvi_initialize(config):
                                         'True') in DISABLED_LIST)
 
     _task_worker_pools['identity'] = \
-        tasks.TaskWorkerPool('Identity', num_workers=1)
+        _create_task_worker_pool(config, 'identity', 'Identity')
     nfvi_identity_initialize(config, _task_worker_pools['identity'])
 
     if not image_plugin_disabled:
         _task_worker_pools['image'] = \
-            tasks.TaskWorkerPool('Image', num_workers=1)
+            _create_task_worker_pool(config, 'image', 'Image')
         nfvi_image_initialize(config, _task_worker_pools['image'])
 
     if not block_storage_plugin_disabled:
         _task_worker_pools['block'] = \
-            tasks.TaskWorkerPool('BlockStorage', num_workers=1)
+            _create_task_worker_pool(config, 'block_storage', 'BlockStorage')
         nfvi_block_storage_initialize(config, _task_worker_pools['block'])
 
     if not compute_plugin_disabled:
-        # Use two workers for the compute plugin. This allows the VIM to send
-        # two requests to the nova-api at a time.
+        # Use two workers for the compute plugin by default. This allows the
+        # VIM to send two requests to the nova-api at a time.
         _task_worker_pools['compute'] = \
-            tasks.TaskWorkerPool('Compute', num_workers=2)
+            _create_task_worker_pool(config, 'compute', 'Compute',
+                                     num_workers=2)
         init_complete = nfvi_compute_initialize(config,
                                                 _task_worker_pools['compute'])
 
     if not network_plugin_disabled:
         _task_worker_pools['network'] = \
-            tasks.TaskWorkerPool('Network', num_workers=1)
+            _create_task_worker_pool(config, 'network', 'Network')
         nfvi_network_initialize(config, _task_worker_pools['network'])
 
     _task_worker_pools['infra'] = \
-        tasks.TaskWorkerPool('Infrastructure', num_workers=1)
+        _create_task_worker_pool(config, 'infrastructure', 'Infrastructure')
     nfvi_infrastructure_initialize(config, _task_worker_pools['infra'])
 
     if not guest_plugin_disabled:
         _task_worker_pools['guest'] = \
-            tasks.TaskWorkerPool('Guest', num_workers=1)
+            _create_task_worker_pool(config, 'guest', 'Guest')
         nfvi_guest_initialize(config, _task_worker_pools['guest'])
 
     _task_worker_pools['sw_mgmt'] = \
-        tasks.TaskWorkerPool('Sw-Mgmt', num_workers=1)
+        _create_task_worker_pool(config, 'sw_mgmt', 'Sw-Mgmt')
     nfvi_sw_mgmt_initialize(config, _task_worker_pools['sw_mgmt'])
 
     if not fault_mgmt_plugin_disabled:
         _task_worker_pools['fault_mgmt'] = \
-            tasks.TaskWorkerPool('Fault-Mgmt', num_workers=1)
+            _create_task_worker_pool(config, 'fault_mgmt', 'Fault-Mgmt')
         nfvi_fault_mgmt_initialize(config, _task_worker_pools['fault_mgmt'])
 
     return init_complete
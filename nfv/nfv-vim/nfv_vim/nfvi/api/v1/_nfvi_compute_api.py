@@ -105,6 +105,13 @@ class NFVIComputeAPI(object):
         """
         pass
 
+    @abc.abstractmethod
+    def get_instances_detail(self, future, paging, context, callback):
+        """
+        Get a list of instances with their details from the plugin
+        """
+        pass
+
     @abc.abstractmethod
     def create_instance(self, future, instance_name, instance_type_uuid,
                         image_uuid, block_devices, networks, context,
@@ -15,6 +15,7 @@ class Paging(object):
         self._page_limit = page_limit
         self._next_page = None
         self._done = False
+        self._changes_since = None
 
     @property
     def page_request_id(self):
@@ -45,6 +46,21 @@ class Paging(object):
         self._next_page = value
         self._done = self._next_page is None
 
+    @property
+    def changes_since(self):
+        """
+        Returns the timestamp used to only list resources changed since
+        """
+        return self._changes_since
+
+    @changes_since.setter
+    def changes_since(self, value):
+        """
+        Set the timestamp used to only list resources changed since, None
+        lists all resources
+        """
+        self._changes_since = value
+
     @property
     def done(self):
         """
@@ -69,5 +85,6 @@ class Paging(object):
         """
         Provide a string representation
         """
-        return ("Paging: page_limit=%s, done=%s, next_page=%s"
-                % (self.page_limit, self.done, self.next_page))
+        return ("Paging: page_limit=%s, done=%s, next_page=%s, "
+                "changes_since=%s" % (self.page_limit, self.done,
+                                      self.next_page, self.changes_since))
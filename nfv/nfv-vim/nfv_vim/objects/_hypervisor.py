@@ -139,6 +139,12 @@ class Hypervisor(ObjectData):
         Persist changes to hypervisor object
         """
         from nfv_vim import database
+        from nfv_vim import tables
+
+        hypervisor_table = tables.tables_get_hypervisor_table()
+        if hypervisor_table is not None:
+            hypervisor_table.reindex(self.uuid)
+
         database.database_hypervisor_add(self)
 
     def as_dict(self):
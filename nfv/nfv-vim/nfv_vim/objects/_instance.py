@@ -2633,6 +2633,9 @@ class Instance(ObjectData):
 
         if from_host_name != to_host_name:
             self._nfvi_instance.host_name = to_host_name
+            # Refile the instance under its new host before anything looks
+            # up the instances on either host
+            self._reindex()
             self._action_fsm.handle_event(
                 instance_fsm.INSTANCE_EVENT.NFVI_HOST_CHANGED)
             self._elapsed_time_on_host = 0
@@ -3021,11 +3024,23 @@ class Instance(ObjectData):
                 self._action_fsm.handle_event(
                     instance_fsm.INSTANCE_EVENT.NFVI_HOST_OFFLINE)
 
+    def _reindex(self):
+        """
+        Refile the instance object in the instance table indexes
+        """
+        from nfv_vim import tables
+
+        instance_table = tables.tables_get_instance_table()
+        if instance_table is not None:
+            instance_table.reindex(self.uuid)
+
     def _persist(self):
         """
         Persist changes to instance object
         """
         from nfv_vim import database
+
+        self._reindex()
         database.database_instance_add(self)
 
     def as_dict(self):
@@ -6,24 +6,30 @@
 from nfv_vim.rpc._rpc_defs import RPC_MSG_RESULT  # noqa: F401
 from nfv_vim.rpc._rpc_defs import RPC_MSG_TYPE  # noqa: F401
 from nfv_vim.rpc._rpc_defs import RPC_MSG_VERSION  # noqa: F401
+from nfv_vim.rpc._rpc_message import RPCListRequest  # noqa: F401
+from nfv_vim.rpc._rpc_message import RPCListResponse  # noqa: F401
 from nfv_vim.rpc._rpc_message import RPCMessage  # noqa: F401
 
 from nfv_vim.rpc._rpc_message_image import APIRequestCreateImage  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIRequestDeleteImage  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIRequestGetImage  # noqa: F401
+from nfv_vim.rpc._rpc_message_image import APIRequestGetImages  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIRequestUpdateImage  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIResponseCreateImage  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIResponseDeleteImage  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIResponseGetImage  # noqa: F401
+from nfv_vim.rpc._rpc_message_image import APIResponseGetImages  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIResponseUpdateImage  # noqa: F401
 
 from nfv_vim.rpc._rpc_message_volume import APIRequestCreateVolume  # noqa: F401
 from nfv_vim.rpc._rpc_message_volume import APIRequestDeleteVolume  # noqa: F401
 from nfv_vim.rpc._rpc_message_volume import APIRequestGetVolume  # noqa: F401
+from nfv_vim.rpc._rpc_message_volume import APIRequestGetVolumes  # noqa: F401
 from nfv_vim.rpc._rpc_message_volume import APIRequestUpdateVolume  # noqa: F401
 from nfv_vim.rpc._rpc_message_volume import APIResponseCreateVolume  # noqa: F401
 from nfv_vim.rpc._rpc_message_volume import APIResponseDeleteVolume  # noqa: F401
 from nfv_vim.rpc._rpc_message_volume import APIResponseGetVolume  # noqa: F401
+from nfv_vim.rpc._rpc_message_volume import APIResponseGetVolumes  # noqa: F401
 from nfv_vim.rpc._rpc_message_volume import APIResponseUpdateVolume  # noqa: F401
 
 from nfv_vim.rpc._rpc_message_instance import APIRequestColdMigrateInstance  # noqa: F401
@@ -31,6 +37,7 @@ from nfv_vim.rpc._rpc_message_instance import APIRequestCreateInstance  # noqa:
 from nfv_vim.rpc._rpc_message_instance import APIRequestDeleteInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIRequestEvacuateInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIRequestGetInstance  # noqa: F401
+from nfv_vim.rpc._rpc_message_instance import APIRequestGetInstances  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIRequestLiveMigrateInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIRequestPauseInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIRequestRebootInstance  # noqa: F401
@@ -44,6 +51,7 @@ from nfv_vim.rpc._rpc_message_instance import APIResponseCreateInstance  # noqa:
 from nfv_vim.rpc._rpc_message_instance import APIResponseDeleteInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponseEvacuateInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponseGetInstance  # noqa: F401
+from nfv_vim.rpc._rpc_message_instance import APIResponseGetInstances  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponseLiveMigrateInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponsePauseInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponseRebootInstance  # noqa: F401
@@ -56,19 +64,23 @@ from nfv_vim.rpc._rpc_message_instance import APIResponseUnpauseInstance  # noqa
 from nfv_vim.rpc._rpc_message_subnet import APIRequestCreateSubnet  # noqa: F401
 from nfv_vim.rpc._rpc_message_subnet import APIRequestDeleteSubnet  # noqa: F401
 from nfv_vim.rpc._rpc_message_subnet import APIRequestGetSubnet  # noqa: F401
+from nfv_vim.rpc._rpc_message_subnet import APIRequestGetSubnets  # noqa: F401
 from nfv_vim.rpc._rpc_message_subnet import APIRequestUpdateSubnet  # noqa: F401
 from nfv_vim.rpc._rpc_message_subnet import APIResponseCreateSubnet  # noqa: F401
 from nfv_vim.rpc._rpc_message_subnet import APIResponseDeleteSubnet  # noqa: F401
 from nfv_vim.rpc._rpc_message_subnet import APIResponseGetSubnet  # noqa: F401
+from nfv_vim.rpc._rpc_message_subnet import APIResponseGetSubnets  # noqa: F401
 from nfv_vim.rpc._rpc_message_subnet import APIResponseUpdateSubnet  # noqa: F401
 
 from nfv_vim.rpc._rpc_message_network import APIRequestCreateNetwork  # noqa: F401
 from nfv_vim.rpc._rpc_message_network import APIRequestDeleteNetwork  # noqa: F401
 from nfv_vim.rpc._rpc_message_network import APIRequestGetNetwork  # noqa: F401
+from nfv_vim.rpc._rpc_message_network import APIRequestGetNetworks  # noqa: F401
 from nfv_vim.rpc._rpc_message_network import APIRequestUpdateNetwork  # noqa: F401
 from nfv_vim.rpc._rpc_message_network import APIResponseCreateNetwork  # noqa: F401
 from nfv_vim.rpc._rpc_message_network import APIResponseDeleteNetwork  # noqa: F401
 from nfv_vim.rpc._rpc_message_network import APIResponseGetNetwork  # noqa: F401
+from nfv_vim.rpc._rpc_message_network import APIResponseGetNetworks  # noqa: F401
 from nfv_vim.rpc._rpc_message_network import APIResponseUpdateNetwork  # noqa: F401
 
 from nfv_vim.rpc._rpc_message_sw_update import APIRequestAbortSwUpdateStrategy  # noqa: F401
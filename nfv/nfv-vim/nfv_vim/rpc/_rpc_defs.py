@@ -35,6 +35,8 @@ class _RPCMessageType(Constants):
     DELETE_IMAGE_RESPONSE = Constant('delete-image-response')
     GET_IMAGE_REQUEST = Constant('get-image-request')
     GET_IMAGE_RESPONSE = Constant('get-image-response')
+    GET_IMAGES_REQUEST = Constant('get-images-request')
+    GET_IMAGES_RESPONSE = Constant('get-images-response')
 
     # Volume Definitions
     CREATE_VOLUME_REQUEST = Constant('create-volume-request')
@@ -45,6 +47,8 @@ class _RPCMessageType(Constants):
     DELETE_VOLUME_RESPONSE = Constant('delete-volume-response')
     GET_VOLUME_REQUEST = Constant('get-volume-request')
     GET_VOLUME_RESPONSE = Constant('get-volume-response')
+    GET_VOLUMES_REQUEST = Constant('get-volumes-request')
+    GET_VOLUMES_RESPONSE = Constant('get-volumes-response')
 
     # Instance Definitions
     CREATE_INSTANCE_REQUEST = Constant('create-instance-request')
@@ -73,6 +77,8 @@ class _RPCMessageType(Constants):
     DELETE_INSTANCE_RESPONSE = Constant('delete-instance-response')
     GET_INSTANCE_REQUEST = Constant('get-instance-request')
     GET_INSTANCE_RESPONSE = Constant('get-instance-response')
+    GET_INSTANCES_REQUEST = Constant('get-instances-request')
+    GET_INSTANCES_RESPONSE = Constant('get-instances-response')
 
     # Subnet Definitions
     CREATE_SUBNET_REQUEST = Constant('create-subnet-request')
@@ -83,6 +89,8 @@ class _RPCMessageType(Constants):
     DELETE_SUBNET_RESPONSE = Constant('delete-subnet-response')
     GET_SUBNET_REQUEST = Constant('get-subnet-request')
     GET_SUBNET_RESPONSE = Constant('get-subnet-response')
+    GET_SUBNETS_REQUEST = Constant('get-subnets-request')
+    GET_SUBNETS_RESPONSE = Constant('get-subnets-response')
 
     # Network Definitions
     CREATE_NETWORK_REQUEST = Constant('create-network-request')
@@ -93,6 +101,8 @@ class _RPCMessageType(Constants):
     DELETE_NETWORK_RESPONSE = Constant('delete-network-response')
     GET_NETWORK_REQUEST = Constant('get-network-request')
     GET_NETWORK_RESPONSE = Constant('get-network-response')
+    GET_NETWORKS_REQUEST = Constant('get-networks-request')
+    GET_NETWORKS_RESPONSE = Constant('get-networks-response')
 
     # Software Update Definitions
     CREATE_SW_UPDATE_STRATEGY_REQUEST = Constant('create-sw-update-strategy-request')
@@ -3,9 +3,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
-import json
-
 from nfv_common import debug
+from nfv_common import tcp
 
 from nfv_vim.rpc._rpc_defs import RPC_MSG_RESULT
 from nfv_vim.rpc._rpc_defs import RPC_MSG_TYPE
@@ -33,16 +32,18 @@ class RPCMessage(object):
         """
         pass
 
-    def serialize(self):
+    def serialize(self, codec=None):
         """
-        Serialize RPC Message
+        Serialize RPC Message, as json unless another codec is given
         """
         msg = dict()
         msg['version'] = self.version
         msg['type'] = self.type
         msg['result'] = self.result
         self.serialize_payload(msg)
-        serialized_msg = json.dumps(msg)
+        if codec is None:
+            codec = tcp.TCP_CODEC.JSON
+        serialized_msg = tcp.tcp_codec_encode(msg, codec)
         return serialized_msg
 
     def deserialize_payload(self, msg):
@@ -54,9 +55,9 @@ class RPCMessage(object):
     @staticmethod
     def deserialize(msg):
         """
-        Deserialize RPC Message
+        Deserialize RPC Message, whichever codec it was serialized with
         """
-        msg = json.loads(msg)
+        msg = tcp.tcp_codec_decode(msg)
         msg_version = msg.get('version', RPC_MSG_VERSION.UNKNOWN)
         msg_type = msg.get('type', RPC_MSG_TYPE.UNKNOWN)
         msg_result = msg.get('result', RPC_MSG_RESULT.UNKNOWN)
@@ -74,6 +75,98 @@ class RPCMessage(object):
         return RPCMessageFactory.get(msg_version, msg_type, msg_result, msg)
 
 
+class RPCListRequest(RPCMessage):
+    """
+    RPC List Request Message, asks for a page of resources
+
+    The page starts after the resource identified by the marker and holds at
+    most limit resources (all when None). Only the fields named are returned
+    (all when None) and only resources matching all the filters are listed.
+    """
+    limit = None
+    marker = None
+    fields = None
+    filters = None
+
+    def __init__(self, msg_version, msg_type, msg_result):
+        super(RPCListRequest, self).__init__(msg_version, msg_type, msg_result)
+        self.filters = dict()
+
+    def serialize_payload(self, msg):
+        msg['limit'] = self.limit
+        msg['marker'] = self.marker
+        msg['fields'] = self.fields
+        msg['filters'] = self.filters
+
+    def deserialize_payload(self, msg):
+        self.limit = msg.get('limit', None)
+        self.marker = msg.get('marker', None)
+        self.fields = msg.get('fields', None)
+        self.filters = msg.get('filters', None) or dict()
+
+    def __str__(self):
+        return ("%s: limit=%s, marker=%s, fields=%s, filters=%s"
+                % (self.type, self.limit, self.marker, self.fields,
+                   self.filters))
+
+
+class RPCListResponse(RPCMessage):
+    """
+    RPC List Response Message, a batch of resources
+
+    A page is sent as one or more batches, the last batch is marked as the
+    end of the stream and gives the marker of the next page, None if there
+    are no more resources.
+    """
+    item_class = None
+    items = None
+    next_marker = None
+    end_of_stream = False
+
+    def __init__(self, msg_version, msg_type, msg_result):
+        super(RPCListResponse, self).__init__(msg_version, msg_type,
+                                              msg_result)
+        self.items = list()
+
+    def add_item(self, item, fields=None):
+        """
+        Add a resource, given as its get response message, to the batch
+        """
+        item_msg = dict()
+        item.serialize_payload(item_msg)
+        if fields is not None:
+            item_msg = dict((field, item_msg[field]) for field in fields
+                            if field in item_msg)
+        self.items.append(item_msg)
+
+    def get_items(self):
+        """
+        Returns the resources of the batch as get response messages, fields
+        not returned are None
+        """
+        items = list()
+        for item_msg in self.items:
+            item = self.item_class()
+            item.deserialize_payload(item_msg)
+            items.append(item)
+        return items
+
+    def serialize_payload(self, msg):
+        msg['items'] = self.items
+        msg['next_marker'] = self.next_marker
+        msg['end_of_stream'] = self.end_of_stream
+
+    def deserialize_payload(self, msg):
+        self.items = msg.get('items', None) or list()
+        self.next_marker = msg.get('next_marker', None)
+        self.end_of_stream = msg.get('end_of_stream', False)
+
+    def __str__(self):
+        return ("%s: items=%s, next_marker=%s, end_of_stream=%s"
+                % (self.type, len(self.items), self.next_marker,
+                   self.end_of_stream))
+
+
 class RPCMessageFactory(object):
     """
     RPC Message Factory
@@ -81,19 +174,23 @@ class RPCMessageFactory(object):
     from nfv_vim.rpc._rpc_message_image import APIRequestCreateImage
     from nfv_vim.rpc._rpc_message_image import APIRequestDeleteImage
     from nfv_vim.rpc._rpc_message_image import APIRequestGetImage
+    from nfv_vim.rpc._rpc_message_image import APIRequestGetImages
     from nfv_vim.rpc._rpc_message_image import APIRequestUpdateImage
     from nfv_vim.rpc._rpc_message_image import APIResponseCreateImage
     from nfv_vim.rpc._rpc_message_image import APIResponseDeleteImage
     from nfv_vim.rpc._rpc_message_image import APIResponseGetImage
+    from nfv_vim.rpc._rpc_message_image import APIResponseGetImages
     from nfv_vim.rpc._rpc_message_image import APIResponseUpdateImage
 
     from nfv_vim.rpc._rpc_message_volume import APIRequestCreateVolume
     from nfv_vim.rpc._rpc_message_volume import APIRequestDeleteVolume
     from nfv_vim.rpc._rpc_message_volume import APIRequestGetVolume
+    from nfv_vim.rpc._rpc_message_volume import APIRequestGetVolumes
     from nfv_vim.rpc._rpc_message_volume import APIRequestUpdateVolume
     from nfv_vim.rpc._rpc_message_volume import APIResponseCreateVolume
     from nfv_vim.rpc._rpc_message_volume import APIResponseDeleteVolume
     from nfv_vim.rpc._rpc_message_volume import APIResponseGetVolume
+    from nfv_vim.rpc._rpc_message_volume import APIResponseGetVolumes
     from nfv_vim.rpc._rpc_message_volume import APIResponseUpdateVolume
 
     from nfv_vim.rpc._rpc_message_instance import APIRequestColdMigrateInstance
@@ -101,6 +198,7 @@ class RPCMessageFactory(object):
     from nfv_vim.rpc._rpc_message_instance import APIRequestDeleteInstance
     from nfv_vim.rpc._rpc_message_instance import APIRequestEvacuateInstance
     from nfv_vim.rpc._rpc_message_instance import APIRequestGetInstance
+    from nfv_vim.rpc._rpc_message_instance import APIRequestGetInstances
     from nfv_vim.rpc._rpc_message_instance import APIRequestLiveMigrateInstance
     from nfv_vim.rpc._rpc_message_instance import APIRequestPauseInstance
     from nfv_vim.rpc._rpc_message_instance import APIRequestRebootInstance
@@ -114,6 +212,7 @@ class RPCMessageFactory(object):
     from nfv_vim.rpc._rpc_message_instance import APIResponseDeleteInstance
     from nfv_vim.rpc._rpc_message_instance import APIResponseEvacuateInstance
     from nfv_vim.rpc._rpc_message_instance import APIResponseGetInstance
+    from nfv_vim.rpc._rpc_message_instance import APIResponseGetInstances
     from nfv_vim.rpc._rpc_message_instance import APIResponseLiveMigrateInstance
     from nfv_vim.rpc._rpc_message_instance import APIResponsePauseInstance
     from nfv_vim.rpc._rpc_message_instance import APIResponseRebootInstance
@@ -126,19 +225,23 @@ class RPCMessageFactory(object):
     from nfv_vim.rpc._rpc_message_subnet import APIRequestCreateSubnet
     from nfv_vim.rpc._rpc_message_subnet import APIRequestDeleteSubnet
     from nfv_vim.rpc._rpc_message_subnet import APIRequestGetSubnet
+    from nfv_vim.rpc._rpc_message_subnet import APIRequestGetSubnets
     from nfv_vim.rpc._rpc_message_subnet import APIRequestUpdateSubnet
     from nfv_vim.rpc._rpc_message_subnet import APIResponseCreateSubnet
     from nfv_vim.rpc._rpc_message_subnet import APIResponseDeleteSubnet
     from nfv_vim.rpc._rpc_message_subnet import APIResponseGetSubnet
+    from nfv_vim.rpc._rpc_message_subnet import APIResponseGetSubnets
     from nfv_vim.rpc._rpc_message_subnet import APIResponseUpdateSubnet
 
     from nfv_vim.rpc._rpc_message_network import APIRequestCreateNetwork
     from nfv_vim.rpc._rpc_message_network import APIRequestDeleteNetwork
     from nfv_vim.rpc._rpc_message_network import APIRequestGetNetwork
+    from nfv_vim.rpc._rpc_message_network import APIRequestGetNetworks
     from nfv_vim.rpc._rpc_message_network import APIRequestUpdateNetwork
     from nfv_vim.rpc._rpc_message_network import APIResponseCreateNetwork
     from nfv_vim.rpc._rpc_message_network import APIResponseDeleteNetwork
     from nfv_vim.rpc._rpc_message_network import APIResponseGetNetwork
+    from nfv_vim.rpc._rpc_message_network import APIResponseGetNetworks
     from nfv_vim.rpc._rpc_message_network import APIResponseUpdateNetwork
 
     from nfv_vim.rpc._rpc_message_sw_update import APIRequestAbortSwUpdateStrategy
@@ -163,6 +266,8 @@ class RPCMessageFactory(object):
         RPC_MSG_TYPE.DELETE_IMAGE_RESPONSE: APIResponseDeleteImage,
         RPC_MSG_TYPE.GET_IMAGE_REQUEST: APIRequestGetImage,
         RPC_MSG_TYPE.GET_IMAGE_RESPONSE: APIResponseGetImage,
+        RPC_MSG_TYPE.GET_IMAGES_REQUEST: APIRequestGetImages,
+        RPC_MSG_TYPE.GET_IMAGES_RESPONSE: APIResponseGetImages,
 
         # Volume Mapping
         RPC_MSG_TYPE.CREATE_VOLUME_REQUEST: APIRequestCreateVolume,
@@ -173,6 +278,8 @@ class RPCMessageFactory(object):
         RPC_MSG_TYPE.DELETE_VOLUME_RESPONSE: APIResponseDeleteVolume,
         RPC_MSG_TYPE.GET_VOLUME_REQUEST: APIRequestGetVolume,
         RPC_MSG_TYPE.GET_VOLUME_RESPONSE: APIResponseGetVolume,
+        RPC_MSG_TYPE.GET_VOLUMES_REQUEST: APIRequestGetVolumes,
+        RPC_MSG_TYPE.GET_VOLUMES_RESPONSE: APIResponseGetVolumes,
 
         # Instance Mapping
         RPC_MSG_TYPE.CREATE_INSTANCE_REQUEST: APIRequestCreateInstance,
@@ -201,6 +308,8 @@ class RPCMessageFactory(object):
         RPC_MSG_TYPE.DELETE_INSTANCE_RESPONSE: APIResponseDeleteInstance,
         RPC_MSG_TYPE.GET_INSTANCE_REQUEST: APIRequestGetInstance,
         RPC_MSG_TYPE.GET_INSTANCE_RESPONSE: APIResponseGetInstance,
+        RPC_MSG_TYPE.GET_INSTANCES_REQUEST: APIRequestGetInstances,
+        RPC_MSG_TYPE.GET_INSTANCES_RESPONSE: APIResponseGetInstances,
 
         # Subnet Mapping
         RPC_MSG_TYPE.CREATE_SUBNET_REQUEST: APIRequestCreateSubnet,
@@ -211,6 +320,8 @@ class RPCMessageFactory(object):
         RPC_MSG_TYPE.DELETE_SUBNET_RESPONSE: APIResponseDeleteSubnet,
         RPC_MSG_TYPE.GET_SUBNET_REQUEST: APIRequestGetSubnet,
         RPC_MSG_TYPE.GET_SUBNET_RESPONSE: APIResponseGetSubnet,
+        RPC_MSG_TYPE.GET_SUBNETS_REQUEST: APIRequestGetSubnets,
+        RPC_MSG_TYPE.GET_SUBNETS_RESPONSE: APIResponseGetSubnets,
 
         # Network Mapping
         RPC_MSG_TYPE.CREATE_NETWORK_REQUEST: APIRequestCreateNetwork,
@@ -221,6 +332,8 @@ class RPCMessageFactory(object):
         RPC_MSG_TYPE.DELETE_NETWORK_RESPONSE: APIResponseDeleteNetwork,
         RPC_MSG_TYPE.GET_NETWORK_REQUEST: APIRequestGetNetwork,
         RPC_MSG_TYPE.GET_NETWORK_RESPONSE: APIResponseGetNetwork,
+        RPC_MSG_TYPE.GET_NETWORKS_REQUEST: APIRequestGetNetworks,
+        RPC_MSG_TYPE.GET_NETWORKS_RESPONSE: APIResponseGetNetworks,
 
         # Software Update Mapping
         RPC_MSG_TYPE.CREATE_SW_UPDATE_STRATEGY_REQUEST: APIRequestCreateSwUpdateStrategy,
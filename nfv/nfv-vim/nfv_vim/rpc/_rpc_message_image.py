@@ -8,6 +8,8 @@ from nfv_common import debug
 from nfv_vim.rpc._rpc_defs import RPC_MSG_RESULT
 from nfv_vim.rpc._rpc_defs import RPC_MSG_TYPE
 from nfv_vim.rpc._rpc_defs import RPC_MSG_VERSION
+from nfv_vim.rpc._rpc_message import RPCListRequest
+from nfv_vim.rpc._rpc_message import RPCListResponse
 from nfv_vim.rpc._rpc_message import RPCMessage
 
 DLOG = debug.debug_get_logger('nfv_vim.rpc.image')
@@ -345,3 +347,27 @@ class APIResponseGetImage(RPCMessage):
         return "get-image response: %s, %s, %s, %s" % (self.uuid, self.name,
                                                        self.container_format,
                                                        self.disk_format)
+
+
+class APIRequestGetImages(RPCListRequest):
+    """
+    RPC API Request Message - Get Images
+    """
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_IMAGES_REQUEST,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIRequestGetImages, self).__init__(msg_version, msg_type,
+                                                  msg_result)
+
+
+class APIResponseGetImages(RPCListResponse):
+    """
+    RPC API Response Message - Get Images
+    """
+    item_class = APIResponseGetImage
+
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_IMAGES_RESPONSE,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIResponseGetImages, self).__init__(msg_version, msg_type,
+                                                   msg_result)
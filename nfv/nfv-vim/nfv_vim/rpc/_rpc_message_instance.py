@@ -8,6 +8,8 @@ from nfv_common import debug
 from nfv_vim.rpc._rpc_defs import RPC_MSG_RESULT
 from nfv_vim.rpc._rpc_defs import RPC_MSG_TYPE
 from nfv_vim.rpc._rpc_defs import RPC_MSG_VERSION
+from nfv_vim.rpc._rpc_message import RPCListRequest
+from nfv_vim.rpc._rpc_message import RPCListResponse
 from nfv_vim.rpc._rpc_message import RPCMessage
 
 DLOG = debug.debug_get_logger('nfv_vim.rpc.instance')
@@ -744,3 +746,27 @@ class APIResponseGetInstance(RPCMessage):
 
     def __str__(self):
         return "get-instance response: %s" % self.uuid
+
+
+class APIRequestGetInstances(RPCListRequest):
+    """
+    RPC API Request Message - Get Instances
+    """
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_INSTANCES_REQUEST,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIRequestGetInstances, self).__init__(msg_version, msg_type,
+                                                     msg_result)
+
+
+class APIResponseGetInstances(RPCListResponse):
+    """
+    RPC API Response Message - Get Instances
+    """
+    item_class = APIResponseGetInstance
+
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_INSTANCES_RESPONSE,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIResponseGetInstances, self).__init__(msg_version, msg_type,
+                                                      msg_result)
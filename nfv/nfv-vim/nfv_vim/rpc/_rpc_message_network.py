@@ -8,6 +8,8 @@ from nfv_common import debug
 from nfv_vim.rpc._rpc_defs import RPC_MSG_RESULT
 from nfv_vim.rpc._rpc_defs import RPC_MSG_TYPE
 from nfv_vim.rpc._rpc_defs import RPC_MSG_VERSION
+from nfv_vim.rpc._rpc_message import RPCListRequest
+from nfv_vim.rpc._rpc_message import RPCListResponse
 from nfv_vim.rpc._rpc_message import RPCMessage
 
 DLOG = debug.debug_get_logger('nfv_vim.rpc.network')
@@ -289,3 +291,27 @@ class APIResponseGetNetwork(RPCMessage):
 
     def __str__(self):
         return "get-network response: %s, %s" % (self.uuid, self.name)
+
+
+class APIRequestGetNetworks(RPCListRequest):
+    """
+    RPC API Request Message - Get Networks
+    """
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_NETWORKS_REQUEST,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIRequestGetNetworks, self).__init__(msg_version, msg_type,
+                                                    msg_result)
+
+
+class APIResponseGetNetworks(RPCListResponse):
+    """
+    RPC API Response Message - Get Networks
+    """
+    item_class = APIResponseGetNetwork
+
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_NETWORKS_RESPONSE,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIResponseGetNetworks, self).__init__(msg_version, msg_type,
+                                                     msg_result)
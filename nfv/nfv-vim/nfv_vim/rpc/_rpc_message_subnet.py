@@ -8,6 +8,8 @@ from nfv_common import debug
 from nfv_vim.rpc._rpc_defs import RPC_MSG_RESULT
 from nfv_vim.rpc._rpc_defs import RPC_MSG_TYPE
 from nfv_vim.rpc._rpc_defs import RPC_MSG_VERSION
+from nfv_vim.rpc._rpc_message import RPCListRequest
+from nfv_vim.rpc._rpc_message import RPCListResponse
 from nfv_vim.rpc._rpc_message import RPCMessage
 
 DLOG = debug.debug_get_logger('nfv_vim.rpc.subnet')
@@ -317,3 +319,27 @@ class APIResponseGetSubnet(RPCMessage):
     def __str__(self):
         return "get-subnet response: %s, %s, %s" % (self.uuid, self.name,
                                                     self.network_uuid)
+
+
+class APIRequestGetSubnets(RPCListRequest):
+    """
+    RPC API Request Message - Get Subnets
+    """
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_SUBNETS_REQUEST,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIRequestGetSubnets, self).__init__(msg_version, msg_type,
+                                                   msg_result)
+
+
+class APIResponseGetSubnets(RPCListResponse):
+    """
+    RPC API Response Message - Get Subnets
+    """
+    item_class = APIResponseGetSubnet
+
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_SUBNETS_RESPONSE,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIResponseGetSubnets, self).__init__(msg_version, msg_type,
+                                                    msg_result)
@@ -8,6 +8,8 @@ from nfv_common import debug
 from nfv_vim.rpc._rpc_defs import RPC_MSG_RESULT
 from nfv_vim.rpc._rpc_defs import RPC_MSG_TYPE
 from nfv_vim.rpc._rpc_defs import RPC_MSG_VERSION
+from nfv_vim.rpc._rpc_message import RPCListRequest
+from nfv_vim.rpc._rpc_message import RPCListResponse
 from nfv_vim.rpc._rpc_message import RPCMessage
 
 DLOG = debug.debug_get_logger('nfv_vim.rpc.volume')
@@ -272,3 +274,27 @@ class APIResponseGetVolume(RPCMessage):
         return ("get-volume response: %s, %s, %s, %s, %s, %s"
                 % (self.uuid, self.name, self.description, self.size_gb,
                    self.bootable, self.encrypted))
+
+
+class APIRequestGetVolumes(RPCListRequest):
+    """
+    RPC API Request Message - Get Volumes
+    """
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_VOLUMES_REQUEST,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIRequestGetVolumes, self).__init__(msg_version, msg_type,
+                                                   msg_result)
+
+
+class APIResponseGetVolumes(RPCListResponse):
+    """
+    RPC API Response Message - Get Volumes
+    """
+    item_class = APIResponseGetVolume
+
+    def __init__(self, msg_version=RPC_MSG_VERSION.VERSION_1_0,
+                 msg_type=RPC_MSG_TYPE.GET_VOLUMES_RESPONSE,
+                 msg_result=RPC_MSG_RESULT.SUCCESS):
+        super(APIResponseGetVolumes, self).__init__(msg_version, msg_type,
+                                                    msg_result)
@@ -21,6 +21,7 @@ from nfv_vim.objects import HOST_SERVICES
 from nfv_vim.objects import INSTANCE_GROUP_POLICY
 from nfv_vim.objects import SW_UPDATE_APPLY_TYPE
 from nfv_vim.objects import SW_UPDATE_INSTANCE_ACTION
+from nfv_vim.strategy import _strategy_batching
 
 
 DLOG = debug.debug_get_logger('nfv_vim.strategy')
@@ -174,17 +175,6 @@ class SwUpdateStrategy(strategy.Strategy):
         """
         from nfv_vim import tables
 
-        def has_policy_conflict(peer_host):
-            for instance in instance_table.on_host(host.name):
-                for peer_instance in instance_table.on_host(peer_host.name):
-                    for policy in policies:
-                        if instance_group_table.same_group(policy, instance.uuid,
-                                                           peer_instance.uuid):
-                            return True
-            DLOG.debug("No instance group policy conflict between host %s and "
-                       "host %s." % (host.name, peer_host.name))
-            return False
-
         def calculate_host_aggregate_limits():
             """
             Calculate limit for each host aggregate
@@ -215,39 +205,6 @@ class SwUpdateStrategy(strategy.Strategy):
                     host_aggregate_limit[host_aggregate] = max(
                         1, int(aggregate_count * aggregate_ratio))
 
-        def aggregate_limit_reached():
-            """
-            Determine whether adding this host to a host_list would exceed
-            the number of hosts to be updated in the same aggregate
-            Note: This isn't efficient, because we will be calling the
-            host_aggregate_table.get_by_host many times, which will traverse
-            all the aggregates each time. It would be more efficient to
-            create a dictionary mapping host names to a list of aggregates
-            for that host. We could do this once and then use it to more
-            quickly calculate the host_aggregate_count here.
-            """
-
-            # count the number of hosts from the current host_list in each aggregate
-            host_aggregate_count = {}
-            for existing_host in host_list:
-                for aggregate in host_aggregate_table.get_by_host(
-                        existing_host.name):
-                    if aggregate.name in host_aggregate_count:
-                        host_aggregate_count[aggregate.name] += 1
-                    else:
-                        host_aggregate_count[aggregate.name] = 1
-
-            # now check whether adding the current host will exceed the limit
-            # for any aggregate
-            for aggregate in host_aggregate_table.get_by_host(host.name):
-                if aggregate.name in host_aggregate_count:
-                    if host_aggregate_count[aggregate.name] == \
-                            host_aggregate_limit[aggregate.name]:
-                        return True
-
-            DLOG.debug("No host aggregate limit reached for host %s." % (host.name))
-            return False
-
         instance_table = tables.tables_get_instance_table()
         instance_group_table = tables.tables_get_instance_group_table()
 
@@ -306,6 +263,7 @@ class SwUpdateStrategy(strategy.Strategy):
             calculate_host_aggregate_limits()
             controller_list = list()
             host_lists.append([])  # start with empty list of workers
+            batch_hosts = list()
 
             for host in worker_hosts:
                 if HOST_PERSONALITY.CONTROLLER in host.personality:
@@ -321,28 +279,41 @@ class SwUpdateStrategy(strategy.Strategy):
                     host_lists[0].append(host)
                     continue
 
-                # find the first list that can add this host else create a new list
-                for idx in range(1, len(host_lists), 1):
-                    host_list = host_lists[idx]
-                    if len(host_list) >= self._max_parallel_worker_hosts:
-                        # this list is full - don't add the host
+                batch_hosts.append(host)
+
+            if batch_hosts:
+                # hosts with instances of the same anti-affinity group and
+                # too many hosts of an aggregate must not be updated at the
+                # same time
+                host_idx = dict((host.name, idx)
+                                for idx, host in enumerate(batch_hosts))
+                conflict_groups = list()
+                for instance_group in instance_group_table.values():
+                    if not any(policy in instance_group.policies
+                               for policy in policies):
                         continue
-
-                    for peer_host in host_list:
-                        if has_policy_conflict(peer_host):
-                            # don't add host to the current list
-                            break
-                    else:
-                        if aggregate_limit_reached():
-                            # don't add host to the current list
-                            continue
-
-                        # add host to the current list
-                        host_list.append(host)
-                        break
-                else:
-                    # create a new list with this host
-                    host_lists.append([host])
+                    group = set()
+                    for member_uuid in instance_group.member_uuids:
+                        instance = instance_table.get(member_uuid, None)
+                        if instance is not None and \
+                                instance.host_name in host_idx:
+                            group.add(host_idx[instance.host_name])
+                    if 1 < len(group):
+                        conflict_groups.append(sorted(group))
+
+                aggregates = list()
+                for host_aggregate in sorted(host_aggregate_limit.keys()):
+                    hosts = [host_idx[host_name] for host_name
+                             in host_aggregate_table[host_aggregate].host_names
+                             if host_name in host_idx]
+                    if hosts:
+                        aggregates.append(
+                            (hosts, host_aggregate_limit[host_aggregate]))
+
+                for batch in _strategy_batching.host_batches(
+                        len(batch_hosts), self._max_parallel_worker_hosts,
+                        conflict_groups, aggregates):
+                    host_lists.append([batch_hosts[idx] for idx in batch])
 
             if controller_list:
                 # handle controller hosts first
@@ -457,11 +428,11 @@ class SwUpdateStrategy(strategy.Strategy):
 
         return self
 
-    def as_dict(self):
+    def as_dict(self, include_stages=True):
         """
         Represent the software update strategy as a dictionary
         """
-        data = super(SwUpdateStrategy, self).as_dict()
+        data = super(SwUpdateStrategy, self).as_dict(include_stages)
         data['controller_apply_type'] = self._controller_apply_type
         data['storage_apply_type'] = self._storage_apply_type
         data['swift_apply_type'] = self._swift_apply_type
@@ -1115,11 +1086,11 @@ class SwPatchStrategy(SwUpdateStrategy):
 
         return self
 
-    def as_dict(self):
+    def as_dict(self, include_stages=True):
         """
         Represent the software patch strategy as a dictionary
         """
-        data = super(SwPatchStrategy, self).as_dict()
+        data = super(SwPatchStrategy, self).as_dict(include_stages)
 
         data['single_controller'] = self._single_controller
 
@@ -1648,11 +1619,11 @@ class SwUpgradeStrategy(SwUpdateStrategy):
 
         return self
 
-    def as_dict(self):
+    def as_dict(self, include_stages=True):
         """
         Represent the software upgrade strategy as a dictionary
         """
-        data = super(SwUpgradeStrategy, self).as_dict()
+        data = super(SwUpgradeStrategy, self).as_dict(include_stages)
 
         data['start_upgrade'] = self._start_upgrade
         data['complete_upgrade'] = self._complete_upgrade
@@ -1997,11 +1968,11 @@ class FwUpdateStrategy(SwUpdateStrategy):
             self._nfvi_alarms = nfvi_alarms
         return self
 
-    def as_dict(self):
+    def as_dict(self, include_stages=True):
         """
         Return firmware update strategy nfvi data object as dictionary.
         """
-        data = super(FwUpdateStrategy, self).as_dict()
+        data = super(FwUpdateStrategy, self).as_dict(include_stages)
 
         data['single_controller'] = self._single_controller
 
@@ -0,0 +1,271 @@
+#
+# Copyright (c) 2015-2020 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import heapq
+
+from nfv_common import debug
+
+DLOG = debug.debug_get_logger('nfv_vim.strategy.batching')
+
+# Moves the improvement pass may evaluate, a count rather than a time so
+# that the same hosts are always given the same batches
+IMPROVE_MAX_MOVES = 500000
+
+
+class _Batches(object):
+    """
+    Hosts assigned to batches, hosts and batches are indexes
+
+    Hosts of a conflict group may not share a batch, a batch holds at most
+    max_batch_size hosts and at most the limit of the hosts of each
+    aggregate.
+    """
+    def __init__(self, num_hosts, max_batch_size, conflict_groups, aggregates):
+        self.max_batch_size = max(1, max_batch_size)
+        self.neighbours = [set() for _ in range(num_hosts)]
+        for group in conflict_groups:
+            for host in group:
+                self.neighbours[host].update(group)
+        for host in range(num_hosts):
+            self.neighbours[host].discard(host)
+
+        self.host_aggregates = [list() for _ in range(num_hosts)]
+        self.limits = list()
+        for aggregate, (hosts, limit) in enumerate(aggregates):
+            self.limits.append(max(1, limit))
+            for host in hosts:
+                self.host_aggregates[host].append(aggregate)
+
+        self.batch_of = [None] * num_hosts
+        self.batches = list()
+        self.aggregate_counts = list()
+        self.moves = 0
+
+    def lower_bound(self, conflict_groups, aggregates):
+        """
+        Returns a number of batches no assignment can go below
+        """
+        num_hosts = len(self.batch_of)
+        bound = -(-num_hosts // self.max_batch_size)
+        for group in conflict_groups:
+            bound = max(bound, len(set(group)))
+        for aggregate, (hosts, _) in enumerate(aggregates):
+            bound = max(bound, -(-len(set(hosts)) // self.limits[aggregate]))
+        return bound
+
+    def fits(self, host, batch, without=None):
+        """
+        Returns true if a host can join a batch, as if the host given as
+        without had left it
+        """
+        self.moves += 1
+        hosts = self.batches[batch]
+        size = len(hosts)
+        if without is not None and without in hosts:
+            size -= 1
+        else:
+            without = None
+        if size >= self.max_batch_size:
+            return False
+
+        batch_of = self.batch_of
+        for peer in self.neighbours[host]:
+            if batch_of[peer] == batch and peer != without:
+                return False
+
+        counts = self.aggregate_counts[batch]
+        for aggregate in self.host_aggregates[host]:
+            count = counts.get(aggregate, 0)
+            if without is not None and \
+                    aggregate in self.host_aggregates[without]:
+                count -= 1
+            if count >= self.limits[aggregate]:
+                return False
+        return True
+
+    def add(self, host, batch=None):
+        if batch is None:
+            batch = len(self.batches)
+            self.batches.append(set())
+            self.aggregate_counts.append(dict())
+        self.batches[batch].add(host)
+        self.batch_of[host] = batch
+        counts = self.aggregate_counts[batch]
+        for aggregate in self.host_aggregates[host]:
+            counts[aggregate] = counts.get(aggregate, 0) + 1
+        return batch
+
+    def remove(self, host):
+        batch = self.batch_of[host]
+        self.batches[batch].discard(host)
+        self.batch_of[host] = None
+        counts = self.aggregate_counts[batch]
+        for aggregate in self.host_aggregates[host]:
+            counts[aggregate] -= 1
+
+    def move(self, host, batch):
+        self.remove(host)
+        self.add(host, batch)
+
+    def first_fit(self, host, exclude=()):
+        """
+        Returns the first batch a host can join
+        """
+        for batch, hosts in enumerate(self.batches):
+            if hosts and batch not in exclude and self.fits(host, batch):
+                return batch
+        return None
+
+    def num_batches(self):
+        return sum(1 for hosts in self.batches if hosts)
+
+    def result(self):
+        """
+        Returns the batches ordered by their first host, each in host order
+        """
+        return sorted(sorted(hosts) for hosts in self.batches if hosts)
+
+    def save(self):
+        return (list(self.batch_of), [set(hosts) for hosts in self.batches],
+                [dict(counts) for counts in self.aggregate_counts])
+
+    def restore(self, state):
+        batch_of, batches, aggregate_counts = state
+        self.batch_of = list(batch_of)
+        self.batches = [set(hosts) for hosts in batches]
+        self.aggregate_counts = [dict(counts) for counts in aggregate_counts]
+
+
+def _first_fit(num_hosts, max_batch_size, conflict_groups, aggregates):
+    """
+    Each host, in order, joins the first batch it fits in
+    """
+    batches = _Batches(num_hosts, max_batch_size, conflict_groups, aggregates)
+    for host in range(num_hosts):
+        batches.add(host, batches.first_fit(host))
+    return batches
+
+
+def _dsatur(num_hosts, max_batch_size, conflict_groups, aggregates):
+    """
+    The host with conflicts in the most batches (then with the most
+    conflicts, then the first) joins the first batch it fits in, until
+    every host is in a batch
+    """
+    batches = _Batches(num_hosts, max_batch_size, conflict_groups, aggregates)
+    saturation = [set() for _ in range(num_hosts)]
+    degree = [len(peers) for peers in batches.neighbours]
+
+    heap = [(0, -degree[host], host) for host in range(num_hosts)]
+    heapq.heapify(heap)
+    while heap:
+        neg_saturation, _, host = heapq.heappop(heap)
+        if batches.batch_of[host] is not None or \
+                -neg_saturation != len(saturation[host]):
+            continue
+
+        batch = batches.add(host, batches.first_fit(host))
+        for peer in batches.neighbours[host]:
+            if batches.batch_of[peer] is None and \
+                    batch not in saturation[peer]:
+                saturation[peer].add(batch)
+                heapq.heappush(heap, (-len(saturation[peer]), -degree[peer],
+                                      peer))
+    return batches
+
+
+def _empty_batch(batches, batch, max_moves):
+    """
+    Move every host out of a batch, directly or by moving a host out of the
+    way to a third batch, returns false if a host is left
+    """
+    for host in sorted(batches.batches[batch]):
+        if batches.moves > max_moves:
+            return False
+
+        target = batches.first_fit(host, exclude=(batch,))
+        if target is not None:
+            batches.move(host, target)
+            continue
+
+        for other, hosts in enumerate(batches.batches):
+            if not hosts or other == batch:
+                continue
+            blockers = [peer for peer in batches.neighbours[host]
+                        if batches.batch_of[peer] == other]
+            if 1 < len(blockers):
+                continue
+            for blocker in (blockers or sorted(hosts)):
+                if not batches.fits(host, other, without=blocker):
+                    continue
+                target = batches.first_fit(blocker, exclude=(batch, other))
+                if target is not None:
+                    batches.move(blocker, target)
+                    batches.move(host, other)
+                    break
+            else:
+                continue
+            break
+        else:
+            return False
+    return True
+
+
+def _improve(batches, lower_bound, max_moves):
+    """
+    Empty the smallest batches while it can be done within the moves
+    allowed
+    """
+    batches.moves = 0
+    improved = True
+    while improved and batches.num_batches() > lower_bound:
+        improved = False
+        candidates = sorted((len(hosts), -batch)
+                            for batch, hosts in enumerate(batches.batches)
+                            if hosts)
+        for _, neg_batch in candidates:
+            if batches.moves > max_moves:
+                return
+            state = batches.save()
+            if _empty_batch(batches, -neg_batch, max_moves):
+                improved = True
+                break
+            batches.restore(state)
+
+
+def host_batches(num_hosts, max_batch_size, conflict_groups=None,
+                 aggregates=None, max_moves=IMPROVE_MAX_MOVES):
+    """
+    Assign hosts to as few batches as possible
+
+    Hosts are indexes, no two hosts of a conflict group (a list of hosts)
+    share a batch, and a batch holds at most max_batch_size hosts and at
+    most limit hosts of each aggregate (a tuple of a list of hosts and a
+    limit). Returns lists of hosts, ordered by their first host.
+
+    Each host joining the first batch it fits in is kept unless colouring
+    the conflicts by saturation followed by the improvement pass needs
+    fewer batches.
+    """
+    conflict_groups = conflict_groups or list()
+    aggregates = aggregates or list()
+
+    first_fit = _first_fit(num_hosts, max_batch_size, conflict_groups,
+                           aggregates)
+    lower_bound = first_fit.lower_bound(conflict_groups, aggregates)
+    if first_fit.num_batches() <= lower_bound:
+        return first_fit.result()
+
+    solved = _dsatur(num_hosts, max_batch_size, conflict_groups, aggregates)
+    _improve(solved, lower_bound, max_moves)
+
+    DLOG.verbose("Hosts=%s, first-fit batches=%s, solved batches=%s, lower "
+                 "bound=%s, moves=%s." % (num_hosts, first_fit.num_batches(),
+                                          solved.num_batches(), lower_bound,
+                                          solved.moves))
+
+    if solved.num_batches() < first_fit.num_batches():
+        return solved.result()
+    return first_fit.result()
@@ -16,11 +16,11 @@ class HypervisorTable(Table):
     """
     def __init__(self):
         super(HypervisorTable, self).__init__()
+        self._add_index('host_name', lambda hypervisor: hypervisor.host_name)
 
     def get_by_host_name(self, host_name, default=None):
-        for hypervisor in self._entries.values():
-            if hypervisor.host_name == host_name:
-                return hypervisor
+        for hypervisor in self._index_lookup('host_name', host_name):
+            return hypervisor
         return default
 
     def _persist_value(self, value):
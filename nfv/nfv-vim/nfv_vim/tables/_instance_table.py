@@ -16,17 +16,14 @@ class InstanceTable(Table):
     """
     def __init__(self):
         super(InstanceTable, self).__init__()
+        self._add_index('host_name', lambda instance: instance.host_name)
 
     def on_host(self, host_name):
-        for instance in self._entries.values():
-            if instance.on_host(host_name):
-                yield instance
+        for instance in self._index_lookup('host_name', host_name):
+            yield instance
 
     def exist_on_host(self, host_name):
-        for instance in self._entries.values():
-            if instance.on_host(host_name):
-                return True
-        return False
+        return self._index_exists('host_name', host_name)
 
     def _persist_value(self, value):
         database.database_instance_add(value)
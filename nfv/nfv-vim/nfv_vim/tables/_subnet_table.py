@@ -16,26 +16,24 @@ class SubnetTable(Table):
     """
     def __init__(self):
         super(SubnetTable, self).__init__()
+        self._add_index('name', lambda subnet: subnet.name)
+        self._add_index('network_uuid', lambda subnet: subnet.network_uuid)
 
     def get_by_name(self, subnet_name):
-        for subnet_uuid in _subnet_table.keys():
-            if _subnet_table[subnet_uuid].name == subnet_name:
-                return _subnet_table[subnet_uuid]
+        for subnet in self._index_lookup('name', subnet_name):
+            return subnet
         return None
 
     def get_by_network_and_ip(self, network_uuid, subnet_ip, subnet_prefix):
-        for subnet_uuid in _subnet_table.keys():
-            subnet = _subnet_table[subnet_uuid]
-            if subnet.network_uuid == network_uuid:
-                if str(subnet.subnet_ip).lower() == str(subnet_ip).lower():
-                    if str(subnet.subnet_prefix) == str(subnet_prefix):
-                        return _subnet_table[subnet_uuid]
+        for subnet in self._index_lookup('network_uuid', network_uuid):
+            if str(subnet.subnet_ip).lower() == str(subnet_ip).lower():
+                if str(subnet.subnet_prefix) == str(subnet_prefix):
+                    return subnet
         return None
 
     def on_network(self, network_uuid):
-        for subnet in self._entries.values():
-            if network_uuid == subnet.network_uuid:
-                yield subnet
+        for subnet in self._index_lookup('network_uuid', network_uuid):
+            yield subnet
 
     def _persist_value(self, value):
         database.database_subnet_add(value)
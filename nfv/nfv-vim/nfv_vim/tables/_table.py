@@ -16,6 +16,8 @@ class Table(collections.MutableMapping):
         """
         self._persist = True
         self._entries = dict()
+        self._indexes = dict()
+        self._index_keys = dict()
 
     @property
     def persist(self):
@@ -45,6 +47,87 @@ class Table(collections.MutableMapping):
         """
         pass
 
+    def _add_index(self, index_name, index_func):
+        """
+        Declare a secondary index on the table, index_func is called with a
+        table value and returns the index key the value is filed under
+        """
+        self._indexes[index_name] = (index_func, dict())
+        for key, value in self._entries.items():
+            self._index_value(index_name, key, value)
+
+    def _index_value(self, index_name, key, value):
+        """
+        File a value under its current index key for the given index
+        """
+        if value is None:
+            return
+
+        index_func, index = self._indexes[index_name]
+        index_key = index_func(value)
+        index.setdefault(index_key, collections.OrderedDict())[key] = None
+        self._index_keys.setdefault(key, dict())[index_name] = index_key
+
+    def _unindex_value(self, key):
+        """
+        Remove a value from all secondary indexes
+        """
+        index_keys = self._index_keys.pop(key, None)
+        if index_keys is None:
+            return
+
+        for index_name, index_key in index_keys.items():
+            index = self._indexes[index_name][1]
+            keys = index.get(index_key, None)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del index[index_key]
+
+    def _index_lookup(self, index_name, index_key):
+        """
+        Returns the values filed under an index key, in the order they
+        were indexed
+        """
+        keys = self._indexes[index_name][1].get(index_key, None)
+        if keys is None:
+            return list()
+        return [self._entries[key] for key in keys]
+
+    def _index_exists(self, index_name, index_key):
+        """
+        Returns true if any value is filed under an index key
+        """
+        return index_key in self._indexes[index_name][1]
+
+    def _reindex_entry(self, key, value):
+        """
+        File an entry under all secondary indexes
+        """
+        self._unindex_value(key)
+        for index_name in self._indexes.keys():
+            self._index_value(index_name, key, value)
+
+    def reindex(self, key):
+        """
+        Refresh the secondary indexes for an entry, needs to be called when
+        an attribute that is indexed on changes
+        """
+        if not self._indexes or key not in self._entries:
+            return
+
+        value = self._entries[key]
+        if value is not None:
+            index_keys = self._index_keys.get(key, dict())
+            for index_name, (index_func, _) in self._indexes.items():
+                if index_name not in index_keys or \
+                        index_keys[index_name] != index_func(value):
+                    break
+            else:
+                return
+
+        self._reindex_entry(key, value)
+
     def __getitem__(self, key):
         """
         Get an item from the table based on a key
@@ -60,6 +143,9 @@ class Table(collections.MutableMapping):
 
         self._entries[key] = value
 
+        if self._indexes:
+            self.reindex(key)
+
     def __delitem__(self, key):
         """
         Delete an item from the table
@@ -67,6 +153,8 @@ class Table(collections.MutableMapping):
         if key is not None and self._persist:
             self._unpersist_value(key)
         del self._entries[key]
+        if self._indexes:
+            self._unindex_value(key)
 
     def __contains__(self, key):
         """
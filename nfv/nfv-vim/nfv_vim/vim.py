@@ -68,8 +68,10 @@ def process_initialize():
     init_complete = True
 
     debug.debug_initialize(config.CONF['debug'], 'VIM')
+    histogram.histogram_initialize(config.CONF.get('histogram'), 'nfv-vim')
     profiler.profiler_initialize()
-    selobj.selobj_initialize()
+    selobj.selobj_initialize(config.CONF['vim'].get(
+        'selobj_backend', selobj.SELOBJ_BACKEND.SELECT))
     timers.timers_initialize(PROCESS_TICK_INTERVAL_IN_MS,
                              PROCESS_TICK_MAX_DELAY_IN_MS,
                              PROCESS_TICK_DELAY_DEBOUNCE_IN_MS)
@@ -166,6 +168,8 @@ def process_main():
         while stay_on:
             selobj.selobj_dispatch(PROCESS_TICK_INTERVAL_IN_MS)
             timers.timers_schedule()
+            histogram.export_histogram_data()
+            debug.debug_flush()
 
             if not alarm.alarm_subsystem_sane():
                 DLOG.error("Alarm subsystem is not sane, exiting")
@@ -184,6 +188,7 @@ def process_main():
             if dump_data_captured:
                 DLOG.info("Dump captured data signalled.")
                 histogram.display_histogram_data()
+                histogram.export_histogram_data(force=True)
                 profiler.profile_memory_dump()
                 DLOG.info("Dump captured data complete.")
                 dump_data_captured = False
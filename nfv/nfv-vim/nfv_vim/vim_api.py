@@ -8,15 +8,15 @@ from netaddr import IPAddress
 import signal
 import socket
 import sys
-from wsgiref import simple_server
 
 from nfv_common import config
 from nfv_common import debug
+from nfv_common import histogram
 from nfv_common import selobj
 from nfv_common import timers
 
 from nfv_common.helpers import coroutine
-from nfv_vim.api import Application
+from nfv_vim import api
 
 PROCESS_TICK_INTERVAL_IN_MS = 500
 PROCESS_TICK_MAX_DELAY_IN_MS = 2000
@@ -28,6 +28,9 @@ DLOG = debug.debug_get_logger('nfv_vim.api')
 
 stay_on = True
 do_reload = False
+dump_data_captured = False
+reset_data_captured = False
+wsgi_server = None
 
 
 def get_address_family(ip_string):
@@ -45,7 +48,7 @@ def process_signal_handler(signum, frame):
     """
     Virtual Infrastructure Manager API - Process Signal Handler
     """
-    global stay_on, do_reload
+    global stay_on, do_reload, dump_data_captured, reset_data_captured
 
     if signal.SIGTERM == signum:
         stay_on = False
@@ -53,6 +56,10 @@ def process_signal_handler(signum, frame):
         stay_on = False
     elif signal.SIGHUP == signum:
         do_reload = True
+    elif signal.SIGUSR1 == signum:
+        dump_data_captured = True
+    elif signal.SIGUSR2 == signum:
+        reset_data_captured = True
     else:
         print("Ignoring signal" % signum)
 
@@ -79,42 +86,54 @@ def process_event_handler(wsgi):
                 pass
 
 
-def get_handler_cls():
-    cls = simple_server.WSGIRequestHandler
-
-    # old-style class doesn't support super
-    class MyHandler(cls, object):
-        def address_string(self):
-            # In the future, we could provide a config option to allow
-            # reverse DNS lookups.
-            return self.client_address[0]
-
-    return MyHandler
-
-
 def process_initialize():
     """
     Virtual Infrastructure Manager API - Initialize
     """
     debug.debug_initialize(config.CONF['debug'], 'VIM-API')
-    selobj.selobj_initialize()
+    histogram.histogram_initialize(config.CONF.get('histogram'), 'nfv-vim-api')
+    selobj.selobj_initialize(config.CONF['vim-api'].get(
+        'selobj_backend', selobj.SELOBJ_BACKEND.SELECT))
     timers.timers_initialize(PROCESS_TICK_INTERVAL_IN_MS,
                              PROCESS_TICK_MAX_DELAY_IN_MS,
                              PROCESS_TICK_DELAY_DEBOUNCE_IN_MS)
 
-    ip = config.CONF['vim-api']['host']
-    port = int(config.CONF['vim-api']['port'])
+    global wsgi_server
+
+    section = config.CONF['vim-api']
+    ip = section['host']
+    port = int(section['port'])
     # In order to support IPv6, set the address family before creating the server.
-    simple_server.WSGIServer.address_family = get_address_family(ip)
-    wsgi = simple_server.make_server(ip, port, Application(),
-                                     handler_class=get_handler_cls())
+    api.WSGIServer.address_family = get_address_family(ip)
+    wsgi = api.make_server(
+        ip, port, api.Application(),
+        num_workers=int(section.get('workers', 0)),
+        queue_size=int(section.get('request_queue_size', 64)),
+        keepalive_timeout_in_secs=int(section.get('keepalive_timeout', 5)))
+    wsgi.start()
     selobj.selobj_add_read_obj(wsgi, process_event_handler, wsgi)
+    wsgi_server = wsgi
+
+
+def process_drain():
+    """
+    Virtual Infrastructure Manager API - Drain, stop accepting connections
+    and let the requests in progress finish
+    """
+    global wsgi_server
+
+    if wsgi_server is not None:
+        selobj.selobj_del_read_obj(wsgi_server)
+        wsgi_server.server_close()
+        wsgi_server.drain(int(config.CONF['vim-api'].get('drain_timeout', 30)))
+        wsgi_server = None
 
 
 def process_finalize():
     """
     Virtual Infrastructure Manager API - Finalize
     """
+    process_drain()
     timers.timers_finalize()
     selobj.selobj_finalize()
     debug.debug_finalize()
@@ -124,12 +143,14 @@ def process_main():
     """
     Virtual Infrastructure Manager API - Main
     """
-    global do_reload
+    global do_reload, dump_data_captured, reset_data_captured
 
     try:
         signal.signal(signal.SIGHUP, process_signal_handler)
         signal.signal(signal.SIGINT, process_signal_handler)
         signal.signal(signal.SIGTERM, process_signal_handler)
+        signal.signal(signal.SIGUSR1, process_signal_handler)
+        signal.signal(signal.SIGUSR2, process_signal_handler)
 
         parser = argparse.ArgumentParser()
         parser.add_argument('-c', '--config', help='configuration file')
@@ -150,11 +171,28 @@ def process_main():
         while stay_on:
             selobj.selobj_dispatch(PROCESS_TICK_INTERVAL_IN_MS)
             timers.timers_schedule()
+            histogram.export_histogram_data()
+            debug.debug_flush()
 
             if do_reload:
                 debug.debug_reload_config()
+                if wsgi_server is not None:
+                    wsgi_server.recycle()
                 do_reload = False
 
+            if dump_data_captured:
+                DLOG.info("Dump captured data signalled.")
+                histogram.display_histogram_data()
+                histogram.export_histogram_data(force=True)
+                DLOG.info("Dump captured data complete.")
+                dump_data_captured = False
+
+            if reset_data_captured:
+                DLOG.info("Reset captured data signalled.")
+                histogram.reset_histogram_data()
+                DLOG.info("Reset captured data complete.")
+                reset_data_captured = False
+
     except KeyboardInterrupt:
         print("Keyboard Interrupt received.")
 
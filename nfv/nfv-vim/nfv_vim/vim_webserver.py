@@ -9,6 +9,7 @@ import sys
 
 from nfv_common import config
 from nfv_common import debug
+from nfv_common import histogram
 from nfv_common import selobj
 from nfv_common import timers
 
@@ -26,13 +27,15 @@ DLOG = debug.debug_get_logger('nfv_vim.webserver')
 
 stay_on = True
 do_reload = False
+dump_data_captured = False
+reset_data_captured = False
 
 
 def process_signal_handler(signum, frame):
     """
     Virtual Infrastructure Manager Web Server - Process Signal Handler
     """
-    global stay_on, do_reload
+    global stay_on, do_reload, dump_data_captured, reset_data_captured
 
     if signal.SIGTERM == signum:
         stay_on = False
@@ -40,6 +43,10 @@ def process_signal_handler(signum, frame):
         stay_on = False
     elif signal.SIGHUP == signum:
         do_reload = True
+    elif signal.SIGUSR1 == signum:
+        dump_data_captured = True
+    elif signal.SIGUSR2 == signum:
+        reset_data_captured = True
     else:
         print("Ignoring signal" % signum)
 
@@ -49,6 +56,8 @@ def process_initialize():
     Virtual Infrastructure Manager Web Server - Initialize
     """
     debug.debug_initialize(config.CONF['debug'], 'VIM-WEB')
+    histogram.histogram_initialize(config.CONF.get('histogram'),
+                                   'nfv-vim-webserver')
     selobj.selobj_initialize()
     timers.timers_initialize(PROCESS_TICK_INTERVAL_IN_MS,
                              PROCESS_TICK_MAX_DELAY_IN_MS,
@@ -72,12 +81,14 @@ def process_main():
     """
     Virtual Infrastructure Manager Web Server - Main
     """
-    global do_reload
+    global do_reload, dump_data_captured, reset_data_captured
 
     try:
         signal.signal(signal.SIGHUP, process_signal_handler)
         signal.signal(signal.SIGINT, process_signal_handler)
         signal.signal(signal.SIGTERM, process_signal_handler)
+        signal.signal(signal.SIGUSR1, process_signal_handler)
+        signal.signal(signal.SIGUSR2, process_signal_handler)
 
         parser = argparse.ArgumentParser()
         parser.add_argument('-c', '--config', help='configuration file')
@@ -96,18 +107,34 @@ def process_main():
 
         server = webserver.SimpleHttpServer(config.CONF['vim-webserver'],
                                             config.CONF['nfvi'],
-                                            config.CONF['vim-api'])
+                                            config.CONF['vim-api'],
+                                            config.CONF.get('histogram'))
         server.start()
 
         DLOG.info("Started")
         while stay_on:
             selobj.selobj_dispatch(PROCESS_TICK_INTERVAL_IN_MS)
             timers.timers_schedule()
+            histogram.export_histogram_data()
+            debug.debug_flush()
 
             if do_reload:
                 debug.debug_reload_config()
                 do_reload = False
 
+            if dump_data_captured:
+                DLOG.info("Dump captured data signalled.")
+                histogram.display_histogram_data()
+                histogram.export_histogram_data(force=True)
+                DLOG.info("Dump captured data complete.")
+                dump_data_captured = False
+
+            if reset_data_captured:
+                DLOG.info("Reset captured data signalled.")
+                histogram.reset_histogram_data()
+                DLOG.info("Reset captured data complete.")
+                reset_data_captured = False
+
         server.stop()
 
     except KeyboardInterrupt:
@@ -13,6 +13,7 @@ import socket
 import threading
 
 from nfv_common import debug
+from nfv_common import histogram
 from nfv_plugins.nfvi_plugins import config
 from nfv_plugins.nfvi_plugins.openstack import fm
 from nfv_plugins.nfvi_plugins.openstack import openstack
@@ -25,6 +26,7 @@ _token = None
 _directory = None
 _webserver_src_dir = '/'
 _vim_api_ip = ''
+_histogram_dir = None
 
 
 def _bare_address_string(self):
@@ -520,6 +522,29 @@ class HTTPRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
                 self.send_header('Content-Type', 'application/json')
                 self.end_headers()
 
+        elif re.search('/vim/histograms', self.path) is not None:
+            histogram_data_list = list()
+            if _histogram_dir is not None:
+                histogram_data_list = \
+                    histogram.load_histogram_data(_histogram_dir)
+
+            self.send_response(httplib.OK)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(json.dumps({'histograms': histogram_data_list}))
+
+        elif self.path == '/metrics':
+            histogram_data_list = list()
+            if _histogram_dir is not None:
+                histogram_data_list = \
+                    histogram.load_histogram_data(_histogram_dir)
+
+            self.send_response(httplib.OK)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.end_headers()
+            self.wfile.write(histogram.format_histogram_data_prometheus(
+                histogram_data_list))
+
         elif re.search('/fonts', self.path) is not None:
             with open(_webserver_src_dir + self.path, 'r') as f:
                 self.send_response(httplib.OK)
@@ -581,8 +606,9 @@ class SimpleHttpServer(object):
     """
     Simple HTTP Server
     """
-    def __init__(self, webserver_config, nfvi_config, vim_api_config):
-        global _webserver_src_dir, _directory, _vim_api_ip
+    def __init__(self, webserver_config, nfvi_config, vim_api_config,
+                 histogram_config=None):
+        global _webserver_src_dir, _directory, _vim_api_ip, _histogram_dir
 
         _webserver_src_dir = webserver_config['source_dir']
 
@@ -602,6 +628,10 @@ class SimpleHttpServer(object):
             # Wrap IPv6 address for use in URLs
             _vim_api_ip = '[' + _vim_api_ip + ']'
 
+        if histogram_config is not None:
+            # Histograms exported by each of the processes are served
+            _histogram_dir = histogram_config.get('export_dir') or None
+
     def start(self):
         self.server_thread = threading.Thread(target=self.server.serve_forever)
         self.server_thread.daemon = True
@@ -31,13 +31,24 @@ server_opts = [
     cfg.BoolOpt('use_ssl',
                 default=False,
                 help="If True, the client is using https "),
+    cfg.StrOpt('histogram_export_dir',
+               default='/var/run/nfv-vim/histograms',
+               help='directory histograms are exported to on SIGUSR1, '
+                    'served along with the nfv-vim histograms'),
 ]
 
 CONF = cfg.CONF
 CONF.register_opts(server_opts)
 
+# Seconds between checks for captured data to dump or reset
+CAPTURED_DATA_CHECK_INTERVAL_IN_SECS = 1
+
+dump_data_captured = False
+reset_data_captured = False
+
 
 def process_signal_handler(signum, frame):
+    global dump_data_captured, reset_data_captured
 
     if signal.SIGTERM == signum:
         LOG.info("Caught SIGTERM...")
@@ -51,15 +62,38 @@ def process_signal_handler(signum, frame):
             CONF.debug = True
         logging.toggle_debug_log(CONF.debug)
     elif signal.SIGUSR1 == signum:
-        LOG.info("Caught SIGUSR1...")
-        histogram.display_histogram_data()
+        dump_data_captured = True
     elif signal.SIGUSR2 == signum:
-        LOG.info("Caught SIGUSR2...")
-        histogram.reset_histogram_data()
+        reset_data_captured = True
     else:
         LOG.info("Ignoring signal" % signum)
 
 
+def process_captured_data():
+    """
+    Dump or reset the captured data when signalled, outside of the signal
+    handler as the histogram lock may be held by the request interrupted
+    """
+    global dump_data_captured, reset_data_captured
+
+    while True:
+        if dump_data_captured:
+            LOG.info("Dump captured data signalled.")
+            dump_data_captured = False
+            histogram.display_histogram_data()
+            histogram.export_histogram_data(CONF.histogram_export_dir,
+                                            'nova-api-proxy')
+            LOG.info("Dump captured data complete.")
+
+        if reset_data_captured:
+            LOG.info("Reset captured data signalled.")
+            reset_data_captured = False
+            histogram.reset_histogram_data()
+            LOG.info("Reset captured data complete.")
+
+        eventlet.sleep(CAPTURED_DATA_CHECK_INTERVAL_IN_SECS)
+
+
 def main():
     global server
     try:
@@ -86,6 +120,8 @@ def main():
         server = Server("osapi_proxy", app, host=CONF.osapi_proxy_listen,
                         port=CONF.osapi_proxy_listen_port,
                         use_ssl=should_use_ssl)
+        eventlet.spawn(process_captured_data)
+
         LOG.debug("Start the server")
         server.start()
 
@@ -5,7 +5,7 @@
 #
 import json
 from paste.request import construct_url
-import routes
+import re
 import webob.dec
 import webob.exc
 
@@ -13,7 +13,6 @@ from oslo_config import cfg
 from oslo_log import log as logging
 
 from nova_api_proxy.apps.dispatcher import APIDispatcher
-from nova_api_proxy.apps.dispatcher import Router
 from nova_api_proxy.apps.proxy import Proxy
 from nova_api_proxy.common.service import Middleware
 from nova_api_proxy.common.service import Request
@@ -39,39 +38,119 @@ proxy_opts = [
 CONF = cfg.CONF
 CONF.register_opts(proxy_opts)
 
+# Environ key the classification of a request is kept under
+CLASSIFICATION_KEY = 'nova_api_proxy.classification'
+
+_PATH_VARIABLE = re.compile(r'{(\w+)(?::([^}]*))?}')
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+_json_decoder = json.JSONDecoder()
+
+
+def compile_paths(paths):
+    """
+    Returns a regex matching any of the given routes style paths, such as
+    '/v2.1/{tenant_id:.*?}/servers/{server_id}'
+    """
+    patterns = list()
+    for path in paths:
+        pattern = ''
+        pos = 0
+        for variable in _PATH_VARIABLE.finditer(path):
+            pattern += re.escape(path[pos:variable.start()])
+            if variable.group(2) is None:
+                pattern += '[^/]+?'
+            else:
+                pattern += '(?:%s)' % variable.group(2)
+            pos = variable.end()
+        pattern += re.escape(path[pos:])
+        patterns.append(pattern)
+    return re.compile('^(?:%s)$' % '|'.join(patterns))
+
+
+def _scan_action(body, actions, actions_regex):
+    """
+    Returns the first top-level key of a JSON object that is one of the
+    actions and its value, only the value of the keys up to the action are
+    decoded
+    """
+    try:
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+
+        if actions_regex.search(body) is None:
+            return None, None
+
+        idx = _WHITESPACE.match(body).end()
+        if '{' != body[idx:idx + 1]:
+            return None, None
+
+        while True:
+            idx = _WHITESPACE.match(body, idx + 1).end()
+            if '"' != body[idx:idx + 1]:
+                return None, None
+            key, idx = json.decoder.scanstring(body, idx + 1)
+            idx = _WHITESPACE.match(body, idx).end()
+            if ':' != body[idx:idx + 1]:
+                return None, None
+            idx = _WHITESPACE.match(body, idx + 1).end()
+            value, idx = _json_decoder.raw_decode(body, idx)
+            if key in actions:
+                return key, value
+            idx = _WHITESPACE.match(body, idx).end()
+            if ',' != body[idx:idx + 1]:
+                return None, None
+
+    except ValueError:
+        return None, None
+
+
+def classify_request(req, actions, actions_regex):
+    """
+    Returns the body of a request, the NFVI action it asks for and the
+    value of the action, the body is read and scanned once and the result
+    kept on the request environ for the rest of the pipeline
+    """
+    classification = req.environ.get(CLASSIFICATION_KEY, None)
+    if classification is None:
+        body = get_jason_request_body(req)
+        action, value = None, None
+        if body is not None and req.environ['REQUEST_METHOD'] == 'POST':
+            action, value = _scan_action(body, actions, actions_regex)
+        classification = (body, action, value)
+        req.environ[CLASSIFICATION_KEY] = classification
+    return classification
+
 
 class APIController(Middleware):
     _actions = ['pause', 'unpause', 'suspend', 'resume', 'os-migrateLive',
                 'migrate', 'resize', 'confirmResize', 'revertResize',
                 'reboot', 'os-stop', 'os-start', 'rebuild']
 
+    _actions_regex = re.compile(r'"(?:%s)"\s*:'
+                                % '|'.join(re.escape(action)
+                                           for action in _actions))
+
     def __init__(self, app, conf):
         self._default_dispatcher = APIDispatcher(app)
+        self._nfvi_dispatcher = APIDispatcher(app, CONF.nfvi_compute_listen,
+                                              CONF.nfvi_compute_listen_port)
         super(APIController, self).__init__(app)
 
     @webob.dec.wsgify(RequestClass=Request)
     def __call__(self, req):
-        self._generate_log(req)
-        LOG.debug("Check if it is a NFVI action")
-        if (req.environ['REQUEST_METHOD'] == 'POST' and self._is_nfvi_request(
-                req)):
-            remote_host = CONF.nfvi_compute_listen
-            remote_port = CONF.nfvi_compute_listen_port
-            return APIDispatcher(self.application, remote_host, remote_port)
+        body, action, value = classify_request(req, self._actions,
+                                               self._actions_regex)
+        self._generate_log(req, body)
+        if action is not None:
+            environ = req.environ
+            LOG.info("Forward to NFV \"%s %s\", action: (%s), val:(%s)" % (
+                environ['REQUEST_METHOD'], construct_url(environ),
+                action, value))
+            return self._nfvi_dispatcher
         return self._default_dispatcher
 
-    def _is_nfvi_request(self, request):
-        body = get_jason_request_body(request)
-        data = json.loads(body)
-        for action in self._actions:
-            if action in list(data):
-                environ = request.environ
-                LOG.info("Forward to NFV \"%s %s\", action: (%s), val:(%s)" % (
-                    environ['REQUEST_METHOD'], construct_url(environ),
-                    action, data[action]))
-                return True
-        return False
-
     def _log_message(self, environ):
         remote_addr = environ.get('HTTP_X_FORWARDED_FOR',
                                   environ['REMOTE_ADDR'])
@@ -84,33 +163,14 @@ class APIController(Middleware):
                                  environ['REQUEST_METHOD'],
                                  construct_url(environ)))
 
-    def _generate_log(self, req):
-        environ = req.environ
-        body = get_jason_request_body(req)
+    def _generate_log(self, req, body):
         if CONF.debug and body is not None:
-            data = json.loads(body)
-            self._print_data(data)
-        self._log_message(environ)
-
-    def _print_data(self, obj):
-        if type(obj) == dict:
-            for k, v in obj.items():
-                if hasattr(v, '__iter__'):
-                    LOG.info("%s" % k)
-                    self._print_data(v)
-                else:
-                    LOG.info('%s : %s' % (k, v))
-        elif type(obj) == list:
-            for v in obj:
-                if hasattr(v, '__iter__'):
-                    self._print_data(v)
-                else:
-                    LOG.info("%s" % v)
-        else:
-            LOG.info("Obj: (%s)" % obj)
-
-
-class Acceptor(Router):
+            LOG.debug("Request body: %s" % utils.log_preview(
+                body[:CONF.body_log_preview], len(body)))
+        self._log_message(req.environ)
+
+
+class Acceptor(Middleware):
     _paths = ['/v2/{tenant_id:.*?}/servers/{server_id}/action',
               '/v2.1/{tenant_id:.*?}/servers/{server_id}/action',
               '/v2.1/{project_id:.*?}/servers/{server_id}/action',
@@ -124,15 +184,22 @@ class Acceptor(Router):
               '/v2.1/{tenant_id:.*?}/servers/{server_id}',
               '/v2.1/{project_id:.*?}/servers/{server_id}']
 
+    _methods = frozenset(['POST', 'DELETE', 'PUT'])
+
+    _paths_regex = compile_paths(_paths)
+
     def __init__(self, app, conf):
         self._conf = conf
-        mapper = routes.Mapper()
-        forwarder = APIDispatcher(app)
-        api_controller = APIController(app, conf)
-        for path in self._paths:
-            mapper.connect(path, controller=api_controller,
-                           conditions=dict(method=['POST', 'DELETE', 'PUT']))
-        super(Acceptor, self).__init__(app, conf, mapper, forwarder)
+        self._forwarder = APIDispatcher(app)
+        self._api_controller = APIController(app, conf)
+        super(Acceptor, self).__init__(app)
+
+    def __call__(self, environ, start_response):
+        if (environ['REQUEST_METHOD'] in self._methods and
+                self._paths_regex.match(environ.get('PATH_INFO', ''))):
+            return self._api_controller(environ, start_response)
+        LOG.debug("Not match found, forward it to Nova-API")
+        return self._forwarder(environ, start_response)
 
 
 class VersionController(Middleware):
@@ -152,16 +219,21 @@ class VersionController(Middleware):
         return self._default_dispatcher
 
 
-class VersionAcceptor(Router):
+class VersionAcceptor(Middleware):
     API_VERSION = '/{version:.*?}'
 
+    _version_regex = compile_paths([API_VERSION])
+
     def __init__(self, app, conf):
         self._conf = conf
-        mapper = routes.Mapper()
-        api_controller = VersionController(app, conf)
-        mapper.connect(self.API_VERSION, controller=api_controller,
-                       conditions=dict(method=['GET']))
-        super(VersionAcceptor, self).__init__(app, conf, mapper)
+        self._api_controller = VersionController(app, conf)
+        super(VersionAcceptor, self).__init__(app)
+
+    def __call__(self, environ, start_response):
+        if (environ['REQUEST_METHOD'] == 'GET' and
+                self._version_regex.match(environ.get('PATH_INFO', ''))):
+            return self._api_controller(environ, start_response)
+        return self.application(environ, start_response)
 
 
 class DebugHeaders(Middleware):
@@ -208,7 +280,8 @@ def get_jason_request_body(request):
     if not content_type or content_type.startswith('text/plain'):
         LOG.info("Content type null or plain text")
         content_type = 'application/json'
-    if content_type in ('JSON', 'application/json') and \
-            request.body.startswith('{'):
-        LOG.debug("Req body: (%s)" % request.body)
-        return request.body
+    if content_type in ('JSON', 'application/json'):
+        body = request.body
+        if body.startswith(b'{'):
+            return body
+    return None
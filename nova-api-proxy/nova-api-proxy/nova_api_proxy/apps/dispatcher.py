@@ -71,8 +71,11 @@ class APIDispatcher(object):
     """
     WSGI middleware that dispatch an incoming requests to a remote WSGI apps.
     """
-    def __init__(self, app, remote_host=CONF.osapi_compute_listen,
-                 remote_port=CONF.osapi_compute_listen_port):
+    def __init__(self, app, remote_host=None, remote_port=None):
+        if remote_host is None:
+            remote_host = CONF.osapi_compute_listen
+        if remote_port is None:
+            remote_port = CONF.osapi_compute_listen_port
         self._remote_host = remote_host
         self._remote_port = remote_port
         self.app = app
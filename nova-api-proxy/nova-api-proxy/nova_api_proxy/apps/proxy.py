@@ -12,43 +12,270 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import collections
+from paste.proxy import filtered_headers
 from paste.proxy import parse_headers
-from paste.proxy import TransparentProxy
+import socket
 from six.moves import http_client as httplib
-import urllib
+from six.moves.urllib.parse import quote
 
+from oslo_config import cfg
 from oslo_log import log as logging
 
 from nova_api_proxy.common import histogram
+from nova_api_proxy.common import utils
 from nova_api_proxy.common.service import Application
 from nova_api_proxy.common.timestamp import get_monotonic_timestamp_in_ms
 
 LOG = logging.getLogger(__name__)
 
+proxy_opts = [
+    cfg.IntOpt('upstream_idle_timeout',
+               default=60,
+               help='Seconds a connection to nova-api or the VIM is kept '
+                    'idle for reuse before being closed'),
+    cfg.IntOpt('body_log_preview',
+               default=512,
+               help='Maximum number of bytes of a request or response body '
+                    'that are logged'),
+]
+
+CONF = cfg.CONF
+CONF.register_opts(proxy_opts)
+
+# Size of the pieces response bodies are streamed back in
+RESPONSE_CHUNK_SIZE = 65536
+
+# Methods that are safe to send again if a reused connection fails
+IDEMPOTENT_METHODS = ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE']
+
+
+def closed_without_response(e):
+    """
+    Returns true if the server closed the connection before any of the
+    response was received
+    """
+    remote_disconnected = getattr(httplib, 'RemoteDisconnected', None)
+    if remote_disconnected is not None:
+        return isinstance(e, remote_disconnected)
+    return isinstance(e, httplib.BadStatusLine) and e.line in ['', "''"]
+
+
+class ConnectionPool(object):
+    """
+    Connections kept alive to an upstream server, most recently used first
+    """
+    def __init__(self, scheme, host, max_size, idle_timeout_in_secs):
+        if 'http' == scheme:
+            self._connection_class = httplib.HTTPConnection
+        elif 'https' == scheme:
+            self._connection_class = httplib.HTTPSConnection
+        else:
+            raise ValueError("Unknown scheme %r" % scheme)
+        self._host = host
+        self._max_size = max_size
+        self._idle_timeout_ms = idle_timeout_in_secs * 1000
+        self._idle = collections.deque()
+
+    @property
+    def host(self):
+        return self._host
+
+    def get(self):
+        """
+        Returns an idle connection, or None if there is none
+        """
+        now_ms = get_monotonic_timestamp_in_ms()
+        while self._idle:
+            connection, idle_since_ms = self._idle.pop()
+            if now_ms - idle_since_ms < self._idle_timeout_ms:
+                return connection
+            connection.close()
+        return None
+
+    def connect(self):
+        """
+        Returns a new connection
+        """
+        start_ms = get_monotonic_timestamp_in_ms()
+        connection = self._connection_class(self._host)
+        try:
+            connection.connect()
+        except Exception:
+            connection.close()
+            raise
+        elapsed_ms = get_monotonic_timestamp_in_ms() - start_ms
+        histogram.add_histogram_data("%s connect" % self._host,
+                                     elapsed_ms, 'ms')
+        return connection
+
+    def put(self, connection):
+        """
+        Keep a connection for reuse, it is closed if enough are kept
+        """
+        if len(self._idle) >= self._max_size:
+            connection.close()
+        else:
+            self._idle.append((connection, get_monotonic_timestamp_in_ms()))
+
+    def close(self):
+        """
+        Close the idle connections
+        """
+        while self._idle:
+            connection, _ = self._idle.pop()
+            connection.close()
+
+
+class ProxyResponse(object):
+    """
+    Response body streamed from the upstream server, the connection goes
+    back to its pool once the body has been read
+    """
+    def __init__(self, pool, connection, response, environ, start_ms):
+        self._pool = pool
+        self._connection = connection
+        self._response = response
+        self._environ = environ
+        self._start_ms = start_ms
+        self._complete = False
+        self._body_length = 0
+        self._preview = None
+        if environ.get('REQUEST_METHOD') == 'POST':
+            self._preview = list()
+            self._preview_length = 0
+
+    def __iter__(self):
+        while True:
+            chunk = self._response.read(RESPONSE_CHUNK_SIZE)
+            if not chunk:
+                break
+            self._body_length += len(chunk)
+            if (self._preview is not None and
+                    self._preview_length < CONF.body_log_preview):
+                chunk_preview = chunk[:CONF.body_log_preview -
+                                      self._preview_length]
+                self._preview.append(chunk_preview)
+                self._preview_length += len(chunk_preview)
+            yield chunk
+        self._complete = True
+
+    def close(self):
+        if self._connection is None:
+            return
+
+        if self._complete and not self._response.will_close:
+            self._pool.put(self._connection)
+        else:
+            self._connection.close()
+        self._connection = None
+
+        elapsed_ms = get_monotonic_timestamp_in_ms() - self._start_ms
+        histogram.add_histogram_data("%s total" % self._pool.host,
+                                     elapsed_ms, 'ms')
+
+        if self._preview is not None:
+            if 'os-keypairs' in self._environ.get('PATH_INFO', ''):
+                LOG.info("POST response body: <keypair. redacted>")
+            else:
+                LOG.info("POST response body: %s" % utils.log_preview(
+                    b''.join(self._preview), self._body_length))
+
 
 class Proxy(Application):
 
     """
     A proxy that sends the request just as it was given, including
     respecting HTTP_HOST, wsgi.url_scheme, etc.
+
+    Connections to each upstream server are kept alive in a pool sized to
+    the green thread pool, and response bodies are streamed back in chunks
+    rather than read whole.
     """
     def __init__(self):
-        self.proxy_app = TransparentProxy()
+        self._pools = dict()
+
+    def _get_pool(self, scheme, host):
+        pool = self._pools.get((scheme, host), None)
+        if pool is None:
+            pool = ConnectionPool(scheme, host, CONF.pool_size,
+                                  CONF.upstream_idle_timeout)
+            self._pools[(scheme, host)] = pool
+        return pool
+
+    def _request(self, pool, method, path, body, headers):
+        """
+        Send a request and returns the connection used and the response,
+        an idle connection the upstream server closed is replaced by a new
+        one. A request the upstream server may have acted on is only sent
+        again if it is idempotent.
+        """
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        connection = pool.get()
+        while True:
+            reused = connection is not None
+            if not reused:
+                connection = pool.connect()
+            sent = False
+            try:
+                connection.request(method, path, body, headers)
+                sent = True
+                return connection, connection.getresponse()
+            except (socket.error, httplib.HTTPException) as e:
+                connection.close()
+                if not reused:
+                    raise
+                if sent and not idempotent and \
+                        not closed_without_response(e):
+                    raise
+                LOG.debug("Idle connection to %s was closed, reconnecting."
+                          % pool.host)
+                connection = None
 
     def __call__(self, environ, start_response):
         LOG.debug("Proxy the request to the remote host: (%s)", environ[
             'HTTP_HOST'])
         start_ms = get_monotonic_timestamp_in_ms()
-        result = self.proxy_app(environ, start_response)
-        now_ms = get_monotonic_timestamp_in_ms()
-        elapsed_secs = (now_ms - start_ms) / 1000
-        histogram.add_histogram_data("%s" % environ['HTTP_HOST'], elapsed_secs)
-        if environ.get('REQUEST_METHOD') == 'POST':
-            if 'os-keypairs' in environ.get('PATH_INFO', ''):
-                LOG.info("POST response body: <keypair. redacted>")
-            else:
-                LOG.info("POST response body: %s" % result)
-        return result
+
+        if 'HTTP_HOST' not in environ:
+            raise ValueError(
+                "WSGI environ must contain an HTTP_HOST key")
+        host = environ['HTTP_HOST']
+        pool = self._get_pool(environ['wsgi.url_scheme'], host)
+
+        headers = {}
+        for key, value in environ.items():
+            if key.startswith('HTTP_'):
+                key = key[5:].lower().replace('_', '-')
+                if key not in filtered_headers:
+                    headers[key] = value
+        headers['host'] = host
+        if 'REMOTE_ADDR' in environ and 'HTTP_X_FORWARDED_FOR' not in environ:
+            headers['x-forwarded-for'] = environ['REMOTE_ADDR']
+        if environ.get('CONTENT_TYPE'):
+            headers['content-type'] = environ['CONTENT_TYPE']
+        if environ.get('CONTENT_LENGTH'):
+            length = int(environ['CONTENT_LENGTH'])
+            body = environ['wsgi.input'].read(length)
+            if length == -1:
+                environ['CONTENT_LENGTH'] = str(len(body))
+        else:
+            body = b''
+
+        path = quote(environ.get('SCRIPT_NAME', '') +
+                     environ.get('PATH_INFO', ''))
+        if 'QUERY_STRING' in environ:
+            path += '?' + environ['QUERY_STRING']
+
+        connection, response = self._request(
+            pool, environ['REQUEST_METHOD'], path, body, headers)
+        elapsed_ms = get_monotonic_timestamp_in_ms() - start_ms
+        histogram.add_histogram_data("%s first-byte" % host,
+                                     elapsed_ms, 'ms')
+
+        start_response('%s %s' % (response.status, response.reason),
+                       parse_headers(response.msg))
+        return ProxyResponse(pool, connection, response, environ, start_ms)
 
 
 class DebugProxy(Application):
@@ -90,7 +317,7 @@ class DebugProxy(Application):
             body = ''
 
         path = (environ.get('SCRIPT_NAME', '') + environ.get('PATH_INFO', ''))
-        path = urllib.quote(path)
+        path = quote(path)
         if 'QUERY_STRING' in environ:
             path += '?' + environ['QUERY_STRING']
         LOG.debug("REQ header: (%s)" % headers)
@@ -3,11 +3,16 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import re
 
 from oslo_log import log as logging
 
 LOG = logging.getLogger(__name__)
 
+# Secrets that are never logged, whatever the request
+_REDACT_SECRETS = re.compile(r'("(?:adminPass|password|private_key)"\s*:\s*")'
+                             r'(?:[^"\\]|\\.)*("?)')
+
 
 def set_request_forward_environ(req, remote_host, remote_port):
     req.environ['HTTP_X_FORWARDED_SERVER'] = req.environ.get(
@@ -19,3 +24,17 @@ def set_request_forward_environ(req, remote_host, remote_port):
     if ('REMOTE_ADDR' in req.environ and 'HTTP_X_FORWARDED_FOR' not in
             req.environ):
         req.environ['HTTP_X_FORWARDED_FOR'] = req.environ['REMOTE_ADDR']
+
+
+def log_preview(body, length=None):
+    """
+    Returns the start of a body for logging, with secrets redacted and the
+    length of the whole body noted if it was cut short
+    """
+    truncated = length is not None and length > len(body)
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', 'replace')
+    preview = _REDACT_SECRETS.sub(r'\1<redacted>\2', body)
+    if truncated:
+        preview += "... (%d bytes)" % length
+    return preview
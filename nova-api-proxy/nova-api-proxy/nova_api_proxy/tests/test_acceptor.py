@@ -0,0 +1,98 @@
+#
+# Copyright (c) 2020 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import testtools
+
+from nova_api_proxy.apps import acceptor
+from nova_api_proxy.common.service import Request
+
+
+class TestRequestClassification(testtools.TestCase):
+
+    def _classify(self, body, method='POST', content_type='application/json'):
+        req = Request.blank('/v2.1/tenant/servers/uuid/action', method=method,
+                            body=body, content_type=content_type)
+        return acceptor.classify_request(
+            req, acceptor.APIController._actions,
+            acceptor.APIController._actions_regex)
+
+    def test_compile_paths(self):
+        """
+        Test paths are matched whole, with variable requirements
+        """
+        regex = acceptor.compile_paths(['/v2.1/{tenant_id:[0-9a-f]+}/servers',
+                                        '/v2.1/servers/{server_id}/action'])
+        assert regex.match('/v2.1/0a1b/servers')
+        assert regex.match('/v2.1/servers/uuid/action')
+        assert not regex.match('/v2.1/tenant/servers')
+        assert not regex.match('/v2.1/servers/uuid/action/more')
+        assert not regex.match('/v2.1/servers//action')
+        assert not regex.match('/v2.1/servers/a/b/action')
+
+    def test_accepted_paths(self):
+        """
+        Test the paths the acceptor passes on to the API controller
+        """
+        regex = acceptor.Acceptor._paths_regex
+        for path in ['/v2/tenant/servers/uuid/action',
+                     '/v2.1/tenant/servers/uuid/action',
+                     '/v2.1/servers/uuid/action',
+                     '/v2.1/uuid/action',
+                     '/v2.1/servers',
+                     '/v2.1/tenant/servers',
+                     '/v2.1/tenant/servers/uuid']:
+            assert regex.match(path), path
+
+        for path in ['/v2.1/tenant/flavors',
+                     '/v2.1/tenant/servers/uuid/os-interface',
+                     '/v2/tenant/servers',
+                     '/v2.1/servers/uuid/action/']:
+            assert not regex.match(path), path
+
+    def test_action(self):
+        """
+        Test the action of a request and its value are found
+        """
+        assert (b'{"os-stop": null}', 'os-stop', None) == \
+            self._classify(b'{"os-stop": null}')
+        assert ('reboot', {'type': 'HARD'}) == \
+            self._classify(b'{\n "reboot" : {"type": "HARD"}}')[1:]
+        assert ('pause', None) == self._classify(
+            b'{"metadata": {"reboot": "\\"resize\\": 1"}, "pause": null}')[1:]
+
+    def test_not_action(self):
+        """
+        Test requests without an NFVI action, including ones that only
+        mention an action below the top level or in a string
+        """
+        for body in [b'{"os-getConsoleOutput": {"length": 5}}',
+                     b'{"createImage": {"name": "\\"reboot\\": 1"}}',
+                     b'{"metadata": {"reboot": null}}',
+                     b'{"reboot": ',
+                     b'{"reboot" null}']:
+            assert (None, None) == self._classify(body)[1:], body
+
+        assert (None, None) == self._classify(b'{"reboot": null}',
+                                              method='PUT')[1:]
+        assert (None, None, None) == self._classify(
+            b'<reboot/>', content_type='application/xml')
+
+    def test_classification_kept(self):
+        """
+        Test a request is only classified once
+        """
+        req = Request.blank('/v2.1/servers/uuid/action', method='POST',
+                            body=b'{"pause": null}',
+                            content_type='application/json')
+        classification = acceptor.classify_request(
+            req, acceptor.APIController._actions,
+            acceptor.APIController._actions_regex)
+        assert (b'{"pause": null}', 'pause', None) == classification
+
+        req.body = b'{"resume": null}'
+        assert classification is acceptor.classify_request(
+            req, acceptor.APIController._actions,
+            acceptor.APIController._actions_regex)
+        assert classification is req.environ[acceptor.CLASSIFICATION_KEY]
@@ -0,0 +1,151 @@
+#
+# Copyright (c) 2020 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from six.moves import BaseHTTPServer
+from six.moves import http_client as httplib
+from six.moves import socketserver as SocketServer
+import testtools
+import threading
+import webob
+
+from nova_api_proxy.apps import proxy
+
+
+class _RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        self.server.requests.append((self.command, self.path))
+        self.server.headers.append(dict((key.lower(), value) for key, value
+                                        in self.headers.items()))
+        if self.path.startswith('/partial'):
+            # Start the response, then drop the connection
+            self.wfile.write(b'HTTP/1.1 2')
+            self.close_connection = True
+            return
+
+        body = b'{"path": "%s"}' % self.path.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+        if self.server.close_connections:
+            # Close without telling the client, as an idle timeout would
+            self.close_connection = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.do_GET()
+
+
+class _Server(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class TestProxy(testtools.TestCase):
+
+    def setUp(self):
+        super(TestProxy, self).setUp()
+        self._server = _Server(('127.0.0.1', 0), _RequestHandler)
+        self._server.connections = set()
+        self._server.close_connections = False
+        self._server.requests = list()
+        self._server.headers = list()
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self._server.server_close)
+        self.addCleanup(self._server.shutdown)
+
+        self._proxy = proxy.Proxy()
+        self._netloc = '127.0.0.1:%s' % self._server.server_address[1]
+
+    def _request(self, method, path, headers=None):
+        request = webob.Request.blank(path, method=method, headers=headers)
+        if 'POST' == method:
+            request.body = b'{}'
+        environ = request.environ
+        environ['HTTP_HOST'] = self._netloc
+        environ['REMOTE_ADDR'] = '10.0.0.1'
+        if not environ['QUERY_STRING']:
+            del environ['QUERY_STRING']
+
+        status = list()
+        response = self._proxy(environ,
+                               lambda *args: status.append(args[0]))
+        try:
+            body = b''.join(response)
+        finally:
+            response.close()
+        return status[0], body
+
+    def test_connection_reused(self):
+        """
+        Test requests to the same upstream server share a connection
+        """
+        assert ('200 OK', b'{"path": "/servers"}') == \
+            self._request('GET', '/servers')
+        assert ('200 OK', b'{"path": "/servers/detail"}') == \
+            self._request('GET', '/servers/detail')
+        self._request('POST', '/servers')
+        assert 1 == len(self._server.connections)
+
+    def test_stale_connection_reconnects(self):
+        """
+        Test a request on a connection closed by the upstream server is
+        sent again on a new connection, for a post as well since the
+        upstream server never answered
+        """
+        self._server.close_connections = True
+        self._request('GET', '/servers')
+        assert ('200 OK', b'{"path": "/servers"}') == \
+            self._request('GET', '/servers')
+        assert ('200 OK', b'{"path": "/servers"}') == \
+            self._request('POST', '/servers')
+        assert 3 == len(self._server.connections)
+        assert [('GET', '/servers'), ('GET', '/servers'),
+                ('POST', '/servers')] == self._server.requests
+
+    def test_post_not_resent_after_response_started(self):
+        """
+        Test a post is not sent again once the upstream server started
+        answering, while a get is
+        """
+        self._request('GET', '/servers')
+        self.assertRaises(httplib.HTTPException,
+                          self._request, 'POST', '/partial')
+        assert [('GET', '/servers'), ('POST', '/partial')] == \
+            self._server.requests
+
+        del self._server.requests[:]
+        self._request('GET', '/servers')
+        self.assertRaises(httplib.HTTPException,
+                          self._request, 'GET', '/partial')
+        assert [('GET', '/servers'), ('GET', '/partial'),
+                ('GET', '/partial')] == self._server.requests
+
+    def test_headers_filtered(self):
+        """
+        Test hop-by-hop headers are not passed on, and the upstream server
+        is told who the request was forwarded for
+        """
+        self._request('GET', '/servers',
+                      headers={'X-Auth-Token': 'token',
+                               'Keep-Alive': '300',
+                               'Upgrade': 'websocket',
+                               'Proxy-Authorization': 'Basic abc'})
+        headers = self._server.headers[0]
+        assert 'token' == headers['x-auth-token']
+        assert self._netloc == headers['host']
+        assert '10.0.0.1' == headers['x-forwarded-for']
+        assert 'keep-alive' not in headers
+        assert 'upgrade' not in headers
+        assert 'proxy-authorization' not in headers
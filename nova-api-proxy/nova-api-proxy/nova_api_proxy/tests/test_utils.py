@@ -0,0 +1,41 @@
+#
+# Copyright (c) 2020 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import testtools
+
+from nova_api_proxy.common import utils
+
+
+class TestLogPreview(testtools.TestCase):
+
+    def test_secrets_redacted(self):
+        """
+        Test secrets are redacted, whatever else is in the body
+        """
+        body = (b'{"server": {"name": "vm-1", "adminPass": "secret", '
+                b'"password" : "also secret"}}')
+        preview = utils.log_preview(body)
+        assert 'secret' not in preview
+        assert ('{"server": {"name": "vm-1", "adminPass": "<redacted>", '
+                '"password" : "<redacted>"}}') == preview
+
+    def test_escaped_quote_redacted(self):
+        """
+        Test a secret with an escaped quote is redacted to its end
+        """
+        body = b'{"password": "ab\\"cd\\\\", "name": "vm-1"}'
+        preview = utils.log_preview(body)
+        assert '{"password": "<redacted>", "name": "vm-1"}' == preview
+
+    def test_truncated(self):
+        """
+        Test the length of a body cut short is noted, and a secret cut
+        short is still redacted
+        """
+        body = b'{"private_key": "-----BEGIN'
+        preview = utils.log_preview(body, 4096)
+        assert '{"private_key": "<redacted>... (4096 bytes)' == preview
+        assert '{"name": "vm-1"}' == utils.log_preview(b'{"name": "vm-1"}',
+                                                       16)